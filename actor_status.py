@@ -24,6 +24,8 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import httpx
 
+from ttl_cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -126,8 +128,11 @@ class ActorStatusChecker:
         self.langfuse_public_key = os.getenv("LANGFUSE_PUBLIC_KEY", "")
         self.langfuse_secret_key = os.getenv("LANGFUSE_SECRET_KEY", "")
 
-        # Cache for recent activities
-        self._activity_cache: Dict[str, Dict] = {}
+        # Cache for recent activities (stale entries fall back to defaults)
+        self._activity_cache = TTLCache(
+            maxsize=64,
+            ttl=int(os.getenv("ACTOR_ACTIVITY_TTL", "86400"))
+        )
         self._last_check: Dict[str, datetime] = {}
 
     async def check_temporal_status(self) -> Dict[str, Any]:
@@ -477,12 +482,16 @@ class ActorStatusChecker:
 
     def update_activity(self, actor_name: str, action: str, detail: str):
         """Update cached activity for an actor (called from workflows)."""
-        self._activity_cache[actor_name] = {
+        self._activity_cache.put(actor_name, {
             "action": action,
             "detail": detail,
             "timestamp": datetime.utcnow().isoformat(),
             "ago": "az once"
-        }
+        })
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get activity cache statistics."""
+        return {"activity_cache": self._activity_cache.get_stats()}
 
 
 # Global instance
@@ -77,6 +77,13 @@ class BaseAgentGraph:
             agent=self.__class__.__name__
         )
 
+    def reset(self):
+        """
+        Clear per-run attributes before the instance is reused for another run.
+
+        Subclasses that keep run state on self (counters, aggregators) override this.
+        """
+
     def build_graph(self) -> StateGraph:
         """
         Build the graph structure (MUST be implemented by subclass).
@@ -6,5 +6,12 @@ HTTP clients for external services used by LangGraph agents.
 """
 
 from .agent_outputs_client import save_to_agent_outputs, AgentOutputsClient
+from .mcp_session_pool import MCPSessionPool, get_mcp_session_pool, close_mcp_session_pool
 
-__all__ = ["save_to_agent_outputs", "AgentOutputsClient"]
+__all__ = [
+    "save_to_agent_outputs",
+    "AgentOutputsClient",
+    "MCPSessionPool",
+    "get_mcp_session_pool",
+    "close_mcp_session_pool"
+]
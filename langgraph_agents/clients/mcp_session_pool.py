@@ -0,0 +1,428 @@
+"""
+MCP Session Pool
+================
+
+Keeps MCP stdio servers running between tool calls.
+
+Spawning `python3 server.py` per call pays interpreter startup, heavy SDK
+imports (google-ads, facebook_business) and `session.initialize()` every
+time. The pool keeps one warm `ClientSession` per server, shared by all
+graphs in the worker process, so repeated calls are plain IPC.
+
+- Sessions are health-checked with a ping after being idle for a while
+- Idle sessions are shut down after MCP_POOL_IDLE_TIMEOUT seconds by a
+  background reaper (started on first use, stopped by close())
+- At most MCP_POOL_MAX_SESSIONS servers are kept running (LRU eviction)
+- Crashed servers are restarted on the next call (read-only calls marked
+  idempotent are resent once to the restarted server)
+- A hung or crashed session is retired: new calls get a fresh server, and
+  the old process is stopped once the calls still using it have returned
+
+Usage:
+    from langgraph_agents.clients import get_mcp_session_pool
+
+    pool = get_mcp_session_pool()
+    result = await pool.call_tool("google-ads", server_path, "get_campaigns", {"days": 7})
+"""
+
+import os
+import time
+import asyncio
+from pathlib import Path
+from typing import Any, Dict, Optional
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Import MCP Python SDK
+try:
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.stdio import stdio_client
+    from mcp.types import CONNECTION_CLOSED
+    MCP_SDK_AVAILABLE = True
+except ImportError:
+    MCP_SDK_AVAILABLE = False
+    CONNECTION_CLOSED = -32000
+
+try:
+    import anyio
+    _CLOSED_ERRORS = (anyio.ClosedResourceError, anyio.BrokenResourceError, BrokenPipeError)
+except ImportError:
+    _CLOSED_ERRORS = (BrokenPipeError,)
+
+
+def _is_disconnect(error: BaseException) -> bool:
+    """Whether an error means the server process went away."""
+    if isinstance(error, _CLOSED_ERRORS):
+        return True
+
+    # MCP SDK errors carry the JSON-RPC code directly (2.x) or on .error (1.x)
+    code = getattr(error, "code", None)
+    if code is None:
+        code = getattr(getattr(error, "error", None), "code", None)
+    return code == CONNECTION_CLOSED
+
+
+class _PooledSession:
+    """A running MCP server process with an initialized session."""
+
+    def __init__(self, server_name: str, server_path: Path):
+        self.server_name = server_name
+        self.server_path = server_path
+        self.session = None
+        self.error: Optional[BaseException] = None
+        self.ready = asyncio.Event()
+        self.closing = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        self.in_use = 0
+        self.retired = False
+        self.last_used = time.monotonic()
+        self.started_at = time.monotonic()
+
+    @property
+    def alive(self) -> bool:
+        return self.session is not None and self.task is not None and not self.task.done()
+
+    async def run(self):
+        """
+        Own the stdio_client / ClientSession contexts for the session lifetime.
+
+        The contexts must be entered and exited in the same task, so they live
+        in this background task rather than in whichever caller started them.
+        """
+        try:
+            server_params = StdioServerParameters(
+                command="python3",
+                args=[str(self.server_path)],
+                env=dict(os.environ)  # Pass all env vars (API keys, etc.)
+            )
+
+            async with stdio_client(server_params) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    self.session = session
+                    self.ready.set()
+                    await self.closing.wait()
+
+        except BaseException as e:
+            self.error = e
+            if not isinstance(e, (Exception, asyncio.CancelledError)):
+                raise
+        finally:
+            self.session = None
+            self.ready.set()
+            logger.info("mcp_session_stopped", server=self.server_name, error=str(self.error) if self.error else None)
+
+
+class MCPSessionPool:
+    """
+    Pool of warm MCP server sessions keyed by server name.
+
+    One session per server is enough: ClientSession multiplexes concurrent
+    requests over the same stdio pipe.
+    """
+
+    def __init__(
+        self,
+        max_sessions: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        health_check_interval: Optional[float] = None,
+        start_timeout: Optional[float] = None,
+        call_timeout: Optional[float] = None
+    ):
+        """
+        Initialize session pool.
+
+        Args:
+            max_sessions: Max servers kept running (defaults to MCP_POOL_MAX_SESSIONS)
+            idle_timeout: Seconds before an unused server is stopped (defaults to MCP_POOL_IDLE_TIMEOUT)
+            health_check_interval: Idle seconds after which a session is pinged before reuse
+                (defaults to MCP_POOL_HEALTH_CHECK_INTERVAL)
+            start_timeout: Seconds to wait for server startup + initialize (defaults to MCP_POOL_START_TIMEOUT)
+            call_timeout: Seconds to wait for a tool result (defaults to MCP_TOOL_TIMEOUT)
+        """
+        self.max_sessions = max_sessions or int(os.getenv("MCP_POOL_MAX_SESSIONS", "8"))
+        self.idle_timeout = idle_timeout or float(os.getenv("MCP_POOL_IDLE_TIMEOUT", "600"))
+        self.health_check_interval = health_check_interval or float(
+            os.getenv("MCP_POOL_HEALTH_CHECK_INTERVAL", "60")
+        )
+        self.start_timeout = start_timeout or float(os.getenv("MCP_POOL_START_TIMEOUT", "60"))
+        self.call_timeout = call_timeout or float(os.getenv("MCP_TOOL_TIMEOUT", "300"))
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sessions: Dict[str, _PooledSession] = {}
+        self._start_locks: Dict[str, asyncio.Lock] = {}
+        self._reaper: Optional[asyncio.Task] = None
+        # Idle sessions are swept at least this often between calls
+        self.reap_interval = min(self.idle_timeout / 2, 60.0)
+
+        # Stats
+        self.sessions_started = 0
+        self.sessions_reused = 0
+        self.restarts = 0
+        self.evictions = 0
+        self.calls = 0
+
+    def _bind_loop(self):
+        """Forget sessions owned by a previous event loop (their tasks are gone)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._sessions:
+                logger.warning("mcp_pool_loop_changed", dropped_sessions=list(self._sessions))
+            self._loop = loop
+            self._sessions = {}
+            self._start_locks = {}
+            self._reaper = None
+
+    def _ensure_reaper(self):
+        """Start the idle reaper if it isn't running."""
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap_idle(), name="mcp-session-reaper")
+
+    async def _reap_idle(self):
+        """Periodically stop sessions idle past idle_timeout; exits once none are left."""
+        while self._sessions:
+            await asyncio.sleep(self.reap_interval)
+            try:
+                await self._evict_idle()
+            except Exception as e:
+                logger.warning("mcp_session_reap_failed", error=str(e))
+
+    async def _start(self, server_name: str, server_path: Path) -> _PooledSession:
+        entry = _PooledSession(server_name, server_path)
+        entry.task = asyncio.create_task(entry.run(), name=f"mcp-session-{server_name}")
+
+        try:
+            await asyncio.wait_for(entry.ready.wait(), timeout=self.start_timeout)
+        except asyncio.TimeoutError:
+            await self._stop(entry)
+            raise RuntimeError(f"MCP server '{server_name}' did not start within {self.start_timeout}s")
+
+        if entry.session is None:
+            raise RuntimeError(f"MCP server '{server_name}' failed to start: {entry.error}")
+
+        self.sessions_started += 1
+        logger.info(
+            "mcp_session_started",
+            server=server_name,
+            startup_ms=round((time.monotonic() - entry.started_at) * 1000)
+        )
+        return entry
+
+    async def _stop(self, entry: _PooledSession):
+        entry.closing.set()
+        if entry.task is None or entry.task.done():
+            return
+
+        try:
+            await asyncio.wait_for(asyncio.shield(entry.task), timeout=5)
+        except (asyncio.TimeoutError, Exception):
+            entry.task.cancel()
+
+    async def _is_healthy(self, entry: _PooledSession) -> bool:
+        if not entry.alive:
+            return False
+        if time.monotonic() - entry.last_used < self.health_check_interval:
+            return True
+
+        try:
+            await asyncio.wait_for(entry.session.send_ping(), timeout=5)
+            return True
+        except Exception as e:
+            logger.warning("mcp_session_health_check_failed", server=entry.server_name, error=str(e))
+            return False
+
+    def _is_acquiring(self, name: str) -> bool:
+        """Whether another call holds the server's lock (health check or start in progress)."""
+        lock = self._start_locks.get(name)
+        return lock is not None and lock.locked()
+
+    async def _evict_idle(self, keep: Optional[str] = None):
+        """Stop sessions unused for longer than idle_timeout."""
+        now = time.monotonic()
+        for name, entry in list(self._sessions.items()):
+            if (
+                name == keep
+                or entry.in_use > 0
+                or self._is_acquiring(name)
+                or now - entry.last_used <= self.idle_timeout
+                or self._sessions.get(name) is not entry
+            ):
+                continue
+
+            self._sessions.pop(name, None)
+            self.evictions += 1
+            logger.info("mcp_session_idle_stopped", server=name)
+            await self._stop(entry)
+
+    async def _evict(self, keep: str):
+        """Stop idle sessions past idle_timeout, then LRU idle ones over max_sessions."""
+        await self._evict_idle(keep=keep)
+
+        while len(self._sessions) >= self.max_sessions:
+            idle = [
+                (entry.last_used, name)
+                for name, entry in self._sessions.items()
+                if name != keep and entry.in_use == 0 and not self._is_acquiring(name)
+            ]
+            if not idle:
+                break
+
+            _, name = min(idle)
+            entry = self._sessions.pop(name)
+            self.evictions += 1
+            await self._stop(entry)
+
+    async def _acquire(self, server_name: str, server_path: Path) -> _PooledSession:
+        self._bind_loop()
+        lock = self._start_locks.setdefault(server_name, asyncio.Lock())
+
+        async with lock:
+            entry = self._sessions.get(server_name)
+            if entry is not None:
+                if await self._is_healthy(entry):
+                    self.sessions_reused += 1
+                    entry.in_use += 1
+                    return entry
+
+                # Crashed or unresponsive: replace it
+                self.restarts += 1
+                await self._retire(entry)
+
+            await self._evict(keep=server_name)
+
+            entry = await self._start(server_name, server_path)
+            self._sessions[server_name] = entry
+            entry.in_use += 1
+            self._ensure_reaper()
+            return entry
+
+    async def _release(self, entry: _PooledSession):
+        entry.in_use -= 1
+        entry.last_used = time.monotonic()
+        if entry.retired and entry.in_use == 0:
+            await self._stop(entry)
+
+    async def _retire(self, entry: _PooledSession):
+        """
+        Take a session out of the pool so new calls start a fresh server.
+
+        Other callers may still be waiting on it, so the process is only
+        stopped once the last of them releases it.
+        """
+        entry.retired = True
+        if self._sessions.get(entry.server_name) is entry:
+            self._sessions.pop(entry.server_name, None)
+        if entry.in_use == 0:
+            await self._stop(entry)
+
+    async def call_tool(
+        self,
+        server_name: str,
+        server_path: Path,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        timeout: Optional[float] = None,
+        idempotent: bool = False
+    ):
+        """
+        Call a tool on a pooled MCP server session.
+
+        If the server process went away, its session is dropped so the next
+        call starts a fresh one. Idempotent (read-only) calls are resent once
+        right away; other calls are not, since the server may already have
+        acted on them before exiting.
+
+        Args:
+            server_name: Name of the MCP server (e.g., 'google-ads')
+            server_path: Path to the server script
+            tool_name: Name of the tool to call
+            arguments: Arguments to pass to the tool
+            timeout: Seconds to wait for the result (defaults to call_timeout)
+            idempotent: Whether the call is safe to resend after a disconnect
+
+        Returns:
+            MCP CallToolResult
+        """
+        if not MCP_SDK_AVAILABLE:
+            raise RuntimeError("MCP SDK not available")
+
+        self.calls += 1
+        timeout = timeout or self.call_timeout
+        attempts = 2 if idempotent else 1
+
+        for attempt in range(attempts):
+            entry = await self._acquire(server_name, server_path)
+            try:
+                return await asyncio.wait_for(
+                    entry.session.call_tool(tool_name, arguments),
+                    timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                # A hung server would block every later call; start fresh next time
+                await self._retire(entry)
+                raise
+            except Exception as e:
+                if not _is_disconnect(e):
+                    raise
+
+                await self._retire(entry)
+                if attempt == attempts - 1:
+                    raise
+
+                self.restarts += 1
+                logger.warning("mcp_session_disconnected_retrying", server=server_name, tool=tool_name, error=str(e))
+            finally:
+                await self._release(entry)
+
+    async def close(self):
+        """Stop the idle reaper and all server processes."""
+        reaper, self._reaper = self._reaper, None
+        if reaper is not None and not reaper.done():
+            reaper.cancel()
+            try:
+                await reaper
+            except (asyncio.CancelledError, Exception):
+                pass
+
+        sessions, self._sessions = list(self._sessions.values()), {}
+        for entry in sessions:
+            await self._stop(entry)
+
+        if sessions:
+            logger.info("mcp_pool_closed", sessions=len(sessions))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        return {
+            "active_sessions": [name for name, entry in self._sessions.items() if entry.alive],
+            "max_sessions": self.max_sessions,
+            "calls": self.calls,
+            "sessions_started": self.sessions_started,
+            "sessions_reused": self.sessions_reused,
+            "restarts": self.restarts,
+            "evictions": self.evictions,
+        }
+
+
+# Global instance shared by all graphs in the process
+_mcp_session_pool: Optional[MCPSessionPool] = None
+
+
+def get_mcp_session_pool() -> MCPSessionPool:
+    """Get or create the global MCP session pool."""
+    global _mcp_session_pool
+
+    if _mcp_session_pool is None:
+        _mcp_session_pool = MCPSessionPool()
+
+    return _mcp_session_pool
+
+
+async def close_mcp_session_pool():
+    """Stop all pooled MCP servers (call on worker shutdown)."""
+    global _mcp_session_pool
+
+    if _mcp_session_pool is not None:
+        await _mcp_session_pool.close()
+        _mcp_session_pool = None
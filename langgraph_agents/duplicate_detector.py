@@ -20,10 +20,13 @@ Usage:
 
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+import asyncio
 import hashlib
 import json
 import structlog
 
+from ttl_cache import TTLCache
+
 logger = structlog.get_logger(__name__)
 
 
@@ -61,6 +64,8 @@ class DuplicateDetector:
                 - hash_ttl: TTL for hash cache in seconds (default: 604800 = 7 days)
                 - similarity_threshold: Qdrant similarity threshold (default: 0.98)
                 - on_duplicate: Action on duplicate - "skip", "update", "warn" (default: "skip")
+                - max_concurrency: Parallel Memory-Hub/Qdrant lookups in batch checks (default: 8)
+                - local_cache_size: Max entries in the local hash cache (default: 1000)
         """
         self.memory_hub = memory_hub_client
         self.qdrant = qdrant_client
@@ -71,13 +76,18 @@ class DuplicateDetector:
             "hash_ttl": 604800,  # 7 days
             "similarity_threshold": 0.98,
             "on_duplicate": "skip",
-            "enabled_checks": ["hash", "memory_hub", "qdrant"]
+            "enabled_checks": ["hash", "memory_hub", "qdrant"],
+            "max_concurrency": 8,
+            "local_cache_size": 1000
         }
         if config:
             self.config.update(config)
 
         # In-memory hash cache (fallback if Redis not available)
-        self._local_hash_cache: Dict[str, str] = {}
+        self._local_hash_cache = TTLCache(
+            maxsize=self.config["local_cache_size"],
+            ttl=self.config["hash_ttl"]
+        )
 
         logger.info(
             "duplicate_detector_initialized",
@@ -107,15 +117,7 @@ class DuplicateDetector:
                 "details": dict
             }
         """
-        result = {
-            "is_duplicate": False,
-            "duplicate_type": None,
-            "existing_id": None,
-            "similarity_score": None,
-            "recommended_action": "proceed",
-            "details": {},
-            "checks_performed": []
-        }
+        result = self._new_result()
 
         source = data.get("source", "unknown")
         date = data.get("date", datetime.now().strftime("%Y-%m-%d"))
@@ -134,20 +136,7 @@ class DuplicateDetector:
             result["checks_performed"].append("hash")
 
             if hash_result["is_duplicate"]:
-                result.update({
-                    "is_duplicate": True,
-                    "duplicate_type": "exact",
-                    "existing_id": hash_result.get("existing_id"),
-                    "recommended_action": "skip",
-                    "details": {"hash": hash_result.get("hash")}
-                })
-                logger.warning(
-                    "duplicate_detected_hash",
-                    source=source,
-                    date=date,
-                    existing_id=hash_result.get("existing_id")
-                )
-                return result
+                return self._apply_hash_duplicate(result, hash_result, source, date)
 
         # === 2. Memory-Hub check ===
         if "memory_hub" in self.config["enabled_checks"] and self.memory_hub:
@@ -155,20 +144,7 @@ class DuplicateDetector:
             result["checks_performed"].append("memory_hub")
 
             if mh_result["is_duplicate"]:
-                result.update({
-                    "is_duplicate": True,
-                    "duplicate_type": "memory_hub",
-                    "existing_id": mh_result.get("existing_id"),
-                    "recommended_action": "update",  # Update instead of create
-                    "details": {"card_type": mh_result.get("card_type")}
-                })
-                logger.warning(
-                    "duplicate_detected_memory_hub",
-                    source=source,
-                    date=date,
-                    existing_id=mh_result.get("existing_id")
-                )
-                return result
+                return self._apply_memory_hub_duplicate(result, mh_result, source, date)
 
         # === 3. Qdrant similarity check (slowest, most thorough) ===
         if "qdrant" in self.config["enabled_checks"] and self.qdrant:
@@ -176,21 +152,7 @@ class DuplicateDetector:
             result["checks_performed"].append("qdrant")
 
             if qdrant_result["is_duplicate"]:
-                result.update({
-                    "is_duplicate": True,
-                    "duplicate_type": "semantic",
-                    "existing_id": qdrant_result.get("existing_id"),
-                    "similarity_score": qdrant_result.get("similarity_score"),
-                    "recommended_action": "warn",  # Warn but don't block
-                    "details": {"similar_to": qdrant_result.get("similar_to")}
-                })
-                logger.warning(
-                    "duplicate_detected_semantic",
-                    source=source,
-                    date=date,
-                    similarity=qdrant_result.get("similarity_score")
-                )
-                return result
+                return self._apply_semantic_duplicate(result, qdrant_result, source, date)
 
         # === Not a duplicate - cache the hash ===
         if "hash" in self.config["enabled_checks"]:
@@ -205,6 +167,70 @@ class DuplicateDetector:
 
         return result
 
+    @staticmethod
+    def _new_result() -> Dict[str, Any]:
+        return {
+            "is_duplicate": False,
+            "duplicate_type": None,
+            "existing_id": None,
+            "similarity_score": None,
+            "recommended_action": "proceed",
+            "details": {},
+            "checks_performed": []
+        }
+
+    @staticmethod
+    def _apply_hash_duplicate(result: Dict[str, Any], hash_result: Dict[str, Any], source: str, date: str) -> Dict[str, Any]:
+        result.update({
+            "is_duplicate": True,
+            "duplicate_type": "exact",
+            "existing_id": hash_result.get("existing_id"),
+            "recommended_action": "skip",
+            "details": {"hash": hash_result.get("hash")}
+        })
+        logger.warning(
+            "duplicate_detected_hash",
+            source=source,
+            date=date,
+            existing_id=hash_result.get("existing_id")
+        )
+        return result
+
+    @staticmethod
+    def _apply_memory_hub_duplicate(result: Dict[str, Any], mh_result: Dict[str, Any], source: str, date: str) -> Dict[str, Any]:
+        result.update({
+            "is_duplicate": True,
+            "duplicate_type": "memory_hub",
+            "existing_id": mh_result.get("existing_id"),
+            "recommended_action": "update",  # Update instead of create
+            "details": {"card_type": mh_result.get("card_type")}
+        })
+        logger.warning(
+            "duplicate_detected_memory_hub",
+            source=source,
+            date=date,
+            existing_id=mh_result.get("existing_id")
+        )
+        return result
+
+    @staticmethod
+    def _apply_semantic_duplicate(result: Dict[str, Any], qdrant_result: Dict[str, Any], source: str, date: str) -> Dict[str, Any]:
+        result.update({
+            "is_duplicate": True,
+            "duplicate_type": "semantic",
+            "existing_id": qdrant_result.get("existing_id"),
+            "similarity_score": qdrant_result.get("similarity_score"),
+            "recommended_action": "warn",  # Warn but don't block
+            "details": {"similar_to": qdrant_result.get("similar_to")}
+        })
+        logger.warning(
+            "duplicate_detected_semantic",
+            source=source,
+            date=date,
+            similarity=qdrant_result.get("similarity_score")
+        )
+        return result
+
     async def _check_hash_duplicate(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Check for exact duplicate using hash."""
         data_hash = self._compute_hash(data)
@@ -223,10 +249,11 @@ class DuplicateDetector:
                 logger.warning("redis_hash_check_failed", error=str(e))
 
         # Fallback to local cache
-        if data_hash in self._local_hash_cache:
+        existing_id = self._local_hash_cache.get(data_hash)
+        if existing_id is not None:
             return {
                 "is_duplicate": True,
-                "existing_id": self._local_hash_cache[data_hash],
+                "existing_id": existing_id,
                 "hash": data_hash
             }
 
@@ -274,22 +301,138 @@ class DuplicateDetector:
                 score_threshold=self.config["similarity_threshold"]
             )
 
-            if results and len(results) > 0 and results[0].get("score", 0) >= self.config["similarity_threshold"]:
-                return {
-                    "is_duplicate": True,
-                    "existing_id": results[0].get("id"),
-                    "similarity_score": results[0].get("score"),
-                    "similar_to": results[0].get("payload", {}).get("source", "unknown")
-                }
+            return self._similarity_match(results)
         except Exception as e:
             logger.warning("qdrant_similarity_check_failed", error=str(e))
 
         return {"is_duplicate": False}
 
+    def _similarity_match(self, results: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Turn Qdrant search results into a similarity check result."""
+        if results and len(results) > 0 and results[0].get("score", 0) >= self.config["similarity_threshold"]:
+            return {
+                "is_duplicate": True,
+                "existing_id": results[0].get("id"),
+                "similarity_score": results[0].get("score"),
+                "similar_to": results[0].get("payload", {}).get("source", "unknown")
+            }
+        return {"is_duplicate": False}
+
+    async def _lookup_hashes(self, hashes: List[str]) -> List[Optional[str]]:
+        """Look up many hashes with one Redis MGET (local cache as fallback)."""
+        found: List[Optional[str]] = [None] * len(hashes)
+
+        if self.redis and hashes:
+            try:
+                cached = await self.redis.mget([f"data_hash:{h}" for h in hashes])
+                found = [
+                    value.decode() if isinstance(value, bytes) else value
+                    for value in cached
+                ]
+            except Exception as e:
+                logger.warning("redis_hash_check_failed", error=str(e))
+
+        return [
+            existing or self._local_hash_cache.get(data_hash)
+            for data_hash, existing in zip(hashes, found)
+        ]
+
+    async def _check_qdrant_similarity_many(self, data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Semantic duplicate check for many items.
+
+        Uses the client's search_many (one batched request) when available,
+        otherwise runs the single searches concurrently.
+        """
+        if not hasattr(self.qdrant, "search_many"):
+            return await self._gather_limited([self._check_qdrant_similarity(data) for data in data_list])
+
+        try:
+            results = await self.qdrant.search_many(
+                collection="analytics_data",
+                queries=[self._create_search_text(data) for data in data_list],
+                top_k=1,
+                score_threshold=self.config["similarity_threshold"]
+            )
+            return [self._similarity_match(item_results) for item_results in results]
+        except Exception as e:
+            logger.warning("qdrant_similarity_check_failed", error=str(e))
+            return [{"is_duplicate": False} for _ in data_list]
+
+    async def _gather_limited(self, coroutines: List[Any]) -> List[Any]:
+        """Run coroutines concurrently, at most config["max_concurrency"] at a time."""
+        semaphore = asyncio.Semaphore(self.config["max_concurrency"])
+
+        async def run(coroutine):
+            async with semaphore:
+                return await coroutine
+
+        return await asyncio.gather(*(run(c) for c in coroutines))
+
+    async def _check_remote_layers(self, pending: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run the Memory-Hub and Qdrant layers for batch items.
+
+        Returns:
+            The items neither layer flagged as duplicate
+        """
+        enabled = self.config["enabled_checks"]
+
+        if "memory_hub" in enabled and self.memory_hub and pending:
+            mh_results = await self._gather_limited([
+                self._check_memory_hub_duplicate(item["source"], item["date"], item["brand"])
+                for item in pending
+            ])
+
+            still_pending = []
+            for item, mh_result in zip(pending, mh_results):
+                item["result"]["checks_performed"].append("memory_hub")
+                if mh_result["is_duplicate"]:
+                    self._apply_memory_hub_duplicate(item["result"], mh_result, item["source"], item["date"])
+                else:
+                    still_pending.append(item)
+            pending = still_pending
+
+        if "qdrant" in enabled and self.qdrant and pending:
+            qdrant_results = await self._check_qdrant_similarity_many([item["data"] for item in pending])
+
+            still_pending = []
+            for item, qdrant_result in zip(pending, qdrant_results):
+                item["result"]["checks_performed"].append("qdrant")
+                if qdrant_result["is_duplicate"]:
+                    self._apply_semantic_duplicate(item["result"], qdrant_result, item["source"], item["date"])
+                else:
+                    still_pending.append(item)
+            pending = still_pending
+
+        return pending
+
+    async def _cache_hashes(self, data_list: List[Dict[str, Any]]) -> None:
+        """Cache the hashes of many items (one Redis pipeline round trip)."""
+        entries = {
+            self._compute_hash(data): self._data_id(data)
+            for data in data_list
+        }
+        if not entries:
+            return
+
+        if self.redis:
+            try:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for data_hash, data_id in entries.items():
+                        pipe.set(f"data_hash:{data_hash}", data_id, ex=self.config["hash_ttl"])
+                    await pipe.execute()
+                logger.debug("hashes_cached_redis", count=len(entries))
+            except Exception as e:
+                logger.warning("redis_cache_failed", error=str(e))
+
+        for data_hash, data_id in entries.items():
+            self._remember_hash_locally(data_hash, data_id)
+
     async def _cache_hash(self, data: Dict[str, Any]) -> None:
         """Cache the data hash for future duplicate detection."""
         data_hash = self._compute_hash(data)
-        data_id = data.get("id", f"{data.get('source')}_{data.get('date')}")
+        data_id = self._data_id(data)
 
         # Cache in Redis
         if self.redis:
@@ -304,14 +447,15 @@ class DuplicateDetector:
                 logger.warning("redis_cache_failed", error=str(e))
 
         # Also cache locally (fallback)
-        self._local_hash_cache[data_hash] = data_id
+        self._remember_hash_locally(data_hash, data_id)
+
+    def _data_id(self, data: Dict[str, Any]) -> str:
+        """ID stored under a data hash (explicit id, else source_date)."""
+        return data.get("id", f"{data.get('source')}_{data.get('date')}")
 
-        # Limit local cache size
-        if len(self._local_hash_cache) > 1000:
-            # Remove oldest entries (simple FIFO)
-            keys_to_remove = list(self._local_hash_cache.keys())[:100]
-            for key in keys_to_remove:
-                del self._local_hash_cache[key]
+    def _remember_hash_locally(self, data_hash: str, data_id: str) -> None:
+        # Bounded LRU; entries expire after hash_ttl like the Redis keys
+        self._local_hash_cache.put(data_hash, data_id)
 
     def _compute_hash(self, data: Dict[str, Any]) -> str:
         """
@@ -360,18 +504,91 @@ class DuplicateDetector:
         """
         Check multiple data items for duplicates.
 
+        Runs each layer once for the whole batch instead of per item:
+        1. One Redis MGET for all hashes
+        2. Concurrent Memory-Hub lookups (config["max_concurrency"])
+        3. One batched Qdrant similarity query for the items still unmatched
+
+        Results match calling check_duplicate per item in order: an item
+        identical to an earlier one in the batch is an exact duplicate only if
+        that earlier item passed every layer (and so had its hash cached).
+
         Args:
             data_list: List of data dictionaries to check
 
         Returns:
             Dict mapping source names to their duplicate check results
         """
-        results = {}
-
+        enabled = self.config["enabled_checks"]
+        items = []
         for data in data_list:
-            source = data.get("source", "unknown")
-            result = await self.check_duplicate(data)
-            results[source] = result
+            items.append({
+                "data": data,
+                "source": data.get("source", "unknown"),
+                "date": data.get("date", datetime.now().strftime("%Y-%m-%d")),
+                "brand": data.get("brand", "unknown"),
+                "result": self._new_result()
+            })
+
+        pending = list(items)
+        # Items whose hash matches an earlier pending item, grouped by hash
+        followers: Dict[str, List[Dict[str, Any]]] = {}
+
+        # === 1. Hash-based check ===
+        if "hash" in enabled and pending:
+            hashes = [self._compute_hash(item["data"]) for item in pending]
+            existing_ids = await self._lookup_hashes(hashes)
+
+            still_pending = []
+            for item, data_hash, existing_id in zip(pending, hashes, existing_ids):
+                item["result"]["checks_performed"].append("hash")
+                item["hash"] = data_hash
+                if existing_id:
+                    self._apply_hash_duplicate(
+                        item["result"],
+                        {"existing_id": existing_id, "hash": data_hash},
+                        item["source"],
+                        item["date"]
+                    )
+                elif data_hash in followers:
+                    # Decided once the earlier identical item's checks are done
+                    followers[data_hash].append(item)
+                else:
+                    followers[data_hash] = []
+                    still_pending.append(item)
+            pending = still_pending
+
+        # === 2-3. Memory-Hub and Qdrant checks ===
+        not_duplicates = []
+        while pending:
+            clean = await self._check_remote_layers(pending)
+            not_duplicates.extend(clean)
+
+            # Sequentially, a clean item's hash is cached before the next
+            # identical item is checked; a duplicate's hash never is, so the
+            # next identical item goes through the remote layers itself
+            clean_ids = {item["hash"]: self._data_id(item["data"]) for item in clean if "hash" in item}
+            pending = []
+            for data_hash, group in list(followers.items()):
+                if data_hash in clean_ids:
+                    for item in group:
+                        self._apply_hash_duplicate(
+                            item["result"],
+                            {"existing_id": clean_ids[data_hash], "hash": data_hash},
+                            item["source"],
+                            item["date"]
+                        )
+                    group.clear()
+                elif group:
+                    pending.append(group.pop(0))
+                if not group:
+                    del followers[data_hash]
+
+        # === Not duplicates - cache their hashes ===
+        if "hash" in enabled:
+            await self._cache_hashes([item["data"] for item in not_duplicates])
+
+        results = {item["source"]: item["result"] for item in items}
 
         # Summary stats
         total = len(data_list)
@@ -390,6 +607,7 @@ class DuplicateDetector:
         """Get duplicate detection statistics."""
         return {
             "local_cache_size": len(self._local_hash_cache),
+            "local_cache": self._local_hash_cache.get_stats(),
             "config": self.config,
             "clients": {
                 "memory_hub": self.memory_hub is not None,
@@ -36,11 +36,11 @@ import os
 import httpx
 
 from .base_graph import BaseAgentGraph
+from .clients.mcp_session_pool import get_mcp_session_pool
 
 # Import MCP Python SDK
 try:
-    from mcp import ClientSession, StdioServerParameters, types
-    from mcp.client.stdio import stdio_client
+    from mcp import types
     MCP_SDK_AVAILABLE = True
 except ImportError:
     MCP_SDK_AVAILABLE = False
@@ -658,27 +658,17 @@ class ActionExecutorGraph(BaseAgentGraph):
             return {"error": f"MCP server not found: {server_name}"}
 
         try:
-            server_params = StdioServerParameters(
-                command="python3",
-                args=[str(server_path)],
-                env=dict(os.environ)
-            )
-
-            async with stdio_client(server_params) as (read, write):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
-
-                    result = await session.call_tool(tool_name, arguments)
+            result = await get_mcp_session_pool().call_tool(server_name, server_path, tool_name, arguments)
 
-                    if result.content:
-                        for content in result.content:
-                            if hasattr(content, 'text'):
-                                try:
-                                    return json.loads(content.text)
-                                except json.JSONDecodeError:
-                                    return {"raw_response": content.text}
+            if result.content:
+                for content in result.content:
+                    if hasattr(content, 'text'):
+                        try:
+                            return json.loads(content.text)
+                        except json.JSONDecodeError:
+                            return {"raw_response": content.text}
 
-                    return {"error": "No content in response"}
+            return {"error": "No content in response"}
 
         except Exception as e:
             return {"error": str(e)}
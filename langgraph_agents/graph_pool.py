@@ -0,0 +1,233 @@
+"""
+Graph Instance Pool
+===================
+
+Keeps compiled, initialized graph instances warm between Temporal activities.
+
+Building a graph per activity re-creates a MemoryManager (Redis connect,
+Qdrant health check, create_collection_if_not_exists for every collection)
+and recompiles the StateGraph, then close() tears it all down again. The
+pool initializes one MemoryManager per worker process, shares it with every
+graph, and hands out already-compiled instances.
+
+- An instance is checked out by one activity at a time (graphs keep
+  per-run attributes); reset() is called on every checkout
+- At most GRAPH_POOL_MAX_PER_GRAPH instances per graph class; further
+  checkouts wait for one to be returned
+- Instances whose run raised are dropped instead of returned
+- start() warms the shared MemoryManager (and optionally one instance per
+  graph) on worker start, close() releases it on worker stop
+
+Usage:
+    from langgraph_agents.graph_pool import get_graph_pool
+
+    async with get_graph_pool().checkout(DailyAnalyticsGraph) as graph:
+        result = await graph.generate_report(days=7, brand="pomandi")
+"""
+
+import os
+import time
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Type
+import structlog
+
+from memory import MemoryManager
+from .base_graph import BaseAgentGraph
+
+logger = structlog.get_logger(__name__)
+
+
+class GraphPool:
+    """
+    Per-process pool of initialized graph instances sharing one MemoryManager.
+    """
+
+    def __init__(
+        self,
+        max_per_graph: Optional[int] = None,
+        memory_manager: Optional[MemoryManager] = None,
+        enable_memory: bool = True
+    ):
+        """
+        Initialize graph pool.
+
+        Args:
+            max_per_graph: Max instances per graph class (defaults to GRAPH_POOL_MAX_PER_GRAPH)
+            memory_manager: Shared memory manager (or creates one on first checkout)
+            enable_memory: Whether pooled graphs use memory
+        """
+        self.max_per_graph = max_per_graph or int(os.getenv("GRAPH_POOL_MAX_PER_GRAPH", "4"))
+        self.enable_memory = enable_memory
+        self.memory_manager = memory_manager
+        self._owns_memory_manager = memory_manager is None
+
+        self._memory_lock = asyncio.Lock()
+        self._idle: Dict[Type[BaseAgentGraph], List[BaseAgentGraph]] = {}
+        self._slots: Dict[Type[BaseAgentGraph], asyncio.Semaphore] = {}
+        self._closed = False
+
+        # Stats
+        self.checkouts = 0
+        self.instances_created = 0
+        self.instances_reused = 0
+        self.instances_discarded = 0
+
+    async def _get_memory_manager(self) -> Optional[MemoryManager]:
+        """Create and initialize the shared memory manager once."""
+        if not self.enable_memory:
+            return None
+
+        async with self._memory_lock:
+            if self.memory_manager is None:
+                manager = MemoryManager()
+                await manager.initialize()
+                self.memory_manager = manager
+                self._owns_memory_manager = True
+
+        return self.memory_manager
+
+    async def _create(self, graph_class: Type[BaseAgentGraph]) -> BaseAgentGraph:
+        started = time.monotonic()
+        memory_manager = await self._get_memory_manager()
+
+        graph = graph_class(memory_manager=memory_manager, enable_memory=self.enable_memory)
+        await graph.initialize()
+
+        self.instances_created += 1
+        logger.info(
+            "graph_pool_instance_created",
+            graph=graph_class.__name__,
+            init_ms=round((time.monotonic() - started) * 1000)
+        )
+        return graph
+
+    @asynccontextmanager
+    async def checkout(self, graph_class: Type[BaseAgentGraph]) -> AsyncIterator[BaseAgentGraph]:
+        """
+        Borrow an initialized graph instance for one run.
+
+        Args:
+            graph_class: BaseAgentGraph subclass
+
+        Yields:
+            Initialized graph, returned to the pool when the block exits cleanly
+        """
+        if self._closed:
+            raise RuntimeError("Graph pool is closed")
+
+        slots = self._slots.setdefault(graph_class, asyncio.Semaphore(self.max_per_graph))
+        async with slots:
+            idle = self._idle.setdefault(graph_class, [])
+            if idle:
+                graph = idle.pop()
+                self.instances_reused += 1
+            else:
+                graph = await self._create(graph_class)
+
+            graph.reset()
+            self.checkouts += 1
+
+            try:
+                yield graph
+            except BaseException:
+                # Don't hand a graph that failed mid-run to the next activity
+                self.instances_discarded += 1
+                raise
+            else:
+                if not self._closed:
+                    idle.append(graph)
+
+    async def warm(self, graph_classes: Iterable[Type[BaseAgentGraph]]):
+        """
+        Pre-create one instance per graph class that has none idle.
+
+        Args:
+            graph_classes: Graph classes to warm
+        """
+        for graph_class in graph_classes:
+            idle = self._idle.setdefault(graph_class, [])
+            if not idle:
+                idle.append(await self._create(graph_class))
+
+    async def start(self, graph_classes: Iterable[Type[BaseAgentGraph]] = ()):
+        """
+        Worker start hook: initialize the shared memory manager and warm graphs.
+
+        Args:
+            graph_classes: Graph classes to pre-create an instance of
+        """
+        started = time.monotonic()
+        await self._get_memory_manager()
+        await self.warm(graph_classes)
+
+        logger.info(
+            "graph_pool_started",
+            graphs=[graph_class.__name__ for graph_class in self._idle],
+            startup_ms=round((time.monotonic() - started) * 1000)
+        )
+
+    async def close(self):
+        """Worker stop hook: drop idle instances and close the shared memory manager."""
+        self._closed = True
+        idle_count = sum(len(idle) for idle in self._idle.values())
+        self._idle = {}
+
+        if self.memory_manager is not None and self._owns_memory_manager:
+            await self.memory_manager.close()
+        self.memory_manager = None
+
+        logger.info("graph_pool_closed", idle_instances=idle_count)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        return {
+            "idle": {graph_class.__name__: len(idle) for graph_class, idle in self._idle.items()},
+            "max_per_graph": self.max_per_graph,
+            "checkouts": self.checkouts,
+            "instances_created": self.instances_created,
+            "instances_reused": self.instances_reused,
+            "instances_discarded": self.instances_discarded,
+        }
+
+
+# Global instance shared by all activities in the worker process
+_graph_pool: Optional[GraphPool] = None
+
+
+def get_graph_pool() -> GraphPool:
+    """Get or create the global graph pool."""
+    global _graph_pool
+
+    if _graph_pool is None:
+        _graph_pool = GraphPool()
+
+    return _graph_pool
+
+
+async def start_graph_pool(graph_classes: Iterable[Type[BaseAgentGraph]] = ()):
+    """
+    Warm the global graph pool (call on worker start).
+
+    Failures are logged rather than raised: the pool retries lazily on the
+    first checkout, as activities did before.
+
+    Args:
+        graph_classes: Graph classes to pre-create (skipped if GRAPH_POOL_WARM=false)
+    """
+    if os.getenv("GRAPH_POOL_WARM", "true").lower() != "true":
+        graph_classes = ()
+
+    try:
+        await get_graph_pool().start(graph_classes)
+    except Exception as e:
+        logger.warning("graph_pool_warmup_failed", error=str(e))
+
+
+async def close_graph_pool():
+    """Release pooled graphs and the shared memory manager (call on worker shutdown)."""
+    global _graph_pool
+
+    if _graph_pool is not None:
+        await _graph_pool.close()
+        _graph_pool = None
@@ -0,0 +1,338 @@
+"""
+LLM Response Cache
+==================
+
+Content-addressed cache for LLM responses.
+
+Temporal retries of analytics activities re-send byte-identical prompts;
+with this cache they replay stored responses instead of re-running every
+Claude call. Keys are derived from (model, system prompt, prompt hash,
+temperature), so any change to the prompt or its settings is a miss.
+
+Backends (LLM_CACHE_BACKEND):
+- redis: shared by all workers (default)
+- disk: local JSON files under LLM_CACHE_DIR
+- none: disabled
+
+Usage:
+    from langgraph_agents.llm_cache import get_llm_response_cache
+
+    cache = get_llm_response_cache()
+    response = await cache.get(prompt, model="claude-sonnet-4")
+    if response is None:
+        response = await call_llm(prompt)
+        await cache.set(prompt, response, model="claude-sonnet-4")
+"""
+
+import os
+import json
+import time
+import asyncio
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+def make_llm_cache_key(
+    prompt: Any,
+    model: Optional[str] = None,
+    system_prompt: Optional[str] = None,
+    temperature: Optional[float] = None
+) -> str:
+    """
+    Build the cache key for an LLM request.
+
+    Args:
+        prompt: Prompt text or structured message content (e.g. with images)
+        model: Model name (None = SDK default)
+        system_prompt: System prompt
+        temperature: Sampling temperature
+
+    Returns:
+        Cache key string
+    """
+    if isinstance(prompt, str):
+        prompt_text = prompt
+    else:
+        prompt_text = json.dumps(prompt, sort_keys=True, default=str)
+
+    prompt_hash = hashlib.sha256(prompt_text.encode("utf-8")).hexdigest()
+    material = json.dumps([model, system_prompt, prompt_hash, temperature], default=str)
+    digest = hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    return f"llm:{model or 'default'}:{digest}"
+
+
+class RedisResponseStore:
+    """Shared response store in Redis."""
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        password: Optional[str] = None
+    ):
+        """
+        Initialize Redis response store.
+
+        Args:
+            host: Redis host (defaults to REDIS_HOST env var)
+            port: Redis port (defaults to REDIS_PORT env var)
+            password: Redis password (optional)
+        """
+        self.host = host or os.getenv("REDIS_HOST", "localhost")
+        self.port = port or int(os.getenv("REDIS_PORT", "6379"))
+        self.password = password or os.getenv("REDIS_PASSWORD")
+
+        self.client = None
+        self.enabled = True
+        self._connect_lock = asyncio.Lock()
+
+    async def _get_client(self):
+        """Connect lazily on first use."""
+        if self.client is not None or not self.enabled:
+            return self.client
+
+        async with self._connect_lock:
+            if self.client is not None:
+                return self.client
+
+            try:
+                import redis.asyncio as aioredis
+
+                client = await aioredis.from_url(
+                    f"redis://{self.host}:{self.port}",
+                    password=self.password,
+                    decode_responses=True
+                )
+                await client.ping()
+                self.client = client
+                logger.info("llm_cache_redis_connected")
+
+            except Exception as e:
+                logger.error("llm_cache_redis_connection_failed", error=str(e))
+                self.enabled = False
+
+        return self.client
+
+    async def get(self, key: str) -> Optional[str]:
+        """Fetch a stored response."""
+        client = await self._get_client()
+        if client is None:
+            return None
+
+        try:
+            return await client.get(key)
+        except Exception as e:
+            logger.error("llm_cache_get_failed", error=str(e))
+            return None
+
+    async def set(self, key: str, value: str, ttl: int):
+        """Store a response with TTL."""
+        client = await self._get_client()
+        if client is None:
+            return
+
+        try:
+            await client.setex(key, ttl, value)
+        except Exception as e:
+            logger.error("llm_cache_set_failed", error=str(e))
+
+    async def close(self):
+        """Close Redis connection."""
+        if self.client is not None:
+            try:
+                await self.client.close()
+            except Exception as e:
+                logger.error("llm_cache_close_failed", error=str(e))
+            self.client = None
+
+
+class DiskResponseStore:
+    """Response store on local disk (one JSON file per response)."""
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Initialize disk response store.
+
+        Args:
+            directory: Cache directory (defaults to LLM_CACHE_DIR env var)
+        """
+        self.directory = Path(directory or os.getenv("LLM_CACHE_DIR", "/tmp/agent-llm-cache"))
+        self.enabled = True
+
+    def _path_for(self, key: str) -> Path:
+        safe_key = key.replace(":", "_").replace("/", "_")
+        return self.directory / safe_key[-2:] / f"{safe_key}.json"
+
+    def _read(self, key: str) -> Optional[str]:
+        path = self._path_for(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+
+        if entry["expires_at"] < time.time():
+            path.unlink(missing_ok=True)
+            return None
+        return entry["response"]
+
+    def _write(self, key: str, value: str, ttl: int):
+        path = self._path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file first so concurrent readers never see partial entries
+        tmp_path = path.parent / f"{path.name}.{os.getpid()}.tmp"
+        tmp_path.write_text(
+            json.dumps({"expires_at": time.time() + ttl, "response": value}, ensure_ascii=False),
+            encoding="utf-8"
+        )
+        os.replace(tmp_path, path)
+
+    async def get(self, key: str) -> Optional[str]:
+        """Fetch a stored response."""
+        try:
+            return await asyncio.to_thread(self._read, key)
+        except Exception as e:
+            logger.error("llm_cache_get_failed", error=str(e))
+            return None
+
+    async def set(self, key: str, value: str, ttl: int):
+        """Store a response with TTL."""
+        try:
+            await asyncio.to_thread(self._write, key, value, ttl)
+        except Exception as e:
+            logger.error("llm_cache_set_failed", error=str(e))
+
+    async def close(self):
+        """Nothing to close for disk store."""
+        return
+
+
+def create_llm_response_store(backend: Optional[str] = None):
+    """
+    Create the response store from LLM_CACHE_BACKEND.
+
+    Args:
+        backend: "redis", "disk" or "none" (defaults to LLM_CACHE_BACKEND env var)
+
+    Returns:
+        Store instance or None
+    """
+    backend = (backend or os.getenv("LLM_CACHE_BACKEND", "redis")).lower()
+
+    if backend == "redis":
+        return RedisResponseStore()
+    if backend == "disk":
+        return DiskResponseStore()
+    if backend in ("none", "", "off"):
+        return None
+
+    logger.warning("unknown_llm_cache_backend", backend=backend)
+    return None
+
+
+class LLMResponseCache:
+    """
+    LLM response cache with TTL over a Redis or disk store.
+
+    Empty responses are never cached.
+    """
+
+    def __init__(self, store=None, ttl: Optional[int] = None):
+        """
+        Initialize response cache.
+
+        Args:
+            store: RedisResponseStore, DiskResponseStore or None (disabled)
+            ttl: Default time-to-live in seconds (defaults to LLM_CACHE_TTL)
+        """
+        self.store = store
+        self.ttl = ttl or int(os.getenv("LLM_CACHE_TTL", str(6 * 3600)))
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.store is not None and self.store.enabled
+
+    async def get(
+        self,
+        prompt: Any,
+        model: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Get a cached response.
+
+        Returns:
+            Cached response or None
+        """
+        if not self.enabled:
+            return None
+
+        response = await self.store.get(make_llm_cache_key(prompt, model, system_prompt, temperature))
+
+        if response is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            logger.debug("llm_cache_hit", model=model)
+
+        return response
+
+    async def set(
+        self,
+        prompt: Any,
+        response: str,
+        model: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        ttl: Optional[int] = None
+    ):
+        """Cache a response (empty responses are skipped)."""
+        if not self.enabled or not response:
+            return
+
+        await self.store.set(
+            make_llm_cache_key(prompt, model, system_prompt, temperature),
+            response,
+            ttl or self.ttl
+        )
+        self.writes += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        total = self.hits + self.misses
+        return {
+            "backend": type(self.store).__name__ if self.store is not None else None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "hit_rate_percent": round(self.hits / total * 100, 2) if total else 0,
+        }
+
+    async def close(self):
+        """Close store connection."""
+        if self.store is not None:
+            await self.store.close()
+
+
+# Global instance (lazy initialized)
+_llm_response_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """Get or create the global LLM response cache."""
+    global _llm_response_cache
+
+    if _llm_response_cache is None:
+        _llm_response_cache = LLMResponseCache(store=create_llm_response_store())
+
+    return _llm_response_cache
@@ -0,0 +1,373 @@
+"""
+LLM Executor
+============
+
+Shared execution layer for Claude Agent SDK calls made by graph nodes.
+
+- Bounded concurrency (LLM_MAX_CONCURRENCY) so parallel nodes don't spawn
+  an unbounded number of SDK sessions
+- Per-request timeout (LLM_TIMEOUT) and retries with exponential backoff
+  (LLM_MAX_RETRIES)
+- Token-budgeted prompt payloads: long lists (campaigns, keywords, ...)
+  are cut to the top-K rows by spend before serialising, and K shrinks
+  until the payload fits LLM_PROMPT_MAX_TOKENS
+- Response cache (see llm_cache.py): identical requests, e.g. from
+  Temporal retries, replay the stored response
+
+Usage:
+    from langgraph_agents.llm_executor import get_llm_executor, build_prompt_payload
+
+    payload = build_prompt_payload(data)
+    response = await get_llm_executor().run(f"Analyze:\\n{payload}", label="google_ads")
+"""
+
+import os
+import json
+import time
+import asyncio
+from typing import Any, Dict, Optional, Tuple
+import structlog
+
+from .llm_cache import LLMResponseCache, get_llm_response_cache
+
+logger = structlog.get_logger(__name__)
+
+# Import Claude Agent SDK
+try:
+    from claude_agent_sdk import query, ClaudeAgentOptions
+    CLAUDE_SDK_AVAILABLE = True
+except ImportError:
+    CLAUDE_SDK_AVAILABLE = False
+
+
+# =============================================================================
+# PROMPT BUDGETING
+# =============================================================================
+
+# Row fields used to rank list items, most important first. Matched
+# case-insensitively ignoring underscores, on the row itself and on nested
+# dicts one level down (e.g. Google Ads "metrics", Meta Ads "insights").
+RANK_FIELDS = (
+    "cost", "costmicros", "spend", "totalspend",
+    "revenue", "totalrevenue", "conversionsvalue",
+    "conversions", "clicks", "sessions", "impressions",
+)
+
+# Claude's tokenizer isn't public; ~4 characters per token is close enough
+# for budgeting JSON payloads
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: Any) -> int:
+    """Approximate token count of a prompt string (0 for structured content)."""
+    if not isinstance(text, str):
+        return 0
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _rank_value(row: Any) -> float:
+    """Ranking value of a list row (higher = more important)."""
+    if not isinstance(row, dict):
+        return 0.0
+
+    fields: Dict[str, Any] = {}
+    for key, value in row.items():
+        if isinstance(value, dict):
+            for nested_key, nested_value in value.items():
+                fields.setdefault(nested_key.replace("_", "").lower(), nested_value)
+        else:
+            fields[key.replace("_", "").lower()] = value
+
+    for field in RANK_FIELDS:
+        number = _to_float(fields.get(field))
+        if number is not None:
+            return number
+
+    return 0.0
+
+
+def trim_lists(value: Any, top_k: int, path: str = "", trimmed: Optional[Dict[str, int]] = None) -> Tuple[Any, Dict[str, int]]:
+    """
+    Cut every list longer than top_k to its top_k rows by spend.
+
+    Lists of dicts are ranked by RANK_FIELDS; other lists keep their
+    first top_k items.
+
+    Args:
+        value: Data to trim (not modified)
+        top_k: Max items per list
+        path: Path of value inside the root (for the trimmed report)
+        trimmed: Accumulator of {path: original_length}
+
+    Returns:
+        (trimmed copy, {path: original_length} of every cut list)
+    """
+    if trimmed is None:
+        trimmed = {}
+
+    if isinstance(value, dict):
+        return {
+            key: trim_lists(item, top_k, f"{path}.{key}" if path else str(key), trimmed)[0]
+            for key, item in value.items()
+        }, trimmed
+
+    if isinstance(value, list):
+        items = value
+        if len(items) > top_k:
+            trimmed[path] = len(items)
+            if any(isinstance(item, dict) for item in items):
+                items = sorted(items, key=_rank_value, reverse=True)
+            items = items[:top_k]
+        return [trim_lists(item, top_k, f"{path}[]", trimmed)[0] for item in items], trimmed
+
+    return value, trimmed
+
+
+def build_prompt_payload(
+    data: Any,
+    max_tokens: Optional[int] = None,
+    top_k: Optional[int] = None
+) -> str:
+    """
+    Serialise data for a prompt within a token budget.
+
+    Lists are trimmed to the top_k rows by spend, halving top_k until the
+    compact JSON fits max_tokens. A "_trimmed" entry tells the model which
+    lists were cut and how long they were.
+
+    Args:
+        data: Data to serialise
+        max_tokens: Token budget (defaults to LLM_PROMPT_MAX_TOKENS)
+        top_k: Initial max rows per list (defaults to LLM_PROMPT_TOP_K)
+
+    Returns:
+        JSON string
+    """
+    max_tokens = max_tokens or int(os.getenv("LLM_PROMPT_MAX_TOKENS", "6000"))
+    top_k = top_k or int(os.getenv("LLM_PROMPT_TOP_K", "20"))
+
+    while True:
+        payload, trimmed = trim_lists(data, top_k)
+        if trimmed and isinstance(payload, dict):
+            payload = {**payload, "_trimmed": {path: f"top {top_k} of {n}" for path, n in trimmed.items()}}
+
+        text = json.dumps(payload, default=str, ensure_ascii=False, separators=(",", ":"))
+        if estimate_tokens(text) <= max_tokens or top_k <= 1:
+            break
+        top_k = max(1, top_k // 2)
+
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) > max_chars:
+        text = text[:max_chars] + "...(truncated)"
+
+    return text
+
+
+# =============================================================================
+# EXECUTOR
+# =============================================================================
+
+class LLMExecutor:
+    """
+    Runs Claude Agent SDK queries under a concurrency cap with timeouts and retries.
+
+    Usage:
+        executor = LLMExecutor(max_concurrency=4)
+        text = await executor.run(prompt, label="meta_ads")
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        cache: Optional[LLMResponseCache] = None
+    ):
+        """
+        Initialize executor.
+
+        Args:
+            max_concurrency: Max queries in flight (defaults to LLM_MAX_CONCURRENCY)
+            timeout: Seconds per attempt (defaults to LLM_TIMEOUT)
+            max_retries: Retries after a failed or timed out attempt (defaults to LLM_MAX_RETRIES)
+            cache: Response cache (defaults to the global LLM_CACHE_BACKEND cache)
+        """
+        self.max_concurrency = max_concurrency or int(os.getenv("LLM_MAX_CONCURRENCY", "4"))
+        self.timeout = timeout or float(os.getenv("LLM_TIMEOUT", "180"))
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv("LLM_MAX_RETRIES", "2"))
+        self.cache = cache if cache is not None else get_llm_response_cache()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.in_flight = 0
+
+        # Stats
+        self.requests = 0
+        self.retries = 0
+        self.timeouts = 0
+        self.failures = 0
+        self.peak_in_flight = 0
+        self.prompt_tokens = 0
+        self.cache_hits = 0
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Semaphores are loop-bound; recreate when used from a new event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self.in_flight = 0
+        return self._semaphore
+
+    async def _query_once(self, prompt: str, options) -> str:
+        response = ""
+        async for msg in query(prompt=prompt, options=options):
+            if hasattr(msg, 'content'):
+                for block in msg.content:
+                    if hasattr(block, 'text'):
+                        response += block.text
+        return response
+
+    async def run(
+        self,
+        prompt: Any,
+        options=None,
+        timeout: Optional[float] = None,
+        label: Optional[str] = None,
+        use_cache: bool = True,
+        cache_ttl: Optional[int] = None,
+        max_retries: Optional[int] = None
+    ) -> str:
+        """
+        Run a single-turn query and return the concatenated text response.
+
+        Args:
+            prompt: Prompt text (or structured message content)
+            options: ClaudeAgentOptions (defaults to max_turns=1, bypassPermissions)
+            timeout: Seconds per attempt (defaults to self.timeout)
+            label: Name used in logs (e.g. source name)
+            use_cache: Read/write the response cache (opt out when a fresh
+                answer is wanted, e.g. regenerating after a quality check)
+            cache_ttl: Cache TTL in seconds for this response (defaults to LLM_CACHE_TTL)
+            max_retries: Retries for this call (defaults to self.max_retries). Pass 0
+                from Temporal activities that leave retries to their RetryPolicy, so
+                timeout x attempts stays inside start_to_close_timeout
+
+        Returns:
+            Response text (may be empty)
+
+        Raises:
+            RuntimeError: If the Claude SDK is not available
+            Exception: Last error after all retries failed
+        """
+        if not CLAUDE_SDK_AVAILABLE:
+            raise RuntimeError("Claude SDK not available")
+
+        if options is None:
+            options = ClaudeAgentOptions(
+                max_turns=1,
+                permission_mode="bypassPermissions"
+            )
+
+        timeout = timeout or self.timeout
+        max_retries = max_retries if max_retries is not None else self.max_retries
+        self.requests += 1
+
+        cache_params = {
+            "model": getattr(options, "model", None),
+            "system_prompt": getattr(options, "system_prompt", None),
+            "temperature": getattr(options, "temperature", None),
+        }
+        if use_cache:
+            cached = await self.cache.get(prompt, **cache_params)
+            if cached is not None:
+                self.cache_hits += 1
+                logger.info("llm_response_replayed_from_cache", label=label)
+                return cached
+
+        self.prompt_tokens += estimate_tokens(prompt)
+        semaphore = self._get_semaphore()
+
+        last_error: Optional[BaseException] = None
+        for attempt in range(max_retries + 1):
+            if attempt > 0:
+                self.retries += 1
+                await asyncio.sleep(min(2 ** attempt, 30))
+
+            async with semaphore:
+                self.in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+                started = time.time()
+
+                try:
+                    response = await asyncio.wait_for(self._query_once(prompt, options), timeout=timeout)
+                    logger.debug(
+                        "llm_query_complete",
+                        label=label,
+                        attempt=attempt + 1,
+                        duration_seconds=round(time.time() - started, 2),
+                        prompt_tokens=estimate_tokens(prompt)
+                    )
+                    break
+
+                except asyncio.TimeoutError as e:
+                    self.timeouts += 1
+                    last_error = e
+                    logger.warning("llm_query_timeout", label=label, attempt=attempt + 1, timeout=timeout)
+
+                except Exception as e:
+                    last_error = e
+                    logger.warning("llm_query_failed", label=label, attempt=attempt + 1, error=str(e))
+
+                finally:
+                    self.in_flight -= 1
+        else:
+            self._give_up(label, timeout, max_retries + 1, last_error)
+
+        if use_cache:
+            await self.cache.set(prompt, response, ttl=cache_ttl, **cache_params)
+
+        return response
+
+    def _give_up(self, label: Optional[str], timeout: float, attempts: int, last_error: BaseException):
+        self.failures += 1
+        logger.error("llm_query_gave_up", label=label, attempts=attempts, error=str(last_error))
+
+        if isinstance(last_error, asyncio.TimeoutError):
+            raise TimeoutError(f"LLM query timed out after {timeout:.0f}s ({attempts} attempts)")
+        raise last_error
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get executor statistics."""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "requests": self.requests,
+            "retries": self.retries,
+            "timeouts": self.timeouts,
+            "failures": self.failures,
+            "peak_in_flight": self.peak_in_flight,
+            "prompt_tokens_estimated": self.prompt_tokens,
+            "cache_hits": self.cache_hits,
+            "cache": self.cache.get_stats(),
+        }
+
+
+# Global instance shared by all graphs in the process
+_llm_executor: Optional[LLMExecutor] = None
+
+
+def get_llm_executor() -> LLMExecutor:
+    """Get or create the global LLM executor."""
+    global _llm_executor
+
+    if _llm_executor is None:
+        _llm_executor = LLMExecutor()
+
+    return _llm_executor
@@ -0,0 +1,236 @@
+"""
+Metrics History
+===============
+
+Compact time-series store of per-source daily analytics totals.
+
+DailyAnalyticsGraph.save_data_node records one row per (brand, source,
+period, metric, day). DataValidatorGraph reads rolling baselines from it
+so the ANOMALY_RULES in validation_rules.py have something to compare
+against:
+
+- avg_<metric>: rolling average over the lookback window
+- std_<metric>: standard deviation over the same window
+- weekday_avg_<metric>: average of the same weekday only
+
+Totals are only comparable for equal windows (a 7-day spend total vs a
+30-day one), so baselines are filtered on period_days.
+
+Usage:
+    from langgraph_agents.metrics_history import get_metrics_history
+
+    history = get_metrics_history()
+    await history.record("pomandi", "2026-01-15", 7, raw_data)
+    baselines = await history.get_baselines("pomandi", period_days=7)
+    baselines["google_ads"]["avg_spend"]
+"""
+
+import os
+import math
+import asyncio
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+import structlog
+
+from sqlite_db import SQLiteDatabase
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_HISTORY_DB = Path(__file__).parent.parent / "agent_outputs" / "daily_analytics" / "metrics_history.sqlite3"
+
+# Source field -> metric name used in baselines (avg_<name>, std_<name>, ...)
+HISTORY_METRICS: Dict[str, str] = {
+    "total_spend": "spend",
+    "total_clicks": "clicks",
+    "total_impressions": "impressions",
+    "total_conversions": "conversions",
+    "total_revenue": "revenue",
+    "total_orders": "orders",
+    "total_sessions": "sessions",
+    "sessions": "sessions",
+    "total_appointments": "appointments",
+    "disapproved_products": "disapproved",
+    "avg_position": "position",
+}
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS daily_metrics (
+        brand TEXT NOT NULL,
+        source TEXT NOT NULL,
+        period_days INTEGER NOT NULL,
+        metric TEXT NOT NULL,
+        day TEXT NOT NULL,
+        value REAL NOT NULL,
+        PRIMARY KEY (brand, source, period_days, metric, day)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_daily_metrics_brand_day ON daily_metrics (brand, period_days, day)",
+]
+
+
+def extract_metrics(source_data: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Pick the tracked numeric totals out of a source's data dict.
+
+    Args:
+        source_data: Data dict as produced by a fetch_*_node
+
+    Returns:
+        {metric_name: value}
+    """
+    metrics = {}
+    for field, name in HISTORY_METRICS.items():
+        value = source_data.get(field)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        metrics.setdefault(name, float(value))
+    return metrics
+
+
+class MetricsHistory:
+    """SQLite store of per-source daily totals with baseline queries."""
+
+    def __init__(self, path: Optional[str] = None, min_samples: Optional[int] = None):
+        """
+        Initialize metrics history.
+
+        Args:
+            path: SQLite file (defaults to METRICS_HISTORY_DB_PATH env var)
+            min_samples: Days of history needed before a baseline is reported
+                (defaults to METRICS_HISTORY_MIN_SAMPLES)
+        """
+        self.path = Path(path or os.getenv("METRICS_HISTORY_DB_PATH", str(DEFAULT_HISTORY_DB)))
+        self.min_samples = min_samples or int(os.getenv("METRICS_HISTORY_MIN_SAMPLES", "3"))
+        self._db = SQLiteDatabase(self.path, _SCHEMA)
+
+    def _write(self, rows):
+        conn = self._db.connect()
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO daily_metrics (brand, source, period_days, metric, day, value) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _query_baselines(self, brand: str, period_days: int, start: str, end: str, weekday: str):
+        conn = self._db.connect()
+        try:
+            return conn.execute(
+                """
+                SELECT source, metric,
+                       COUNT(*), AVG(value), AVG(value * value),
+                       AVG(CASE WHEN strftime('%w', day) = ? THEN value END)
+                FROM daily_metrics
+                WHERE brand = ? AND period_days = ? AND day >= ? AND day < ?
+                GROUP BY source, metric
+                """,
+                (weekday, brand, period_days, start, end)
+            ).fetchall()
+        finally:
+            conn.close()
+
+    async def record(
+        self,
+        brand: str,
+        day: str,
+        period_days: int,
+        raw_data: Dict[str, Dict[str, Any]]
+    ) -> int:
+        """
+        Record the totals of one analytics run.
+
+        Sources with an error are skipped. Re-running the same day overwrites it.
+
+        Args:
+            brand: Brand name
+            day: Collection date (YYYY-MM-DD)
+            period_days: Window length the totals cover
+            raw_data: Source name -> source data dict
+
+        Returns:
+            Number of metric values stored
+        """
+        rows = []
+        for source, source_data in raw_data.items():
+            if not isinstance(source_data, dict) or source_data.get("error"):
+                continue
+            for metric, value in extract_metrics(source_data).items():
+                rows.append((brand, source, period_days, metric, day, value))
+
+        if not rows:
+            return 0
+
+        try:
+            await asyncio.to_thread(self._write, rows)
+            logger.debug("metrics_history_recorded", brand=brand, day=day, values=len(rows))
+            return len(rows)
+        except Exception as e:
+            logger.error("metrics_history_record_failed", brand=brand, error=str(e))
+            return 0
+
+    async def get_baselines(
+        self,
+        brand: str,
+        period_days: int,
+        lookback_days: int = 30,
+        as_of: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get rolling baselines per source.
+
+        The as_of day itself is excluded so a run is never compared with
+        its own totals.
+
+        Args:
+            brand: Brand name
+            period_days: Window length of the totals to compare
+            lookback_days: Days of history to average over
+            as_of: Reference date (YYYY-MM-DD, defaults to today)
+
+        Returns:
+            {source: {"avg_spend": ..., "std_spend": ..., "weekday_avg_spend": ..., "samples": n}}
+        """
+        end = date.fromisoformat(as_of) if as_of else date.today()
+        start = end - timedelta(days=lookback_days)
+        # SQLite %w: 0 = Sunday
+        weekday = str((end.weekday() + 1) % 7)
+
+        try:
+            rows = await asyncio.to_thread(
+                self._query_baselines, brand, period_days, start.isoformat(), end.isoformat(), weekday
+            )
+        except Exception as e:
+            logger.error("metrics_history_query_failed", brand=brand, error=str(e))
+            return {}
+
+        baselines: Dict[str, Dict[str, Any]] = {}
+        for source, metric, count, mean, mean_sq, weekday_mean in rows:
+            if count < self.min_samples:
+                continue
+            source_baseline = baselines.setdefault(source, {"samples": 0})
+            source_baseline["samples"] = max(source_baseline["samples"], count)
+            source_baseline[f"avg_{metric}"] = mean
+            source_baseline[f"std_{metric}"] = math.sqrt(max(mean_sq - mean * mean, 0.0))
+            if weekday_mean is not None:
+                source_baseline[f"weekday_avg_{metric}"] = weekday_mean
+
+        return baselines
+
+
+# Global instance (lazy initialized)
+_metrics_history: Optional[MetricsHistory] = None
+
+
+def get_metrics_history() -> MetricsHistory:
+    """Get or create the global metrics history."""
+    global _metrics_history
+
+    if _metrics_history is None:
+        _metrics_history = MetricsHistory()
+
+    return _metrics_history
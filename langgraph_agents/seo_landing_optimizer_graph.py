@@ -31,6 +31,7 @@ import structlog
 
 from .base_graph import BaseAgentGraph
 from .state_schemas import SEOLandingOptimizerState, init_seo_landing_optimizer_state
+from .clients.mcp_session_pool import get_mcp_session_pool
 
 logger = structlog.get_logger(__name__)
 
@@ -39,8 +40,7 @@ MCP_SDK_AVAILABLE = False
 _mcp_import_error = None
 
 try:
-    from mcp import ClientSession, StdioServerParameters
-    from mcp.client.stdio import stdio_client
+    import mcp  # noqa: F401 - sessions are managed by the MCP session pool
     MCP_SDK_AVAILABLE = True
 except ImportError as e:
     _mcp_import_error = str(e)
@@ -251,59 +251,47 @@ ALLEEN JSON TERUGGEVEN, GEEN ANDERE TEKST."""
             return error_detail
 
         try:
-            # Create server parameters with INHERITED ENVIRONMENT
-            # This is critical for passing credentials (GOOGLE_CREDENTIALS_JSON etc.)
-            server_params = StdioServerParameters(
-                command="python3",
-                args=[str(server_path)],
-                env=os.environ.copy()  # IMPORTANT: Pass environment variables!
+            # Call tool on the pooled server session (the pool starts servers
+            # with the inherited environment, e.g. GOOGLE_CREDENTIALS_JSON)
+            logger.debug("mcp_tool_calling", server=server_name, tool=tool_name, args=arguments)
+            result = await get_mcp_session_pool().call_tool(
+                server_name, server_path, tool_name, arguments, idempotent=True
             )
-
-            logger.info("mcp_connecting", server=server_name, path=str(server_path))
-
-            async with stdio_client(server_params) as (read, write):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
-                    logger.info("mcp_session_initialized", server=server_name)
-
-                    # Call tool
-                    logger.debug("mcp_tool_calling", server=server_name, tool=tool_name, args=arguments)
-                    result = await session.call_tool(tool_name, arguments)
-                    logger.debug("mcp_tool_success", server=server_name, tool=tool_name)
-
-                    # Parse result
-                    if result.content:
-                        for content in result.content:
-                            if hasattr(content, 'text'):
-                                try:
-                                    parsed = json.loads(content.text)
-                                    # Check if MCP server returned an error
-                                    if isinstance(parsed, dict) and "Error:" in str(parsed.get("error", "")):
-                                        return {
-                                            "error": parsed.get("error", content.text),
-                                            "error_type": "MCP_SERVER_ERROR",
-                                            "server": server_name,
-                                            "tool": tool_name,
-                                            "raw_response": content.text[:500]
-                                        }
-                                    return parsed
-                                except json.JSONDecodeError:
-                                    # Check if it's an error message
-                                    if content.text.startswith("Error:"):
-                                        return {
-                                            "error": content.text,
-                                            "error_type": "MCP_SERVER_ERROR",
-                                            "server": server_name,
-                                            "tool": tool_name
-                                        }
-                                    return {"result": content.text}
-
-                    return {
-                        "error": "No content returned from MCP server",
-                        "error_type": "EMPTY_RESPONSE",
-                        "server": server_name,
-                        "tool": tool_name
-                    }
+            logger.debug("mcp_tool_success", server=server_name, tool=tool_name)
+
+            # Parse result
+            if result.content:
+                for content in result.content:
+                    if hasattr(content, 'text'):
+                        try:
+                            parsed = json.loads(content.text)
+                            # Check if MCP server returned an error
+                            if isinstance(parsed, dict) and "Error:" in str(parsed.get("error", "")):
+                                return {
+                                    "error": parsed.get("error", content.text),
+                                    "error_type": "MCP_SERVER_ERROR",
+                                    "server": server_name,
+                                    "tool": tool_name,
+                                    "raw_response": content.text[:500]
+                                }
+                            return parsed
+                        except json.JSONDecodeError:
+                            # Check if it's an error message
+                            if content.text.startswith("Error:"):
+                                return {
+                                    "error": content.text,
+                                    "error_type": "MCP_SERVER_ERROR",
+                                    "server": server_name,
+                                    "tool": tool_name
+                                }
+                            return {"result": content.text}
+
+            return {
+                "error": "No content returned from MCP server",
+                "error_type": "EMPTY_RESPONSE",
+                "server": server_name,
+                "tool": tool_name
+            }
 
         except Exception as e:
             error_detail = {
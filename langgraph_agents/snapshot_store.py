@@ -0,0 +1,235 @@
+"""
+Source Snapshot Store
+=====================
+
+Per-source, per-day snapshot store for incremental analytics fetching.
+
+Daily reports cover a trailing window (7, 14 or 30 days) that mostly
+overlaps the previous run. Day-level rows are stored in SQLite under
+agent_outputs/, so a fetch node only requests the days that are missing
+or still settling and merges the rest from the store.
+
+A day is "settled" once it has been fetched at least SNAPSHOT_SETTLE_DAYS
+after it ended (ad platforms and GA4 keep revising recent days for a
+day or two). Unsettled days are refetched on every run; today is never
+settled.
+
+Usage:
+    from langgraph_agents.snapshot_store import get_snapshot_store
+
+    store = get_snapshot_store()
+    fetch_from = await store.first_unsettled_day("ga4", "traffic", start, end)
+    if fetch_from is not None:
+        rows = await fetch_rows(days=(end - fetch_from).days)
+        await store.put_days("ga4", "traffic", rows, start=fetch_from, end=end)
+    rows = await store.get_days("ga4", "traffic", start, end)
+"""
+
+import os
+import json
+import asyncio
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+import structlog
+
+from sqlite_db import SQLiteDatabase
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_SNAPSHOT_DB = Path(__file__).parent.parent / "agent_outputs" / "daily_analytics" / "snapshots.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS source_snapshots (
+    source TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    day TEXT NOT NULL,
+    payload TEXT,
+    fetched_on TEXT NOT NULL,
+    PRIMARY KEY (source, kind, day)
+)
+"""
+
+
+def _date_range(start: date, end: date):
+    day = start
+    while day <= end:
+        yield day
+        day += timedelta(days=1)
+
+
+class SourceSnapshotStore:
+    """
+    SQLite store of day-level source rows keyed by (source, kind, day).
+
+    Days that were fetched but had no data are stored with a NULL payload,
+    so they count as covered without appearing in merged results.
+    """
+
+    def __init__(self, path: Optional[str] = None, settle_days: Optional[int] = None):
+        """
+        Initialize snapshot store.
+
+        Args:
+            path: SQLite file (defaults to SNAPSHOT_DB_PATH env var)
+            settle_days: Days after which a day's data is final (defaults to SNAPSHOT_SETTLE_DAYS)
+        """
+        self.path = Path(path or os.getenv("SNAPSHOT_DB_PATH", str(DEFAULT_SNAPSHOT_DB)))
+        self.settle_days = settle_days if settle_days is not None else int(os.getenv("SNAPSHOT_SETTLE_DAYS", "2"))
+        self._db = SQLiteDatabase(self.path, [_SCHEMA])
+
+        # Stats
+        self.days_fetched = 0
+
+    def _read_days(self, source: str, kind: str, start: date, end: date) -> Dict[str, tuple]:
+        conn = self._db.connect()
+        try:
+            rows = conn.execute(
+                "SELECT day, payload, fetched_on FROM source_snapshots "
+                "WHERE source = ? AND kind = ? AND day BETWEEN ? AND ?",
+                (source, kind, start.isoformat(), end.isoformat())
+            ).fetchall()
+        finally:
+            conn.close()
+        return {day: (payload, fetched_on) for day, payload, fetched_on in rows}
+
+    def _write_days(self, source: str, kind: str, entries: Dict[str, Optional[str]], fetched_on: str):
+        conn = self._db.connect()
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO source_snapshots (source, kind, day, payload, fetched_on) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(source, kind, day, payload, fetched_on) for day, payload in entries.items()]
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _is_settled(self, day: str, fetched_on: str) -> bool:
+        return date.fromisoformat(fetched_on) >= date.fromisoformat(day) + timedelta(days=self.settle_days)
+
+    async def first_unsettled_day(
+        self,
+        source: str,
+        kind: str,
+        start: date,
+        end: date
+    ) -> Optional[date]:
+        """
+        Find the earliest day in [start, end] that has to be fetched.
+
+        Args:
+            source: Source name (e.g. "ga4")
+            kind: Dataset within the source (e.g. "traffic")
+            start: First day of the window
+            end: Last day of the window (usually today)
+
+        Returns:
+            Earliest missing or unsettled day, or None if the window is fully stored
+        """
+        try:
+            stored = await asyncio.to_thread(self._read_days, source, kind, start, end)
+        except Exception as e:
+            logger.error("snapshot_read_failed", source=source, kind=kind, error=str(e))
+            return start
+
+        for day in _date_range(start, end):
+            entry = stored.get(day.isoformat())
+            if entry is None or not self._is_settled(day.isoformat(), entry[1]):
+                return day
+        return None
+
+    async def put_days(
+        self,
+        source: str,
+        kind: str,
+        rows: Dict[str, Any],
+        start: date,
+        end: date
+    ):
+        """
+        Store the rows of a fetched range.
+
+        Days in [start, end] without a row are stored as empty so they
+        aren't fetched again once settled.
+
+        Args:
+            source: Source name
+            kind: Dataset within the source
+            rows: {YYYY-MM-DD: row} for the fetched days
+            start: First fetched day
+            end: Last fetched day
+        """
+        entries = {day.isoformat(): None for day in _date_range(start, end)}
+        for day, row in rows.items():
+            entries[day] = json.dumps(row, default=str)
+
+        try:
+            await asyncio.to_thread(self._write_days, source, kind, entries, date.today().isoformat())
+            self.days_fetched += len(entries)
+        except Exception as e:
+            logger.error("snapshot_write_failed", source=source, kind=kind, error=str(e))
+
+    async def get_days(
+        self,
+        source: str,
+        kind: str,
+        start: date,
+        end: date
+    ) -> Dict[str, Any]:
+        """
+        Get stored rows for [start, end].
+
+        Returns:
+            {YYYY-MM-DD: row} ordered by day (days without data omitted)
+        """
+        try:
+            stored = await asyncio.to_thread(self._read_days, source, kind, start, end)
+        except Exception as e:
+            logger.error("snapshot_read_failed", source=source, kind=kind, error=str(e))
+            return {}
+
+        return {
+            day: json.loads(payload)
+            for day, (payload, _) in sorted(stored.items())
+            if payload is not None
+        }
+
+    async def prune(self, keep_days: int = 400):
+        """Delete snapshots older than keep_days."""
+        cutoff = (date.today() - timedelta(days=keep_days)).isoformat()
+
+        def _prune():
+            conn = self._db.connect()
+            try:
+                conn.execute("DELETE FROM source_snapshots WHERE day < ?", (cutoff,))
+                conn.commit()
+            finally:
+                conn.close()
+
+        try:
+            await asyncio.to_thread(_prune)
+        except Exception as e:
+            logger.error("snapshot_prune_failed", error=str(e))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics."""
+        return {
+            "path": str(self.path),
+            "settle_days": self.settle_days,
+            "days_fetched": self.days_fetched,
+        }
+
+
+# Global instance (lazy initialized)
+_snapshot_store: Optional[SourceSnapshotStore] = None
+
+
+def get_snapshot_store() -> SourceSnapshotStore:
+    """Get or create the global snapshot store."""
+    global _snapshot_store
+
+    if _snapshot_store is None:
+        _snapshot_store = SourceSnapshotStore()
+
+    return _snapshot_store
@@ -0,0 +1,304 @@
+"""
+Batch Rule Evaluation
+=====================
+
+Vectorized evaluation of CROSS_SOURCE_RULES and ANOMALY_RULES over many days.
+
+run_cross_source_validation / run_anomaly_detection check one brand-day at
+a time. For backtesting and rule tuning, the saved daily outputs are loaded
+into a columnar MetricFrame (one NumPy array per source field, one slot per
+calendar day) and every rule's "vectorized" expression is evaluated over
+the whole history at once.
+
+Anomaly baselines are rolling averages over the previous lookback_days
+days, matching what MetricsHistory.get_baselines returns at run time.
+
+The result is a RuleMatrix: a rule x day boolean failure matrix.
+
+Usage:
+    from langgraph_agents.validation_batch import load_daily_outputs, evaluate_rules_batch
+
+    frames = load_daily_outputs(period_days=7)
+    matrix = evaluate_rules_batch(frames["pomandi"])
+    matrix.failure_counts()
+    matrix.failing_days("google_ads.sudden_spend_spike")
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import structlog
+
+from .validation_rules import CROSS_SOURCE_RULES, ANOMALY_RULES, NUMPY_AVAILABLE
+from .metrics_history import HISTORY_METRICS
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+logger = structlog.get_logger(__name__)
+
+DAILY_OUTPUTS_DIR = Path(__file__).parent.parent / "agent_outputs" / "daily_analytics"
+
+
+class ColumnView:
+    """Dict-like view over a source's columns; get() returns whole-history arrays."""
+
+    def __init__(self, columns: Dict[str, "np.ndarray"], size: int):
+        self.columns = columns
+        self.size = size
+
+    def get(self, field: str, default: float = 0.0) -> "np.ndarray":
+        """Column values, with default wherever the field was missing."""
+        column = self.columns.get(field)
+        if column is None:
+            return np.full(self.size, float(default))
+        return np.where(np.isnan(column), default, column)
+
+
+class MetricFrame:
+    """
+    Columnar per-source metrics over a dense range of calendar days.
+
+    Attributes:
+        days: datetime64[D] array, one slot per calendar day
+        columns: {source: {field: float array}} (NaN = missing)
+        present: {source: bool array} - source had a non-empty dict that day
+        valid: {source: bool array} - present without error / skip marker
+    """
+
+    def __init__(self, days, columns, present, valid):
+        self.days = days
+        self.columns = columns
+        self.present = present
+        self.valid = valid
+
+    @property
+    def size(self) -> int:
+        return len(self.days)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Tuple[str, Dict[str, Dict[str, Any]]]]) -> "MetricFrame":
+        """
+        Build a frame from (YYYY-MM-DD, raw_data) records.
+
+        Numeric top-level fields of each source dict become columns. Days
+        without a record stay empty; a later record for the same day wins.
+
+        Args:
+            records: Iterable of (day, {source: source_data})
+
+        Returns:
+            MetricFrame
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy is required for batch rule evaluation")
+
+        by_day = {date.fromisoformat(day): raw_data for day, raw_data in records}
+        if not by_day:
+            return cls(np.array([], dtype="datetime64[D]"), {}, {}, {})
+
+        start = np.datetime64(min(by_day), "D")
+        size = int((np.datetime64(max(by_day), "D") - start).astype(int)) + 1
+        days = start + np.arange(size)
+
+        columns: Dict[str, Dict[str, np.ndarray]] = {}
+        present: Dict[str, np.ndarray] = {}
+        valid: Dict[str, np.ndarray] = {}
+
+        for day, raw_data in by_day.items():
+            index = int((np.datetime64(day, "D") - start).astype(int))
+            for source, source_data in (raw_data or {}).items():
+                if not isinstance(source_data, dict) or not source_data:
+                    continue
+                if source not in present:
+                    present[source] = np.zeros(size, dtype=bool)
+                    valid[source] = np.zeros(size, dtype=bool)
+                    columns[source] = {}
+                present[source][index] = True
+                valid[source][index] = not (source_data.get("error") or source_data.get("_skipped"))
+
+                for field, value in source_data.items():
+                    if isinstance(value, bool) or not isinstance(value, (int, float)):
+                        continue
+                    if field not in columns[source]:
+                        columns[source][field] = np.full(size, np.nan)
+                    columns[source][field][index] = value
+
+        return cls(days, columns, present, valid)
+
+    def view(self, source: str) -> ColumnView:
+        """Column view of one source (all-missing if the source never appeared)."""
+        return ColumnView(self.columns.get(source, {}), self.size)
+
+    def rolling_baselines(self, source: str, lookback_days: int = 30, min_samples: int = 3) -> ColumnView:
+        """
+        Rolling avg_<metric> baselines per day, excluding the day itself.
+
+        Only valid days count as samples (as with MetricsHistory.record);
+        days with fewer than min_samples get 0 (= no baseline).
+
+        Args:
+            source: Source name
+            lookback_days: Calendar days before each day to average over
+            min_samples: Samples needed for a baseline
+
+        Returns:
+            ColumnView with avg_<metric> columns
+        """
+        source_columns = self.columns.get(source, {})
+        valid = self.valid.get(source, np.zeros(self.size, dtype=bool))
+        baselines: Dict[str, np.ndarray] = {}
+
+        for field, name in HISTORY_METRICS.items():
+            key = f"avg_{name}"
+            if field not in source_columns or key in baselines:
+                continue
+
+            values = source_columns[field]
+            sampled = valid & ~np.isnan(values)
+            sums = np.concatenate(([0.0], np.cumsum(np.where(sampled, values, 0.0))))
+            counts = np.concatenate(([0], np.cumsum(sampled)))
+
+            index = np.arange(self.size)
+            window_start = np.maximum(index - lookback_days, 0)
+            window_sum = sums[index] - sums[window_start]
+            window_count = counts[index] - counts[window_start]
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                baselines[key] = np.where(window_count >= min_samples, window_sum / np.maximum(window_count, 1), 0.0)
+
+        return ColumnView(baselines, self.size)
+
+
+@dataclass
+class RuleMatrix:
+    """Rule x day failure matrix (True = rule failed that day)."""
+    rule_ids: List[str]
+    days: Any
+    failures: Any
+
+    def failure_counts(self) -> Dict[str, int]:
+        """Failed days per rule."""
+        return {rule_id: int(count) for rule_id, count in zip(self.rule_ids, self.failures.sum(axis=1))}
+
+    def failing_days(self, rule_id: str) -> List[str]:
+        """Days (YYYY-MM-DD) on which a rule failed."""
+        row = self.failures[self.rule_ids.index(rule_id)]
+        return [str(day) for day in self.days[row]]
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        """{rule_id: failing days} for rules that failed at least once."""
+        return {
+            rule_id: self.failing_days(rule_id)
+            for rule_id in self.rule_ids
+            if self.failures[self.rule_ids.index(rule_id)].any()
+        }
+
+
+def _evaluate(rule: Dict[str, Any], views: List[ColumnView], size: int) -> "np.ndarray":
+    """Evaluate a rule's vectorized check; a broken rule counts as passing (like the scalar runners)."""
+    try:
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            passed = np.broadcast_to(np.asarray(rule["vectorized"](*views), dtype=bool), (size,))
+        return ~passed
+    except Exception as e:
+        logger.error("batch_rule_evaluation_error", rule_id=rule["rule_id"], error=str(e))
+        return np.zeros(size, dtype=bool)
+
+
+def evaluate_rules_batch(
+    frame: MetricFrame,
+    lookback_days: int = 30,
+    min_samples: int = 3,
+    cross_source_rules: Optional[List[Dict[str, Any]]] = None,
+    anomaly_rules: Optional[List[Dict[str, Any]]] = None
+) -> RuleMatrix:
+    """
+    Evaluate cross-source and anomaly rules over every day of a frame.
+
+    Cross-source rows are "<rule_id>" and only fail on days where all the
+    rule's sources were present. Anomaly rows are "<source>.<rule_id>" and
+    only fail on days where the source was valid.
+
+    Args:
+        frame: MetricFrame of one brand
+        lookback_days: Baseline window for anomaly rules
+        min_samples: Samples needed for an anomaly baseline
+        cross_source_rules: Rules to run (defaults to CROSS_SOURCE_RULES)
+        anomaly_rules: Rules to run (defaults to ANOMALY_RULES)
+
+    Returns:
+        RuleMatrix
+    """
+    cross_source_rules = CROSS_SOURCE_RULES if cross_source_rules is None else cross_source_rules
+    anomaly_rules = ANOMALY_RULES if anomaly_rules is None else anomaly_rules
+
+    rule_ids: List[str] = []
+    rows: List[np.ndarray] = []
+    absent = np.zeros(frame.size, dtype=bool)
+
+    for rule in cross_source_rules:
+        if "vectorized" not in rule:
+            logger.warning("batch_rule_not_vectorized", rule_id=rule["rule_id"])
+            continue
+        sources = rule["sources"]
+        mask = np.logical_and.reduce([frame.present.get(s, absent) for s in sources])
+        rule_ids.append(rule["rule_id"])
+        rows.append(_evaluate(rule, [frame.view(s) for s in sources], frame.size) & mask)
+
+    for source in sorted(frame.present):
+        current = frame.view(source)
+        historical = frame.rolling_baselines(source, lookback_days, min_samples)
+        for rule in anomaly_rules:
+            if "vectorized" not in rule:
+                continue
+            rule_ids.append(f"{source}.{rule['rule_id']}")
+            rows.append(_evaluate(rule, [current, historical], frame.size) & frame.valid[source])
+
+    failures = np.vstack(rows) if rows else np.zeros((0, frame.size), dtype=bool)
+    return RuleMatrix(rule_ids=rule_ids, days=frame.days, failures=failures)
+
+
+def load_daily_outputs(
+    directory: Optional[str] = None,
+    brand: Optional[str] = None,
+    period_days: Optional[int] = None
+) -> Dict[str, MetricFrame]:
+    """
+    Load saved daily analytics JSON files into one MetricFrame per brand.
+
+    Reads agent_outputs/daily_analytics/YYYY-MM-DD_{brand}.json (backups
+    are skipped). Pass period_days when runs used different windows, since
+    totals of different windows aren't comparable.
+
+    Args:
+        directory: Output directory (defaults to agent_outputs/daily_analytics)
+        brand: Only load this brand
+        period_days: Only load runs with this window length
+
+    Returns:
+        {brand: MetricFrame}
+    """
+    records: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+
+    for path in sorted(Path(directory or DAILY_OUTPUTS_DIR).glob("*.json")):
+        if "_backup_" in path.name:
+            continue
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("daily_output_load_failed", path=str(path), error=str(e))
+            continue
+
+        metadata = data.get("metadata", {})
+        file_brand = metadata.get("brand")
+        if not file_brand or not metadata.get("collection_date") or (brand and file_brand != brand):
+            continue
+        if period_days is not None and metadata.get("period_days") != period_days:
+            continue
+
+        records.setdefault(file_brand, []).append((metadata["collection_date"], data.get("raw_data", {})))
+
+    return {name: MetricFrame.from_records(brand_records) for name, brand_records in records.items()}
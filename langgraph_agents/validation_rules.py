@@ -15,6 +15,10 @@ Usage:
     for rule in CROSS_SOURCE_RULES:
         if not rule["validation"](google_ads_data, shopify_data):
             print(f"Validation failed: {rule['message']}")
+
+Cross-source and anomaly rules also carry a "vectorized" form of the same
+check. It receives column views (get(field, default) returns a NumPy array
+over many days) and returns a boolean array; see validation_batch.py.
 """
 
 from typing import Dict, Any, List, Callable, Optional
@@ -22,9 +26,20 @@ from dataclasses import dataclass
 from enum import Enum
 import structlog
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 logger = structlog.get_logger(__name__)
 
 
+def _between(values, low, high):
+    """Vectorized chained comparison: low <= values <= high."""
+    return (low <= values) & (values <= high)
+
+
 class Severity(Enum):
     """Severity levels for validation failures."""
     CRITICAL = "critical"  # Stops processing, requires human review
@@ -77,6 +92,11 @@ CROSS_SOURCE_RULES: List[Dict[str, Any]] = [
             sh.get("total_orders", 0) == 0 or
             abs(ga.get("total_conversions", 0) - sh.get("total_orders", 0)) / max(sh.get("total_orders", 1), 1) < 0.5
         ),
+        "vectorized": lambda ga, sh: (
+            (ga.get("total_conversions") == 0) |
+            (sh.get("total_orders") == 0) |
+            (np.abs(ga.get("total_conversions") - sh.get("total_orders")) / np.maximum(sh.get("total_orders", 1), 1) < 0.5)
+        ),
         "tolerance": 0.5,  # 50% tolerance (some conversions may not result in orders)
         "severity": Severity.HIGH,
         "action": ValidationAction.WARN,
@@ -93,6 +113,11 @@ CROSS_SOURCE_RULES: List[Dict[str, Any]] = [
             sh.get("total_revenue", 0) == 0 or
             (0.1 <= (sh.get("total_revenue", 0) / max(ga.get("total_spend", 1), 0.01)) <= 15)
         ),
+        "vectorized": lambda ga, sh: (
+            (ga.get("total_spend") == 0) |
+            (sh.get("total_revenue") == 0) |
+            _between(sh.get("total_revenue") / np.maximum(ga.get("total_spend", 1), 0.01), 0.1, 15)
+        ),
         "tolerance": None,
         "severity": Severity.CRITICAL,
         "action": ValidationAction.WARN,
@@ -109,6 +134,11 @@ CROSS_SOURCE_RULES: List[Dict[str, Any]] = [
             vt.get("total_sessions", 0) == 0 or
             (ma.get("total_reach", 0) * 0.001 < vt.get("total_sessions", 0) < ma.get("total_reach", 0) * 0.5)
         ),
+        "vectorized": lambda ma, vt: (
+            (ma.get("total_reach") == 0) |
+            (vt.get("total_sessions") == 0) |
+            ((ma.get("total_reach") * 0.001 < vt.get("total_sessions")) & (vt.get("total_sessions") < ma.get("total_reach") * 0.5))
+        ),
         "tolerance": None,
         "severity": Severity.MEDIUM,
         "action": ValidationAction.LOG,
@@ -129,6 +159,15 @@ CROSS_SOURCE_RULES: List[Dict[str, Any]] = [
                 sh.get("average_order_value", 0)
             ) / sh.get("average_order_value", 1) < 0.7
         ),
+        "vectorized": lambda ga, sh: (
+            (ga.get("total_conversions") == 0) |
+            (sh.get("total_orders") == 0) |
+            (sh.get("average_order_value") == 0) |
+            (np.abs(
+                (ga.get("total_spend") * ga.get("roas") / np.maximum(ga.get("total_conversions", 1), 1)) -
+                sh.get("average_order_value")
+            ) / sh.get("average_order_value", 1) < 0.7)
+        ),
         "tolerance": 0.7,
         "severity": Severity.HIGH,
         "action": ValidationAction.WARN,
@@ -144,6 +183,10 @@ CROSS_SOURCE_RULES: List[Dict[str, Any]] = [
             ap.get("total_appointments", 0) == 0 or
             ap.get("with_visitor_id", 0) / max(ap.get("total_appointments", 1), 1) > 0.3
         ),
+        "vectorized": lambda ap, vt: (
+            (ap.get("total_appointments") == 0) |
+            (ap.get("with_visitor_id") / np.maximum(ap.get("total_appointments", 1), 1) > 0.3)
+        ),
         "tolerance": 0.3,  # At least 30% should have attribution
         "severity": Severity.MEDIUM,
         "action": ValidationAction.WARN,
@@ -160,6 +203,11 @@ CROSS_SOURCE_RULES: List[Dict[str, Any]] = [
             vt.get("total_sessions", 0) == 0 or
             abs(g4.get("sessions", 0) - vt.get("total_sessions", 0)) / max(g4.get("sessions", 1), 1) < 0.5
         ),
+        "vectorized": lambda g4, vt: (
+            (g4.get("sessions") == 0) |
+            (vt.get("total_sessions") == 0) |
+            (np.abs(g4.get("sessions") - vt.get("total_sessions")) / np.maximum(g4.get("sessions", 1), 1) < 0.5)
+        ),
         "tolerance": 0.5,
         "severity": Severity.MEDIUM,
         "action": ValidationAction.LOG,
@@ -174,6 +222,7 @@ CROSS_SOURCE_RULES: List[Dict[str, Any]] = [
         "validation": lambda ga, ma: (
             (ga.get("total_spend", 0) + ma.get("total_spend", 0)) < 10000  # Daily limit sanity check
         ),
+        "vectorized": lambda ga, ma: (ga.get("total_spend") + ma.get("total_spend")) < 10000,
         "tolerance": None,
         "severity": Severity.CRITICAL,
         "action": ValidationAction.BLOCK,
@@ -190,6 +239,7 @@ CROSS_SOURCE_RULES: List[Dict[str, Any]] = [
             len(sh.get("top_products", [])) == 0 or
             True  # Simplified - Shopify doesn't return total product count
         ),
+        "vectorized": lambda mc, sh: np.full(mc.size, True),
         "tolerance": 0.3,
         "severity": Severity.LOW,
         "action": ValidationAction.LOG,
@@ -212,6 +262,10 @@ ANOMALY_RULES: List[Dict[str, Any]] = [
             historical.get("avg_spend", 0) == 0 or
             current.get("total_spend", 0) <= historical.get("avg_spend", 0) * 2
         ),
+        "vectorized": lambda current, historical: (
+            (historical.get("avg_spend") == 0) |
+            (current.get("total_spend") <= historical.get("avg_spend") * 2)
+        ),
         "severity": Severity.HIGH,
         "action": ValidationAction.WARN,
         "message": "Spend (€{current_spend:.2f}) is 2x+ higher than average (€{avg_spend:.2f})",
@@ -225,6 +279,10 @@ ANOMALY_RULES: List[Dict[str, Any]] = [
             data.get("total_spend", 0) > 50 and
             data.get("total_conversions", 0) == 0
         ),
+        "vectorized": lambda data, hist: ~(
+            (data.get("total_spend") > 50) &
+            (data.get("total_conversions") == 0)
+        ),
         "severity": Severity.CRITICAL,
         "action": ValidationAction.WARN,
         "message": "€{spend:.2f} spent but 0 conversions",
@@ -238,6 +296,10 @@ ANOMALY_RULES: List[Dict[str, Any]] = [
             data.get("avg_ctr", 0) == 0 or
             (0.3 <= data.get("avg_ctr", 0) <= 20)
         ),
+        "vectorized": lambda data, hist: (
+            (data.get("avg_ctr") == 0) |
+            _between(data.get("avg_ctr"), 0.3, 20)
+        ),
         "severity": Severity.MEDIUM,
         "action": ValidationAction.LOG,
         "message": "CTR ({ctr:.2f}%) is outside normal range (0.5% - 15%)",
@@ -251,6 +313,10 @@ ANOMALY_RULES: List[Dict[str, Any]] = [
             historical.get("avg_disapproved", 0) == 0 or
             current.get("disapproved_products", 0) <= historical.get("avg_disapproved", 0) * 1.5
         ),
+        "vectorized": lambda current, historical: (
+            (historical.get("avg_disapproved") == 0) |
+            (current.get("disapproved_products") <= historical.get("avg_disapproved") * 1.5)
+        ),
         "severity": Severity.HIGH,
         "action": ValidationAction.WARN,
         "message": "Disapproved products ({current}) increased significantly from average ({avg})",
@@ -264,6 +330,10 @@ ANOMALY_RULES: List[Dict[str, Any]] = [
             data.get("median_session_duration", 60) == 0 or
             (5 <= data.get("median_session_duration", 60) <= 1800)
         ),
+        "vectorized": lambda data, hist: (
+            (data.get("median_session_duration", 60) == 0) |
+            _between(data.get("median_session_duration", 60), 5, 1800)
+        ),
         "severity": Severity.MEDIUM,
         "action": ValidationAction.LOG,
         "message": "Median session duration ({duration}s) seems unusual",
@@ -277,6 +347,10 @@ ANOMALY_RULES: List[Dict[str, Any]] = [
             historical.get("avg_revenue", 0) == 0 or
             current.get("total_revenue", 0) >= historical.get("avg_revenue", 0) * 0.5
         ),
+        "vectorized": lambda current, historical: (
+            (historical.get("avg_revenue") == 0) |
+            (current.get("total_revenue") >= historical.get("avg_revenue") * 0.5)
+        ),
         "severity": Severity.CRITICAL,
         "action": ValidationAction.WARN,
         "message": "Revenue (€{current:.2f}) dropped 50%+ from average (€{avg:.2f})",
@@ -290,6 +364,10 @@ ANOMALY_RULES: List[Dict[str, Any]] = [
             historical.get("avg_orders", 0) == 0 or
             (historical.get("avg_orders", 0) * 0.3 <= current.get("total_orders", 0) <= historical.get("avg_orders", 0) * 3)
         ),
+        "vectorized": lambda current, historical: (
+            (historical.get("avg_orders") == 0) |
+            _between(current.get("total_orders"), historical.get("avg_orders") * 0.3, historical.get("avg_orders") * 3)
+        ),
         "severity": Severity.HIGH,
         "action": ValidationAction.WARN,
         "message": "Order count ({current}) is unusual compared to average ({avg})",
@@ -303,6 +381,10 @@ ANOMALY_RULES: List[Dict[str, Any]] = [
             historical.get("avg_position", 0) == 0 or
             current.get("avg_position", 0) <= historical.get("avg_position", 0) + 5
         ),
+        "vectorized": lambda current, historical: (
+            (historical.get("avg_position") == 0) |
+            (current.get("avg_position") <= historical.get("avg_position") + 5)
+        ),
         "severity": Severity.MEDIUM,
         "action": ValidationAction.LOG,
         "message": "Average search position dropped from {hist_pos:.1f} to {current_pos:.1f}",
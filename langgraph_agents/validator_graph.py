@@ -36,6 +36,7 @@ import httpx
 
 from .base_graph import BaseAgentGraph
 from .duplicate_detector import DuplicateDetector
+from .metrics_history import get_metrics_history
 from memory.memory_hub_client import save_to_memory_hub
 from .validation_rules import (
     CROSS_SOURCE_RULES,
@@ -172,6 +173,10 @@ class DataValidatorGraph(BaseAgentGraph):
         # Output directory for validation results
         self._output_dir = Path(__file__).parent.parent / "agent_outputs" / "validation_results"
 
+    def reset(self):
+        """Forget hashes seen in earlier runs (instances may be pooled)."""
+        self.duplicate_detector.clear_cache()
+
     def build_graph(self) -> StateGraph:
         """Build validation graph with CONDITIONAL EDGES.
 
@@ -329,6 +334,7 @@ class DataValidatorGraph(BaseAgentGraph):
             dedup_stats = {"checked": 0, "duplicates_found": 0, "skipped": 0, "updated": 0}
             raw_data = state.get("raw_data", {})
 
+            check_list = []
             for source_name, source_data in raw_data.items():
                 dedup_stats["checked"] += 1
 
@@ -337,18 +343,19 @@ class DataValidatorGraph(BaseAgentGraph):
                     continue
 
                 # Prepare data for duplicate check
-                check_data = {
+                check_list.append({
                     "source": source_name,
                     "date": state.get("date"),
                     "brand": state.get("brand"),
                     "total_spend": source_data.get("total_spend", 0),
                     "total_clicks": source_data.get("total_clicks", 0),
                     "total_conversions": source_data.get("total_conversions", 0)
-                }
+                })
 
-                # Check for duplicate
-                dup_result = await self.duplicate_detector.check_duplicate(check_data)
+            # Check all sources in one batch (one round trip per layer)
+            dup_results = await self.duplicate_detector.batch_check_duplicates(check_list)
 
+            for source_name, dup_result in dup_results.items():
                 if dup_result["is_duplicate"]:
                     dedup_stats["duplicates_found"] += 1
 
@@ -445,7 +452,9 @@ class DataValidatorGraph(BaseAgentGraph):
             # Get historical context (if available)
             historical = await self._get_historical_context(
                 state["brand"],
-                days=30
+                days=30,
+                period_days=state["days"],
+                as_of=state["date"]
             )
             state["historical_context"] = historical
 
@@ -885,15 +894,29 @@ Report: {state.get('validation_report', 'No report')[:500]}
     async def _get_historical_context(
         self,
         brand: str,
-        days: int = 30
+        days: int = 30,
+        period_days: int = 7,
+        as_of: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Get historical averages for anomaly detection."""
-        try:
-            # Try to get from Memory-Hub
-            # TODO: Implement Memory-Hub query for historical data
+        """
+        Get historical baselines for anomaly detection.
 
-            # For now, return empty (anomaly detection will still work, just less accurate)
-            return {}
+        Args:
+            brand: Brand name
+            days: Lookback window in days
+            period_days: Window length of the totals being validated
+            as_of: Date being validated (excluded from the baseline)
+
+        Returns:
+            {source: {"avg_spend": ..., "std_spend": ..., ...}} (empty without history)
+        """
+        try:
+            return await get_metrics_history().get_baselines(
+                brand,
+                period_days=period_days,
+                lookback_days=days,
+                as_of=as_of
+            )
 
         except Exception as e:
             logger.warning("historical_context_fetch_failed", error=str(e))
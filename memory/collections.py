@@ -4,11 +4,30 @@ Qdrant Collection Schemas
 
 Defines vector database collections for different data types.
 Each collection stores embeddings + metadata for semantic search.
+
+Each config also carries a "storage" profile: small, hot collections stay
+fully in RAM, while large growing ones keep original vectors and payloads
+on disk with a quantized copy in RAM, and rescore oversampled candidates
+against the originals at search time.
 """
 
+import os
 from enum import Enum
-from typing import Dict, Any
-from qdrant_client.models import Distance, VectorParams
+from typing import Dict, Any, Optional
+from qdrant_client.models import (
+    Distance,
+    VectorParams,
+    HnswConfigDiff,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    BinaryQuantization,
+    BinaryQuantizationConfig
+)
+
+# Vector size for every collection. text-embedding-3 models accept reduced
+# `dimensions` (e.g. 512 or 768); this must match EmbeddingGenerator.
+EMBEDDING_DIMENSIONS = int(os.getenv("EMBEDDING_DIMENSIONS", "1536"))
 
 
 class CollectionName(str, Enum):
@@ -25,13 +44,36 @@ class CollectionName(str, Enum):
     ACTION_HISTORY = "action_history"
 
 
+# Storage profiles
+IN_MEMORY_STORAGE: Dict[str, Any] = {
+    "quantization": None,       # None, "scalar" (int8, ~4x less RAM) or "binary" (~32x)
+    "on_disk_payload": False,
+    "hnsw": None,               # HnswConfigDiff fields, None = Qdrant defaults
+    "oversampling": None        # Candidate multiplier rescored with original vectors
+}
+
+QUANTIZED_STORAGE: Dict[str, Any] = {
+    "quantization": "scalar",
+    "on_disk_payload": True,
+    "hnsw": {"m": 16, "ef_construct": 100},
+    "oversampling": 2.0
+}
+
+
+def _vectors(on_disk: bool = False) -> VectorParams:
+    """Vector params shared by all collections (cosine over EMBEDDING_DIMENSIONS)."""
+    return VectorParams(
+        size=EMBEDDING_DIMENSIONS,
+        distance=Distance.COSINE,
+        on_disk=on_disk
+    )
+
+
 # Collection configurations with vector params and schema
 COLLECTION_CONFIGS: Dict[CollectionName, Dict[str, Any]] = {
     CollectionName.INVOICES: {
-        "vectors_config": VectorParams(
-            size=1536,  # text-embedding-3-small dimensions
-            distance=Distance.COSINE
-        ),
+        "vectors_config": _vectors(),
+        "storage": IN_MEMORY_STORAGE,
         "schema": {
             "invoice_id": "int",
             "vendor_name": "str",
@@ -46,10 +88,8 @@ COLLECTION_CONFIGS: Dict[CollectionName, Dict[str, Any]] = {
     },
 
     CollectionName.SOCIAL_POSTS: {
-        "vectors_config": VectorParams(
-            size=1536,
-            distance=Distance.COSINE
-        ),
+        "vectors_config": _vectors(on_disk=True),
+        "storage": QUANTIZED_STORAGE,
         "schema": {
             "post_id": "str",
             "brand": "str",  # pomandi, costume
@@ -64,10 +104,8 @@ COLLECTION_CONFIGS: Dict[CollectionName, Dict[str, Any]] = {
     },
 
     CollectionName.AD_REPORTS: {
-        "vectors_config": VectorParams(
-            size=1536,
-            distance=Distance.COSINE
-        ),
+        "vectors_config": _vectors(),
+        "storage": IN_MEMORY_STORAGE,
         "schema": {
             "campaign_id": "str",
             "campaign_name": "str",
@@ -82,10 +120,8 @@ COLLECTION_CONFIGS: Dict[CollectionName, Dict[str, Any]] = {
     },
 
     CollectionName.AGENT_CONTEXT: {
-        "vectors_config": VectorParams(
-            size=1536,
-            distance=Distance.COSINE
-        ),
+        "vectors_config": _vectors(on_disk=True),
+        "storage": QUANTIZED_STORAGE,
         "schema": {
             "agent_name": "str",
             "context_type": "str",  # decision, error, success
@@ -97,10 +133,8 @@ COLLECTION_CONFIGS: Dict[CollectionName, Dict[str, Any]] = {
     },
 
     CollectionName.EMAIL_PATTERNS: {
-        "vectors_config": VectorParams(
-            size=1536,
-            distance=Distance.COSINE
-        ),
+        "vectors_config": _vectors(),
+        "storage": IN_MEMORY_STORAGE,
         "schema": {
             "sender_email": "str",
             "sender_domain": "str",
@@ -117,10 +151,8 @@ COLLECTION_CONFIGS: Dict[CollectionName, Dict[str, Any]] = {
     },
 
     CollectionName.EMAIL_CONVERSATIONS: {
-        "vectors_config": VectorParams(
-            size=1536,
-            distance=Distance.COSINE
-        ),
+        "vectors_config": _vectors(on_disk=True),
+        "storage": QUANTIZED_STORAGE,
         "schema": {
             "thread_id": "str",
             "sender_email": "str",
@@ -136,10 +168,8 @@ COLLECTION_CONFIGS: Dict[CollectionName, Dict[str, Any]] = {
     },
 
     CollectionName.SEO_STRATEGIES: {
-        "vectors_config": VectorParams(
-            size=1536,
-            distance=Distance.COSINE
-        ),
+        "vectors_config": _vectors(),
+        "storage": IN_MEMORY_STORAGE,
         "schema": {
             "keyword": "str",  # Target keyword
             "slug": "str",  # Generated page slug
@@ -157,10 +187,8 @@ COLLECTION_CONFIGS: Dict[CollectionName, Dict[str, Any]] = {
     },
 
     CollectionName.ANALYTICS_DATA: {
-        "vectors_config": VectorParams(
-            size=1536,
-            distance=Distance.COSINE
-        ),
+        "vectors_config": _vectors(),
+        "storage": IN_MEMORY_STORAGE,
         "schema": {
             "brand": "str",  # pomandi, costume
             "date": "str",  # YYYY-MM-DD
@@ -177,10 +205,8 @@ COLLECTION_CONFIGS: Dict[CollectionName, Dict[str, Any]] = {
     },
 
     CollectionName.ACTION_HISTORY: {
-        "vectors_config": VectorParams(
-            size=1536,
-            distance=Distance.COSINE
-        ),
+        "vectors_config": _vectors(),
+        "storage": IN_MEMORY_STORAGE,
         "schema": {
             "action_type": "str",  # budget_change, bid_adjustment, pause_campaign, etc.
             "platform": "str",  # google_ads, meta_ads, shopify, etc.
@@ -224,3 +250,57 @@ def get_collection_config(collection_name: str) -> Dict[str, Any]:
 def get_all_collection_names() -> list[str]:
     """Get list of all defined collection names."""
     return [c.value for c in CollectionName]
+
+
+def get_storage_config(collection_name: str) -> Dict[str, Any]:
+    """
+    Get the resolved storage profile for a collection.
+
+    QDRANT_QUANTIZATION ("scalar", "binary" or "none") overrides the
+    quantization type of collections that use quantized storage.
+
+    Args:
+        collection_name: Name of the collection
+
+    Returns:
+        Storage profile dict (see IN_MEMORY_STORAGE)
+    """
+    storage = dict(get_collection_config(collection_name).get("storage", IN_MEMORY_STORAGE))
+
+    override = os.getenv("QDRANT_QUANTIZATION", "").lower()
+    if storage["quantization"] and override:
+        storage["quantization"] = None if override == "none" else override
+        if override == "binary":
+            # Binary codes lose more precision, so rescore a wider candidate set
+            storage["oversampling"] = max(storage["oversampling"] or 1.0, 3.0)
+
+    return storage
+
+
+def build_quantization_config(kind: Optional[str]):
+    """
+    Build a Qdrant quantization config.
+
+    Quantized vectors are kept in RAM (always_ram) while the originals live
+    wherever the vector params put them (on disk for quantized profiles).
+
+    Args:
+        kind: "scalar", "binary" or None
+
+    Returns:
+        ScalarQuantization, BinaryQuantization or None
+    """
+    if kind == "scalar":
+        return ScalarQuantization(
+            scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+        )
+    if kind == "binary":
+        return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+    if kind:
+        raise ValueError(f"Unknown quantization '{kind}'. Valid: scalar, binary")
+    return None
+
+
+def build_hnsw_config(hnsw: Optional[Dict[str, Any]]) -> Optional[HnswConfigDiff]:
+    """Build HNSW config from a storage profile entry."""
+    return HnswConfigDiff(**hnsw) if hnsw else None
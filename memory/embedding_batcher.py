@@ -0,0 +1,165 @@
+"""
+Embedding Micro-Batcher
+=======================
+
+Coalesces concurrent single-text embedding requests into batched API calls.
+
+Calls arriving within a short window (or until batch_size texts are queued)
+are sent as one embeddings request and the results fanned back out to the
+waiting callers. Identical texts in flight share a single future.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class EmbeddingBatcher:
+    """
+    Async micro-batcher for embedding requests.
+
+    Usage:
+        batcher = EmbeddingBatcher(request_fn=generator.request_embeddings)
+        vector = await batcher.submit(text_hash, text)
+    """
+
+    def __init__(
+        self,
+        request_fn: Callable[[List[str]], Awaitable[List[List[float]]]],
+        batch_size: int = 100,
+        window_seconds: float = 0.005,
+        on_batch_complete: Optional[Callable[[Dict[str, List[float]]], Awaitable[None]]] = None
+    ):
+        """
+        Initialize batcher.
+
+        Args:
+            request_fn: Coroutine embedding a list of texts (one API call)
+            batch_size: Max texts per API call (flushes immediately when reached)
+            window_seconds: How long to wait for more requests before flushing
+            on_batch_complete: Optional coroutine receiving {key: embedding} per batch
+        """
+        self.request_fn = request_fn
+        self.batch_size = batch_size
+        self.window_seconds = window_seconds
+        self.on_batch_complete = on_batch_complete
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._queue: List[Tuple[str, str]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Strong refs to running flushes (the loop only keeps weak ones)
+        self._flush_tasks: Set[asyncio.Task] = set()
+
+        # Stats
+        self.requests = 0
+        self.coalesced = 0
+        self.batches_sent = 0
+
+    def _bind_loop(self):
+        """Reset state if used from a different event loop (futures are loop-bound)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._inflight = {}
+            self._queue = []
+            self._flush_handle = None
+            self._flush_tasks = set()
+        return loop
+
+    async def submit(self, key: str, text: str) -> List[float]:
+        """
+        Request an embedding, sharing in-flight work for identical keys.
+
+        Args:
+            key: Stable content key (e.g. content hash)
+            text: Text to embed
+
+        Returns:
+            Embedding vector
+        """
+        loop = self._bind_loop()
+        self.requests += 1
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        future = loop.create_future()
+        self._inflight[key] = future
+        self._queue.append((key, text))
+
+        if len(self._queue) >= self.batch_size:
+            self._schedule_flush(immediate=True)
+        elif self._flush_handle is None:
+            self._schedule_flush(immediate=False)
+
+        return await asyncio.shield(future)
+
+    def _schedule_flush(self, immediate: bool):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if immediate:
+            self._start_flush()
+        else:
+            self._flush_handle = self._loop.call_later(self.window_seconds, self._start_flush)
+
+    def _start_flush(self):
+        self._flush_handle = None
+        if not self._queue:
+            return
+
+        batch = self._queue[:self.batch_size]
+        self._queue = self._queue[self.batch_size:]
+        task = self._loop.create_task(self._flush(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+        # Leftovers (more than one batch queued) get their own window
+        if self._queue:
+            self._schedule_flush(immediate=len(self._queue) >= self.batch_size)
+
+    async def _flush(self, batch: List[Tuple[str, str]]):
+        keys = [key for key, _ in batch]
+        texts = [text for _, text in batch]
+        self.batches_sent += 1
+
+        try:
+            vectors = await self.request_fn(texts)
+            # A short response can't be matched to texts; fail every waiter
+            if len(vectors) != len(keys):
+                raise ValueError(f"Embedding API returned {len(vectors)} vectors for {len(keys)} texts")
+        except Exception as e:
+            logger.error("embedding_batch_flush_failed", batch_size=len(batch), error=str(e))
+            for key in keys:
+                future = self._inflight.pop(key, None)
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            return
+
+        results = dict(zip(keys, vectors))
+        for key in keys:
+            future = self._inflight.pop(key, None)
+            if future is not None and not future.done():
+                future.set_result(results[key])
+
+        logger.debug("embedding_batch_flushed", batch_size=len(batch))
+
+        if self.on_batch_complete is not None:
+            try:
+                await self.on_batch_complete(results)
+            except Exception as e:
+                logger.error("embedding_batch_callback_failed", error=str(e))
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get batching statistics."""
+        return {
+            "single_requests": self.requests,
+            "coalesced_requests": self.coalesced,
+            "batches_sent": self.batches_sent,
+        }
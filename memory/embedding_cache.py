@@ -0,0 +1,422 @@
+"""
+Embedding Cache
+===============
+
+Tiered cache for embedding vectors so the same text is only paid for once.
+
+- Tier 1: In-process LRU bounded by a byte budget (compact float32 arrays)
+- Tier 2: Shared store (Redis or local disk) surviving graph rebuilds and
+  worker restarts
+
+Keys are derived from (model, dimensions, content hash), so changing the
+embedding model or dimensions never serves stale vectors.
+"""
+
+import os
+import asyncio
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+def make_embedding_key(model: str, dimensions: int, content_hash: str) -> str:
+    """Build the cache key for an embedding."""
+    return f"emb:{model}:{dimensions}:{content_hash}"
+
+
+def pack_vector(vector: Sequence[float]) -> array:
+    """Convert a vector to a compact float32 array."""
+    return array("f", vector)
+
+
+def vector_to_bytes(vector: array) -> bytes:
+    """Serialize a float32 array for the shared tier."""
+    return vector.tobytes()
+
+
+def vector_from_bytes(data: bytes) -> array:
+    """Deserialize a float32 array from the shared tier."""
+    vector = array("f")
+    vector.frombytes(data)
+    return vector
+
+
+class LocalEmbeddingLRU:
+    """
+    In-process LRU cache of float32 vectors bounded by total bytes.
+
+    A 1536-dim vector costs ~6 KB here versus ~50 KB as a list of Python floats.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize LRU cache.
+
+        Args:
+            max_bytes: Byte budget for stored vectors
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, array]" = OrderedDict()
+        self.current_bytes = 0
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[array]:
+        """Get vector and mark it as most recently used."""
+        vector = self._entries.get(key)
+        if vector is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return vector
+
+    def put(self, key: str, vector: array):
+        """Store vector, evicting least recently used entries over budget."""
+        size = vector.itemsize * len(vector)
+        if size > self.max_bytes:
+            return
+
+        existing = self._entries.pop(key, None)
+        if existing is not None:
+            self.current_bytes -= existing.itemsize * len(existing)
+
+        self._entries[key] = vector
+        self.current_bytes += size
+
+        while self.current_bytes > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= evicted.itemsize * len(evicted)
+            self.evictions += 1
+
+    def clear(self) -> int:
+        """Remove all entries. Returns number of entries removed."""
+        removed = len(self._entries)
+        self._entries.clear()
+        self.current_bytes = 0
+        return removed
+
+
+class RedisEmbeddingStore:
+    """Shared embedding store in Redis (raw float32 bytes with TTL)."""
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        password: Optional[str] = None,
+        ttl: int = 30 * 86400
+    ):
+        """
+        Initialize Redis embedding store.
+
+        Args:
+            host: Redis host (defaults to REDIS_HOST env var)
+            port: Redis port (defaults to REDIS_PORT env var)
+            password: Redis password (optional)
+            ttl: Time-to-live for stored vectors in seconds
+        """
+        self.host = host or os.getenv("REDIS_HOST", "localhost")
+        self.port = port or int(os.getenv("REDIS_PORT", "6379"))
+        self.password = password or os.getenv("REDIS_PASSWORD")
+        self.ttl = ttl
+
+        self.client = None
+        self.enabled = True
+        self._connect_lock = asyncio.Lock()
+
+    async def _get_client(self):
+        """Connect lazily (EmbeddingGenerator has no async setup hook)."""
+        if self.client is not None or not self.enabled:
+            return self.client
+
+        async with self._connect_lock:
+            if self.client is not None:
+                return self.client
+
+            try:
+                import redis.asyncio as aioredis
+
+                # Vectors are raw bytes, so responses must not be decoded
+                client = await aioredis.from_url(
+                    f"redis://{self.host}:{self.port}",
+                    password=self.password,
+                    decode_responses=False
+                )
+                await client.ping()
+                self.client = client
+                logger.info("embedding_store_redis_connected")
+
+            except Exception as e:
+                logger.error("embedding_store_redis_connection_failed", error=str(e))
+                self.enabled = False
+
+        return self.client
+
+    async def get_many(self, keys: List[str]) -> Dict[str, array]:
+        """Fetch vectors for keys (missing keys are omitted)."""
+        client = await self._get_client()
+        if client is None or not keys:
+            return {}
+
+        try:
+            values = await client.mget(keys)
+        except Exception as e:
+            logger.error("embedding_store_get_failed", error=str(e))
+            return {}
+
+        return {
+            key: vector_from_bytes(value)
+            for key, value in zip(keys, values)
+            if value is not None
+        }
+
+    async def set_many(self, items: Dict[str, array]):
+        """Store vectors with TTL in a single pipeline."""
+        client = await self._get_client()
+        if client is None or not items:
+            return
+
+        try:
+            pipe = client.pipeline(transaction=False)
+            for key, vector in items.items():
+                pipe.setex(key, self.ttl, vector_to_bytes(vector))
+            await pipe.execute()
+        except Exception as e:
+            logger.error("embedding_store_set_failed", error=str(e))
+
+    async def close(self):
+        """Close Redis connection."""
+        if self.client is not None:
+            try:
+                await self.client.close()
+            except Exception as e:
+                logger.error("embedding_store_close_failed", error=str(e))
+            self.client = None
+
+
+class DiskEmbeddingStore:
+    """Shared embedding store on local disk (one float32 file per vector)."""
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Initialize disk embedding store.
+
+        Args:
+            directory: Cache directory (defaults to EMBEDDING_CACHE_DIR env var)
+        """
+        self.directory = Path(
+            directory or os.getenv("EMBEDDING_CACHE_DIR", "/tmp/agent-embedding-cache")
+        )
+        self.enabled = True
+
+    def _path_for(self, key: str) -> Path:
+        # Model names may contain characters that are awkward in file names
+        safe_key = key.replace(":", "_").replace("/", "_")
+        return self.directory / safe_key[-2:] / f"{safe_key}.f32"
+
+    def _read_many(self, keys: List[str]) -> Dict[str, array]:
+        found = {}
+        for key in keys:
+            path = self._path_for(key)
+            try:
+                found[key] = vector_from_bytes(path.read_bytes())
+            except FileNotFoundError:
+                continue
+        return found
+
+    def _write_many(self, items: Dict[str, array]):
+        for key, vector in items.items():
+            path = self._path_for(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file first so concurrent readers never see partial vectors
+            tmp_path = path.parent / f"{path.name}.{os.getpid()}.tmp"
+            tmp_path.write_bytes(vector_to_bytes(vector))
+            os.replace(tmp_path, path)
+
+    async def get_many(self, keys: List[str]) -> Dict[str, array]:
+        """Fetch vectors for keys (missing keys are omitted)."""
+        if not keys:
+            return {}
+
+        try:
+            return await asyncio.to_thread(self._read_many, keys)
+        except Exception as e:
+            logger.error("embedding_store_get_failed", error=str(e))
+            return {}
+
+    async def set_many(self, items: Dict[str, array]):
+        """Store vectors on disk."""
+        if not items:
+            return
+
+        try:
+            await asyncio.to_thread(self._write_many, items)
+        except Exception as e:
+            logger.error("embedding_store_set_failed", error=str(e))
+
+    async def close(self):
+        """Nothing to close for disk store."""
+        return
+
+
+class TieredEmbeddingCache:
+    """
+    Two-tier embedding cache: in-process LRU in front of a shared store.
+
+    Usage:
+        cache = TieredEmbeddingCache(model="text-embedding-3-small", dimensions=1536)
+        found = await cache.get_many(["a1b2c3..."])
+        await cache.set_many({"a1b2c3...": [0.1, 0.2, ...]})
+    """
+
+    def __init__(
+        self,
+        model: str,
+        dimensions: int,
+        max_bytes: int = 64 * 1024 * 1024,
+        shared_store=None
+    ):
+        """
+        Initialize tiered cache.
+
+        Args:
+            model: Embedding model name (part of the key)
+            dimensions: Vector dimensions (part of the key)
+            max_bytes: Byte budget for the in-process tier
+            shared_store: RedisEmbeddingStore, DiskEmbeddingStore or None
+        """
+        self.model = model
+        self.dimensions = dimensions
+        self.local = LocalEmbeddingLRU(max_bytes=max_bytes)
+        self.shared_store = shared_store
+
+        # Shared tier stats
+        self.shared_hits = 0
+        self.shared_misses = 0
+
+    def _key(self, content_hash: str) -> str:
+        return make_embedding_key(self.model, self.dimensions, content_hash)
+
+    async def get_many(self, content_hashes: List[str]) -> Dict[str, List[float]]:
+        """
+        Look up embeddings by content hash.
+
+        Args:
+            content_hashes: Content hashes to look up
+
+        Returns:
+            Dict of content_hash -> embedding for every hash found in any tier
+        """
+        found: Dict[str, List[float]] = {}
+        missing: List[str] = []
+
+        for content_hash in content_hashes:
+            vector = self.local.get(self._key(content_hash))
+            if vector is not None:
+                found[content_hash] = vector.tolist()
+            else:
+                missing.append(content_hash)
+
+        if missing and self.shared_store is not None:
+            keys = {self._key(h): h for h in missing}
+            shared = await self.shared_store.get_many(list(keys))
+
+            for key, vector in shared.items():
+                if len(vector) != self.dimensions:
+                    continue
+                self.local.put(key, vector)
+                found[keys[key]] = vector.tolist()
+
+            self.shared_hits += len(shared)
+            self.shared_misses += len(missing) - len(shared)
+
+        return found
+
+    async def get(self, content_hash: str) -> Optional[List[float]]:
+        """Look up a single embedding by content hash."""
+        found = await self.get_many([content_hash])
+        return found.get(content_hash)
+
+    async def set_many(self, embeddings: Dict[str, Sequence[float]]):
+        """
+        Store embeddings in both tiers.
+
+        Args:
+            embeddings: Dict of content_hash -> embedding
+        """
+        if not embeddings:
+            return
+
+        packed = {}
+        for content_hash, embedding in embeddings.items():
+            key = self._key(content_hash)
+            vector = pack_vector(embedding)
+            self.local.put(key, vector)
+            packed[key] = vector
+
+        if self.shared_store is not None:
+            await self.shared_store.set_many(packed)
+
+    async def set(self, content_hash: str, embedding: Sequence[float]):
+        """Store a single embedding."""
+        await self.set_many({content_hash: embedding})
+
+    def clear_local(self) -> int:
+        """Clear the in-process tier. Returns number of entries removed."""
+        return self.local.clear()
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get hit/miss/eviction counts for both tiers."""
+        local_total = self.local.hits + self.local.misses
+        return {
+            "cached_embeddings": len(self.local),
+            "cache_memory_mb": round(self.local.current_bytes / (1024 * 1024), 3),
+            "cache_max_mb": round(self.local.max_bytes / (1024 * 1024), 3),
+            "local_hits": self.local.hits,
+            "local_misses": self.local.misses,
+            "local_evictions": self.local.evictions,
+            "local_hit_rate_percent": round(self.local.hits / local_total * 100, 2) if local_total else 0,
+            "shared_backend": type(self.shared_store).__name__ if self.shared_store is not None else None,
+            "shared_hits": self.shared_hits,
+            "shared_misses": self.shared_misses,
+        }
+
+    async def close(self):
+        """Close shared store connection."""
+        if self.shared_store is not None:
+            await self.shared_store.close()
+
+
+def create_shared_store(backend: Optional[str] = None):
+    """
+    Create the shared embedding store from EMBEDDING_CACHE_BACKEND.
+
+    Args:
+        backend: "redis", "disk" or "none" (defaults to EMBEDDING_CACHE_BACKEND env var)
+
+    Returns:
+        Store instance or None
+    """
+    backend = (backend or os.getenv("EMBEDDING_CACHE_BACKEND", "redis")).lower()
+
+    if backend == "redis":
+        return RedisEmbeddingStore(ttl=int(os.getenv("EMBEDDING_CACHE_TTL", str(30 * 86400))))
+    if backend == "disk":
+        return DiskEmbeddingStore()
+    if backend in ("none", "", "off"):
+        return None
+
+    logger.warning("unknown_embedding_cache_backend", backend=backend)
+    return None
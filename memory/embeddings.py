@@ -4,16 +4,22 @@ Embedding Generation
 
 Generates vector embeddings for text using OpenAI's text-embedding-3-small model.
 Includes batching, caching, and error handling.
+
+Embeddings are cached in a tiered cache (see embedding_cache.py): an
+in-process LRU backed by a shared Redis or on-disk store.
 """
 
 import os
 import hashlib
 import asyncio
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 from openai import AsyncOpenAI
 import tiktoken
 import structlog
 
+from .embedding_cache import TieredEmbeddingCache, create_shared_store
+from .embedding_batcher import EmbeddingBatcher
+
 logger = structlog.get_logger(__name__)
 
 
@@ -23,9 +29,10 @@ class EmbeddingGenerator:
 
     Features:
     - Batch processing for efficiency
+    - Micro-batching of concurrent generate_single calls
     - Token counting and validation
     - Error handling and retries
-    - Content hash caching
+    - Tiered content hash caching (in-process LRU + shared store)
     """
 
     def __init__(
@@ -34,7 +41,8 @@ class EmbeddingGenerator:
         model: str = "text-embedding-3-small",
         dimensions: int = 1536,
         batch_size: int = 100,
-        max_retries: int = 3
+        max_retries: int = 3,
+        cache: Optional[TieredEmbeddingCache] = None
     ):
         """
         Initialize embedding generator.
@@ -45,6 +53,7 @@ class EmbeddingGenerator:
             dimensions: Vector dimensions
             batch_size: Max texts per API call
             max_retries: Retry attempts on failure
+            cache: Custom embedding cache (defaults to LRU + EMBEDDING_CACHE_BACKEND store)
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
@@ -58,8 +67,21 @@ class EmbeddingGenerator:
         self.client = AsyncOpenAI(api_key=self.api_key)
         self.encoding = tiktoken.encoding_for_model("text-embedding-3-small")
 
-        # In-memory cache: content_hash -> embedding
-        self._cache: Dict[str, List[float]] = {}
+        # Tiered cache: (model, dimensions, content_hash) -> embedding
+        self._cache = cache or TieredEmbeddingCache(
+            model=self.model,
+            dimensions=self.dimensions,
+            max_bytes=int(float(os.getenv("EMBEDDING_CACHE_MAX_MB", "64")) * 1024 * 1024),
+            shared_store=create_shared_store()
+        )
+
+        # Concurrent generate_single calls within the window share one API request
+        self._batcher = EmbeddingBatcher(
+            request_fn=self.request_embeddings,
+            batch_size=self.batch_size,
+            window_seconds=float(os.getenv("EMBEDDING_BATCH_WINDOW_MS", "5")) / 1000,
+            on_batch_complete=self._cache.set_many
+        )
 
         logger.info(
             "embedding_generator_initialized",
@@ -76,13 +98,50 @@ class EmbeddingGenerator:
         """Count tokens in text (useful for cost estimation)."""
         return len(self.encoding.encode(text))
 
+    async def request_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts with a single API call (retried with exponential backoff).
+
+        Args:
+            texts: Texts to embed (at most batch_size)
+
+        Returns:
+            Embedding vectors in input order
+        """
+        for attempt in range(self.max_retries):
+            try:
+                response = await self.client.embeddings.create(
+                    model=self.model,
+                    input=texts,
+                    dimensions=self.dimensions
+                )
+                return [data.embedding for data in response.data]
+
+            except Exception as e:
+                if attempt < self.max_retries - 1:
+                    wait_time = 2 ** attempt  # Exponential backoff
+                    logger.warning(
+                        "embedding_batch_retry",
+                        attempt=attempt + 1,
+                        wait_seconds=wait_time,
+                        error=str(e)
+                    )
+                    await asyncio.sleep(wait_time)
+                else:
+                    logger.error("embedding_batch_failed", error=str(e))
+                    raise
+
     async def generate_single(self, text: str, use_cache: bool = True) -> List[float]:
         """
         Generate embedding for a single text.
 
+        Concurrent calls are coalesced: they are collected for
+        EMBEDDING_BATCH_WINDOW_MS (or until batch_size texts are queued) and
+        sent as one request, and identical texts share one in-flight result.
+
         Args:
             text: Text to embed
-            use_cache: Use in-memory cache
+            use_cache: Read from embedding cache (generated vectors are always cached)
 
         Returns:
             Embedding vector (list of floats)
@@ -93,23 +152,15 @@ class EmbeddingGenerator:
 
         # Check cache
         text_hash = self._compute_hash(text)
-        if use_cache and text_hash in self._cache:
-            logger.debug("embedding_cache_hit", text_preview=text[:50])
-            return self._cache[text_hash]
+        if use_cache:
+            cached = await self._cache.get(text_hash)
+            if cached is not None:
+                logger.debug("embedding_cache_hit", text_preview=text[:50])
+                return cached
 
-        # Generate embedding
+        # Generate embedding (batcher caches results once per batch)
         try:
-            response = await self.client.embeddings.create(
-                model=self.model,
-                input=text,
-                dimensions=self.dimensions
-            )
-
-            embedding = response.data[0].embedding
-
-            # Cache result
-            if use_cache:
-                self._cache[text_hash] = embedding
+            embedding = await self._batcher.submit(text_hash, text)
 
             logger.debug(
                 "embedding_generated",
@@ -135,7 +186,7 @@ class EmbeddingGenerator:
 
         Args:
             texts: List of texts to embed
-            use_cache: Use in-memory cache
+            use_cache: Use embedding cache
             show_progress: Log progress updates
 
         Returns:
@@ -150,10 +201,11 @@ class EmbeddingGenerator:
 
         # Check cache first
         if use_cache:
+            hashes = [self._compute_hash(text) for text in texts]
+            cached = await self._cache.get_many(list(set(hashes)))
             for i, text in enumerate(texts):
-                text_hash = self._compute_hash(text)
-                if text_hash in self._cache:
-                    embeddings[i] = self._cache[text_hash]
+                if hashes[i] in cached:
+                    embeddings[i] = cached[hashes[i]]
                 else:
                     uncached_indices.append(i)
                     uncached_texts.append(text)
@@ -187,40 +239,18 @@ class EmbeddingGenerator:
 
             try:
                 # API call with retries
-                for attempt in range(self.max_retries):
-                    try:
-                        response = await self.client.embeddings.create(
-                            model=self.model,
-                            input=batch_texts,
-                            dimensions=self.dimensions
-                        )
-
-                        # Extract embeddings
-                        for i, data in enumerate(response.data):
-                            original_idx = batch_indices[i]
-                            embedding = data.embedding
-                            embeddings[original_idx] = embedding
-
-                            # Cache result
-                            if use_cache:
-                                text_hash = self._compute_hash(batch_texts[i])
-                                self._cache[text_hash] = embedding
-
-                        break  # Success
-
-                    except Exception as e:
-                        if attempt < self.max_retries - 1:
-                            wait_time = 2 ** attempt  # Exponential backoff
-                            logger.warning(
-                                "embedding_batch_retry",
-                                attempt=attempt + 1,
-                                wait_seconds=wait_time,
-                                error=str(e)
-                            )
-                            await asyncio.sleep(wait_time)
-                        else:
-                            logger.error("embedding_batch_failed", error=str(e))
-                            raise
+                batch_vectors = await self.request_embeddings(batch_texts)
+
+                new_entries: Dict[str, List[float]] = {}
+                for i, embedding in enumerate(batch_vectors):
+                    embeddings[batch_indices[i]] = embedding
+
+                    if use_cache:
+                        new_entries[self._compute_hash(batch_texts[i])] = embedding
+
+                # Cache results (one shared-store round trip per batch)
+                if use_cache:
+                    await self._cache.set_many(new_entries)
 
             except Exception as e:
                 logger.error("batch_processing_failed", batch=f"{batch_start}-{batch_end}", error=str(e))
@@ -256,17 +286,26 @@ class EmbeddingGenerator:
         }
 
     def clear_cache(self):
-        """Clear in-memory embedding cache."""
-        cache_size = len(self._cache)
-        self._cache.clear()
+        """Clear in-process embedding cache (shared store entries expire via TTL)."""
+        cache_size = self._cache.clear_local()
         logger.info("embedding_cache_cleared", entries_removed=cache_size)
 
-    def get_cache_stats(self) -> Dict[str, int]:
-        """Get cache statistics."""
-        return {
-            "cached_embeddings": len(self._cache),
-            "cache_memory_mb": sum(len(v) * 4 for v in self._cache.values()) / (1024 * 1024)  # Rough estimate
-        }
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with entry count, memory usage and hit/miss/eviction counts
+            per tier. ``api_calls_saved`` counts embeddings served from cache.
+        """
+        stats = self._cache.get_stats()
+        stats["api_calls_saved"] = stats["local_hits"] + stats["shared_hits"]
+        stats.update(self._batcher.get_stats())
+        return stats
+
+    async def close(self):
+        """Close shared cache connections."""
+        await self._cache.close()
 
 
 # Global instance (lazy initialized)
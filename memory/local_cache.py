@@ -0,0 +1,236 @@
+"""
+Local Search Cache (L1)
+=======================
+
+Optional in-process TTL + LRU cache in front of Redis for search results.
+
+Avoids the Redis round trip and json.loads for queries repeated within a
+run. Bounded by entry count and approximate bytes.
+
+Disabled by default (MEMORY_L1_ENABLED=true turns it on). Invalidation is
+per process: MemoryManager.invalidate_collection clears this process's L1,
+but a Redis generation bump from another worker never reaches it, so a
+search may return results up to MEMORY_L1_TTL seconds old after another
+process writes. Only enable it where that staleness is acceptable.
+"""
+
+import os
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+import structlog
+
+# Import monitoring metrics
+try:
+    from monitoring.metrics import MemoryMetrics
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
+logger = structlog.get_logger(__name__)
+
+
+class LocalSearchCache:
+    """
+    In-process TTL + LRU cache for search results.
+
+    Entries remember the top_k they were fetched with, so smaller top_k
+    requests are served from a larger cached list (same rule as RedisCache).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttl: float = 60.0
+    ):
+        """
+        Initialize local cache.
+
+        Args:
+            max_entries: Maximum number of cached searches
+            max_bytes: Approximate byte budget (serialized result size)
+            ttl: Time-to-live in seconds
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        # key -> (expires_at, generation, top_k, size, results)
+        self._entries: "OrderedDict[Tuple, Tuple[float, int, Optional[int], int, list]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self.current_bytes = 0
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_env(cls) -> Optional["LocalSearchCache"]:
+        """Create from MEMORY_L1_* env vars (None unless MEMORY_L1_ENABLED is true)."""
+        if os.getenv("MEMORY_L1_ENABLED", "false").lower() != "true":
+            return None
+
+        return cls(
+            max_entries=int(os.getenv("MEMORY_L1_MAX_ENTRIES", "1000")),
+            max_bytes=int(float(os.getenv("MEMORY_L1_MAX_MB", "32")) * 1024 * 1024),
+            ttl=float(os.getenv("MEMORY_L1_TTL", "60"))
+        )
+
+    def _make_key(
+        self,
+        collection: str,
+        query: str,
+        filters: Optional[Dict[str, Any]],
+        score_threshold: Optional[float]
+    ) -> Tuple:
+        return (
+            collection,
+            query,
+            json.dumps(filters or {}, sort_keys=True, default=str),
+            score_threshold
+        )
+
+    def _remove(self, key: Tuple):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry[3]
+
+    def _record(self, collection: str, hit: bool):
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+        if METRICS_AVAILABLE:
+            counter = MemoryMetrics.memory_l1_cache_hit_total if hit else MemoryMetrics.memory_l1_cache_miss_total
+            counter.labels(collection=collection).inc()
+
+    def generation(self, collection: str) -> int:
+        """Current local generation of a collection (read before searching, pass to set)."""
+        return self._generations.get(collection, 0)
+
+    def get(
+        self,
+        collection: str,
+        query: str,
+        top_k: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        score_threshold: Optional[float] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get cached search results.
+
+        Returns:
+            Copy of cached results (at most top_k) or None
+        """
+        key = self._make_key(collection, query, filters, score_threshold)
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            expires_at, generation, cached_top_k, _, results = entry
+
+            if expires_at < time.monotonic() or generation != self._generations.get(collection, 0):
+                self._remove(key)
+            elif (
+                top_k is None
+                or cached_top_k is None
+                or cached_top_k >= top_k
+                or len(results) < cached_top_k
+            ):
+                self._entries.move_to_end(key)
+                self._record(collection, hit=True)
+                # Copy result dicts so callers can't mutate cached entries
+                return [dict(r) for r in results[:top_k]]
+
+        self._record(collection, hit=False)
+        return None
+
+    def set(
+        self,
+        collection: str,
+        query: str,
+        results: List[Dict[str, Any]],
+        top_k: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        score_threshold: Optional[float] = None,
+        generation: Optional[int] = None
+    ):
+        """
+        Cache search results, evicting least recently used entries over budget.
+
+        Args:
+            generation: Local generation read before the search ran; results
+                from a search that overlapped clear_collection are dropped
+        """
+        current_generation = self.generation(collection)
+        if generation is not None and generation != current_generation:
+            return
+
+        key = self._make_key(collection, query, filters, score_threshold)
+
+        existing = self._entries.get(key)
+        if existing is not None and top_k is not None:
+            existing_top_k = existing[2]
+            if existing_top_k is None or existing_top_k > top_k:
+                return
+
+        size = len(json.dumps(results, default=str))
+        if size > self.max_bytes:
+            return
+
+        self._remove(key)
+        self._entries[key] = (
+            time.monotonic() + self.ttl,
+            current_generation,
+            top_k,
+            size,
+            [dict(r) for r in results]
+        )
+        self.current_bytes += size
+
+        while self._entries and (
+            len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= evicted[3]
+            self.evictions += 1
+
+        if METRICS_AVAILABLE:
+            MemoryMetrics.memory_l1_cache_entries.set(len(self._entries))
+            MemoryMetrics.memory_l1_cache_bytes.set(self.current_bytes)
+
+    def clear_collection(self, collection: str):
+        """Invalidate all entries for a collection (O(1), stale entries dropped lazily)."""
+        self._generations[collection] = self._generations.get(collection, 0) + 1
+
+    def clear_all(self):
+        """Remove all entries."""
+        self._entries.clear()
+        self.current_bytes = 0
+
+        if METRICS_AVAILABLE:
+            MemoryMetrics.memory_l1_cache_entries.set(0)
+            MemoryMetrics.memory_l1_cache_bytes.set(0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with hits, misses, evictions, hit_rate and size
+        """
+        total = self.hits + self.misses
+        hit_rate = (self.hits / total * 100) if total > 0 else 0
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "total_requests": total,
+            "hit_rate_percent": round(hit_rate, 2),
+            "entries": len(self._entries),
+            "memory_mb": round(self.current_bytes / (1024 * 1024), 3)
+        }
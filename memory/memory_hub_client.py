@@ -7,6 +7,12 @@ Provides async methods to create memory cards for analytics data.
 
 Uses streamable HTTP transport (POST /mcp) instead of SSE for reliability.
 
+All calls share one pooled httpx.AsyncClient (HTTP/2 via httpx[http2],
+keep-alive limits from MEMORY_HUB_MAX_CONNECTIONS /
+MEMORY_HUB_MAX_KEEPALIVE), so TCP+TLS setup is paid once per process
+instead of once per call. Whether the server speaks streamable HTTP or
+only SSE is probed on the first call and remembered.
+
 Usage:
     client = MemoryHubClient("https://memory-hub.pomandi.com")
     result = await client.create_card(
@@ -17,18 +23,35 @@ Usage:
         data_source="daily_analytics",
         data_date="2026-01-12"
     )
+
+    # Several cards in one burst over the shared connection
+    results = await client.create_cards_batch([
+        {"type": "note", "title": "Google Ads", "content": "..."},
+        {"type": "note", "title": "Meta Ads", "content": "..."},
+    ])
 """
 
 import os
 import json
 import re
 import uuid
+import asyncio
 from typing import Any, Dict, Optional, List
 import httpx
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# HTTP/2 needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+TRANSPORT_STREAMABLE_HTTP = "streamable_http"
+TRANSPORT_SSE = "sse"
+
 # Default Memory-Hub URL
 DEFAULT_MEMORY_HUB_URL = "https://memory-hub.pomandi.com"
 
@@ -41,18 +64,78 @@ class MemoryHubClient:
     Falls back to SSE transport if streamable HTTP is not available.
     """
 
-    def __init__(self, base_url: Optional[str] = None):
+    def __init__(self, base_url: Optional[str] = None, transport: Optional[httpx.AsyncBaseTransport] = None):
         """
         Initialize Memory-Hub client.
 
         Args:
             base_url: Memory-Hub server URL (defaults to MEMORY_HUB_URL env var)
+            transport: Custom httpx transport (e.g. httpx.MockTransport in tests)
         """
         self.base_url = base_url or os.getenv("MEMORY_HUB_URL", DEFAULT_MEMORY_HUB_URL)
         self.base_url = self.base_url.rstrip("/")
         self._initialized = False
 
-        logger.info("memory_hub_client_init", base_url=self.base_url)
+        self.http2 = HTTP2_AVAILABLE and os.getenv("MEMORY_HUB_HTTP2", "true").lower() == "true"
+        self.limits = httpx.Limits(
+            max_connections=int(os.getenv("MEMORY_HUB_MAX_CONNECTIONS", "10")),
+            max_keepalive_connections=int(os.getenv("MEMORY_HUB_MAX_KEEPALIVE", "5")),
+            keepalive_expiry=float(os.getenv("MEMORY_HUB_KEEPALIVE_EXPIRY", "60"))
+        )
+        # An SSE call holds one connection for its /sse stream while it waits
+        # for a second one for /message, so at most max_connections // 2
+        # SSE calls can run at once without starving each other
+        self.max_sse_calls = max(1, self.limits.max_connections // 2)
+        self.max_concurrency = min(
+            int(os.getenv("MEMORY_HUB_MAX_CONCURRENCY", "8")),
+            self.max_sse_calls
+        )
+
+        # Pooled client, bound to the event loop it was created on
+        self._http_transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sse_slots: Optional[asyncio.Semaphore] = None
+
+        # Transport that worked last (None = not probed yet)
+        self._transport: Optional[str] = None
+
+        logger.info("memory_hub_client_init", base_url=self.base_url, http2=self.http2)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared pooled client.
+
+        Connections belong to the event loop that opened them, so a new
+        client is created when called from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            if self._client is not None and not self._client.is_closed:
+                self._close_on_loop(self._client, self._client_loop)
+            self._client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=self.limits,
+                timeout=httpx.Timeout(30.0, connect=10.0),
+                transport=self._http_transport
+            )
+            self._client_loop = loop
+            self._sse_slots = asyncio.Semaphore(self.max_sse_calls)
+        return self._client
+
+    def _close_on_loop(self, client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]):
+        """
+        Close a client left behind by a previous event loop.
+
+        Its connections can only be closed on the loop that opened them: the
+        close is scheduled there if that loop is still open, otherwise the
+        client is dropped and its sockets are freed when it is collected.
+        """
+        if loop is not None and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            logger.debug("memory_hub_client_close_scheduled")
+        else:
+            logger.info("memory_hub_client_dropped", reason="event_loop_closed")
 
     async def _call_tool_streamable_http(
         self,
@@ -82,48 +165,49 @@ class MemoryHubClient:
             }
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.post(
-                    f"{self.base_url}/mcp",
-                    json=mcp_request,
-                    headers={
-                        "Content-Type": "application/json",
-                        "Accept": "application/json, text/event-stream"
-                    }
+        client = self._get_client()
+
+        try:
+            response = await client.post(
+                f"{self.base_url}/mcp",
+                json=mcp_request,
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept": "application/json, text/event-stream"
+                }
+            )
+
+            if response.status_code == 200:
+                result = response.json()
+                logger.debug("memory_hub_streamable_http_response", result=result)
+
+                # Extract result from JSON-RPC response
+                if "result" in result:
+                    return result["result"]
+                elif "error" in result:
+                    logger.error("memory_hub_jsonrpc_error", error=result["error"])
+                    return {"error": result["error"]}
+                return result
+
+            elif response.status_code == 404:
+                # Streamable HTTP not available, return None to try fallback
+                logger.debug("memory_hub_streamable_http_not_available")
+                return None
+
+            else:
+                logger.error(
+                    "memory_hub_http_error",
+                    status=response.status_code,
+                    body=response.text[:500]
                 )
+                return {"error": f"HTTP {response.status_code}"}
 
-                if response.status_code == 200:
-                    result = response.json()
-                    logger.debug("memory_hub_streamable_http_response", result=result)
-
-                    # Extract result from JSON-RPC response
-                    if "result" in result:
-                        return result["result"]
-                    elif "error" in result:
-                        logger.error("memory_hub_jsonrpc_error", error=result["error"])
-                        return {"error": result["error"]}
-                    return result
-
-                elif response.status_code == 404:
-                    # Streamable HTTP not available, return None to try fallback
-                    logger.debug("memory_hub_streamable_http_not_available")
-                    return None
-
-                else:
-                    logger.error(
-                        "memory_hub_http_error",
-                        status=response.status_code,
-                        body=response.text[:500]
-                    )
-                    return {"error": f"HTTP {response.status_code}"}
-
-            except httpx.TimeoutException:
-                logger.error("memory_hub_timeout", tool=tool_name)
-                return {"error": "Request timeout"}
-            except Exception as e:
-                logger.error("memory_hub_request_error", error=str(e))
-                return {"error": str(e)}
+        except httpx.TimeoutException:
+            logger.error("memory_hub_timeout", tool=tool_name)
+            return {"error": "Request timeout"}
+        except Exception as e:
+            logger.error("memory_hub_request_error", error=str(e))
+            return {"error": str(e)}
 
     async def _call_tool_sse(
         self,
@@ -143,108 +227,121 @@ class MemoryHubClient:
         Returns:
             Tool result
         """
-        async with httpx.AsyncClient(timeout=60.0) as sse_client:
-            try:
-                # Step 1: Open SSE stream and keep it open
-                async with sse_client.stream(
-                    "GET",
-                    f"{self.base_url}/sse",
-                    headers={"Accept": "text/event-stream"}
-                ) as response:
-                    if response.status_code != 200:
-                        logger.error("memory_hub_sse_connect_failed", status=response.status_code)
-                        return {"error": f"SSE connect failed: {response.status_code}"}
-
-                    # Read chunks until we find the session ID
-                    session_id = None
-                    collected_data = ""
-
-                    async for chunk in response.aiter_text():
-                        collected_data += chunk
-                        logger.debug("memory_hub_sse_chunk", chunk_len=len(chunk))
-
-                        # Look for sessionId in the data
-                        if "sessionId=" in collected_data:
-                            match = re.search(r'sessionId=([a-f0-9-]+)', collected_data)
-                            if match:
-                                session_id = match.group(1)
-                                logger.debug("memory_hub_session_obtained", session_id=session_id)
-
-                                # Step 2: Call /message while SSE is still open!
-                                # Use a separate client for the POST
-                                async with httpx.AsyncClient(timeout=30.0) as msg_client:
-                                    mcp_message = {
-                                        "jsonrpc": "2.0",
-                                        "id": str(uuid.uuid4()),
-                                        "method": "tools/call",
-                                        "params": {
-                                            "name": tool_name,
-                                            "arguments": arguments
-                                        }
-                                    }
-
-                                    tool_response = await msg_client.post(
-                                        f"{self.base_url}/message",
-                                        params={"sessionId": session_id},
-                                        json=mcp_message,
-                                        headers={"Content-Type": "application/json"}
-                                    )
-
-                                    if tool_response.status_code in (200, 202):
-                                        # Status 202 means Accepted (async processing)
-                                        if tool_response.status_code == 202:
-                                            logger.info("memory_hub_message_accepted")
-                                            # For 202, the result comes on SSE stream
-                                            # but we just return success since card is created
-                                            return {"success": True, "action": "accepted"}
-
-                                        try:
-                                            result = tool_response.json()
-
-                                            # Handle JSON-RPC response format
-                                            if "result" in result:
-                                                tool_result = result["result"]
-                                                if isinstance(tool_result, dict) and "content" in tool_result:
-                                                    contents = tool_result.get("content", [])
-                                                    if contents and isinstance(contents, list):
-                                                        for content in contents:
-                                                            if content.get("type") == "text":
-                                                                try:
-                                                                    return json.loads(content.get("text", "{}"))
-                                                                except json.JSONDecodeError:
-                                                                    return {"text": content.get("text")}
-                                                return tool_result
-                                            return result
-                                        except json.JSONDecodeError:
-                                            # Non-JSON response (like "Accepted")
-                                            return {"success": True, "response": tool_response.text[:200]}
-                                    else:
-                                        logger.error("memory_hub_tool_call_failed", status=tool_response.status_code)
-                                        return {"error": f"Tool call failed: {tool_response.status_code} - {tool_response.text[:200]}"}
-
-                                # Exit the SSE loop after we're done
-                                break
-
-                        # Safety limit
-                        if len(collected_data) > 2000:
-                            logger.error("memory_hub_no_session_id_found")
-                            return {"error": "No session ID found in SSE stream"}
-
-                    if not session_id:
-                        return {"error": "Session ID not found in SSE stream"}
-
-            except httpx.TimeoutException:
-                logger.error("memory_hub_sse_timeout", tool=tool_name)
-                return {"error": "SSE timeout"}
-            except Exception as e:
-                logger.error("memory_hub_sse_error", error=str(e))
-                return {"error": str(e)}
+        sse_client = self._get_client()
+
+        async with self._sse_slots:
+            return await self._call_tool_sse_stream(sse_client, tool_name, arguments)
+
+    async def _call_tool_sse_stream(
+        self,
+        sse_client: httpx.AsyncClient,
+        tool_name: str,
+        arguments: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Run one SSE tool call (caller holds an SSE slot)."""
+        try:
+            # Step 1: Open SSE stream and keep it open
+            async with sse_client.stream(
+                "GET",
+                f"{self.base_url}/sse",
+                headers={"Accept": "text/event-stream"},
+                timeout=60.0
+            ) as response:
+                if response.status_code != 200:
+                    logger.error("memory_hub_sse_connect_failed", status=response.status_code)
+                    return {"error": f"SSE connect failed: {response.status_code}"}
+
+                # Read chunks until we find the session ID
+                session_id = None
+                collected_data = ""
+
+                async for chunk in response.aiter_text():
+                    collected_data += chunk
+                    logger.debug("memory_hub_sse_chunk", chunk_len=len(chunk))
+
+                    # Look for sessionId in the data
+                    if "sessionId=" in collected_data:
+                        match = re.search(r'sessionId=([a-f0-9-]+)', collected_data)
+                        if match:
+                            session_id = match.group(1)
+                            logger.debug("memory_hub_session_obtained", session_id=session_id)
+
+                            # Step 2: Call /message while SSE is still open!
+                            # POST on the pooled client (the SSE GET keeps its own connection/stream)
+                            mcp_message = {
+                                "jsonrpc": "2.0",
+                                "id": str(uuid.uuid4()),
+                                "method": "tools/call",
+                                "params": {
+                                    "name": tool_name,
+                                    "arguments": arguments
+                                }
+                            }
+
+                            tool_response = await sse_client.post(
+                                f"{self.base_url}/message",
+                                params={"sessionId": session_id},
+                                json=mcp_message,
+                                headers={"Content-Type": "application/json"}
+                            )
+
+                            if tool_response.status_code in (200, 202):
+                                # Status 202 means Accepted (async processing)
+                                if tool_response.status_code == 202:
+                                    logger.info("memory_hub_message_accepted")
+                                    # For 202, the result comes on SSE stream
+                                    # but we just return success since card is created
+                                    return {"success": True, "action": "accepted"}
+
+                                try:
+                                    result = tool_response.json()
+
+                                    # Handle JSON-RPC response format
+                                    if "result" in result:
+                                        tool_result = result["result"]
+                                        if isinstance(tool_result, dict) and "content" in tool_result:
+                                            contents = tool_result.get("content", [])
+                                            if contents and isinstance(contents, list):
+                                                for content in contents:
+                                                    if content.get("type") == "text":
+                                                        try:
+                                                            return json.loads(content.get("text", "{}"))
+                                                        except json.JSONDecodeError:
+                                                            return {"text": content.get("text")}
+                                        return tool_result
+                                    return result
+                                except json.JSONDecodeError:
+                                    # Non-JSON response (like "Accepted")
+                                    return {"success": True, "response": tool_response.text[:200]}
+                            else:
+                                logger.error("memory_hub_tool_call_failed", status=tool_response.status_code)
+                                return {"error": f"Tool call failed: {tool_response.status_code} - {tool_response.text[:200]}"}
+
+                            # Exit the SSE loop after we're done
+                            break
+
+                    # Safety limit
+                    if len(collected_data) > 2000:
+                        logger.error("memory_hub_no_session_id_found")
+                        return {"error": "No session ID found in SSE stream"}
+
+                if not session_id:
+                    return {"error": "Session ID not found in SSE stream"}
+
+        except httpx.TimeoutException:
+            logger.error("memory_hub_sse_timeout", tool=tool_name)
+            return {"error": "SSE timeout"}
+        except Exception as e:
+            logger.error("memory_hub_sse_error", error=str(e))
+            return {"error": str(e)}
 
     async def _call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
         Call an MCP tool on the Memory-Hub server.
 
-        Tries streamable HTTP first, falls back to SSE if not available.
+        Tries streamable HTTP first and falls back to SSE if it is not
+        available. The transport that worked is remembered, so later calls
+        go straight to it.
 
         Args:
             tool_name: Name of the tool (e.g., "memory_create")
@@ -253,13 +350,19 @@ class MemoryHubClient:
         Returns:
             Tool result
         """
+        if self._transport == TRANSPORT_SSE:
+            return await self._call_tool_sse(tool_name, arguments)
+
         # Try streamable HTTP transport first (more reliable)
         result = await self._call_tool_streamable_http(tool_name, arguments)
 
         if result is None:
             # Streamable HTTP not available, fallback to SSE
             logger.info("memory_hub_fallback_to_sse", tool=tool_name)
+            self._transport = TRANSPORT_SSE
             result = await self._call_tool_sse(tool_name, arguments)
+        elif self._transport is None and not (isinstance(result, dict) and result.get("error")):
+            self._transport = TRANSPORT_STREAMABLE_HTTP
 
         return result
 
@@ -270,15 +373,14 @@ class MemoryHubClient:
         Returns:
             Health status dict
         """
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            try:
-                response = await client.get(f"{self.base_url}/health")
-                if response.status_code == 200:
-                    return response.json()
-                return {"status": "unhealthy", "code": response.status_code}
-            except Exception as e:
-                logger.error("memory_hub_health_error", error=str(e))
-                return {"status": "error", "error": str(e)}
+        try:
+            response = await self._get_client().get(f"{self.base_url}/health", timeout=10.0)
+            if response.status_code == 200:
+                return response.json()
+            return {"status": "unhealthy", "code": response.status_code}
+        except Exception as e:
+            logger.error("memory_hub_health_error", error=str(e))
+            return {"status": "error", "error": str(e)}
 
     async def create_card(
         self,
@@ -344,6 +446,53 @@ class MemoryHubClient:
 
         return result
 
+    async def create_cards_batch(
+        self,
+        cards: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Create several memory cards in one burst.
+
+        Requests are sent concurrently over the pooled client (multiplexed
+        on one connection with HTTP/2). The transport is probed with the
+        first card if it isn't known yet.
+
+        Args:
+            cards: create_card keyword arguments per card
+            max_concurrency: Max requests in flight (defaults to MEMORY_HUB_MAX_CONCURRENCY;
+                capped at max_connections // 2 so SSE calls can't exhaust the pool)
+
+        Returns:
+            Results aligned with cards (errors as {"error": ...})
+        """
+        if not cards:
+            return []
+
+        semaphore = asyncio.Semaphore(min(max_concurrency or self.max_concurrency, self.max_sse_calls))
+
+        async def create(card: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self.create_card(**card)
+                except Exception as e:
+                    logger.error("memory_hub_create_failed", title=card.get("title"), error=str(e))
+                    return {"error": str(e)}
+
+        results: List[Dict[str, Any]] = []
+        if self._transport is None:
+            results.append(await create(cards[0]))
+            cards = cards[1:]
+
+        results.extend(await asyncio.gather(*(create(card) for card in cards)))
+
+        logger.info(
+            "memory_hub_batch_created",
+            cards=len(results),
+            failed=sum(1 for r in results if not is_card_saved(r))
+        )
+        return results
+
     async def search(
         self,
         query: str,
@@ -378,6 +527,13 @@ class MemoryHubClient:
 
     async def close(self):
         """Close the client and cleanup resources."""
+        if self._client is not None:
+            try:
+                await self._client.aclose()
+            except Exception as e:
+                logger.debug("memory_hub_client_close_error", error=str(e))
+            self._client = None
+            self._client_loop = None
         logger.debug("memory_hub_client_closed")
 
 
@@ -398,6 +554,21 @@ def get_memory_hub_client() -> MemoryHubClient:
     return _client
 
 
+def is_card_saved(result: Any) -> bool:
+    """
+    Check a create_card result for success indicators.
+
+    Note: SSE transport returns "accepted" for 202 responses.
+    """
+    if not isinstance(result, dict):
+        return False
+    return bool(
+        result.get("success", False) or
+        result.get("id") is not None or
+        result.get("action") in ["created", "updated", "accepted"]
+    )
+
+
 async def save_to_memory_hub(
     type: str,
     title: str,
@@ -428,13 +599,7 @@ async def save_to_memory_hub(
             on_duplicate="update"
         )
 
-        # Check for success indicators
-        # Note: SSE transport returns "accepted" for 202 responses
-        success = (
-            result.get("success", False) or
-            result.get("id") is not None or
-            result.get("action") in ["created", "updated", "accepted"]
-        )
+        success = is_card_saved(result)
 
         if success:
             logger.info(
@@ -454,3 +619,25 @@ async def save_to_memory_hub(
     except Exception as e:
         logger.error("memory_hub_save_error", error=str(e), title=title)
         return False
+
+
+async def save_cards_to_memory_hub(cards: List[Dict[str, Any]]) -> List[bool]:
+    """
+    Convenience function to save several cards to Memory-Hub in one burst.
+
+    Args:
+        cards: create_card keyword arguments per card (on_duplicate defaults to "update")
+
+    Returns:
+        Success flag per card
+    """
+    try:
+        client = get_memory_hub_client()
+        results = await client.create_cards_batch([
+            {"on_duplicate": "update", **card} for card in cards
+        ])
+        return [is_card_saved(result) for result in results]
+
+    except Exception as e:
+        logger.error("memory_hub_batch_save_error", error=str(e), cards=len(cards))
+        return [False] * len(cards)
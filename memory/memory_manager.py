@@ -3,7 +3,8 @@ Memory Manager
 ==============
 
 Unified interface for three-tier memory architecture:
-- Tier 1: Redis (working memory, hot cache)
+- Tier 1: Redis (working memory, hot cache), optionally fronted by an
+  opt-in in-process L1 cache (local_cache.py, MEMORY_L1_ENABLED)
 - Tier 2: Qdrant (semantic memory, vector search)
 - Tier 3: PostgreSQL (structured data - handled by existing code)
 
@@ -11,18 +12,29 @@ This is the main API that agents use to interact with memory.
 """
 
 import os
-from typing import List, Dict, Any, Optional
+import json
+import asyncio
+import hashlib
+from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
 import structlog
 
 from .embeddings import EmbeddingGenerator, get_embedding_generator
-from .qdrant_client import QdrantClientWrapper, get_qdrant_client
+from .qdrant_client import QdrantClientWrapper, get_qdrant_client, stable_point_id
 from .redis_cache import RedisCache, get_redis_cache
+from .local_cache import LocalSearchCache
 from .collections import get_collection_config, get_all_collection_names
 
 logger = structlog.get_logger(__name__)
 
 
+def _fingerprint(value: Any) -> str:
+    """Stable hash of content or metadata for change detection."""
+    if not isinstance(value, str):
+        value = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()[:16]
+
+
 class MemoryManager:
     """
     Unified memory manager for agent system.
@@ -51,6 +63,7 @@ class MemoryManager:
         embedding_generator: Optional[EmbeddingGenerator] = None,
         qdrant_client: Optional[QdrantClientWrapper] = None,
         redis_cache: Optional[RedisCache] = None,
+        local_cache: Optional[LocalSearchCache] = None,
         enabled: bool = True
     ):
         """
@@ -60,6 +73,7 @@ class MemoryManager:
             embedding_generator: Custom embedding generator (or uses global)
             qdrant_client: Custom Qdrant client (or uses global)
             redis_cache: Custom Redis cache (or uses global)
+            local_cache: Custom in-process L1 cache (or built from MEMORY_L1_* env vars)
             enabled: Whether memory system is enabled (from ENABLE_MEMORY env var)
         """
         self.enabled = enabled and os.getenv("ENABLE_MEMORY", "true").lower() == "true"
@@ -72,6 +86,7 @@ class MemoryManager:
         self.embedding_generator = embedding_generator or get_embedding_generator()
         self.qdrant_client = qdrant_client or get_qdrant_client()
         self.redis_cache = redis_cache or get_redis_cache()
+        self.local_cache = local_cache or LocalSearchCache.from_env()
 
         # Config
         self.max_results = int(os.getenv("MAX_MEMORY_RESULTS", "10"))
@@ -132,11 +147,15 @@ class MemoryManager:
             collection: Collection name (e.g., "invoices", "social_posts")
             content: Text content to embed
             metadata: Additional metadata to store with the vector
-            doc_id: Optional document ID (auto-generated if not provided)
+            doc_id: Optional document ID (derived from content if not provided,
+                so identical content always maps to the same point)
 
         Returns:
             Document ID
 
+        Unchanged documents are skipped entirely; if only metadata changed,
+        the payload is updated without re-embedding.
+
         Example:
             doc_id = await manager.save(
                 collection="invoices",
@@ -154,39 +173,24 @@ class MemoryManager:
             return -1
 
         try:
-            # Generate embedding
-            vector = await self.embedding_generator.generate_single(content)
-
-            # Add timestamp to metadata
-            metadata_with_timestamp = {
-                **metadata,
-                "created_at": datetime.utcnow().isoformat(),
-                "_content_preview": content[:100]  # Store preview for debugging
-            }
-
             # Generate ID if not provided
             if doc_id is None:
-                doc_id = hash(content + str(metadata))
+                doc_id = stable_point_id(content)
 
-            # Upsert to Qdrant
-            points = [{
+            outcome = await self._save_items(collection, [{
                 "id": doc_id,
-                "vector": vector,
-                "payload": metadata_with_timestamp
-            }]
-
-            await self.qdrant_client.upsert_points(collection, points)
+                "content": content,
+                "metadata": metadata
+            }])
 
             logger.info(
                 "memory_saved",
                 collection=collection,
                 doc_id=doc_id,
-                content_preview=content[:50]
+                content_preview=content[:50],
+                **outcome
             )
 
-            # Invalidate related cache entries
-            await self.redis_cache.clear_collection(collection)
-
             return doc_id
 
         except Exception as e:
@@ -242,12 +246,35 @@ class MemoryManager:
             top_k = self.max_results
 
         try:
-            # Check cache first
+            # Check cache first (L1, then Redis)
+            local_generation = self.local_cache.generation(collection) if self.local_cache is not None else None
+            if use_cache and self.local_cache is not None:
+                local_results = self.local_cache.get(
+                    collection,
+                    query,
+                    top_k=top_k,
+                    filters=filters,
+                    score_threshold=self.similarity_threshold
+                )
+                if local_results is not None:
+                    logger.debug("using_local_cached_results", collection=collection)
+                    return local_results
+
             if use_cache:
-                cached_results = await self.redis_cache.get(collection, query)
+                cached_results = await self.redis_cache.get(
+                    collection,
+                    query,
+                    top_k=top_k,
+                    filters=filters,
+                    score_threshold=self.similarity_threshold
+                )
                 if cached_results is not None:
                     logger.debug("using_cached_results", collection=collection)
-                    return cached_results[:top_k]
+                    self._set_local(collection, query, cached_results, top_k, filters, local_generation)
+                    return cached_results
+
+            # Read the generation before searching so a concurrent invalidation wins
+            generation = await self.redis_cache.get_generation(collection) if use_cache else None
 
             # Generate query embedding
             query_vector = await self.embedding_generator.generate_single(query)
@@ -263,7 +290,16 @@ class MemoryManager:
 
             # Cache results
             if use_cache and results:
-                await self.redis_cache.set(collection, query, results)
+                await self.redis_cache.set(
+                    collection,
+                    query,
+                    results,
+                    top_k=top_k,
+                    filters=filters,
+                    score_threshold=self.similarity_threshold,
+                    generation=generation
+                )
+                self._set_local(collection, query, results, top_k, filters, local_generation)
 
             logger.info(
                 "memory_search_complete",
@@ -288,6 +324,277 @@ class MemoryManager:
 
             return []
 
+    async def search_many(
+        self,
+        collection: str,
+        queries: List[str],
+        top_k: Optional[int] = None,
+        filters: Optional[Union[Dict[str, Any], List[Optional[Dict[str, Any]]]]] = None,
+        use_cache: bool = True,
+        score_threshold: Optional[float] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search memory for several queries at once.
+
+        Cache misses are embedded in one batch and sent to Qdrant as a single
+        batch search request.
+
+        Args:
+            collection: Collection to search
+            queries: Query texts
+            top_k: Number of results per query (defaults to MAX_MEMORY_RESULTS)
+            filters: One filter dict for all queries, or a list aligned with queries
+            use_cache: Use L1 / Redis cache
+            score_threshold: Minimum similarity (defaults to MEMORY_SIMILARITY_THRESHOLD)
+
+        Returns:
+            List of result lists aligned with queries
+
+        Raises:
+            ValueError: If filters is a list of a different length than queries
+
+        Example:
+            results = await manager.search_many(
+                collection="social_posts",
+                queries=[caption_a, caption_b],
+                top_k=1,
+                filters={"brand": "pomandi"}
+            )
+        """
+        if isinstance(filters, list) and len(filters) != len(queries):
+            raise ValueError(f"Got {len(filters)} filters for {len(queries)} queries")
+
+        if not self.enabled:
+            logger.debug("memory_disabled_returning_empty")
+            return [[] for _ in queries]
+
+        if not queries:
+            return []
+
+        if top_k is None:
+            top_k = self.max_results
+        if score_threshold is None:
+            score_threshold = self.similarity_threshold
+
+        if isinstance(filters, list):
+            query_filters = filters
+        else:
+            query_filters = [filters] * len(queries)
+
+        results: List[Optional[List[Dict[str, Any]]]] = [None] * len(queries)
+
+        try:
+            # Check cache first (L1, then Redis concurrently)
+            local_generation = self.local_cache.generation(collection) if self.local_cache is not None else None
+            if use_cache:
+                redis_lookups = []
+                for i, query in enumerate(queries):
+                    if self.local_cache is not None:
+                        results[i] = self.local_cache.get(
+                            collection, query, top_k=top_k,
+                            filters=query_filters[i], score_threshold=score_threshold
+                        )
+                    if results[i] is None:
+                        redis_lookups.append(i)
+
+                if redis_lookups:
+                    cached = await asyncio.gather(*(
+                        self.redis_cache.get(
+                            collection, queries[i], top_k=top_k,
+                            filters=query_filters[i], score_threshold=score_threshold
+                        )
+                        for i in redis_lookups
+                    ))
+                    for i, cached_results in zip(redis_lookups, cached):
+                        if cached_results is not None:
+                            results[i] = cached_results
+
+            # Deduplicate remaining (query, filters) pairs
+            pending: Dict[str, List[int]] = {}
+            for i, query in enumerate(queries):
+                if results[i] is None:
+                    key = json.dumps([query, query_filters[i] or {}], sort_keys=True, default=str)
+                    pending.setdefault(key, []).append(i)
+
+            if pending:
+                first_indices = [indices[0] for indices in pending.values()]
+                generation = await self.redis_cache.get_generation(collection) if use_cache else None
+
+                vectors = await self.embedding_generator.generate_batch(
+                    [queries[i] for i in first_indices]
+                )
+                batch_results = await self.qdrant_client.search_batch(
+                    collection_name=collection,
+                    query_vectors=vectors,
+                    top_k=top_k,
+                    filters=[query_filters[i] for i in first_indices],
+                    score_threshold=score_threshold
+                )
+
+                for indices, query_results in zip(pending.values(), batch_results):
+                    for i in indices:
+                        results[i] = list(query_results)
+
+                    if use_cache and query_results:
+                        i = indices[0]
+                        await self.redis_cache.set(
+                            collection, queries[i], query_results, top_k=top_k,
+                            filters=query_filters[i], score_threshold=score_threshold,
+                            generation=generation
+                        )
+                        if self.local_cache is not None:
+                            self.local_cache.set(
+                                collection, queries[i], query_results, top_k=top_k,
+                                filters=query_filters[i], score_threshold=score_threshold,
+                                generation=local_generation
+                            )
+
+            logger.info(
+                "memory_search_many_complete",
+                collection=collection,
+                queries=len(queries),
+                searched=len(pending)
+            )
+
+            return results  # type: ignore
+
+        except Exception as e:
+            logger.error(
+                "memory_search_many_failed",
+                collection=collection,
+                queries=len(queries),
+                error=str(e)
+            )
+
+            if not self.fallback_enabled:
+                raise
+
+            return [r if r is not None else [] for r in results]
+
+    async def _save_items(
+        self,
+        collection: str,
+        items: List[Dict[str, Any]]
+    ) -> Dict[str, int]:
+        """
+        Persist items, skipping work for documents already stored unchanged.
+
+        Args:
+            collection: Collection name
+            items: Dicts with 'id', 'content' and 'metadata'
+
+        Returns:
+            Counts of embedded, payload_updated and unchanged items
+        """
+        # Last item wins for duplicate IDs within one call
+        by_id = {item["id"]: item for item in items}
+
+        try:
+            existing = await self.qdrant_client.retrieve_points(collection, list(by_id))
+        except Exception as e:
+            logger.warning("existing_points_lookup_failed", collection=collection, error=str(e))
+            existing = {}
+
+        to_embed: List[Dict[str, Any]] = []
+        payload_updates: Dict[Any, Dict[str, Any]] = {}
+        unchanged = 0
+        now = datetime.utcnow().isoformat()
+
+        for doc_id, item in by_id.items():
+            content_hash = _fingerprint(item["content"])
+            metadata_hash = _fingerprint(item["metadata"])
+            stored = existing.get(doc_id)
+
+            if stored is None or stored.get("_content_hash") != content_hash:
+                to_embed.append({**item, "content_hash": content_hash, "metadata_hash": metadata_hash})
+            elif stored.get("_metadata_hash") != metadata_hash:
+                payload_updates[doc_id] = {
+                    **item["metadata"],
+                    "created_at": stored.get("created_at", now),
+                    "updated_at": now,
+                    "_content_preview": item["content"][:100],
+                    "_content_hash": content_hash,
+                    "_metadata_hash": metadata_hash
+                }
+            else:
+                unchanged += 1
+
+        if to_embed:
+            texts = [item["content"] for item in to_embed]
+            if len(texts) == 1:
+                # Single saves go through the micro-batcher
+                vectors = [await self.embedding_generator.generate_single(texts[0])]
+            else:
+                vectors = await self.embedding_generator.generate_batch(texts, show_progress=True)
+
+            points = [
+                {
+                    "id": item["id"],
+                    "vector": vector,
+                    "payload": {
+                        **item["metadata"],
+                        "created_at": now,
+                        "_content_preview": item["content"][:100],  # Store preview for debugging
+                        "_content_hash": item["content_hash"],
+                        "_metadata_hash": item["metadata_hash"]
+                    }
+                }
+                for item, vector in zip(to_embed, vectors)
+            ]
+            await self.qdrant_client.upsert_points(collection, points)
+
+        if payload_updates:
+            await self.qdrant_client.overwrite_payloads(collection, payload_updates)
+
+        # Invalidate related cache entries only if something changed
+        if to_embed or payload_updates:
+            await self.invalidate_collection(collection)
+
+        return {
+            "embedded": len(to_embed),
+            "payload_updated": len(payload_updates),
+            "unchanged": unchanged
+        }
+
+    def _set_local(
+        self,
+        collection: str,
+        query: str,
+        results: List[Dict[str, Any]],
+        top_k: int,
+        filters: Optional[Dict[str, Any]],
+        generation: Optional[int] = None
+    ):
+        """Populate the L1 cache (no-op when disabled)."""
+        if self.local_cache is None:
+            return
+
+        self.local_cache.set(
+            collection,
+            query,
+            results,
+            top_k=top_k,
+            filters=filters,
+            score_threshold=self.similarity_threshold,
+            generation=generation
+        )
+
+    async def invalidate_collection(self, collection: str, purge: bool = False):
+        """
+        Invalidate cached search results for a collection in all cache tiers.
+
+        Args:
+            collection: Collection name
+            purge: Also sweep stale Redis keys in the background
+        """
+        if not self.enabled:
+            return
+
+        if self.local_cache is not None:
+            self.local_cache.clear_collection(collection)
+
+        await self.redis_cache.clear_collection(collection, purge=purge)
+
     async def batch_save(
         self,
         collection: str,
@@ -298,10 +605,14 @@ class MemoryManager:
 
         Args:
             collection: Collection name
-            items: List of dicts with 'content' and 'metadata' keys
+            items: List of dicts with 'content', 'metadata' and optional 'id' keys
 
         Returns:
-            Number of items saved
+            Number of items saved (including ones already up to date)
+
+        Existing points are fetched in one request first; only new or
+        changed content is embedded and upserted, and metadata-only changes
+        overwrite the payload without re-embedding.
 
         Example:
             items = [
@@ -321,42 +632,25 @@ class MemoryManager:
             return 0
 
         try:
-            # Extract texts for batch embedding
-            texts = [item["content"] for item in items]
-
-            # Generate embeddings in batch
-            vectors = await self.embedding_generator.generate_batch(texts, show_progress=True)
-
-            # Prepare points
-            points = []
-            for i, item in enumerate(items):
-                metadata_with_timestamp = {
-                    **item["metadata"],
-                    "created_at": datetime.utcnow().isoformat(),
-                    "_content_preview": item["content"][:100]
+            prepared = [
+                {
+                    "id": item.get("id", stable_point_id(item["content"])),
+                    "content": item["content"],
+                    "metadata": item["metadata"]
                 }
+                for item in items
+            ]
 
-                doc_id = item.get("id", hash(item["content"] + str(item["metadata"])))
-
-                points.append({
-                    "id": doc_id,
-                    "vector": vectors[i],
-                    "payload": metadata_with_timestamp
-                })
-
-            # Upsert batch
-            count = await self.qdrant_client.upsert_points(collection, points)
+            outcome = await self._save_items(collection, prepared)
 
             logger.info(
                 "batch_save_complete",
                 collection=collection,
-                items_saved=count
+                items_saved=len(prepared),
+                **outcome
             )
 
-            # Invalidate cache
-            await self.redis_cache.clear_collection(collection)
-
-            return count
+            return len(prepared)
 
         except Exception as e:
             logger.error(
@@ -398,6 +692,7 @@ class MemoryManager:
         stats = {
             "enabled": self.enabled,
             "cache": self.redis_cache.get_stats(),
+            "local_cache": self.local_cache.get_stats() if self.local_cache is not None else {"enabled": False},
             "embedding_cache": self.embedding_generator.get_cache_stats(),
             "collections": {}
         }
@@ -416,6 +711,9 @@ class MemoryManager:
         if not self.enabled:
             return
 
+        if self.local_cache is not None:
+            self.local_cache.clear_all()
+
         await self.redis_cache.clear_all()
         logger.info("memory_cache_cleared")
 
@@ -426,6 +724,7 @@ class MemoryManager:
 
         await self.redis_cache.close()
         await self.qdrant_client.close()
+        await self.embedding_generator.close()
         logger.info("memory_manager_closed")
 
 
@@ -7,7 +7,10 @@ Handles connection pooling, error handling, and retries.
 """
 
 import os
-from typing import List, Dict, Any, Optional
+import json
+import asyncio
+import hashlib
+from typing import List, Dict, Any, Optional, Union
 from qdrant_client import AsyncQdrantClient
 from qdrant_client.models import (
     Distance,
@@ -16,16 +19,40 @@ from qdrant_client.models import (
     Filter,
     FieldCondition,
     MatchValue,
-    SearchRequest
+    SearchRequest,
+    SearchParams,
+    QuantizationSearchParams,
+    SetPayload,
+    OverwritePayloadOperation,
+    CollectionParamsDiff,
+    VectorParamsDiff,
+    Disabled
 )
 import structlog
 from tenacity import retry, stop_after_attempt, wait_exponential
 
-from .collections import get_collection_config, get_all_collection_names
+from .collections import (
+    get_collection_config,
+    get_all_collection_names,
+    get_storage_config,
+    build_quantization_config,
+    build_hnsw_config
+)
 
 logger = structlog.get_logger(__name__)
 
 
+def stable_point_id(text: str) -> int:
+    """
+    Derive a stable point ID from text (same on every process and run).
+
+    Unlike hash(), this is not randomized by PYTHONHASHSEED. Returns a
+    positive 63-bit integer, which Qdrant accepts as an unsigned point ID.
+    """
+    digest = hashlib.sha256(text.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") >> 1
+
+
 class QdrantClientWrapper:
     """
     Async Qdrant client with convenience methods.
@@ -43,7 +70,10 @@ class QdrantClientWrapper:
         host: Optional[str] = None,
         port: Optional[int] = None,
         api_key: Optional[str] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        upsert_concurrency: Optional[int] = None,
+        upsert_max_bytes: Optional[int] = None,
+        migrate_storage: Optional[bool] = None
     ):
         """
         Initialize Qdrant client.
@@ -53,11 +83,23 @@ class QdrantClientWrapper:
             port: Qdrant port (defaults to QDRANT_PORT env var)
             api_key: API key for authentication (optional)
             timeout: Request timeout in seconds
+            upsert_concurrency: Upsert batches in flight (defaults to QDRANT_UPSERT_CONCURRENCY)
+            upsert_max_bytes: Approximate max request size per upsert batch
+                (defaults to QDRANT_UPSERT_MAX_BYTES)
+            migrate_storage: Apply storage profile changes (quantization, on-disk)
+                to existing collections (defaults to QDRANT_MIGRATE_STORAGE)
         """
         self.host = host or os.getenv("QDRANT_HOST", "localhost")
         self.port = port or int(os.getenv("QDRANT_PORT", "6333"))
         self.api_key = api_key or os.getenv("QDRANT_API_KEY")
         self.timeout = timeout
+        self.upsert_concurrency = upsert_concurrency or int(os.getenv("QDRANT_UPSERT_CONCURRENCY", "4"))
+        self.upsert_max_bytes = upsert_max_bytes or int(
+            os.getenv("QDRANT_UPSERT_MAX_BYTES", str(8 * 1024 * 1024))
+        )
+        if migrate_storage is None:
+            migrate_storage = os.getenv("QDRANT_MIGRATE_STORAGE", "true").lower() == "true"
+        self.migrate_storage = migrate_storage
 
         # Initialize client
         self.client = AsyncQdrantClient(
@@ -102,6 +144,10 @@ class QdrantClientWrapper:
         """
         Create collection if it doesn't exist.
 
+        New collections get the storage profile from collections.py
+        (quantization, on-disk vectors/payload, HNSW params). Existing ones
+        are migrated in place when migrate_storage is enabled.
+
         Args:
             collection_name: Name of the collection
             vectors_config: Vector configuration (defaults to config from collections.py)
@@ -116,24 +162,39 @@ class QdrantClientWrapper:
 
             if collection_name in existing_names:
                 logger.debug("collection_already_exists", collection=collection_name)
+                if self.migrate_storage and vectors_config is None:
+                    await self.apply_storage_config(collection_name)
                 return False
 
             # Get default config if not provided
+            storage = None
             if vectors_config is None:
                 config = get_collection_config(collection_name)
                 vectors_config = config["vectors_config"]
+                storage = get_storage_config(collection_name)
 
             # Create collection
-            await self.client.create_collection(
-                collection_name=collection_name,
-                vectors_config=vectors_config
-            )
+            if storage is None:
+                await self.client.create_collection(
+                    collection_name=collection_name,
+                    vectors_config=vectors_config
+                )
+            else:
+                await self.client.create_collection(
+                    collection_name=collection_name,
+                    vectors_config=vectors_config,
+                    on_disk_payload=storage["on_disk_payload"],
+                    hnsw_config=build_hnsw_config(storage["hnsw"]),
+                    quantization_config=build_quantization_config(storage["quantization"])
+                )
 
             logger.info(
                 "collection_created",
                 collection=collection_name,
                 vector_size=vectors_config.size,
-                distance=vectors_config.distance
+                distance=vectors_config.distance,
+                quantization=storage["quantization"] if storage else None,
+                vectors_on_disk=bool(vectors_config.on_disk)
             )
             return True
 
@@ -141,19 +202,150 @@ class QdrantClientWrapper:
             logger.error("collection_creation_failed", collection=collection_name, error=str(e))
             raise
 
+    async def apply_storage_config(self, collection_name: str) -> bool:
+        """
+        Bring an existing collection in line with its storage profile.
+
+        Quantization, on-disk vectors/payload and HNSW params can be changed
+        in place; Qdrant rebuilds the affected segments in the background
+        while the collection stays searchable. A vector size change cannot
+        be applied in place: recreate the collection and run
+        scripts/backfill_embeddings.py.
+
+        Args:
+            collection_name: Name of the collection
+
+        Returns:
+            True if an update was sent, False if already up to date
+        """
+        config = get_collection_config(collection_name)
+        storage = get_storage_config(collection_name)
+        wanted_vectors: VectorParams = config["vectors_config"]
+
+        info = await self.client.get_collection(collection_name)
+        params = info.config.params
+        current_vectors = params.vectors
+
+        if isinstance(current_vectors, VectorParams) and current_vectors.size != wanted_vectors.size:
+            logger.error(
+                "collection_dimension_mismatch",
+                collection=collection_name,
+                current_size=current_vectors.size,
+                expected_size=wanted_vectors.size,
+                action="recreate collection and run scripts/backfill_embeddings.py"
+            )
+            return False
+
+        wanted_quantization = build_quantization_config(storage["quantization"])
+        wanted_hnsw = build_hnsw_config(storage["hnsw"])
+        current_hnsw = info.config.hnsw_config
+
+        changes: Dict[str, Any] = {}
+
+        if type(info.config.quantization_config) is not type(wanted_quantization):
+            changes["quantization"] = storage["quantization"]
+        if bool(getattr(current_vectors, "on_disk", False)) != bool(wanted_vectors.on_disk):
+            changes["vectors_on_disk"] = bool(wanted_vectors.on_disk)
+        if bool(params.on_disk_payload) != storage["on_disk_payload"]:
+            changes["on_disk_payload"] = storage["on_disk_payload"]
+        if wanted_hnsw is not None and (
+            current_hnsw.m != wanted_hnsw.m or current_hnsw.ef_construct != wanted_hnsw.ef_construct
+        ):
+            changes["hnsw"] = storage["hnsw"]
+
+        if not changes:
+            return False
+
+        if "quantization" in changes and wanted_quantization is None:
+            # Disabled quantization must be removed explicitly
+            wanted_quantization = Disabled.DISABLED
+
+        await self.client.update_collection(
+            collection_name=collection_name,
+            vectors_config={"": VectorParamsDiff(on_disk=wanted_vectors.on_disk)}
+            if "vectors_on_disk" in changes else None,
+            collection_params=CollectionParamsDiff(on_disk_payload=storage["on_disk_payload"])
+            if "on_disk_payload" in changes else None,
+            hnsw_config=wanted_hnsw if "hnsw" in changes else None,
+            quantization_config=wanted_quantization if "quantization" in changes else None
+        )
+
+        logger.info("collection_storage_migrated", collection=collection_name, changes=changes)
+        return True
+
+    def _search_params(self, collection_name: str) -> Optional[SearchParams]:
+        """Rescoring params for quantized collections (None for in-memory ones)."""
+        try:
+            storage = get_storage_config(collection_name)
+        except ValueError:
+            return None
+
+        if not storage["quantization"]:
+            return None
+
+        return SearchParams(
+            quantization=QuantizationSearchParams(
+                rescore=True,
+                oversampling=storage["oversampling"]
+            )
+        )
+
+    def _split_batches(
+        self,
+        points: List[Dict[str, Any]],
+        batch_size: int,
+        max_bytes: int
+    ) -> List[List[PointStruct]]:
+        """
+        Split points into batches capped by count and approximate request bytes.
+
+        Vector bytes are estimated at ~12 bytes per float as serialized JSON.
+        """
+        batches: List[List[PointStruct]] = []
+        current: List[PointStruct] = []
+        current_bytes = 0
+
+        for point in points:
+            size = len(point["vector"]) * 12 + len(json.dumps(point["payload"], default=str))
+
+            if current and (len(current) >= batch_size or current_bytes + size > max_bytes):
+                batches.append(current)
+                current = []
+                current_bytes = 0
+
+            current.append(PointStruct(
+                id=point.get("id", stable_point_id(str(point["payload"]))),  # Auto-generate ID if missing
+                vector=point["vector"],
+                payload=point["payload"]
+            ))
+            current_bytes += size
+
+        if current:
+            batches.append(current)
+
+        return batches
+
     async def upsert_points(
         self,
         collection_name: str,
         points: List[Dict[str, Any]],
-        batch_size: int = 100
+        batch_size: int = 100,
+        max_in_flight: Optional[int] = None
     ) -> int:
         """
         Upsert points into collection (insert or update).
 
+        Batches are pipelined: up to max_in_flight intermediate batches are
+        sent concurrently without waiting for indexing (wait=False). The last
+        batch is sent with wait=True only after all others were acknowledged.
+        Qdrant applies updates in order, so it acts as a consistency barrier:
+        when this returns, every point is searchable.
+
         Args:
             collection_name: Target collection
             points: List of points with 'id', 'vector', and 'payload'
-            batch_size: Points per batch
+            batch_size: Max points per batch (batches are also capped by upsert_max_bytes)
+            max_in_flight: Concurrent batches (defaults to upsert_concurrency; 1 = sequential)
 
         Returns:
             Number of points upserted
@@ -161,35 +353,33 @@ class QdrantClientWrapper:
         if not points:
             return 0
 
-        try:
-            # Convert to PointStruct objects
-            point_structs = [
-                PointStruct(
-                    id=point.get("id", hash(str(point["payload"]))),  # Auto-generate ID if missing
-                    vector=point["vector"],
-                    payload=point["payload"]
-                )
-                for point in points
-            ]
+        max_in_flight = max_in_flight or self.upsert_concurrency
 
-            # Upsert in batches
-            total_upserted = 0
-            for i in range(0, len(point_structs), batch_size):
-                batch = point_structs[i:i + batch_size]
+        try:
+            batches = self._split_batches(points, batch_size, self.upsert_max_bytes)
+            *intermediate, final = batches
 
-                await self.client.upsert(
-                    collection_name=collection_name,
-                    points=batch
-                )
+            semaphore = asyncio.Semaphore(max_in_flight)
 
-                total_upserted += len(batch)
+            async def send(batch: List[PointStruct], wait: bool):
+                async with semaphore:
+                    await self.client.upsert(
+                        collection_name=collection_name,
+                        points=batch,
+                        wait=wait
+                    )
                 logger.debug(
                     "batch_upserted",
                     collection=collection_name,
                     batch_size=len(batch),
-                    total=total_upserted
+                    wait=wait
                 )
 
+            await asyncio.gather(*(send(batch, wait=False) for batch in intermediate))
+            await send(final, wait=True)
+
+            total_upserted = sum(len(batch) for batch in batches)
+
             logger.info(
                 "points_upserted",
                 collection=collection_name,
@@ -227,19 +417,7 @@ class QdrantClientWrapper:
             List of results with 'id', 'score', and 'payload'
         """
         try:
-            # Build filter if provided
-            query_filter = None
-            if filters:
-                conditions = []
-                for key, value in filters.items():
-                    conditions.append(
-                        FieldCondition(
-                            key=key,
-                            match=MatchValue(value=value)
-                        )
-                    )
-                if conditions:
-                    query_filter = Filter(must=conditions)
+            query_filter = self._build_filter(filters)
 
             # Search
             results = await self.client.search(
@@ -247,7 +425,8 @@ class QdrantClientWrapper:
                 query_vector=query_vector,
                 limit=top_k,
                 query_filter=query_filter,
-                score_threshold=score_threshold
+                score_threshold=score_threshold,
+                search_params=self._search_params(collection_name)
             )
 
             # Format results
@@ -277,6 +456,168 @@ class QdrantClientWrapper:
             )
             raise
 
+    async def retrieve_points(
+        self,
+        collection_name: str,
+        ids: List[Union[int, str]]
+    ) -> Dict[Union[int, str], Dict[str, Any]]:
+        """
+        Fetch payloads for existing points (vectors are not transferred).
+
+        Args:
+            collection_name: Collection name
+            ids: Point IDs to look up
+
+        Returns:
+            Dict of point ID -> payload for points that exist
+        """
+        if not ids:
+            return {}
+
+        try:
+            records = await self.client.retrieve(
+                collection_name=collection_name,
+                ids=ids,
+                with_payload=True,
+                with_vectors=False
+            )
+            return {record.id: record.payload or {} for record in records}
+
+        except Exception as e:
+            logger.error("retrieve_points_failed", collection=collection_name, error=str(e))
+            raise
+
+    async def overwrite_payloads(
+        self,
+        collection_name: str,
+        payloads: Dict[Union[int, str], Dict[str, Any]]
+    ) -> int:
+        """
+        Replace payloads of existing points without touching vectors.
+
+        All updates are sent in a single batch request.
+
+        Args:
+            collection_name: Collection name
+            payloads: Dict of point ID -> new payload
+
+        Returns:
+            Number of points updated
+        """
+        if not payloads:
+            return 0
+
+        try:
+            operations = [
+                OverwritePayloadOperation(
+                    overwrite_payload=SetPayload(payload=payload, points=[point_id])
+                )
+                for point_id, payload in payloads.items()
+            ]
+            await self.client.batch_update_points(
+                collection_name=collection_name,
+                update_operations=operations
+            )
+
+            logger.info("payloads_overwritten", collection=collection_name, count=len(payloads))
+            return len(payloads)
+
+        except Exception as e:
+            logger.error("overwrite_payloads_failed", collection=collection_name, error=str(e))
+            raise
+
+    def _build_filter(self, filters: Optional[Dict[str, Any]]) -> Optional[Filter]:
+        """Build a Qdrant filter from {field: value} equality conditions."""
+        if not filters:
+            return None
+
+        conditions = [
+            FieldCondition(
+                key=key,
+                match=MatchValue(value=value)
+            )
+            for key, value in filters.items()
+        ]
+        return Filter(must=conditions)
+
+    async def search_batch(
+        self,
+        collection_name: str,
+        query_vectors: List[List[float]],
+        top_k: int = 10,
+        filters: Optional[List[Optional[Dict[str, Any]]]] = None,
+        score_threshold: Optional[float] = None,
+        batch_size: int = 100
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for several query vectors in one request per batch.
+
+        Args:
+            collection_name: Collection to search
+            query_vectors: Query embeddings
+            top_k: Number of results per query
+            filters: Optional filters aligned with query_vectors
+            score_threshold: Minimum similarity score (0-1)
+            batch_size: Queries per batch request
+
+        Returns:
+            List of result lists aligned with query_vectors
+        """
+        if not query_vectors:
+            return []
+
+        if filters is None:
+            filters = [None] * len(query_vectors)
+
+        try:
+            search_params = self._search_params(collection_name)
+            requests = [
+                SearchRequest(
+                    vector=vector,
+                    filter=self._build_filter(query_filters),
+                    limit=top_k,
+                    score_threshold=score_threshold,
+                    params=search_params,
+                    with_payload=True
+                )
+                for vector, query_filters in zip(query_vectors, filters)
+            ]
+
+            all_results: List[List[Dict[str, Any]]] = []
+            for i in range(0, len(requests), batch_size):
+                batch_results = await self.client.search_batch(
+                    collection_name=collection_name,
+                    requests=requests[i:i + batch_size]
+                )
+
+                all_results.extend(
+                    [
+                        {
+                            "id": result.id,
+                            "score": result.score,
+                            "payload": result.payload
+                        }
+                        for result in results
+                    ]
+                    for results in batch_results
+                )
+
+            logger.debug(
+                "search_batch_complete",
+                collection=collection_name,
+                queries=len(query_vectors)
+            )
+
+            return all_results
+
+        except Exception as e:
+            logger.error(
+                "search_batch_failed",
+                collection=collection_name,
+                error=str(e)
+            )
+            raise
+
     async def get_collection_info(self, collection_name: str) -> Dict[str, Any]:
         """
         Get information about a collection.
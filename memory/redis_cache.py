@@ -4,12 +4,26 @@ Redis Cache Layer
 
 Session-based caching for working memory (24h TTL).
 Used for hot data during agent execution.
+
+Invalidation uses per-collection generation counters: every cache key embeds
+the collection's current generation, so bumping the counter (O(1)) makes all
+older entries unreachable and they simply age out via TTL. Explicit purges
+run as a background SCAN sweep instead of a blocking KEYS + DELETE.
+
+Callers read the generation before searching and pass it to set(), so
+results from a search that overlapped an invalidation are stored under the
+superseded generation and never served.
+
+Search entries are keyed on (collection, query, filters, score_threshold)
+and remember the top_k they were fetched with, so a smaller top_k request
+is served from a larger cached result list.
 """
 
 import os
 import json
+import asyncio
 import hashlib
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Set
 import redis.asyncio as aioredis
 import structlog
 
@@ -25,6 +39,7 @@ class RedisCache:
     - JSON serialization
     - Connection pooling
     - Health checks
+    - O(1) collection invalidation via generation counters
     """
 
     def __init__(
@@ -53,9 +68,13 @@ class RedisCache:
 
         self.client: Optional[aioredis.Redis] = None
 
+        # Background purge tasks (kept referenced until done)
+        self._purge_tasks: Set[asyncio.Task] = set()
+
         # Stats
         self.hits = 0
         self.misses = 0
+        self.invalidations = 0
 
         logger.info(
             "redis_cache_initialized",
@@ -104,50 +123,125 @@ class RedisCache:
             logger.error("redis_health_check_failed", error=str(e))
             return False
 
-    def _make_key(self, collection: str, query: str) -> str:
+    def _generation_key(self, collection: str) -> str:
+        """Key holding the collection's current cache generation."""
+        return f"memory_gen:{collection}"
+
+    async def _get_generation(self, collection: str) -> int:
+        """
+        Get current cache generation for a collection.
+
+        Args:
+            collection: Collection name
+
+        Returns:
+            Generation number (0 if never invalidated)
         """
-        Generate cache key from collection and query.
+        generation = await self.client.get(self._generation_key(collection))
+        return int(generation) if generation else 0
+
+    async def get_generation(self, collection: str) -> Optional[int]:
+        """
+        Read a collection's cache generation before running a search.
+
+        Args:
+            collection: Collection name
+
+        Returns:
+            Generation number, or None when the cache is disabled/unreachable
+        """
+        if not self.enabled or not self.client:
+            return None
+
+        try:
+            return await self._get_generation(collection)
+        except Exception as e:
+            logger.error("cache_generation_read_failed", collection=collection, error=str(e))
+            return None
+
+    def _make_key(
+        self,
+        collection: str,
+        query: str,
+        generation: int = 0,
+        filters: Optional[Dict[str, Any]] = None,
+        score_threshold: Optional[float] = None
+    ) -> str:
+        """
+        Generate cache key from collection, generation and search parameters.
 
         Args:
             collection: Collection name
             query: Query text
+            generation: Collection cache generation
+            filters: Search filters (order-insensitive)
+            score_threshold: Minimum similarity score used for the search
 
         Returns:
             Cache key (hash-based)
         """
-        content = f"{collection}:{query}"
+        content = json.dumps(
+            [collection, query, filters or {}, score_threshold],
+            sort_keys=True,
+            default=str
+        )
         hash_digest = hashlib.sha256(content.encode()).hexdigest()[:16]
-        return f"memory:{collection}:{hash_digest}"
+        return f"memory:{collection}:g{generation}:{hash_digest}"
 
-    async def get(self, collection: str, query: str) -> Optional[list]:
+    async def get(
+        self,
+        collection: str,
+        query: str,
+        top_k: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        score_threshold: Optional[float] = None
+    ) -> Optional[list]:
         """
         Get cached search results.
 
+        An entry cached with a larger top_k (or one that returned fewer
+        results than it asked for) also serves smaller top_k requests.
+
         Args:
             collection: Collection name
             query: Query text
+            top_k: Number of results needed (None accepts any cached entry)
+            filters: Search filters
+            score_threshold: Minimum similarity score
 
         Returns:
-            Cached results or None
+            Cached results (at most top_k) or None
         """
         if not self.enabled or not self.client:
             return None
 
         try:
-            key = self._make_key(collection, query)
+            generation = await self._get_generation(collection)
+            key = self._make_key(collection, query, generation, filters, score_threshold)
             cached_json = await self.client.get(key)
 
             if cached_json:
-                self.hits += 1
-                logger.debug(
-                    "cache_hit",
-                    collection=collection,
-                    query_preview=query[:50]
-                )
-                return json.loads(cached_json)
-            else:
-                self.misses += 1
-                return None
+                entry = json.loads(cached_json)
+                results = entry["results"]
+                cached_top_k = entry.get("top_k")
+
+                # Usable if it holds at least top_k results or is exhaustive
+                if (
+                    top_k is None
+                    or cached_top_k is None
+                    or cached_top_k >= top_k
+                    or len(results) < cached_top_k
+                ):
+                    self.hits += 1
+                    logger.debug(
+                        "cache_hit",
+                        collection=collection,
+                        query_preview=query[:50]
+                    )
+                    return results[:top_k] if top_k is not None else results
+
+            self.misses += 1
+            return None
 
         except Exception as e:
             logger.error("cache_get_failed", error=str(e))
@@ -158,7 +252,11 @@ class RedisCache:
         collection: str,
         query: str,
         results: list,
-        ttl: Optional[int] = None
+        ttl: Optional[int] = None,
+        top_k: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        score_threshold: Optional[float] = None,
+        generation: Optional[int] = None
     ):
         """
         Cache search results.
@@ -168,13 +266,29 @@ class RedisCache:
             query: Query text
             results: Search results to cache
             ttl: Time-to-live in seconds (defaults to default_ttl)
+            top_k: top_k the results were fetched with (None = complete)
+            filters: Search filters
+            score_threshold: Minimum similarity score
+            generation: Generation read before the search ran (see get_generation);
+                if the collection was invalidated since, the entry is unreachable
         """
         if not self.enabled or not self.client:
             return
 
         try:
-            key = self._make_key(collection, query)
-            results_json = json.dumps(results)
+            if generation is None:
+                generation = await self._get_generation(collection)
+            key = self._make_key(collection, query, generation, filters, score_threshold)
+
+            # Never replace a larger superset entry with a smaller one
+            if top_k is not None:
+                existing_json = await self.client.get(key)
+                if existing_json:
+                    existing_top_k = json.loads(existing_json).get("top_k")
+                    if existing_top_k is None or existing_top_k > top_k:
+                        return
+
+            results_json = json.dumps({"top_k": top_k, "results": results})
             ttl_seconds = ttl or self.default_ttl
 
             await self.client.setex(
@@ -193,19 +307,28 @@ class RedisCache:
         except Exception as e:
             logger.error("cache_set_failed", error=str(e))
 
-    async def invalidate(self, collection: str, query: str):
+    async def invalidate(
+        self,
+        collection: str,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        score_threshold: Optional[float] = None
+    ):
         """
         Invalidate cached results for a specific query.
 
         Args:
             collection: Collection name
             query: Query text
+            filters: Search filters
+            score_threshold: Minimum similarity score
         """
         if not self.enabled or not self.client:
             return
 
         try:
-            key = self._make_key(collection, query)
+            generation = await self._get_generation(collection)
+            key = self._make_key(collection, query, generation, filters, score_threshold)
             await self.client.delete(key)
 
             logger.debug(
@@ -217,28 +340,84 @@ class RedisCache:
         except Exception as e:
             logger.error("cache_invalidation_failed", error=str(e))
 
-    async def clear_collection(self, collection: str):
+    async def clear_collection(self, collection: str, purge: bool = False):
         """
-        Clear all cached results for a collection.
+        Invalidate all cached results for a collection.
+
+        Bumps the collection generation (a single INCR), so existing entries
+        are no longer read and expire via TTL.
 
         Args:
             collection: Collection name
+            purge: Also delete stale keys with a background SCAN sweep
         """
         if not self.enabled or not self.client:
             return
 
         try:
-            # Find all keys for this collection
-            pattern = f"memory:{collection}:*"
-            keys = await self.client.keys(pattern)
+            generation = await self.client.incr(self._generation_key(collection))
+            self.invalidations += 1
+            logger.debug("collection_cache_invalidated", collection=collection, generation=generation)
 
-            if keys:
-                await self.client.delete(*keys)
-                logger.info("collection_cache_cleared", collection=collection, keys_deleted=len(keys))
+            if purge:
+                self.purge_collection(collection)
 
         except Exception as e:
             logger.error("clear_collection_failed", collection=collection, error=str(e))
 
+    def purge_collection(self, collection: str) -> Optional[asyncio.Task]:
+        """
+        Start a background sweep deleting stale keys for a collection.
+
+        Args:
+            collection: Collection name
+
+        Returns:
+            The sweeper task (await it to wait for completion)
+        """
+        if not self.enabled or not self.client:
+            return None
+
+        task = asyncio.get_running_loop().create_task(self._sweep_stale_keys(collection))
+        self._purge_tasks.add(task)
+        task.add_done_callback(self._purge_tasks.discard)
+        return task
+
+    async def _sweep_stale_keys(self, collection: str, batch_size: int = 500) -> int:
+        """
+        Delete keys from older generations using incremental SCAN.
+
+        Args:
+            collection: Collection name
+            batch_size: SCAN COUNT hint and UNLINK batch size
+
+        Returns:
+            Number of keys deleted
+        """
+        deleted = 0
+        try:
+            current_prefix = f"memory:{collection}:g{await self._get_generation(collection)}:"
+            stale_keys = []
+
+            async for key in self.client.scan_iter(match=f"memory:{collection}:*", count=batch_size):
+                if key.startswith(current_prefix):
+                    continue
+                stale_keys.append(key)
+
+                if len(stale_keys) >= batch_size:
+                    deleted += await self.client.unlink(*stale_keys)
+                    stale_keys = []
+
+            if stale_keys:
+                deleted += await self.client.unlink(*stale_keys)
+
+            logger.info("collection_cache_purged", collection=collection, keys_deleted=deleted)
+
+        except Exception as e:
+            logger.error("collection_purge_failed", collection=collection, error=str(e))
+
+        return deleted
+
     async def clear_all(self):
         """Clear entire cache (use with caution!)."""
         if not self.enabled or not self.client:
@@ -265,12 +444,16 @@ class RedisCache:
             "enabled": self.enabled,
             "hits": self.hits,
             "misses": self.misses,
+            "invalidations": self.invalidations,
             "total_requests": total,
             "hit_rate_percent": round(hit_rate, 2)
         }
 
     async def close(self):
         """Close Redis connection."""
+        for task in list(self._purge_tasks):
+            task.cancel()
+
         if self.client:
             try:
                 await self.client.close()
@@ -186,6 +186,29 @@ class MemoryMetrics:
         ['collection']
     )
 
+    # In-process L1 search cache (memory/local_cache.py)
+    memory_l1_cache_hit_total = Counter(
+        'memory_l1_cache_hit_total',
+        'Total in-process L1 search cache hits',
+        ['collection']
+    )
+
+    memory_l1_cache_miss_total = Counter(
+        'memory_l1_cache_miss_total',
+        'Total in-process L1 search cache misses',
+        ['collection']
+    )
+
+    memory_l1_cache_entries = Gauge(
+        'memory_l1_cache_entries',
+        'Number of entries in the in-process L1 search cache'
+    )
+
+    memory_l1_cache_bytes = Gauge(
+        'memory_l1_cache_bytes',
+        'Approximate size of the in-process L1 search cache in bytes'
+    )
+
     # Embedding generation
     embedding_generation_total = Counter(
         'embedding_generation_total',
@@ -10,29 +10,45 @@ Imports:
 - Social posts from agent_outputs database
 - Ad reports from agent_outputs database
 
+Rows are streamed with a server-side cursor in id order, embedded with
+bounded concurrency and upserted to Qdrant in parallel. After each
+contiguous run of completed pages the highest id is saved as a per-source
+checkpoint, so a crashed or interrupted run resumes where it stopped.
+
 Usage:
     python scripts/backfill_embeddings.py --collection invoices --limit 100
     python scripts/backfill_embeddings.py --collection social_posts
-    python scripts/backfill_embeddings.py --all
+    python scripts/backfill_embeddings.py --all --yes
+    python scripts/backfill_embeddings.py --collection invoices --reset
 
 Options:
     --collection: Specific collection to backfill (invoices, social_posts, ad_reports)
-    --limit: Max number of records to process (default: 1000)
+    --limit: Max number of records to process in this run (default: all)
     --all: Backfill all collections
     --dry-run: Test without saving to Qdrant
+    --page-size: Rows per cursor page / embedding request (default: 100)
+    --concurrency: Pages embedded and upserted in parallel (default: 4)
+    --checkpoint-file: Checkpoint JSON path (default: BACKFILL_CHECKPOINT_FILE or
+                       .backfill_checkpoints.json)
+    --reset: Ignore and overwrite the existing checkpoint for the collection
+    --yes: Skip the confirmation prompt
 """
 
 import asyncio
 import argparse
+import json
 import os
 import sys
-from typing import List, Dict, Any
+import time
+from datetime import datetime
+from typing import List, Dict, Any, Optional
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 import asyncpg
 from memory import MemoryManager
+from memory.memory_manager import _fingerprint
 import structlog
 
 structlog.configure(
@@ -46,83 +62,22 @@ structlog.configure(
 logger = structlog.get_logger(__name__)
 
 
-async def fetch_invoices(limit: int = 1000) -> List[Dict[str, Any]]:
-    """
-    Fetch invoices from retouche database.
-
-    Returns:
-        List of invoice dicts with content and metadata
-    """
-    print(f"Fetching invoices from retouche database (limit: {limit})...")
+# ============================================================================
+# SOURCES
+# ============================================================================
 
-    # Connect to retouche database
+async def connect_retouche() -> Optional[asyncpg.Connection]:
+    """Connect to retouche database (invoices)."""
     retouche_db_url = os.getenv("RETOUCHE_DATABASE_URL")
     if not retouche_db_url:
         print("  ✗ RETOUCHE_DATABASE_URL not set")
-        return []
-
-    try:
-        conn = await asyncpg.connect(retouche_db_url)
-
-        # Query invoices (adjust table/column names based on actual schema)
-        query = """
-        SELECT
-            id,
-            vendor_name,
-            amount,
-            invoice_date,
-            description,
-            file_path,
-            matched
-        FROM invoices
-        WHERE amount IS NOT NULL
-        ORDER BY invoice_date DESC
-        LIMIT $1
-        """
-
-        rows = await conn.fetch(query, limit)
-        await conn.close()
-
-        # Convert to format for memory
-        items = []
-        for row in rows:
-            # Build content for embedding
-            content = f"Invoice from {row['vendor_name']} for €{row['amount']:.2f}"
-            if row['description']:
-                content += f" - {row['description']}"
-
-            items.append({
-                "id": row['id'],
-                "content": content,
-                "metadata": {
-                    "invoice_id": row['id'],
-                    "vendor_name": row['vendor_name'],
-                    "amount": float(row['amount']),
-                    "date": row['invoice_date'].isoformat() if row['invoice_date'] else None,
-                    "description": row['description'] or "",
-                    "file_path": row['file_path'] or "",
-                    "matched": row['matched'] or False
-                }
-            })
-
-        print(f"  ✓ Fetched {len(items)} invoices")
-        return items
-
-    except Exception as e:
-        print(f"  ✗ Failed to fetch invoices: {e}")
-        return []
-
+        return None
 
-async def fetch_social_posts(limit: int = 1000) -> List[Dict[str, Any]]:
-    """
-    Fetch social media posts from agent_outputs database.
+    return await asyncpg.connect(retouche_db_url)
 
-    Returns:
-        List of post dicts with content and metadata
-    """
-    print(f"Fetching social posts from agent_outputs database (limit: {limit})...")
 
-    # Connect to agent_outputs database
+async def connect_agent_outputs() -> Optional[asyncpg.Connection]:
+    """Connect to agent_outputs database (social posts, ad reports)."""
     db_host = os.getenv("DB_HOST")
     db_port = os.getenv("DB_PORT", "5432")
     db_name = os.getenv("DB_NAME")
@@ -131,205 +86,387 @@ async def fetch_social_posts(limit: int = 1000) -> List[Dict[str, Any]]:
 
     if not all([db_host, db_name, db_user, db_password]):
         print("  ✗ Database credentials not set (DB_HOST, DB_NAME, DB_USER, DB_PASSWORD)")
-        return []
+        return None
+
+    return await asyncpg.connect(
+        host=db_host,
+        port=int(db_port),
+        database=db_name,
+        user=db_user,
+        password=db_password
+    )
+
 
+def invoice_to_item(row) -> Dict[str, Any]:
+    """Convert an invoice row to a memory item."""
+    content = f"Invoice from {row['vendor_name']} for €{row['amount']:.2f}"
+    if row['description']:
+        content += f" - {row['description']}"
+
+    return {
+        "id": row['id'],
+        "content": content,
+        "metadata": {
+            "invoice_id": row['id'],
+            "vendor_name": row['vendor_name'],
+            "amount": float(row['amount']),
+            "date": row['invoice_date'].isoformat() if row['invoice_date'] else None,
+            "description": row['description'] or "",
+            "file_path": row['file_path'] or "",
+            "matched": row['matched'] or False
+        }
+    }
+
+
+def social_post_to_item(row) -> Dict[str, Any]:
+    """Convert a social post row to a memory item."""
+    return {
+        "id": row['id'],
+        "content": row['caption'],
+        "metadata": {
+            "post_id": str(row['id']),
+            "brand": row['brand'] or "",
+            "platform": row['platform'] or "",
+            "caption": row['caption'],
+            "published_at": row['published_at'].isoformat() if row['published_at'] else None,
+            "engagement_rate": float(row['engagement_rate']) if row['engagement_rate'] else 0.0,
+            "photo_key": row['photo_key'] or ""
+        }
+    }
+
+
+def ad_report_to_item(row) -> Dict[str, Any]:
+    """Convert an ad report row to a memory item."""
+    return {
+        "id": row['id'],
+        "content": f"Campaign {row['campaign_name']} - {row['insights']}",
+        "metadata": {
+            "campaign_id": row['campaign_id'] or "",
+            "campaign_name": row['campaign_name'] or "",
+            "date": row['report_date'].isoformat() if row['report_date'] else None,
+            "spend": float(row['spend']) if row['spend'] else 0.0,
+            "conversions": int(row['conversions']) if row['conversions'] else 0,
+            "roas": float(row['roas']) if row['roas'] else 0.0,
+            "insights": row['insights']
+        }
+    }
+
+
+# Each source is read in primary-key order so `id` doubles as the high-water mark.
+# Row ids are used directly as Qdrant point ids (one collection per source).
+SOURCES: Dict[str, Dict[str, Any]] = {
+    "invoices": {
+        "connect": connect_retouche,
+        "columns": "id, vendor_name, amount, invoice_date, description, file_path, matched",
+        "table": "invoices",
+        "condition": "amount IS NOT NULL",
+        "to_item": invoice_to_item,
+    },
+    "social_posts": {
+        "connect": connect_agent_outputs,
+        "columns": "id, brand, platform, caption, published_at, engagement_rate, photo_key",
+        "table": "social_media_posts",
+        "condition": "caption IS NOT NULL",
+        "to_item": social_post_to_item,
+    },
+    "ad_reports": {
+        "connect": connect_agent_outputs,
+        "columns": "id, campaign_id, campaign_name, report_date, spend, conversions, roas, insights",
+        "table": "ad_reports",
+        "condition": "insights IS NOT NULL",
+        "to_item": ad_report_to_item,
+    },
+}
+
+
+# ============================================================================
+# CHECKPOINTS
+# ============================================================================
+
+def load_checkpoints(path: str) -> Dict[str, Dict[str, Any]]:
+    """Load per-source checkpoints (empty if file doesn't exist)."""
     try:
-        conn = await asyncpg.connect(
-            host=db_host,
-            port=int(db_port),
-            database=db_name,
-            user=db_user,
-            password=db_password
-        )
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
 
-        # Query social posts (adjust based on actual schema)
-        query = """
-        SELECT
-            id,
-            brand,
-            platform,
-            caption,
-            published_at,
-            engagement_rate,
-            photo_key
-        FROM social_media_posts
-        WHERE caption IS NOT NULL
-        ORDER BY published_at DESC
-        LIMIT $1
-        """
-
-        rows = await conn.fetch(query, limit)
-        await conn.close()
 
-        # Convert to format for memory
-        items = []
-        for row in rows:
-            items.append({
-                "id": f"post_{row['id']}",
-                "content": row['caption'],
-                "metadata": {
-                    "post_id": str(row['id']),
-                    "brand": row['brand'] or "",
-                    "platform": row['platform'] or "",
-                    "caption": row['caption'],
-                    "published_at": row['published_at'].isoformat() if row['published_at'] else None,
-                    "engagement_rate": float(row['engagement_rate']) if row['engagement_rate'] else 0.0,
-                    "photo_key": row['photo_key'] or ""
-                }
-            })
-
-        print(f"  ✓ Fetched {len(items)} social posts")
-        return items
+def save_checkpoint(path: str, collection: str, last_id: Any, processed: int):
+    """Atomically record the high-water mark for a source."""
+    checkpoints = load_checkpoints(path)
+    checkpoints[collection] = {
+        "last_id": last_id,
+        "processed": processed,
+        "updated_at": datetime.utcnow().isoformat()
+    }
 
-    except Exception as e:
-        print(f"  ✗ Failed to fetch social posts: {e}")
-        logger.exception("fetch_social_posts_error")
-        return []
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(checkpoints, f, indent=2)
+    os.replace(tmp_path, path)
 
 
-async def fetch_ad_reports(limit: int = 1000) -> List[Dict[str, Any]]:
+class CheckpointTracker:
     """
-    Fetch ad reports from agent_outputs database.
+    Advances the checkpoint only over a contiguous prefix of completed pages.
 
-    Returns:
-        List of report dicts with content and metadata
+    Pages finish out of order under concurrency; saving the max id of a later
+    page before an earlier one finished would skip rows after a crash.
     """
-    print(f"Fetching ad reports from agent_outputs database (limit: {limit})...")
 
-    # Connect to agent_outputs database
-    db_host = os.getenv("DB_HOST")
-    db_port = os.getenv("DB_PORT", "5432")
-    db_name = os.getenv("DB_NAME")
-    db_user = os.getenv("DB_USER")
-    db_password = os.getenv("DB_PASSWORD")
+    def __init__(self, path: Optional[str], collection: str, start_processed: int = 0):
+        self.path = path
+        self.collection = collection
+        self.processed = start_processed
+        self._next_page = 0
+        self._completed: Dict[int, tuple] = {}
+
+    def complete(self, page_no: int, last_id: Any, count: int):
+        self._completed[page_no] = (last_id, count)
+
+        advanced_to = None
+        while self._next_page in self._completed:
+            last_id, count = self._completed.pop(self._next_page)
+            self.processed += count
+            advanced_to = last_id
+            self._next_page += 1
+
+        if advanced_to is not None and self.path is not None:
+            save_checkpoint(self.path, self.collection, advanced_to, self.processed)
 
-    if not all([db_host, db_name, db_user, db_password]):
-        print("  ✗ Database credentials not set")
-        return []
+
+# ============================================================================
+# PIPELINE
+# ============================================================================
+
+def build_points(items: List[Dict[str, Any]], vectors: List[List[float]]) -> List[Dict[str, Any]]:
+    """
+    Build Qdrant points (same payload layout as MemoryManager.batch_save).
+
+    Includes the content/metadata hashes MemoryManager uses for change
+    detection, so a later save of the same row is recognized as unchanged.
+    """
+    now = datetime.utcnow().isoformat()
+    points = []
+    for item, vector in zip(items, vectors):
+        points.append({
+            "id": item["id"],
+            "vector": vector,
+            "payload": {
+                **item["metadata"],
+                "created_at": now,
+                "_content_preview": item["content"][:100],
+                "_content_hash": _fingerprint(item["content"]),
+                "_metadata_hash": _fingerprint(item["metadata"])
+            }
+        })
+    return points
+
+
+async def count_remaining(conn, source: Dict[str, Any], last_id: Any) -> int:
+    """Count rows left after the high-water mark."""
+    query = f"""
+    SELECT count(*) FROM {source['table']}
+    WHERE {source['condition']} AND ($1::bigint IS NULL OR id > $1)
+    """
+    return await conn.fetchval(query, last_id)
+
+
+async def produce_pages(
+    conn,
+    source: Dict[str, Any],
+    last_id: Any,
+    page_size: int,
+    limit: Optional[int],
+    queue: asyncio.Queue,
+    workers: int
+):
+    """Stream rows with a server-side cursor and enqueue converted pages."""
+    query = f"""
+    SELECT {source['columns']}
+    FROM {source['table']}
+    WHERE {source['condition']} AND ($1::bigint IS NULL OR id > $1)
+    ORDER BY id
+    """
+
+    page_no = 0
+    fetched = 0
 
     try:
-        conn = await asyncpg.connect(
-            host=db_host,
-            port=int(db_port),
-            database=db_name,
-            user=db_user,
-            password=db_password
-        )
+        # Cursors require a transaction in asyncpg
+        async with conn.transaction(readonly=True):
+            cursor = await conn.cursor(query, last_id)
 
-        # Query ad reports (adjust based on actual schema)
-        query = """
-        SELECT
-            id,
-            campaign_id,
-            campaign_name,
-            report_date,
-            spend,
-            conversions,
-            roas,
-            insights
-        FROM ad_reports
-        WHERE insights IS NOT NULL
-        ORDER BY report_date DESC
-        LIMIT $1
-        """
-
-        rows = await conn.fetch(query, limit)
-        await conn.close()
+            while limit is None or fetched < limit:
+                size = page_size if limit is None else min(page_size, limit - fetched)
+                rows = await cursor.fetch(size)
+                if not rows:
+                    break
 
-        # Convert to format for memory
-        items = []
-        for row in rows:
-            # Build content from insights
-            content = f"Campaign {row['campaign_name']} - {row['insights']}"
-
-            items.append({
-                "id": f"ad_report_{row['id']}",
-                "content": content,
-                "metadata": {
-                    "campaign_id": row['campaign_id'] or "",
-                    "campaign_name": row['campaign_name'] or "",
-                    "date": row['report_date'].isoformat() if row['report_date'] else None,
-                    "spend": float(row['spend']) if row['spend'] else 0.0,
-                    "conversions": int(row['conversions']) if row['conversions'] else 0,
-                    "roas": float(row['roas']) if row['roas'] else 0.0,
-                    "insights": row['insights']
-                }
-            })
-
-        print(f"  ✓ Fetched {len(items)} ad reports")
-        return items
+                items = [source["to_item"](row) for row in rows]
+                await queue.put((page_no, items, rows[-1]["id"]))
 
-    except Exception as e:
-        print(f"  ✗ Failed to fetch ad reports: {e}")
-        logger.exception("fetch_ad_reports_error")
-        return []
+                page_no += 1
+                fetched += len(rows)
+    finally:
+        # One sentinel per worker
+        for _ in range(workers):
+            await queue.put(None)
+
+
+async def process_pages(
+    manager: MemoryManager,
+    collection: str,
+    queue: asyncio.Queue,
+    tracker: CheckpointTracker,
+    progress: Dict[str, Any],
+    dry_run: bool
+):
+    """Worker: embed a page in one request and upsert it."""
+    while True:
+        job = await queue.get()
+        if job is None:
+            return
+
+        page_no, items, page_last_id = job
+
+        if not dry_run:
+            # request_embeddings raises on failure instead of writing zero vectors
+            vectors = await manager.embedding_generator.request_embeddings(
+                [item["content"] for item in items]
+            )
+            await manager.qdrant_client.upsert_points(collection, build_points(items, vectors))
+
+        tracker.complete(page_no, page_last_id, len(items))
+        progress["done"] += len(items)
+        report_progress(progress)
+
+
+def report_progress(progress: Dict[str, Any]):
+    """Print throughput and ETA."""
+    elapsed = time.monotonic() - progress["started"]
+    done = progress["done"]
+    rate = done / elapsed if elapsed > 0 else 0.0
+    remaining = max(progress["total"] - done, 0)
+    eta = remaining / rate if rate > 0 else float("inf")
+
+    eta_text = f"{eta / 60:.1f} min" if eta != float("inf") else "?"
+    print(
+        f"  {done:,}/{progress['total']:,} items "
+        f"({rate:.1f} items/s, ETA {eta_text})"
+    )
 
 
 async def backfill_collection(
     collection: str,
-    items: List[Dict[str, Any]],
-    dry_run: bool = False
+    limit: Optional[int] = None,
+    page_size: int = 100,
+    concurrency: int = 4,
+    checkpoint_file: str = ".backfill_checkpoints.json",
+    reset: bool = False,
+    dry_run: bool = False,
+    assume_yes: bool = False
 ) -> int:
     """
-    Backfill a collection with items.
+    Backfill a collection from its source table.
 
     Args:
         collection: Collection name
-        items: Items to import
-        dry_run: If True, don't actually save
+        limit: Max rows to process in this run (None = all remaining)
+        page_size: Rows per cursor page / embedding request
+        concurrency: Pages processed in parallel
+        checkpoint_file: Checkpoint JSON path
+        reset: Start from the beginning instead of the checkpoint
+        dry_run: If True, read and convert rows without embedding or saving
+        assume_yes: Skip confirmation prompt
 
     Returns:
-        Number of items processed
+        Number of items processed in this run
     """
-    if not items:
-        print(f"No items to backfill for {collection}")
-        return 0
+    source = SOURCES[collection]
 
-    print(f"\nBackfilling '{collection}' collection...")
-    print(f"  Items to process: {len(items)}")
+    checkpoint = {} if reset else load_checkpoints(checkpoint_file).get(collection, {})
+    last_id = checkpoint.get("last_id")
+    if last_id is not None:
+        print(f"  Resuming after id {last_id} ({checkpoint.get('processed', 0):,} already done)")
 
-    if dry_run:
-        print("  (DRY RUN - not saving to Qdrant)")
-        return len(items)
+    try:
+        conn = await source["connect"]()
+    except Exception as e:
+        print(f"  ✗ Failed to connect: {e}")
+        return 0
+    if conn is None:
+        return 0
 
-    # Initialize memory manager
-    manager = MemoryManager()
-    await manager.initialize()
+    manager: Optional[MemoryManager] = None
+    # Dry runs never move the checkpoint
+    tracker = CheckpointTracker(
+        None if dry_run else checkpoint_file,
+        collection,
+        checkpoint.get("processed", 0)
+    )
 
     try:
-        # Estimate cost first
-        contents = [item["content"] for item in items]
-        cost_estimate = await manager.embedding_generator.estimate_cost(contents)
-
-        print(f"  Estimated cost:")
-        print(f"    - Total tokens: {cost_estimate['total_tokens']:,}")
-        print(f"    - Estimated USD: ${cost_estimate['estimated_usd']:.4f}")
-        print(f"    - Avg tokens/item: {cost_estimate['avg_tokens_per_text']:.1f}")
-
-        # Confirm before proceeding
-        response = input("\n  Proceed with backfill? (y/n): ")
-        if response.lower() != 'y':
-            print("  Cancelled by user")
-            await manager.close()
+        remaining = await count_remaining(conn, source, last_id)
+        total = remaining if limit is None else min(limit, remaining)
+
+        print(f"\nBackfilling '{collection}' collection...")
+        print(f"  Items to process: {total:,}")
+
+        if total == 0:
             return 0
 
-        # Batch save
-        count = await manager.batch_save(collection, items)
+        if dry_run:
+            print("  (DRY RUN - not saving to Qdrant)")
+        elif not assume_yes:
+            response = input("\n  Proceed with backfill? (y/n): ")
+            if response.lower() != 'y':
+                print("  Cancelled by user")
+                return 0
+
+        if not dry_run:
+            manager = MemoryManager()
+            await manager.initialize()
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+        progress = {"done": 0, "total": total, "started": time.monotonic()}
+
+        producer = asyncio.create_task(
+            produce_pages(conn, source, last_id, page_size, limit, queue, concurrency)
+        )
+        workers = [
+            asyncio.create_task(process_pages(manager, collection, queue, tracker, progress, dry_run))
+            for _ in range(concurrency)
+        ]
+
+        try:
+            await asyncio.gather(producer, *workers)
+        except Exception:
+            producer.cancel()
+            for worker in workers:
+                worker.cancel()
+            raise
 
-        print(f"  ✓ Successfully backfilled {count} items")
+        print(f"  ✓ Successfully backfilled {progress['done']:,} items")
 
-        # Show stats
-        stats = await manager.get_collection_stats(collection)
-        print(f"  Collection now has {stats.get('points_count', 0)} total items")
+        if manager is not None:
+            await manager.invalidate_collection(collection)
+            stats = await manager.get_collection_stats(collection)
+            print(f"  Collection now has {stats.get('points_count', 0)} total items")
 
-        await manager.close()
-        return count
+        return progress["done"]
 
     except Exception as e:
         print(f"  ✗ Backfill failed: {e}")
+        print(f"  Checkpoint saved in {checkpoint_file}; rerun to resume")
         logger.exception("backfill_error")
-        await manager.close()
-        return 0
+        return tracker.processed - checkpoint.get("processed", 0)
+
+    finally:
+        await conn.close()
+        if manager is not None:
+            await manager.close()
 
 
 async def main():
@@ -337,14 +474,14 @@ async def main():
     parser = argparse.ArgumentParser(description="Backfill embeddings to Qdrant")
     parser.add_argument(
         "--collection",
-        choices=["invoices", "social_posts", "ad_reports"],
+        choices=list(SOURCES),
         help="Specific collection to backfill"
     )
     parser.add_argument(
         "--limit",
         type=int,
-        default=1000,
-        help="Max records to process (default: 1000)"
+        default=None,
+        help="Max records to process in this run (default: all)"
     )
     parser.add_argument(
         "--all",
@@ -356,6 +493,33 @@ async def main():
         action="store_true",
         help="Test without saving to Qdrant"
     )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=100,
+        help="Rows per cursor page / embedding request (default: 100)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Pages embedded and upserted in parallel (default: 4)"
+    )
+    parser.add_argument(
+        "--checkpoint-file",
+        default=os.getenv("BACKFILL_CHECKPOINT_FILE", ".backfill_checkpoints.json"),
+        help="Checkpoint JSON path"
+    )
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Ignore existing checkpoints and start from the beginning"
+    )
+    parser.add_argument(
+        "--yes",
+        action="store_true",
+        help="Skip confirmation prompt"
+    )
 
     args = parser.parse_args()
 
@@ -367,7 +531,7 @@ async def main():
     collections_to_process = []
 
     if args.all:
-        collections_to_process = ["invoices", "social_posts", "ad_reports"]
+        collections_to_process = list(SOURCES)
     elif args.collection:
         collections_to_process = [args.collection]
     else:
@@ -381,19 +545,16 @@ async def main():
         print(f"\nProcessing collection: {collection_name}")
         print("-" * 60)
 
-        # Fetch data
-        if collection_name == "invoices":
-            items = await fetch_invoices(args.limit)
-        elif collection_name == "social_posts":
-            items = await fetch_social_posts(args.limit)
-        elif collection_name == "ad_reports":
-            items = await fetch_ad_reports(args.limit)
-        else:
-            print(f"Unknown collection: {collection_name}")
-            continue
-
-        # Backfill
-        count = await backfill_collection(collection_name, items, dry_run=args.dry_run)
+        count = await backfill_collection(
+            collection_name,
+            limit=args.limit,
+            page_size=args.page_size,
+            concurrency=args.concurrency,
+            checkpoint_file=args.checkpoint_file,
+            reset=args.reset,
+            dry_run=args.dry_run,
+            assume_yes=args.yes
+        )
         total_processed += count
 
     print()
@@ -0,0 +1,58 @@
+"""
+SQLite Database
+===============
+
+Shared bootstrap for the small SQLite stores under agent_outputs/ (source
+snapshots, metrics history, product photo catalog). Creates the parent
+directory, opens connections with a busy timeout, and on first use
+switches the file to WAL (readers don't block the writer) and creates
+the schema.
+
+Dependency-free so it can be imported from langgraph_agents and
+temporal_app alike.
+
+Usage:
+    from sqlite_db import SQLiteDatabase
+
+    db = SQLiteDatabase(path, ["CREATE TABLE IF NOT EXISTS ..."])
+    conn = db.connect()
+    try:
+        conn.execute(...)
+        conn.commit()
+    finally:
+        conn.close()
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Union
+
+
+class SQLiteDatabase:
+    """A SQLite file whose schema is created on the first connection."""
+
+    def __init__(self, path: Union[str, Path], schema: Iterable[str], timeout: float = 30):
+        """
+        Initialize database.
+
+        Args:
+            path: SQLite file
+            schema: Idempotent DDL statements (CREATE ... IF NOT EXISTS)
+            timeout: Seconds to wait for a lock held by another connection
+        """
+        self.path = Path(path)
+        self.schema = list(schema)
+        self.timeout = timeout
+        self._initialized = False
+
+    def connect(self) -> sqlite3.Connection:
+        """Open a new connection (caller closes it), creating the schema once."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=self.timeout)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            for statement in self.schema:
+                conn.execute(statement)
+            conn.commit()
+            self._initialized = True
+        return conn
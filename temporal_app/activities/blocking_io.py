@@ -0,0 +1,176 @@
+"""
+Blocking I/O helpers for async activities.
+
+boto3 and psycopg2 are synchronous. Called inline from an `async def`
+activity they block the worker's event loop, stalling every other
+concurrent activity and heartbeat. Activities hand that work to
+run_blocking(), which runs it on a dedicated thread pool, and reuse
+process-wide clients instead of building them per call:
+
+- get_s3_client(): one boto3 S3 client (clients are thread-safe)
+- pg_connection(): connections from a ThreadedConnectionPool
+
+Both are meant to be used inside the function passed to run_blocking().
+
+Sizing: ACTIVITY_IO_THREADS (default 10) caps blocking calls in flight
+across all task queues; the io queue alone may run 20 activities, so
+extra calls queue on the executor. ACTIVITY_PG_POOL_SIZE (default 4)
+caps open Postgres connections; pg_connection() waits for a free one
+instead of letting ThreadedConnectionPool raise PoolError.
+
+Usage:
+    from temporal_app.activities.blocking_io import run_blocking, get_s3_client
+
+    def download():
+        return get_s3_client().get_object(Bucket=bucket, Key=key)['Body'].read()
+
+    data = await run_blocking(download)
+"""
+import asyncio
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_s3_client = None
+_pg_pool = None
+_pg_slots: Optional[threading.BoundedSemaphore] = None
+_lock = threading.Lock()
+
+
+def get_io_executor() -> ThreadPoolExecutor:
+    """Get or create the thread pool for blocking activity I/O (ACTIVITY_IO_THREADS workers)."""
+    global _executor
+
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=int(os.getenv('ACTIVITY_IO_THREADS', '10')),
+                thread_name_prefix='activity-io'
+            )
+        return _executor
+
+
+async def run_blocking(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run a blocking callable on the I/O thread pool.
+
+    Args:
+        func: Synchronous function
+        *args, **kwargs: Arguments for func
+
+    Returns:
+        func's return value
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_io_executor(), functools.partial(func, *args, **kwargs))
+
+
+def get_s3_client():
+    """Get or create the shared S3 client (call from an I/O thread; creation loads botocore models)."""
+    global _s3_client
+
+    with _lock:
+        if _s3_client is None:
+            import boto3
+            from botocore.config import Config
+
+            _s3_client = boto3.client(
+                's3',
+                aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+                aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+                region_name=os.getenv('AWS_S3_REGION_NAME', 'us-east-1'),
+                config=Config(
+                    signature_version='s3v4',
+                    max_pool_connections=int(os.getenv('ACTIVITY_IO_THREADS', '10'))
+                )
+            )
+        return _s3_client
+
+
+def _pg_pool_size() -> int:
+    return int(os.getenv('ACTIVITY_PG_POOL_SIZE', '4'))
+
+
+def _get_pg_slots() -> threading.BoundedSemaphore:
+    """One slot per pooled connection; getconn() raises instead of blocking when none is free."""
+    global _pg_slots
+
+    with _lock:
+        if _pg_slots is None:
+            _pg_slots = threading.BoundedSemaphore(_pg_pool_size())
+        return _pg_slots
+
+
+def _get_pg_pool():
+    global _pg_pool
+
+    with _lock:
+        if _pg_pool is None:
+            from psycopg2.pool import ThreadedConnectionPool
+
+            _pg_pool = ThreadedConnectionPool(
+                minconn=1,
+                maxconn=_pg_pool_size(),
+                host=os.getenv('POSTGRES_HOST', '127.0.0.1'),
+                port=int(os.getenv('POSTGRES_PORT', 5433)),
+                database=os.getenv('POSTGRES_DB', 'postgres'),
+                user=os.getenv('POSTGRES_USER', 'postgres'),
+                password=os.getenv('POSTGRES_PASSWORD'),
+            )
+        return _pg_pool
+
+
+@contextmanager
+def pg_connection():
+    """
+    Borrow a pooled Postgres connection (call from an I/O thread).
+
+    Blocks while all ACTIVITY_PG_POOL_SIZE connections are borrowed.
+    Commits on success and rolls back on error. Connections that broke
+    are closed instead of being returned to the pool.
+    """
+    slots = _get_pg_slots()
+    slots.acquire()
+    try:
+        pool = _get_pg_pool()
+        conn = pool.getconn()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            broken = bool(conn.closed)
+            if not broken:
+                try:
+                    conn.rollback()
+                except Exception:
+                    broken = True
+            pool.putconn(conn, close=broken)
+            raise
+        else:
+            pool.putconn(conn)
+    finally:
+        slots.release()
+
+
+def shutdown_blocking_io():
+    """Stop the I/O threads and close pooled connections (call on worker shutdown)."""
+    global _executor, _s3_client, _pg_pool, _pg_slots
+
+    with _lock:
+        executor, _executor = _executor, None
+        pg_pool, _pg_pool = _pg_pool, None
+        _s3_client = None
+        _pg_slots = None
+
+    if executor is not None:
+        executor.shutdown(wait=True)
+    if pg_pool is not None:
+        pg_pool.closeall()
+    logger.info("Blocking I/O pool shut down")
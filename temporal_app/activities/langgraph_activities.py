@@ -4,7 +4,8 @@ LangGraph activities - wrap LangGraph workflows as Temporal activities.
 Provides integration between Temporal orchestration and LangGraph agent execution.
 """
 from temporalio import activity
-from typing import Dict, Any
+from temporalio.exceptions import ApplicationError
+from typing import Dict, Any, Optional
 import logging
 import sys
 import os
@@ -50,12 +51,11 @@ async def run_invoice_matcher_graph(
 
     try:
         from langgraph_agents import InvoiceMatcherGraph
+        from langgraph_agents.graph_pool import get_graph_pool
 
-        # Create and run graph
-        graph = InvoiceMatcherGraph()
-        await graph.initialize()
-
-        result = await graph.match(transaction, invoices)
+        # Borrow a warm instance from the worker's graph pool
+        async with get_graph_pool().checkout(InvoiceMatcherGraph) as graph:
+            result = await graph.match(transaction, invoices)
 
         duration = time.time() - start_time
 
@@ -76,8 +76,6 @@ async def run_invoice_matcher_graph(
                 activity_name="invoice_matcher_graph"
             ).observe(duration)
 
-        await graph.close()
-
         return result
 
     except Exception as e:
@@ -127,12 +125,11 @@ async def run_feed_publisher_graph(
 
     try:
         from langgraph_agents import FeedPublisherGraph
+        from langgraph_agents.graph_pool import get_graph_pool
 
-        # Create and run graph
-        graph = FeedPublisherGraph()
-        await graph.initialize()
-
-        result = await graph.publish(brand, platform, photo_s3_key)
+        # Borrow a warm instance from the worker's graph pool
+        async with get_graph_pool().checkout(FeedPublisherGraph) as graph:
+            result = await graph.publish(brand, platform, photo_s3_key)
 
         duration = time.time() - start_time
 
@@ -153,8 +150,6 @@ async def run_feed_publisher_graph(
                 activity_name="feed_publisher_graph"
             ).observe(duration)
 
-        await graph.close()
-
         return result
 
     except Exception as e:
@@ -177,6 +172,36 @@ async def run_feed_publisher_graph(
         raise
 
 
+def _truncate_daily_analytics_result(
+    result: Dict[str, Any],
+    days: int,
+    brand: str,
+    duration: float
+) -> Dict[str, Any]:
+    """Trim a DailyAnalyticsGraph result for the workflow history."""
+    # IMPORTANT: Truncate large lists to avoid gRPC message size limit (4MB)
+    # The state uses operator.add which causes exponential growth
+    return {
+        "success": result.get("success", False),
+        "brand": result.get("brand", brand),
+        "period_days": result.get("period_days", days),
+        "report_markdown": result.get("report_markdown", ""),
+        "insights": result.get("insights", [])[:20],  # Max 20 insights
+        "recommendations": result.get("recommendations", [])[:20],  # Max 20
+        "quality_score": result.get("quality_score", 0.0),
+        "telegram_sent": result.get("telegram_sent", False),
+        "telegram_message_id": result.get("telegram_message_id"),
+        # Only include unique errors and limit count
+        "errors": list(set(result.get("errors", [])))[:50],
+        "error_count": len(result.get("errors", [])),
+        # Only include unique steps and limit count
+        "steps_completed": list(set(result.get("steps_completed", [])))[:50],
+        "steps_count": len(result.get("steps_completed", [])),
+        "regenerate_attempts": result.get("regenerate_attempts", 0),
+        "duration_seconds": duration
+    }
+
+
 @activity.defn
 async def run_daily_analytics_graph(
     days: int = 7,
@@ -204,24 +229,19 @@ async def run_daily_analytics_graph(
 
     try:
         from langgraph_agents import DailyAnalyticsGraph
+        from langgraph_agents.graph_pool import get_graph_pool
 
-        # Create and run graph
-        graph = DailyAnalyticsGraph()
-        await graph.initialize()
-
-        result = await graph.generate_report(days=days, brand=brand)
+        # Borrow a warm instance from the worker's graph pool
+        async with get_graph_pool().checkout(DailyAnalyticsGraph) as graph:
+            result = await graph.generate_report(days=days, brand=brand)
 
         duration = time.time() - start_time
 
-        # Get counts before truncating
-        error_count = len(result.get('errors', []))
-        steps_count = len(result.get('steps_completed', []))
-
         activity.logger.info(
             f"Daily analytics complete: quality={result['quality_score']:.0%}, "
             f"telegram={result['telegram_sent']}, "
             f"insights={len(result['insights'])}, "
-            f"errors={error_count}"
+            f"errors={len(result.get('errors', []))}"
         )
 
         # Record workflow metrics
@@ -235,31 +255,7 @@ async def run_daily_analytics_graph(
                 activity_name="daily_analytics_graph"
             ).observe(duration)
 
-        await graph.close()
-
-        # IMPORTANT: Truncate large lists to avoid gRPC message size limit (4MB)
-        # The state uses operator.add which causes exponential growth
-        truncated_result = {
-            "success": result.get("success", False),
-            "brand": result.get("brand", brand),
-            "period_days": result.get("period_days", days),
-            "report_markdown": result.get("report_markdown", ""),
-            "insights": result.get("insights", [])[:20],  # Max 20 insights
-            "recommendations": result.get("recommendations", [])[:20],  # Max 20
-            "quality_score": result.get("quality_score", 0.0),
-            "telegram_sent": result.get("telegram_sent", False),
-            "telegram_message_id": result.get("telegram_message_id"),
-            # Only include unique errors and limit count
-            "errors": list(set(result.get("errors", [])))[:50],
-            "error_count": error_count,
-            # Only include unique steps and limit count
-            "steps_completed": list(set(result.get("steps_completed", [])))[:50],
-            "steps_count": steps_count,
-            "regenerate_attempts": result.get("regenerate_attempts", 0),
-            "duration_seconds": duration
-        }
-
-        return truncated_result
+        return _truncate_daily_analytics_result(result, days, brand, duration)
 
     except Exception as e:
         status = "failed"
@@ -281,6 +277,197 @@ async def run_daily_analytics_graph(
         raise
 
 
+# =============================================================================
+# PER-SOURCE DAILY ANALYTICS ACTIVITIES
+# =============================================================================
+
+def _record_activity_metrics(activity_name: str, status: str, duration: float):
+    if METRICS_AVAILABLE:
+        WorkflowMetrics.activity_execution_total.labels(
+            activity_name=activity_name,
+            status=status
+        ).inc()
+
+        WorkflowMetrics.activity_duration.labels(
+            activity_name=activity_name
+        ).observe(duration)
+
+
+@activity.defn
+async def fetch_analytics_source(
+    source: str,
+    days: int = 7,
+    brand: str = "pomandi"
+) -> Dict[str, Any]:
+    """
+    Fetch one daily analytics source.
+
+    A source that comes back with an error raises a retryable
+    ApplicationError carrying the fetch result as its details, so Temporal
+    retries only this source and the workflow can still analyze the
+    error payload once retries run out.
+
+    Args:
+        source: Source name (e.g. "google_ads")
+        days: Number of days to analyze
+        brand: Brand name ("pomandi" or "costume")
+
+    Returns:
+        {"data", "steps_completed", "errors"} from DailyAnalyticsGraph.fetch_source
+    """
+    activity.logger.info(f"Fetching analytics source: source={source}, brand={brand}, days={days}")
+
+    start_time = time.time()
+    status = "completed"
+
+    try:
+        from langgraph_agents import DailyAnalyticsGraph
+        from langgraph_agents.graph_pool import get_graph_pool
+
+        async with get_graph_pool().checkout(DailyAnalyticsGraph) as graph:
+            result = await graph.fetch_source(source, days=days, brand=brand)
+
+        error = result["data"].get("error")
+        if error:
+            status = "failed"
+            raise ApplicationError(f"{source} fetch failed: {error}", result, type="SourceFetchError")
+
+        return result
+
+    except Exception as e:
+        status = "failed"
+        activity.logger.error(f"Analytics source fetch failed: source={source}, error={str(e)}")
+        raise
+
+    finally:
+        _record_activity_metrics("fetch_analytics_source", status, time.time() - start_time)
+
+
+@activity.defn
+async def analyze_analytics_source(
+    source: str,
+    data: Dict[str, Any],
+    days: int = 7,
+    brand: str = "pomandi",
+    llm_timeout: Optional[float] = None,
+    llm_max_retries: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Run the LLM analysis for one daily analytics source.
+
+    The source's Telegram message is returned instead of sent; the merge
+    activity posts all of them in order.
+
+    Args:
+        source: Source name (e.g. "google_ads")
+        data: Data from fetch_analytics_source
+        days: Number of days to analyze
+        brand: Brand name ("pomandi" or "costume")
+        llm_timeout: Seconds per LLM attempt (the workflow sizes this and
+            llm_max_retries to fit the activity's start_to_close_timeout)
+        llm_max_retries: LLM retries within this activity attempt
+
+    Returns:
+        {"report", "message", "steps_completed", "errors"} from DailyAnalyticsGraph.analyze_source
+    """
+    activity.logger.info(f"Analyzing analytics source: source={source}, brand={brand}")
+
+    start_time = time.time()
+    status = "completed"
+
+    try:
+        from langgraph_agents import DailyAnalyticsGraph
+        from langgraph_agents.graph_pool import get_graph_pool
+
+        async with get_graph_pool().checkout(DailyAnalyticsGraph) as graph:
+            return await graph.analyze_source(
+                source,
+                data,
+                days=days,
+                brand=brand,
+                llm_timeout=llm_timeout,
+                llm_max_retries=llm_max_retries
+            )
+
+    except Exception as e:
+        status = "failed"
+        activity.logger.error(f"Analytics source analysis failed: source={source}, error={str(e)}")
+        raise
+
+    finally:
+        _record_activity_metrics("analyze_analytics_source", status, time.time() - start_time)
+
+
+@activity.defn
+async def merge_daily_analytics(
+    sources: Dict[str, Dict[str, Any]],
+    days: int = 7,
+    brand: str = "pomandi"
+) -> Dict[str, Any]:
+    """
+    Merge per-source results into the daily report and deliver it.
+
+    Posts the per-source Telegram messages in order, writes the executive
+    summary, saves the data and sends the summary message.
+
+    Each posted source index is recorded in the heartbeat details. A retry
+    reads them back and only posts the messages the failed attempt didn't
+    reach, so sources aren't repeated and still arrive before the summary.
+    A crash between a post and its heartbeat can repeat that one message.
+
+    Args:
+        sources: Source name -> fetch and analysis results
+        days: Number of days analyzed
+        brand: Brand name ("pomandi" or "costume")
+
+    Returns:
+        Same shape as run_daily_analytics_graph
+    """
+    activity.logger.info(f"Merging daily analytics: brand={brand}, sources={len(sources)}")
+
+    start_time = time.time()
+    status = "completed"
+
+    heartbeat_details = activity.info().heartbeat_details
+    posted = list(heartbeat_details[0]) if heartbeat_details else []
+    if posted:
+        activity.logger.info(f"Skipping source messages posted by an earlier attempt: {posted}")
+
+    def record_posted(index: int):
+        posted.append(index)
+        activity.heartbeat(list(posted))
+
+    try:
+        from langgraph_agents import DailyAnalyticsGraph
+        from langgraph_agents.graph_pool import get_graph_pool
+
+        async with get_graph_pool().checkout(DailyAnalyticsGraph) as graph:
+            result = await graph.finish_report(
+                sources,
+                days=days,
+                brand=brand,
+                posted_messages=posted,
+                on_message_posted=record_posted
+            )
+
+        duration = time.time() - start_time
+
+        activity.logger.info(
+            f"Daily analytics merge complete: quality={result['quality_score']:.0%}, "
+            f"telegram={result['telegram_sent']}, errors={len(result.get('errors', []))}"
+        )
+
+        return _truncate_daily_analytics_result(result, days, brand, duration)
+
+    except Exception as e:
+        status = "failed"
+        activity.logger.error(f"Daily analytics merge failed: {str(e)}")
+        raise
+
+    finally:
+        _record_activity_metrics("merge_daily_analytics", status, time.time() - start_time)
+
+
 # =============================================================================
 # VALIDATOR GRAPH ACTIVITY
 # =============================================================================
@@ -317,11 +504,11 @@ async def run_validator_graph(
 
     try:
         from langgraph_agents import DataValidatorGraph
+        from langgraph_agents.graph_pool import get_graph_pool
 
-        graph = DataValidatorGraph()
-        await graph.initialize()
-
-        result = await graph.validate(raw_data, brand=brand, days=days)
+        # Borrow a warm instance from the worker's graph pool
+        async with get_graph_pool().checkout(DataValidatorGraph) as graph:
+            result = await graph.validate(raw_data, brand=brand, days=days)
 
         duration = time.time() - start_time
 
@@ -337,8 +524,6 @@ async def run_validator_graph(
                 status=status
             ).inc()
 
-        await graph.close()
-
         return {
             "validation_score": result.get("validation_score", 0.0),
             "proceed_to_analysis": result.get("proceed_to_analysis", False),
@@ -397,15 +582,15 @@ async def run_action_planner_graph(
 
     try:
         from langgraph_agents import ActionPlannerGraph
+        from langgraph_agents.graph_pool import get_graph_pool
 
-        graph = ActionPlannerGraph()
-        await graph.initialize()
-
-        result = await graph.plan_actions(
-            validated_data=validated_data,
-            analysis_reports=analysis_reports,
-            brand=brand
-        )
+        # Borrow a warm instance from the worker's graph pool
+        async with get_graph_pool().checkout(ActionPlannerGraph) as graph:
+            result = await graph.plan_actions(
+                validated_data=validated_data,
+                analysis_reports=analysis_reports,
+                brand=brand
+            )
 
         duration = time.time() - start_time
 
@@ -422,8 +607,6 @@ async def run_action_planner_graph(
                 status=status
             ).inc()
 
-        await graph.close()
-
         return {
             "actions": actions[:20],  # Max 20 actions
             "action_count": len(actions),
@@ -480,15 +663,15 @@ async def run_executor_graph(
 
     try:
         from langgraph_agents import ActionExecutorGraph
+        from langgraph_agents.graph_pool import get_graph_pool
 
-        graph = ActionExecutorGraph()
-        await graph.initialize()
-
-        result = await graph.execute_actions(
-            actions=actions_to_execute,
-            brand=brand,
-            dry_run=dry_run
-        )
+        # Borrow a warm instance from the worker's graph pool
+        async with get_graph_pool().checkout(ActionExecutorGraph) as graph:
+            result = await graph.execute_actions(
+                actions=actions_to_execute,
+                brand=brand,
+                dry_run=dry_run
+            )
 
         duration = time.time() - start_time
 
@@ -504,8 +687,6 @@ async def run_executor_graph(
                 status=status
             ).inc()
 
-        await graph.close()
-
         return {
             "successful_count": result.get("successful_count", 0),
             "failed_count": result.get("failed_count", 0),
@@ -559,11 +740,11 @@ async def run_feedback_collector_graph(
 
     try:
         from langgraph_agents import FeedbackCollectorGraph
+        from langgraph_agents.graph_pool import get_graph_pool
 
-        graph = FeedbackCollectorGraph()
-        await graph.initialize()
-
-        result = await graph.collect_feedback(brand=brand)
+        # Borrow a warm instance from the worker's graph pool
+        async with get_graph_pool().checkout(FeedbackCollectorGraph) as graph:
+            result = await graph.collect_feedback(brand=brand)
 
         duration = time.time() - start_time
 
@@ -579,8 +760,6 @@ async def run_feedback_collector_graph(
                 status=status
             ).inc()
 
-        await graph.close()
-
         return {
             "successful_count": result.get("successful_count", 0),
             "failed_count": result.get("failed_count", 0),
@@ -610,6 +789,9 @@ LANGGRAPH_ACTIVITIES = [
     run_invoice_matcher_graph,
     run_feed_publisher_graph,
     run_daily_analytics_graph,
+    fetch_analytics_source,
+    analyze_analytics_source,
+    merge_daily_analytics,
     run_validator_graph,
     run_action_planner_graph,
     run_executor_graph,
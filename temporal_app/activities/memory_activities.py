@@ -431,9 +431,9 @@ async def clear_memory_cache(collection: Optional[str] = None) -> bool:
         manager = await get_memory_manager()
 
         if collection:
-            await manager.redis_cache.clear_collection(collection)
+            await manager.invalidate_collection(collection, purge=True)
         else:
-            await manager.redis_cache.clear_all()
+            await manager.clear_cache()
 
         activity.logger.info("Cache cleared successfully")
 
@@ -0,0 +1,290 @@
+"""
+Product photo catalog - local SQLite index of the S3 product photos.
+
+get_random_unused_photo used to list `products/` (first 1000 keys only)
+and scan 15 days of agent_outputs on every post. The catalog keeps one
+row per photo (key, size, ETag, last modified) plus the last date each
+brand used it, so picking a random unused photo is a local query over
+the full bucket instead of a listing.
+
+Sync is incremental: listings continue with StartAfter from the largest
+key seen, following continuation tokens. Every PHOTO_CATALOG_FULL_SYNC_HOURS
+a full listing refreshes sizes/ETags and drops deleted objects (keys added
+below the largest one are also only picked up then).
+
+All methods are synchronous; call them through blocking_io.run_blocking().
+
+Usage:
+    from temporal_app.activities.photo_catalog import get_photo_catalog
+
+    catalog = get_photo_catalog()
+    catalog.sync(s3_client, bucket, prefix='products/')
+    catalog.record_usage([(brand, key, used_at)])
+    photo = catalog.pick_unused(brand, unused_days=15)
+"""
+import logging
+import os
+import random
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from sqlite_db import SQLiteDatabase
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CATALOG_DB = Path(__file__).parent.parent.parent / "agent_outputs" / "feed_publisher" / "photo_catalog.sqlite3"
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS photos (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        key TEXT NOT NULL UNIQUE,
+        size INTEGER,
+        etag TEXT,
+        last_modified TEXT,
+        sync_generation INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS photo_usage (
+        brand TEXT NOT NULL,
+        key TEXT NOT NULL,
+        last_used TEXT NOT NULL,
+        PRIMARY KEY (brand, key)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS catalog_state (
+        name TEXT PRIMARY KEY,
+        value TEXT
+    )
+    """,
+]
+
+
+def _timestamp(value: Any) -> str:
+    """Normalize datetimes/strings to sortable ISO text."""
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None).isoformat(timespec='seconds')
+    return str(value)
+
+
+class PhotoCatalog:
+    """
+    SQLite index of S3 product photos with per-brand last-used dates.
+    """
+
+    def __init__(self, path: Optional[str] = None, full_sync_hours: Optional[float] = None):
+        """
+        Initialize photo catalog.
+
+        Args:
+            path: SQLite file (defaults to PHOTO_CATALOG_DB_PATH env var)
+            full_sync_hours: Hours between full listings (defaults to PHOTO_CATALOG_FULL_SYNC_HOURS)
+        """
+        self.path = Path(path or os.getenv('PHOTO_CATALOG_DB_PATH', str(DEFAULT_CATALOG_DB)))
+        self.full_sync_hours = full_sync_hours if full_sync_hours is not None else float(
+            os.getenv('PHOTO_CATALOG_FULL_SYNC_HOURS', '24')
+        )
+        self._db = SQLiteDatabase(self.path, _SCHEMA)
+
+    def _get_state(self, conn: sqlite3.Connection, name: str) -> Optional[str]:
+        row = conn.execute("SELECT value FROM catalog_state WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, conn: sqlite3.Connection, name: str, value: str):
+        conn.execute("INSERT OR REPLACE INTO catalog_state (name, value) VALUES (?, ?)", (name, value))
+
+    def _full_sync_due(self, conn: sqlite3.Connection, prefix: str) -> bool:
+        last_full = self._get_state(conn, f"{prefix}:full_sync_at")
+        if last_full is None:
+            return True
+        return datetime.utcnow() - datetime.fromisoformat(last_full) >= timedelta(hours=self.full_sync_hours)
+
+    def sync(self, s3_client, bucket: str, prefix: str = 'products/', full: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        Bring the catalog up to date with the bucket.
+
+        Args:
+            s3_client: boto3 S3 client
+            bucket: Bucket name
+            prefix: Key prefix to index
+            full: Force (True) or skip (False) a full listing; None = when due
+
+        Returns:
+            {"full": bool, "listed": objects seen, "removed": rows dropped}
+        """
+        conn = self._db.connect()
+        try:
+            if full is None:
+                full = self._full_sync_due(conn, prefix)
+            last_key = self._get_state(conn, f"{prefix}:last_key")
+            generation = int(self._get_state(conn, f"{prefix}:sync_generation") or 0) + 1
+            self._set_state(conn, f"{prefix}:sync_generation", str(generation))
+
+            params = {'Bucket': bucket, 'Prefix': prefix, 'MaxKeys': 1000}
+            if not full and last_key:
+                params['StartAfter'] = last_key
+
+            listed = 0
+            while True:
+                response = s3_client.list_objects_v2(**params)
+                rows = [
+                    (obj['Key'], obj.get('Size'), str(obj.get('ETag', '')).strip('"'),
+                     _timestamp(obj['LastModified']) if obj.get('LastModified') else None, generation)
+                    for obj in response.get('Contents', [])
+                    if obj['Key'].lower().endswith(IMAGE_EXTENSIONS)
+                ]
+                conn.executemany(
+                    "INSERT INTO photos (key, size, etag, last_modified, sync_generation) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET size = excluded.size, etag = excluded.etag, "
+                    "last_modified = excluded.last_modified, sync_generation = excluded.sync_generation",
+                    rows
+                )
+                listed += len(response.get('Contents', []))
+
+                page_keys = [obj['Key'] for obj in response.get('Contents', [])]
+                if page_keys and (last_key is None or page_keys[-1] > last_key):
+                    last_key = page_keys[-1]
+                    self._set_state(conn, f"{prefix}:last_key", last_key)
+                conn.commit()
+
+                if not response.get('IsTruncated'):
+                    break
+                params['ContinuationToken'] = response['NextContinuationToken']
+
+            removed = 0
+            if full:
+                # Rows not touched by a complete listing were deleted from S3
+                removed = conn.execute(
+                    "DELETE FROM photos WHERE substr(key, 1, ?) = ? AND sync_generation < ?",
+                    (len(prefix), prefix, generation)
+                ).rowcount
+                self._set_state(conn, f"{prefix}:full_sync_at", datetime.utcnow().isoformat(timespec='seconds'))
+                conn.commit()
+        finally:
+            conn.close()
+
+        logger.info(f"Photo catalog synced: full={full}, listed={listed}, removed={removed}")
+        return {"full": full, "listed": listed, "removed": removed}
+
+    def usage_watermark(self) -> Optional[str]:
+        """Latest usage timestamp recorded from agent_outputs (None before the first sync)."""
+        conn = self._db.connect()
+        try:
+            return self._get_state(conn, "usage_synced_to")
+        finally:
+            conn.close()
+
+    def record_usage(self, rows: Iterable[Tuple[str, str, Any]], advance_watermark: bool = True):
+        """
+        Record photo uses.
+
+        Args:
+            rows: (brand, key, used_at) tuples
+            advance_watermark: Move the agent_outputs usage watermark to the latest used_at
+        """
+        entries = [(brand, key, _timestamp(used_at)) for brand, key, used_at in rows if brand and key]
+        if not entries:
+            return
+
+        conn = self._db.connect()
+        try:
+            conn.executemany(
+                "INSERT INTO photo_usage (brand, key, last_used) VALUES (?, ?, ?) "
+                "ON CONFLICT(brand, key) DO UPDATE SET last_used = MAX(last_used, excluded.last_used)",
+                entries
+            )
+            if advance_watermark:
+                latest = max(used_at for _, _, used_at in entries)
+                current = self._get_state(conn, "usage_synced_to")
+                if current is None or latest > current:
+                    self._set_state(conn, "usage_synced_to", latest)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def pick_unused(
+        self,
+        brand: str,
+        unused_days: Optional[int] = 15,
+        rng: Optional[random.Random] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Pick a random photo the brand hasn't used in unused_days.
+
+        Counts the eligible photos and takes the one at a random offset,
+        so every eligible photo is equally likely (jumping to a random id
+        would favour photos after gaps of used or deleted ids). Both reads
+        run in one transaction so a concurrent sync can't shrink the set
+        in between. The photo_usage lookups hit its (brand, key) primary key.
+
+        Args:
+            brand: Brand name
+            unused_days: Days a used photo is excluded for (None = any photo)
+            rng: Random source (injectable for tests)
+
+        Returns:
+            {"key", "size", "etag"} or None if no photo qualifies
+        """
+        rng = rng or random
+        cutoff = (datetime.utcnow() - timedelta(days=unused_days)).isoformat(timespec='seconds') if unused_days else None
+
+        where = ""
+        params: Tuple[Any, ...] = ()
+        if cutoff is not None:
+            where = (
+                " WHERE NOT EXISTS (SELECT 1 FROM photo_usage u"
+                " WHERE u.brand = ? AND u.key = p.key AND u.last_used >= ?)"
+            )
+            params = (brand, cutoff)
+
+        conn = self._db.connect()
+        try:
+            conn.execute("BEGIN")
+            count = conn.execute(f"SELECT COUNT(*) FROM photos p{where}", params).fetchone()[0]
+            if count == 0:
+                return None
+
+            row = conn.execute(
+                f"SELECT key, size, etag FROM photos p{where} ORDER BY p.id LIMIT 1 OFFSET ?",
+                params + (rng.randrange(count),)
+            ).fetchone()
+        finally:
+            conn.close()
+
+        if row is None:
+            return None
+        return {"key": row[0], "size": row[1], "etag": row[2]}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get catalog statistics."""
+        conn = self._db.connect()
+        try:
+            photos = conn.execute("SELECT COUNT(*) FROM photos").fetchone()[0]
+            usage = dict(conn.execute("SELECT brand, COUNT(*) FROM photo_usage GROUP BY brand").fetchall())
+            state = dict(conn.execute("SELECT name, value FROM catalog_state").fetchall())
+        finally:
+            conn.close()
+
+        return {"path": str(self.path), "photos": photos, "used_by_brand": usage, "state": state}
+
+
+# Global instance (lazy initialized)
+_photo_catalog: Optional[PhotoCatalog] = None
+_lock = threading.Lock()
+
+
+def get_photo_catalog() -> PhotoCatalog:
+    """Get or create the global photo catalog."""
+    global _photo_catalog
+
+    with _lock:
+        if _photo_catalog is None:
+            _photo_catalog = PhotoCatalog()
+        return _photo_catalog
@@ -3,6 +3,8 @@ Social media activities - wraps MCP tools as Temporal activities.
 """
 from temporalio import activity
 from typing import Dict, Any, Optional
+from datetime import datetime, timedelta
+import asyncio
 import logging
 import sys
 import os
@@ -11,6 +13,8 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from temporal_app.monitoring import observe_activity
+from temporal_app.activities.blocking_io import run_blocking, get_s3_client, pg_connection
+from temporal_app.activities.photo_catalog import get_photo_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -24,74 +28,58 @@ async def get_random_unused_photo(brand: str) -> Dict[str, Any]:
     activity.logger.info(f"Getting random photo for brand: {brand}")
 
     try:
-        import boto3
-        import random
-        from botocore.config import Config
-        import psycopg2
-
-        # AWS S3 config
-        s3_client = boto3.client(
-            's3',
-            aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-            aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-            region_name=os.getenv('AWS_S3_REGION_NAME', 'us-east-1'),
-            config=Config(signature_version='s3v4')
-        )
-
         bucket = os.getenv('AWS_STORAGE_BUCKET_NAME', 'saleorme')
-
-        # List product images from S3
-        response = s3_client.list_objects_v2(
-            Bucket=bucket,
-            Prefix='products/',
-            MaxKeys=1000
+        unused_days = int(os.getenv('PHOTO_UNUSED_DAYS', '15'))
+        catalog = get_photo_catalog()
+
+        def sync_catalog():
+            # Incremental S3 listing (continuation tokens, StartAfter last key)
+            return catalog.sync(get_s3_client(), bucket, prefix='products/')
+
+        def sync_usage():
+            # Pull photo uses logged since the last sync (first run: last unused_days)
+            since = catalog.usage_watermark() or (
+                datetime.utcnow() - timedelta(days=unused_days)
+            ).isoformat(timespec='seconds')
+            with pg_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT content->>'brand', content->>'photo_key', MAX(created_at)
+                    FROM agent_outputs
+                    WHERE agent_name = 'feed-publisher'
+                      AND created_at > %s
+                      AND content->>'photo_key' IS NOT NULL
+                    GROUP BY 1, 2
+                """, (since,))
+                rows = cursor.fetchall()
+                cursor.close()
+            catalog.record_usage(rows)
+            return len(rows)
+
+        # S3 sync and the usage sync are independent; run both off the event loop
+        synced, used = await asyncio.gather(
+            run_blocking(sync_catalog),
+            run_blocking(sync_usage),
+            return_exceptions=True
         )
+        if isinstance(synced, BaseException):
+            activity.logger.warning(f"Photo catalog sync failed, using cached catalog: {synced}")
+        if isinstance(used, BaseException):
+            activity.logger.warning(f"Could not check used photos: {used}")
 
-        if 'Contents' not in response:
-            raise ValueError("No product images found in S3")
-
-        # Filter image files
-        image_keys = [
-            obj['Key'] for obj in response['Contents']
-            if obj['Key'].lower().endswith(('.jpg', '.jpeg', '.png'))
-        ]
-
-        # Get recently used photos from database (last 15 days)
-        try:
-            conn = psycopg2.connect(
-                host=os.getenv('POSTGRES_HOST', '127.0.0.1'),
-                port=int(os.getenv('POSTGRES_PORT', 5433)),
-                database=os.getenv('POSTGRES_DB', 'postgres'),
-                user=os.getenv('POSTGRES_USER', 'postgres'),
-                password=os.getenv('POSTGRES_PASSWORD'),
-            )
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT DISTINCT content->>'photo_key' as photo_key
-                FROM agent_outputs
-                WHERE agent_name = 'feed-publisher'
-                  AND created_at > NOW() - INTERVAL '15 days'
-                  AND content->>'brand' = %s
-                  AND content->>'photo_key' IS NOT NULL
-            """, (brand,))
-
-            used_keys = {row[0] for row in cursor.fetchall()}
-            cursor.close()
-            conn.close()
-        except Exception as e:
-            activity.logger.warning(f"Could not check used photos: {e}")
-            used_keys = set()
-
-        # Filter out recently used photos
-        available_keys = [k for k in image_keys if k not in used_keys]
+        # Random unused photo: indexed lookup in the local catalog
+        photo = await run_blocking(catalog.pick_unused, brand, unused_days)
 
-        if not available_keys:
+        if photo is None:
             activity.logger.warning("No unused photos, using all photos")
-            available_keys = image_keys
+            photo = await run_blocking(catalog.pick_unused, brand, None)
 
-        # Select random photo
-        selected_key = random.choice(available_keys)
+        if photo is None:
+            if isinstance(synced, BaseException):
+                raise synced
+            raise ValueError("No product images found in S3")
+
+        selected_key = photo["key"]
 
         # Generate public URL (without signature - required for Meta APIs)
         # Meta (Facebook/Instagram) APIs require clean URLs without query params
@@ -128,28 +116,17 @@ async def view_image(s3_key: str) -> Dict[str, Any]:
     activity.logger.info(f"Viewing image: {s3_key}")
 
     try:
-        import boto3
-        from botocore.config import Config
         import base64
 
-        # Get image from S3
-        s3_client = boto3.client(
-            's3',
-            aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-            aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-            region_name=os.getenv('AWS_S3_REGION_NAME', 'us-east-1'),
-            config=Config(signature_version='s3v4')
-        )
-
         bucket = os.getenv('AWS_STORAGE_BUCKET_NAME', 'saleorme')
 
-        # Download image
-        response = s3_client.get_object(Bucket=bucket, Key=s3_key)
-        image_data = response['Body'].read()
-        image_base64 = base64.b64encode(image_data).decode('utf-8')
+        def download_image():
+            # Download image
+            response = get_s3_client().get_object(Bucket=bucket, Key=s3_key)
+            image_data = response['Body'].read()
+            return base64.b64encode(image_data).decode('utf-8'), response.get('ContentType', 'image/jpeg')
 
-        # Determine image type
-        content_type = response.get('ContentType', 'image/jpeg')
+        image_base64, content_type = await run_blocking(download_image)
 
         # Use Claude SDK to analyze image
         from claude_agent_sdk import query, ClaudeAgentOptions
@@ -206,7 +183,8 @@ async def generate_caption(
     activity.logger.info(f"Generating {language} caption for {brand}")
 
     try:
-        from claude_agent_sdk import query, ClaudeAgentOptions
+        from claude_agent_sdk import ClaudeAgentOptions
+        from langgraph_agents.llm_executor import get_llm_executor
 
         # Build prompt with product description
         prompt = f"""Write a compelling social media caption in {language.upper()} for this product.
@@ -273,12 +251,17 @@ DO NOT ask to see images. DO NOT explain. Just write the caption.""",
             max_turns=1,
         )
 
-        caption = ""
-        async for message in query(prompt=message_content, options=options):
-            if hasattr(message, 'content'):
-                for block in message.content:
-                    if hasattr(block, 'text'):
-                        caption += block.text
+        # Cached for an hour so activity retries replay the same caption.
+        # One attempt that fits FeedPublisherWorkflow's 3 minute
+        # start_to_close_timeout; Temporal's RetryPolicy owns the retries.
+        caption = await get_llm_executor().run(
+            message_content,
+            options=options,
+            timeout=150,
+            label="caption",
+            cache_ttl=3600,
+            max_retries=0
+        )
 
         activity.heartbeat("Caption generated")
 
@@ -541,8 +524,6 @@ async def save_publication_report(
 
     try:
         import json
-        from datetime import datetime
-        import psycopg2
 
         content = {
             "brand": brand,
@@ -553,47 +534,53 @@ async def save_publication_report(
             "published_at": datetime.utcnow().isoformat()
         }
 
-        # Save to agent_outputs database
-        conn = psycopg2.connect(
-            host=os.getenv('POSTGRES_HOST', '127.0.0.1'),
-            port=int(os.getenv('POSTGRES_PORT', 5433)),
-            database=os.getenv('POSTGRES_DB', 'postgres'),
-            user=os.getenv('POSTGRES_USER', 'postgres'),
-            password=os.getenv('POSTGRES_PASSWORD'),
-        )
-        cursor = conn.cursor()
-
-        # Create table if not exists
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS agent_outputs (
-                id SERIAL PRIMARY KEY,
-                agent_name VARCHAR(255) NOT NULL,
-                output_type VARCHAR(50) NOT NULL,
-                title VARCHAR(500),
-                content JSONB,
-                metadata JSONB,
-                tags TEXT[],
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        def insert_report():
+            # Save to agent_outputs database
+            with pg_connection() as conn:
+                cursor = conn.cursor()
+
+                # Create table if not exists
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS agent_outputs (
+                        id SERIAL PRIMARY KEY,
+                        agent_name VARCHAR(255) NOT NULL,
+                        output_type VARCHAR(50) NOT NULL,
+                        title VARCHAR(500),
+                        content JSONB,
+                        metadata JSONB,
+                        tags TEXT[],
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+
+                # Insert report
+                cursor.execute("""
+                    INSERT INTO agent_outputs (agent_name, output_type, title, content, tags)
+                    VALUES (%s, %s, %s, %s, %s)
+                    RETURNING id
+                """, (
+                    'feed-publisher',
+                    'report',
+                    f'{brand.capitalize()} - Social Media Post',
+                    json.dumps(content),
+                    [brand, 'social-media', 'feed-post']
+                ))
+
+                report_id = cursor.fetchone()[0]
+                cursor.close()
+            return report_id
+
+        report_id = await run_blocking(insert_report)
+
+        # Exclude the photo locally right away (other workers pick it up from agent_outputs)
+        try:
+            await run_blocking(
+                get_photo_catalog().record_usage,
+                [(brand, photo_key, content["published_at"])],
+                advance_watermark=False
             )
-        """)
-
-        # Insert report
-        cursor.execute("""
-            INSERT INTO agent_outputs (agent_name, output_type, title, content, tags)
-            VALUES (%s, %s, %s, %s, %s)
-            RETURNING id
-        """, (
-            'feed-publisher',
-            'report',
-            f'{brand.capitalize()} - Social Media Post',
-            json.dumps(content),
-            [brand, 'social-media', 'feed-post']
-        ))
-
-        report_id = cursor.fetchone()[0]
-        conn.commit()
-        cursor.close()
-        conn.close()
+        except Exception as e:
+            activity.logger.warning(f"Could not update photo catalog: {e}")
 
         result = {
             "success": True,
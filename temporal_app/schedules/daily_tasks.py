@@ -153,7 +153,9 @@ async def setup_schedules():
             schedule=Schedule(
                 action=ScheduleActionStartWorkflow(
                     workflow=DailyAnalyticsWorkflow.run,
-                    args=[7, "pomandi"],  # Last 7 days, pomandi brand
+                    args=[7, "pomandi", {  # Last 7 days, pomandi brand
+                        "per_source_activities": os.getenv('DAILY_ANALYTICS_PER_SOURCE', 'false').lower() == 'true'
+                    }],
                     id="daily-analytics-pomandi",
                     task_queue=task_queue,
                     execution_timeout=timedelta(minutes=30),
@@ -0,0 +1,139 @@
+"""
+Task queue topology - which queue each activity runs on, and how each queue is sized.
+
+One queue for everything let a 15-minute analytics graph hold activity
+slots that quick checks like check_caption_quality were waiting for.
+Activities are split by what bounds them:
+
+- llm:  LangGraph runs and Claude calls (long, few at a time)
+- io:   S3, Postgres, Meta/Google APIs, git/deploys (mostly waiting)
+- fast: sub-second CPU checks (never queued behind the others)
+
+Workflows stay on TEMPORAL_TASK_QUEUE (default "agent-tasks") together
+with any activity not listed here, and pass task_queue_for(activity) to
+execute_activity. A worker process polls the queues in WORKER_QUEUES
+(default: all), so scaling a class means starting more processes with
+e.g. WORKER_QUEUES=llm.
+
+Set TEMPORAL_SPLIT_QUEUES=false to route every activity to the workflow's
+own queue again.
+
+This module is imported inside workflow code: it only reads the
+environment at import time and has no other side effects.
+"""
+import os
+from typing import Any, Callable, Dict, List, Optional, Union
+
+WORKFLOW_QUEUE = "workflows"
+LLM_QUEUE = "llm"
+IO_QUEUE = "io"
+FAST_QUEUE = "fast"
+
+QUEUE_CLASSES = [WORKFLOW_QUEUE, LLM_QUEUE, IO_QUEUE, FAST_QUEUE]
+
+SPLIT_QUEUES = os.getenv('TEMPORAL_SPLIT_QUEUES', 'true').lower() == 'true'
+
+TASK_QUEUES: Dict[str, str] = {
+    WORKFLOW_QUEUE: os.getenv('TEMPORAL_TASK_QUEUE', 'agent-tasks'),
+    LLM_QUEUE: os.getenv('TEMPORAL_LLM_TASK_QUEUE', 'agent-tasks-llm'),
+    IO_QUEUE: os.getenv('TEMPORAL_IO_TASK_QUEUE', 'agent-tasks-io'),
+    FAST_QUEUE: os.getenv('TEMPORAL_FAST_TASK_QUEUE', 'agent-tasks-fast'),
+}
+
+# Max concurrent activities per queue class (per worker process)
+MAX_CONCURRENT_ACTIVITIES: Dict[str, int] = {
+    WORKFLOW_QUEUE: int(os.getenv('TEMPORAL_MAX_ACTIVITIES', '10')),
+    LLM_QUEUE: int(os.getenv('TEMPORAL_LLM_MAX_ACTIVITIES', '4')),
+    IO_QUEUE: int(os.getenv('TEMPORAL_IO_MAX_ACTIVITIES', '20')),
+    FAST_QUEUE: int(os.getenv('TEMPORAL_FAST_MAX_ACTIVITIES', '20')),
+}
+
+MAX_CONCURRENT_WORKFLOW_TASKS = int(os.getenv('TEMPORAL_MAX_WORKFLOW_TASKS', '10'))
+
+# Activity name -> queue class (unlisted activities stay on the workflow queue)
+ACTIVITY_QUEUE_CLASSES: Dict[str, str] = {
+    # LangGraph / Claude
+    "run_daily_analytics_graph": LLM_QUEUE,
+    "analyze_analytics_source": LLM_QUEUE,
+    "merge_daily_analytics": LLM_QUEUE,
+    "run_validator_graph": LLM_QUEUE,
+    "run_action_planner_graph": LLM_QUEUE,
+    "run_executor_graph": LLM_QUEUE,
+    "run_feedback_collector_graph": LLM_QUEUE,
+    "run_invoice_matcher_graph": LLM_QUEUE,
+    "run_feed_publisher_graph": LLM_QUEUE,
+    "run_langgraph_feed_publisher": LLM_QUEUE,
+    "run_seo_optimizer_graph": LLM_QUEUE,
+    "run_email_assistant_check": LLM_QUEUE,
+    "view_image": LLM_QUEUE,
+    "generate_caption": LLM_QUEUE,
+    # External I/O
+    "fetch_analytics_source": IO_QUEUE,
+    "get_random_unused_photo": IO_QUEUE,
+    "publish_facebook_photo": IO_QUEUE,
+    "publish_instagram_photo": IO_QUEUE,
+    "save_publication_report": IO_QUEUE,
+    "collect_appointments": IO_QUEUE,
+    "save_appointment_report": IO_QUEUE,
+    "send_daily_email_summary": IO_QUEUE,
+    "process_pending_approvals": IO_QUEUE,
+    "fetch_search_console_data": IO_QUEUE,
+    "get_existing_pages": IO_QUEUE,
+    "save_page_config": IO_QUEUE,
+    "push_landing_page_to_git": IO_QUEUE,
+    "trigger_coolify_deployment": IO_QUEUE,
+    "save_seo_report": IO_QUEUE,
+    "check_deployment_status": IO_QUEUE,
+    "test_memory_hub_save": IO_QUEUE,
+    # Quick checks
+    "check_caption_quality": FAST_QUEUE,
+    "check_caption_duplicate": FAST_QUEUE,
+    "analyze_appointments": FAST_QUEUE,
+}
+
+
+def _activity_name(activity: Union[str, Callable[..., Any]]) -> str:
+    if isinstance(activity, str):
+        return activity
+    return getattr(activity, "__name__", str(activity))
+
+
+def queue_class_for(activity: Union[str, Callable[..., Any]]) -> str:
+    """Queue class of an activity (function or name)."""
+    if not SPLIT_QUEUES:
+        return WORKFLOW_QUEUE
+    return ACTIVITY_QUEUE_CLASSES.get(_activity_name(activity), WORKFLOW_QUEUE)
+
+
+def task_queue_for(activity: Union[str, Callable[..., Any]]) -> Optional[str]:
+    """
+    Task queue to pass to workflow.execute_activity.
+
+    Args:
+        activity: Activity function or name
+
+    Returns:
+        Queue name, or None to use the workflow's own queue
+    """
+    queue_class = queue_class_for(activity)
+    if queue_class == WORKFLOW_QUEUE:
+        return None
+    return TASK_QUEUES[queue_class]
+
+
+def worker_queue_classes() -> List[str]:
+    """Queue classes this worker process polls (WORKER_QUEUES, comma-separated, default all)."""
+    configured = os.getenv('WORKER_QUEUES', 'all').strip().lower()
+    if configured in ('', 'all'):
+        return list(QUEUE_CLASSES) if SPLIT_QUEUES else [WORKFLOW_QUEUE]
+
+    classes = [name.strip() for name in configured.split(',') if name.strip()]
+    unknown = [name for name in classes if name not in QUEUE_CLASSES]
+    if unknown:
+        raise ValueError(f"Unknown WORKER_QUEUES entries: {unknown} (expected {QUEUE_CLASSES})")
+    return classes
+
+
+def activities_for(queue_class: str, activities: List[Callable[..., Any]]) -> List[Callable[..., Any]]:
+    """Activities from a registration list that belong on a queue class."""
+    return [activity for activity in activities if queue_class_for(activity) == queue_class]
@@ -2,6 +2,7 @@
 Temporal worker - runs activities and workflows.
 """
 import asyncio
+import inspect
 import os
 import logging
 import sys
@@ -47,6 +48,9 @@ from temporal_app.activities.langgraph_wrapper import (
 )
 from temporal_app.activities.langgraph_activities import (
     run_daily_analytics_graph,
+    fetch_analytics_source,        # Per-source daily analytics mode
+    analyze_analytics_source,
+    merge_daily_analytics,
     run_validator_graph,           # New: Data validation
     run_action_planner_graph,      # New: Action planning
     run_executor_graph,            # New: Action execution
@@ -68,6 +72,15 @@ from temporal_app.activities.seo_activities import (
     check_deployment_status,
 )
 from temporal_app.activities.memory_hub_test import test_memory_hub_save
+from temporal_app.task_queues import (
+    WORKFLOW_QUEUE,
+    TASK_QUEUES,
+    MAX_CONCURRENT_ACTIVITIES,
+    MAX_CONCURRENT_WORKFLOW_TASKS,
+    activities_for,
+    queue_class_for,
+    worker_queue_classes,
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -75,20 +88,70 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_resource_tuner_config = None
+
+
+def _concurrency_options(queue_class: str) -> dict:
+    """
+    Slot limits for a queue's Worker.
+
+    Fixed per-queue limits by default. With TEMPORAL_RESOURCE_TUNER=true,
+    activity slots are handed out by Temporal's resource-based tuner (up to
+    the queue's limit) while CPU/memory stay under the configured targets.
+    """
+    global _resource_tuner_config
+
+    max_activities = MAX_CONCURRENT_ACTIVITIES[queue_class]
+    if os.getenv('TEMPORAL_RESOURCE_TUNER', 'false').lower() != 'true':
+        return {
+            "max_concurrent_activities": max_activities,
+            "max_concurrent_workflow_tasks": MAX_CONCURRENT_WORKFLOW_TASKS,
+        }
+
+    from temporalio.worker import (
+        WorkerTuner,
+        FixedSizeSlotSupplier,
+        ResourceBasedSlotConfig,
+        ResourceBasedSlotSupplier,
+        ResourceBasedTunerConfig,
+    )
+
+    # One tuner config per process: all queues share the same resource budget
+    if _resource_tuner_config is None:
+        _resource_tuner_config = ResourceBasedTunerConfig(
+            target_memory_usage=float(os.getenv('TEMPORAL_TUNER_TARGET_MEMORY', '0.8')),
+            target_cpu_usage=float(os.getenv('TEMPORAL_TUNER_TARGET_CPU', '0.9')),
+        )
+
+    suppliers = {
+        "workflow_supplier": FixedSizeSlotSupplier(MAX_CONCURRENT_WORKFLOW_TASKS),
+        "activity_supplier": ResourceBasedSlotSupplier(
+            ResourceBasedSlotConfig(minimum_slots=1, maximum_slots=max_activities),
+            _resource_tuner_config,
+        ),
+        "local_activity_supplier": FixedSizeSlotSupplier(max_activities),
+    }
+    # Newer SDKs require a Nexus slot supplier; older ones reject the keyword
+    if "nexus_supplier" in inspect.signature(WorkerTuner.create_composite).parameters:
+        suppliers["nexus_supplier"] = FixedSizeSlotSupplier(1)
+
+    return {"tuner": WorkerTuner.create_composite(**suppliers)}
+
+
 async def run_worker():
     """Start Temporal worker."""
 
     # Get configuration from environment
     temporal_host = os.getenv('TEMPORAL_HOST', 'localhost:7233')
     namespace = os.getenv('TEMPORAL_NAMESPACE', 'default')
-    task_queue = os.getenv('TEMPORAL_TASK_QUEUE', 'agent-tasks')
+    queue_classes = worker_queue_classes()
 
     logger.info("=" * 60)
     logger.info("Temporal Worker Starting")
     logger.info("=" * 60)
     logger.info(f"Temporal Host: {temporal_host}")
     logger.info(f"Namespace: {namespace}")
-    logger.info(f"Task Queue: {task_queue}")
+    logger.info(f"Task Queues: {', '.join(TASK_QUEUES[c] for c in queue_classes)}")
     logger.info("=" * 60)
 
     # Connect to Temporal
@@ -131,6 +194,9 @@ async def run_worker():
         check_caption_duplicate,
         # LangGraph activities (full graph execution)
         run_daily_analytics_graph,
+        fetch_analytics_source,
+        analyze_analytics_source,
+        merge_daily_analytics,
         # New Pipeline Activities
         run_validator_graph,
         run_action_planner_graph,
@@ -153,22 +219,29 @@ async def run_worker():
         test_memory_hub_save,
     ]
 
-    # Create worker
-    worker = Worker(
-        client,
-        task_queue=task_queue,
-        workflows=workflows,
-        activities=activities,
-        max_concurrent_activities=10,
-        max_concurrent_workflow_tasks=10,
-    )
+    # One Worker per queue class polled by this process
+    workers = []
+    for queue_class in queue_classes:
+        queue_workflows = workflows if queue_class == WORKFLOW_QUEUE else []
+        queue_activities = activities_for(queue_class, activities)
+        if not queue_workflows and not queue_activities:
+            continue
+
+        workers.append(Worker(
+            client,
+            task_queue=TASK_QUEUES[queue_class],
+            workflows=queue_workflows,
+            activities=queue_activities,
+            **_concurrency_options(queue_class),
+        ))
 
     logger.info("=" * 60)
-    logger.info(f"✅ Worker initialized on task queue: {task_queue}")
+    for worker in workers:
+        logger.info(f"✅ Worker initialized on task queue: {worker.task_queue}")
     logger.info("Registered workflows:")
     for wf in workflows:
         logger.info(f"  - {wf.__name__}")
-    logger.info(f"Registered activities: {len(activities)} total")
+    logger.info(f"Registered activities: {sum(len(activities_for(c, activities)) for c in queue_classes)} total")
     logger.info("  Core activities:")
     logger.info("    - get_random_unused_photo")
     logger.info("    - view_image")
@@ -185,6 +258,7 @@ async def run_worker():
     logger.info("    - check_caption_duplicate")
     logger.info("  LangGraph activities:")
     logger.info("    - run_daily_analytics_graph")
+    logger.info("    - fetch_analytics_source / analyze_analytics_source / merge_daily_analytics")
     logger.info("  Pipeline activities (NEW):")
     logger.info("    - run_validator_graph")
     logger.info("    - run_action_planner_graph")
@@ -195,15 +269,48 @@ async def run_worker():
     logger.info("Press Ctrl+C to stop")
     logger.info("=" * 60)
 
-    # Run worker (blocks until stopped)
+    # Warm the shared MemoryManager and one compiled instance per pipeline graph
+    from langgraph_agents import (
+        DailyAnalyticsGraph,
+        DataValidatorGraph,
+        ActionPlannerGraph,
+        ActionExecutorGraph,
+        FeedbackCollectorGraph,
+    )
+    from langgraph_agents.graph_pool import start_graph_pool, close_graph_pool
+    if queue_class_for(run_daily_analytics_graph) in queue_classes:
+        await start_graph_pool([
+            DailyAnalyticsGraph,
+            DataValidatorGraph,
+            ActionPlannerGraph,
+            ActionExecutorGraph,
+            FeedbackCollectorGraph,
+        ])
+
+    # Run workers (blocks until stopped)
     try:
-        await worker.run()
+        await asyncio.gather(*(worker.run() for worker in workers))
     except KeyboardInterrupt:
         logger.info("\n👋 Worker shutting down...")
     except Exception as e:
         logger.error(f"❌ Worker error: {e}", exc_info=True)
         raise
     finally:
+        # Stop the other queues' workers if one of them failed
+        for worker in workers:
+            if worker.is_running and not worker.is_shutdown:
+                await worker.shutdown()
+        # Release pooled graphs and the shared MemoryManager
+        await close_graph_pool()
+        # Stop MCP servers kept warm by the session pool
+        from langgraph_agents.clients.mcp_session_pool import close_mcp_session_pool
+        await close_mcp_session_pool()
+        # Stop activity I/O threads and pooled Postgres connections
+        from temporal_app.activities.blocking_io import shutdown_blocking_io
+        shutdown_blocking_io()
+        # Release pooled Memory-Hub connections
+        from memory.memory_hub_client import get_memory_hub_client
+        await get_memory_hub_client().close()
         await client.close()
         logger.info("✅ Worker stopped")
 
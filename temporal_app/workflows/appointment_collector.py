@@ -9,6 +9,7 @@ import logging
 
 # Import activities
 with workflow.unsafe.imports_passed_through():
+    from temporal_app.task_queues import task_queue_for
     from temporal_app.activities.appointment_activities import (
         collect_appointments,
         analyze_appointments,
@@ -54,6 +55,7 @@ class AppointmentCollectorWorkflow:
             workflow.logger.info(f"📊 Step 1: Collecting appointments from last {days} days...")
             appointments_data = await workflow.execute_activity(
                 collect_appointments,
+                task_queue=task_queue_for(collect_appointments),
                 args=[days],
                 start_to_close_timeout=timedelta(minutes=5),
                 retry_policy=RetryPolicy(
@@ -72,6 +74,7 @@ class AppointmentCollectorWorkflow:
             workflow.logger.info("🔍 Step 2: Analyzing appointment data...")
             analysis = await workflow.execute_activity(
                 analyze_appointments,
+                task_queue=task_queue_for(analyze_appointments),
                 args=[appointments],
                 start_to_close_timeout=timedelta(minutes=3),
                 retry_policy=RetryPolicy(
@@ -88,6 +91,7 @@ class AppointmentCollectorWorkflow:
             workflow.logger.info("💾 Step 3: Saving appointment report...")
             report_id = await workflow.execute_activity(
                 save_appointment_report,
+                task_queue=task_queue_for(save_appointment_report),
                 args=[days, total_appointments, appointments, analysis],
                 start_to_close_timeout=timedelta(minutes=2),
                 retry_policy=RetryPolicy(
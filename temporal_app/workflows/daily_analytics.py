@@ -9,6 +9,8 @@ This workflow implements the complete closed-loop autonomous system:
 Pipeline Flow:
     1. Data Collection (8 sources)
        └── DailyAnalyticsGraph: Collect from Google Ads, Meta Ads, Shopify, etc.
+           (per_source_activities: one fetch + analyze activity per source,
+            in parallel, then a merge activity)
 
     2. Data Validation
        └── DataValidatorGraph: Duplicate detection, cross-source verification, anomaly detection
@@ -28,19 +30,26 @@ Note: FeedbackCollectorGraph runs separately on its own schedule (T+1, T+3, T+7)
 """
 from temporalio import workflow
 from temporalio.common import RetryPolicy
+from temporalio.exceptions import ActivityError, ApplicationError
 from datetime import timedelta
 from typing import Dict, Any
+import asyncio
 import logging
 
 # Import activities
 with workflow.unsafe.imports_passed_through():
+    from temporal_app.task_queues import task_queue_for
     from temporal_app.activities.langgraph_activities import (
         run_daily_analytics_graph,
+        fetch_analytics_source,
+        analyze_analytics_source,
+        merge_daily_analytics,
         run_validator_graph,
         run_action_planner_graph,
         run_executor_graph
     )
     from temporal_app.monitoring import observe_workflow
+    from langgraph_agents.daily_analytics_graph import DAILY_ANALYTICS_SOURCES
 
 logger = logging.getLogger(__name__)
 
@@ -58,9 +67,23 @@ PIPELINE_CONFIG = {
     "enable_action_planning": True,
     "enable_execution": True,
     "execution_dry_run": True,  # Safety: Default to dry-run mode
-    "send_telegram_on_validation_fail": True
+    "send_telegram_on_validation_fail": True,
+    # Run each source's fetch/analysis as separate activities instead of
+    # one run_daily_analytics_graph activity (failed sources retry alone)
+    "per_source_activities": False
 }
 
+# LLM budget for one analyze_analytics_source attempt. The executor's own
+# retries (timeout x attempts + backoff) must finish inside the activity's
+# start_to_close_timeout, otherwise Temporal kills the attempt first.
+ANALYSIS_LLM_TIMEOUT_SECONDS = 120
+ANALYSIS_LLM_MAX_RETRIES = 1
+ANALYSIS_ACTIVITY_TIMEOUT = timedelta(
+    seconds=ANALYSIS_LLM_TIMEOUT_SECONDS * (ANALYSIS_LLM_MAX_RETRIES + 1)
+    + sum(min(2 ** attempt, 30) for attempt in range(1, ANALYSIS_LLM_MAX_RETRIES + 1))
+    + 60  # Executor queueing, cache lookup, message capture
+)
+
 
 # =============================================================================
 # INTEGRATED DAILY ANALYTICS WORKFLOW
@@ -112,6 +135,10 @@ class DailyAnalyticsWorkflow:
     Returns comprehensive result with all pipeline stage outputs.
     """
 
+    def __init__(self):
+        # Per-source fetch/analysis results (per_source_activities mode)
+        self.source_results: Dict[str, Dict[str, Any]] = {}
+
     @workflow.run
     async def run(
         self,
@@ -162,17 +189,21 @@ class DailyAnalyticsWorkflow:
             workflow.logger.info("📊 STAGE 1: Data Collection (DailyAnalyticsGraph)")
             result["pipeline_stages"].append("data_collection_started")
 
-            analytics_result = await workflow.execute_activity(
-                run_daily_analytics_graph,
-                args=[days, brand],
-                start_to_close_timeout=timedelta(minutes=15),
-                retry_policy=RetryPolicy(
-                    maximum_attempts=2,
-                    initial_interval=timedelta(minutes=1),
-                    maximum_interval=timedelta(minutes=5),
-                    backoff_coefficient=2.0,
-                ),
-            )
+            if pipeline_config["per_source_activities"]:
+                analytics_result = await self._collect_per_source(days, brand)
+            else:
+                analytics_result = await workflow.execute_activity(
+                    run_daily_analytics_graph,
+                    task_queue=task_queue_for(run_daily_analytics_graph),
+                    args=[days, brand],
+                    start_to_close_timeout=timedelta(minutes=15),
+                    retry_policy=RetryPolicy(
+                        maximum_attempts=2,
+                        initial_interval=timedelta(minutes=1),
+                        maximum_interval=timedelta(minutes=5),
+                        backoff_coefficient=2.0,
+                    ),
+                )
 
             result["data_collection"] = {
                 "success": analytics_result.get("success", False),
@@ -201,6 +232,7 @@ class DailyAnalyticsWorkflow:
 
                 validation_result = await workflow.execute_activity(
                     run_validator_graph,
+                    task_queue=task_queue_for(run_validator_graph),
                     args=[raw_data, brand, days],
                     start_to_close_timeout=timedelta(minutes=5),
                     retry_policy=RetryPolicy(
@@ -255,6 +287,7 @@ class DailyAnalyticsWorkflow:
 
                 planning_result = await workflow.execute_activity(
                     run_action_planner_graph,
+                    task_queue=task_queue_for(run_action_planner_graph),
                     args=[validation_result, analytics_result, brand],
                     start_to_close_timeout=timedelta(minutes=10),
                     retry_policy=RetryPolicy(
@@ -297,6 +330,7 @@ class DailyAnalyticsWorkflow:
 
                 execution_result = await workflow.execute_activity(
                     run_executor_graph,
+                    task_queue=task_queue_for(run_executor_graph),
                     args=[actions_to_execute, brand, pipeline_config["execution_dry_run"]],
                     start_to_close_timeout=timedelta(minutes=10),
                     retry_policy=RetryPolicy(
@@ -346,6 +380,105 @@ class DailyAnalyticsWorkflow:
             result["completed_at"] = workflow.now().isoformat()
             raise
 
+    async def _collect_per_source(self, days: int, brand: str) -> Dict[str, Any]:
+        """
+        Stage 1 as per-source activities.
+
+        Every source runs fetch -> analyze as its own activities, all
+        sources in parallel, so a failing source is retried on its own and
+        finished LLM analyses are never repeated. Results are kept in
+        self.source_results until merge_daily_analytics writes the report.
+
+        Returns:
+            Same shape as run_daily_analytics_graph
+        """
+        await asyncio.gather(*(
+            self._collect_source(source, days, brand)
+            for source in DAILY_ANALYTICS_SOURCES
+        ))
+
+        failed = [name for name, result in self.source_results.items() if result["data"].get("error")]
+        workflow.logger.info(
+            f"📥 Sources collected: {len(self.source_results) - len(failed)}/{len(self.source_results)} ok"
+            + (f", failed: {', '.join(failed)}" if failed else "")
+        )
+
+        return await workflow.execute_activity(
+            merge_daily_analytics,
+            task_queue=task_queue_for(merge_daily_analytics),
+            args=[self.source_results, days, brand],
+            start_to_close_timeout=timedelta(minutes=10),
+            retry_policy=RetryPolicy(
+                maximum_attempts=2,
+                initial_interval=timedelta(minutes=1),
+            ),
+        )
+
+    async def _collect_source(self, source: str, days: int, brand: str):
+        """Fetch and analyze one source, recording the result in workflow state."""
+        try:
+            fetched = await workflow.execute_activity(
+                fetch_analytics_source,
+                task_queue=task_queue_for(fetch_analytics_source),
+                args=[source, days, brand],
+                start_to_close_timeout=timedelta(minutes=5),
+                retry_policy=RetryPolicy(
+                    maximum_attempts=3,
+                    initial_interval=timedelta(seconds=30),
+                    maximum_interval=timedelta(minutes=2),
+                    backoff_coefficient=2.0,
+                ),
+            )
+        except ActivityError as e:
+            # Out of retries: analyze the error payload so the report still diagnoses it
+            fetched = self._failed_fetch_result(source, e)
+            workflow.logger.warning(f"⚠️ {source} fetch failed: {fetched['data'].get('error')}")
+
+        try:
+            analyzed = await workflow.execute_activity(
+                analyze_analytics_source,
+                task_queue=task_queue_for(analyze_analytics_source),
+                args=[
+                    source, fetched["data"], days, brand,
+                    ANALYSIS_LLM_TIMEOUT_SECONDS, ANALYSIS_LLM_MAX_RETRIES
+                ],
+                start_to_close_timeout=ANALYSIS_ACTIVITY_TIMEOUT,
+                retry_policy=RetryPolicy(
+                    maximum_attempts=2,
+                    initial_interval=timedelta(seconds=30),
+                ),
+            )
+        except ActivityError as e:
+            error_msg = str(e.cause or e)
+            analyzed = {
+                "report": f"❌ Analiz hatası: {error_msg}",
+                "message": None,
+                "steps_completed": [],
+                "errors": [f"{source}: {error_msg}"]
+            }
+
+        self.source_results[source] = {
+            "data": fetched["data"],
+            "report": analyzed.get("report"),
+            "message": analyzed.get("message"),
+            "steps_completed": fetched.get("steps_completed", []) + analyzed.get("steps_completed", []),
+            "errors": fetched.get("errors", []) + analyzed.get("errors", []),
+        }
+
+    def _failed_fetch_result(self, source: str, error: ActivityError) -> Dict[str, Any]:
+        """Fetch result for a source whose activity ran out of retries."""
+        cause = error.cause
+        # fetch_analytics_source attaches its result when the source returned an error
+        if isinstance(cause, ApplicationError) and cause.details and isinstance(cause.details[0], dict):
+            return cause.details[0]
+
+        error_msg = str(cause or error)
+        return {
+            "data": {"source": source, "error": error_msg},
+            "steps_completed": [],
+            "errors": [f"{source}: {error_msg}"]
+        }
+
     def _extract_raw_data_for_validation(self, analytics_result: Dict) -> Dict[str, Any]:
         """
         Extract raw data from analytics result for validation.
@@ -428,6 +561,7 @@ class FeedbackCollectionWorkflow:
 
         result = await workflow.execute_activity(
             run_feedback_collector_graph,
+            task_queue=task_queue_for(run_feedback_collector_graph),
             args=[brand],
             start_to_close_timeout=timedelta(minutes=10),
             retry_policy=RetryPolicy(
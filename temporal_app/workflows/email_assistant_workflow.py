@@ -11,6 +11,7 @@ from temporalio.common import RetryPolicy
 from datetime import timedelta
 
 with workflow.unsafe.imports_passed_through():
+    from temporal_app.task_queues import task_queue_for
     from temporal_app.activities.email_activities import (
         run_email_assistant_check,
         process_pending_approvals,
@@ -60,6 +61,7 @@ class EmailAssistantWorkflow:
         # Step 1: Run email assistant check (LangGraph agent)
         result = await workflow.execute_activity(
             run_email_assistant_check,
+            task_queue=task_queue_for(run_email_assistant_check),
             args=[check_outlook, check_godaddy],
             start_to_close_timeout=timedelta(minutes=10),
             retry_policy=RetryPolicy(
@@ -87,6 +89,7 @@ class EmailAssistantWorkflow:
             try:
                 approval_result = await workflow.execute_activity(
                     process_pending_approvals,
+                    task_queue=task_queue_for(process_pending_approvals),
                     start_to_close_timeout=timedelta(minutes=5),
                     retry_policy=RetryPolicy(maximum_attempts=2)
                 )
@@ -138,6 +141,7 @@ class DailyEmailSummaryWorkflow:
 
         result = await workflow.execute_activity(
             send_daily_email_summary,
+            task_queue=task_queue_for(send_daily_email_summary),
             start_to_close_timeout=timedelta(minutes=2),
             retry_policy=RetryPolicy(
                 maximum_attempts=3,
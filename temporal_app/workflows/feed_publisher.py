@@ -16,6 +16,7 @@ import asyncio
 
 # Import activities
 with workflow.unsafe.imports_passed_through():
+    from temporal_app.task_queues import task_queue_for
     from temporal_app.activities.social_media import (
         get_random_unused_photo,
         view_image,
@@ -83,6 +84,7 @@ class FeedPublisherWorkflow:
             workflow.logger.info("📸 Step 1: Getting random photo...")
             photo_data = await workflow.execute_activity(
                 get_random_unused_photo,
+                task_queue=task_queue_for(get_random_unused_photo),
                 args=[brand],
                 start_to_close_timeout=timedelta(minutes=2),
                 retry_policy=RetryPolicy(
@@ -101,6 +103,7 @@ class FeedPublisherWorkflow:
             workflow.logger.info("🔍 Step 2: Analyzing image...")
             image_analysis = await workflow.execute_activity(
                 view_image,
+                task_queue=task_queue_for(view_image),
                 args=[photo_key],
                 start_to_close_timeout=timedelta(minutes=1),
                 retry_policy=RetryPolicy(
@@ -115,6 +118,7 @@ class FeedPublisherWorkflow:
             workflow.logger.info("✍️  Step 3: Generating caption with AI...")
             caption = await workflow.execute_activity(
                 generate_caption,
+                task_queue=task_queue_for(generate_caption),
                 args=[image_description, brand, language],
                 start_to_close_timeout=timedelta(minutes=3),
                 retry_policy=RetryPolicy(
@@ -136,6 +140,7 @@ class FeedPublisherWorkflow:
                 # Check for duplicates
                 duplicate_result = await workflow.execute_activity(
                     check_caption_duplicate,
+                    task_queue=task_queue_for(check_caption_duplicate),
                     args=[brand, "facebook", caption],
                     start_to_close_timeout=timedelta(minutes=1),
                     retry_policy=RetryPolicy(maximum_attempts=2),
@@ -150,6 +155,7 @@ class FeedPublisherWorkflow:
                 # Check quality
                 quality_result = await workflow.execute_activity(
                     check_caption_quality,
+                    task_queue=task_queue_for(check_caption_quality),
                     args=[caption, brand, language],
                     start_to_close_timeout=timedelta(minutes=1),
                     retry_policy=RetryPolicy(maximum_attempts=2),
@@ -183,6 +189,7 @@ class FeedPublisherWorkflow:
             # Create both tasks
             facebook_task = workflow.execute_activity(
                 publish_facebook_photo,
+                task_queue=task_queue_for(publish_facebook_photo),
                 args=[brand, image_url, caption],
                 start_to_close_timeout=timedelta(minutes=5),
                 retry_policy=RetryPolicy(
@@ -192,6 +199,7 @@ class FeedPublisherWorkflow:
 
             instagram_task = workflow.execute_activity(
                 publish_instagram_photo,
+                task_queue=task_queue_for(publish_instagram_photo),
                 args=[brand, image_url, caption],
                 start_to_close_timeout=timedelta(minutes=5),
                 retry_policy=RetryPolicy(
@@ -213,6 +221,7 @@ class FeedPublisherWorkflow:
             workflow.logger.info("💾 Step 6: Saving publication report...")
             report = await workflow.execute_activity(
                 save_publication_report,
+                task_queue=task_queue_for(save_publication_report),
                 args=[
                     brand,
                     photo_key,
@@ -15,6 +15,7 @@ import logging
 
 # Import activities
 with workflow.unsafe.imports_passed_through():
+    from temporal_app.task_queues import task_queue_for
     from temporal_app.activities.social_media import get_random_unused_photo
     from temporal_app.activities.langgraph_activities import run_feed_publisher_graph
     from temporal_app.monitoring import observe_workflow
@@ -65,6 +66,7 @@ class FeedPublisherLangGraphWorkflow:
             workflow.logger.info("📸 Step 1: Getting random photo...")
             photo_data = await workflow.execute_activity(
                 get_random_unused_photo,
+                task_queue=task_queue_for(get_random_unused_photo),
                 args=[brand],
                 start_to_close_timeout=timedelta(minutes=2),
                 retry_policy=RetryPolicy(
@@ -82,6 +84,7 @@ class FeedPublisherLangGraphWorkflow:
             workflow.logger.info("🤖 Step 2: Running LangGraph feed publisher...")
             graph_result = await workflow.execute_activity(
                 run_feed_publisher_graph,
+                task_queue=task_queue_for(run_feed_publisher_graph),
                 args=[brand, platform, photo_key],
                 start_to_close_timeout=timedelta(minutes=5),
                 retry_policy=RetryPolicy(
@@ -15,6 +15,7 @@ import logging
 
 # Import activities
 with workflow.unsafe.imports_passed_through():
+    from temporal_app.task_queues import task_queue_for
     from temporal_app.activities.langgraph_activities import run_invoice_matcher_graph
     from temporal_app.monitoring import observe_workflow
 
@@ -71,6 +72,7 @@ class InvoiceMatcherLangGraphWorkflow:
             workflow.logger.info("🤖 Running LangGraph invoice matcher...")
             graph_result = await workflow.execute_activity(
                 run_invoice_matcher_graph,
+                task_queue=task_queue_for(run_invoice_matcher_graph),
                 args=[transaction, invoices],
                 start_to_close_timeout=timedelta(minutes=3),
                 retry_policy=RetryPolicy(
@@ -10,6 +10,7 @@ from datetime import timedelta
 from temporalio import workflow
 
 with workflow.unsafe.imports_passed_through():
+    from temporal_app.task_queues import task_queue_for
     from temporal_app.activities.memory_hub_test import test_memory_hub_save
 
 
@@ -32,6 +33,7 @@ class MemoryHubTestWorkflow:
         # Run the test activity
         result = await workflow.execute_activity(
             test_memory_hub_save,
+            task_queue=task_queue_for(test_memory_hub_save),
             start_to_close_timeout=timedelta(seconds=60)
         )
 
@@ -14,6 +14,7 @@ import logging
 
 # Import activities using safe imports
 with workflow.unsafe.imports_passed_through():
+    from temporal_app.task_queues import task_queue_for
     from temporal_app.activities.seo_activities import (
         fetch_search_console_data,
         run_seo_optimizer_graph,
@@ -84,6 +85,7 @@ class SEOLandingOptimizerWorkflow:
             workflow.logger.info("📊 Step 1: Fetching Search Console data...")
             search_console_data = await workflow.execute_activity(
                 fetch_search_console_data,
+                task_queue=task_queue_for(fetch_search_console_data),
                 args=[days],
                 start_to_close_timeout=timedelta(minutes=5),
                 retry_policy=RetryPolicy(
@@ -131,6 +133,7 @@ class SEOLandingOptimizerWorkflow:
             workflow.logger.info("📑 Step 2: Checking existing pages...")
             existing_pages = await workflow.execute_activity(
                 get_existing_pages,
+                task_queue=task_queue_for(get_existing_pages),
                 start_to_close_timeout=timedelta(minutes=1),
                 retry_policy=RetryPolicy(maximum_attempts=2),
             )
@@ -142,6 +145,7 @@ class SEOLandingOptimizerWorkflow:
             workflow.logger.info("🤖 Step 3: Running SEO optimizer graph...")
             optimizer_result = await workflow.execute_activity(
                 run_seo_optimizer_graph,
+                task_queue=task_queue_for(run_seo_optimizer_graph),
                 args=[mode, workflow.now().strftime("%Y-%m-%d"), search_console_data, target_keyword],
                 start_to_close_timeout=timedelta(minutes=10),
                 retry_policy=RetryPolicy(
@@ -171,6 +175,7 @@ class SEOLandingOptimizerWorkflow:
                 workflow.logger.info("💾 Step 4: Saving page config...")
                 save_result = await workflow.execute_activity(
                     save_page_config,
+                    task_queue=task_queue_for(save_page_config),
                     args=[generated_config],
                     start_to_close_timeout=timedelta(minutes=1),
                     retry_policy=RetryPolicy(maximum_attempts=2),
@@ -186,6 +191,7 @@ class SEOLandingOptimizerWorkflow:
                     workflow.logger.info("📤 Step 5: Pushing to Git...")
                     git_result = await workflow.execute_activity(
                         push_landing_page_to_git,
+                        task_queue=task_queue_for(push_landing_page_to_git),
                         args=[save_result.get("file_path"), generated_config.get("slug")],
                         start_to_close_timeout=timedelta(minutes=2),
                         retry_policy=RetryPolicy(maximum_attempts=2),
@@ -208,6 +214,7 @@ class SEOLandingOptimizerWorkflow:
                     workflow.logger.info("🚢 Step 6: Triggering Coolify deployment...")
                     deployment_result = await workflow.execute_activity(
                         trigger_coolify_deployment,
+                        task_queue=task_queue_for(trigger_coolify_deployment),
                         args=[False],  # skip=False
                         start_to_close_timeout=timedelta(minutes=2),
                         retry_policy=RetryPolicy(maximum_attempts=3),
@@ -224,6 +231,7 @@ class SEOLandingOptimizerWorkflow:
 
                         status_result = await workflow.execute_activity(
                             check_deployment_status,
+                            task_queue=task_queue_for(check_deployment_status),
                             args=[deployment_result.get("uuid")],
                             start_to_close_timeout=timedelta(minutes=1),
                         )
@@ -250,6 +258,7 @@ class SEOLandingOptimizerWorkflow:
                 workflow.logger.info("📝 Step 6: Saving SEO report...")
                 report_result = await workflow.execute_activity(
                     save_seo_report,
+                    task_queue=task_queue_for(save_seo_report),
                     args=[report_content, workflow.now().strftime("%Y-%m-%d"), {
                         "keyword": result.get("selected_keyword"),
                         "config_saved": result.get("config_saved"),
@@ -322,6 +331,7 @@ class SEOWeeklyReportWorkflow:
             # Fetch 7 days of Search Console data
             search_console_data = await workflow.execute_activity(
                 fetch_search_console_data,
+                task_queue=task_queue_for(fetch_search_console_data),
                 args=[7],
                 start_to_close_timeout=timedelta(minutes=5),
                 retry_policy=RetryPolicy(maximum_attempts=3),
@@ -330,6 +340,7 @@ class SEOWeeklyReportWorkflow:
             # Run optimizer in report mode
             optimizer_result = await workflow.execute_activity(
                 run_seo_optimizer_graph,
+                task_queue=task_queue_for(run_seo_optimizer_graph),
                 args=["report", workflow.now().strftime("%Y-%m-%d"), search_console_data],
                 start_to_close_timeout=timedelta(minutes=10),
             )
@@ -339,6 +350,7 @@ class SEOWeeklyReportWorkflow:
             if report_content:
                 await workflow.execute_activity(
                     save_seo_report,
+                    task_queue=task_queue_for(save_seo_report),
                     args=[report_content, workflow.now().strftime("%Y-%m-%d"), {
                         "report_type": "weekly"
                     }],
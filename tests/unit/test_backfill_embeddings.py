@@ -0,0 +1,193 @@
+"""
+Unit tests for the embedding backfill script.
+
+Tests:
+- Checkpoint only advances over a contiguous prefix of completed pages
+- Points carry MemoryManager's change-detection hashes
+- Resume from checkpoint
+- A failing worker leaves the checkpoint at the last contiguous page
+"""
+
+import pytest
+import json
+import importlib.util
+from unittest.mock import AsyncMock, Mock
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from memory.memory_manager import _fingerprint
+
+_SCRIPT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "scripts", "backfill_embeddings.py"
+)
+_spec = importlib.util.spec_from_file_location("backfill_embeddings", _SCRIPT)
+backfill = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(backfill)
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def fetch(self, size):
+        page, self.rows = self.rows[:size], self.rows[size:]
+        return page
+
+
+class FakeTransaction:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeConnection:
+    """Stands in for an asyncpg connection over an id-ordered table."""
+
+    def __init__(self, ids):
+        self.ids = ids
+
+    def _after(self, last_id):
+        return [{"id": i} for i in self.ids if last_id is None or i > last_id]
+
+    async def fetchval(self, query, last_id):
+        return len(self._after(last_id))
+
+    def transaction(self, readonly=False):
+        return FakeTransaction()
+
+    async def cursor(self, query, last_id):
+        return FakeCursor(self._after(last_id))
+
+    async def close(self):
+        pass
+
+
+def _make_manager(fail_on_id=None):
+    """Fake MemoryManager recording upserted point ids."""
+    upserted = []
+
+    async def upsert_points(collection, points):
+        ids = [point["id"] for point in points]
+        if fail_on_id in ids:
+            raise RuntimeError("qdrant unavailable")
+        upserted.extend(ids)
+        return len(points)
+
+    manager = Mock()
+    manager.initialize = AsyncMock()
+    manager.close = AsyncMock()
+    manager.invalidate_collection = AsyncMock()
+    manager.get_collection_stats = AsyncMock(return_value={"points_count": 0})
+    manager.embedding_generator.request_embeddings = AsyncMock(
+        side_effect=lambda texts: [[0.1] for _ in texts]
+    )
+    manager.qdrant_client.upsert_points = AsyncMock(side_effect=upsert_points)
+    return manager, upserted
+
+
+@pytest.fixture
+def source(monkeypatch):
+    conn = FakeConnection(list(range(1, 11)))
+    monkeypatch.setitem(backfill.SOURCES, "test_rows", {
+        "connect": AsyncMock(return_value=conn),
+        "columns": "id",
+        "table": "test_rows",
+        "condition": "TRUE",
+        "to_item": lambda row: {"id": row["id"], "content": f"row {row['id']}", "metadata": {"n": row["id"]}},
+    })
+    monkeypatch.setattr(backfill, "report_progress", lambda progress: None)
+    return conn
+
+
+async def _run(monkeypatch, checkpoint_file, manager, concurrency=2):
+    monkeypatch.setattr(backfill, "MemoryManager", lambda: manager)
+    return await backfill.backfill_collection(
+        "test_rows",
+        page_size=2,
+        concurrency=concurrency,
+        checkpoint_file=str(checkpoint_file),
+        assume_yes=True
+    )
+
+
+class TestCheckpointTracker:
+    """Test contiguous-prefix checkpointing."""
+
+    def test_out_of_order_pages(self, tmp_path):
+        """Test a later page finishing first doesn't move the checkpoint past an open page."""
+        path = str(tmp_path / "checkpoints.json")
+        tracker = backfill.CheckpointTracker(path, "invoices", start_processed=10)
+
+        tracker.complete(1, last_id=40, count=2)
+        tracker.complete(2, last_id=60, count=2)
+        assert backfill.load_checkpoints(path) == {}
+
+        tracker.complete(0, last_id=20, count=2)
+        checkpoint = backfill.load_checkpoints(path)["invoices"]
+        assert checkpoint["last_id"] == 60
+        assert checkpoint["processed"] == 16
+
+    def test_gap_holds_checkpoint(self, tmp_path):
+        """Test the checkpoint stops at the first unfinished page."""
+        path = str(tmp_path / "checkpoints.json")
+        tracker = backfill.CheckpointTracker(path, "invoices")
+
+        tracker.complete(0, last_id=20, count=2)
+        tracker.complete(2, last_id=60, count=2)
+
+        assert backfill.load_checkpoints(path)["invoices"]["last_id"] == 20
+        assert tracker.processed == 2
+
+
+class TestBuildPoints:
+    """Test point payloads match MemoryManager saves."""
+
+    def test_payload_has_change_hashes(self):
+        """Test backfilled points are recognized as unchanged by the next save."""
+        item = {"id": 7, "content": "Invoice from SNCB", "metadata": {"matched": False}}
+
+        point = backfill.build_points([item], [[0.1]])[0]
+
+        assert point["payload"]["_content_hash"] == _fingerprint(item["content"])
+        assert point["payload"]["_metadata_hash"] == _fingerprint(item["metadata"])
+
+
+class TestBackfillPipeline:
+    """Test the producer/worker pipeline against fake backends."""
+
+    @pytest.mark.asyncio
+    async def test_full_run_and_resume(self, source, monkeypatch, tmp_path):
+        """Test a run checkpoints the last id and a rerun resumes after it."""
+        checkpoint_file = tmp_path / "checkpoints.json"
+        manager, upserted = _make_manager()
+
+        assert await _run(monkeypatch, checkpoint_file, manager) == 10
+        assert sorted(upserted) == list(range(1, 11))
+        assert json.loads(checkpoint_file.read_text())["test_rows"]["last_id"] == 10
+
+        source.ids = list(range(1, 14))
+        manager, upserted = _make_manager()
+
+        assert await _run(monkeypatch, checkpoint_file, manager) == 3
+        assert sorted(upserted) == [11, 12, 13]
+        assert json.loads(checkpoint_file.read_text())["test_rows"]["processed"] == 13
+
+    @pytest.mark.asyncio
+    async def test_worker_failure_keeps_contiguous_checkpoint(self, source, monkeypatch, tmp_path):
+        """Test a failed page stops the checkpoint before it and the rerun redoes it."""
+        checkpoint_file = tmp_path / "checkpoints.json"
+        manager, upserted = _make_manager(fail_on_id=5)
+
+        await _run(monkeypatch, checkpoint_file, manager, concurrency=1)
+
+        checkpoint = json.loads(checkpoint_file.read_text())["test_rows"]
+        assert checkpoint["last_id"] == 4
+        assert checkpoint["processed"] == 4
+
+        manager, upserted = _make_manager()
+        assert await _run(monkeypatch, checkpoint_file, manager) == 6
+        assert sorted(upserted) == list(range(5, 11))
@@ -0,0 +1,208 @@
+"""
+Unit tests for blocking I/O helpers used by social media activities.
+
+Tests:
+- run_blocking keeps the event loop responsive
+- pg_connection commits, rolls back and drops broken connections
+- pg_connection waits for a free connection instead of exhausting the pool
+- get_random_unused_photo runs S3/DB work off the loop with a shared client
+"""
+
+import pytest
+import asyncio
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from temporalio.testing import ActivityEnvironment
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from temporal_app.activities import blocking_io
+from temporal_app.activities import social_media
+from temporal_app.activities.photo_catalog import PhotoCatalog
+
+
+class FakeConnection:
+    def __init__(self, fail_rollback=False):
+        self.closed = 0
+        self.commits = 0
+        self.rollbacks = 0
+        self.fail_rollback = fail_rollback
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        if self.fail_rollback:
+            raise RuntimeError("connection lost")
+        self.rollbacks += 1
+
+
+class FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+        self.returned = []
+
+    def getconn(self):
+        return self.conn
+
+    def putconn(self, conn, close=False):
+        self.returned.append(close)
+
+
+class LimitedPool:
+    """Raises like ThreadedConnectionPool when more than maxconn are borrowed."""
+
+    def __init__(self, maxconn):
+        self.maxconn = maxconn
+        self.borrowed = 0
+        self.peak = 0
+        self.lock = blocking_io.threading.Lock()
+
+    def getconn(self):
+        with self.lock:
+            if self.borrowed >= self.maxconn:
+                raise RuntimeError("connection pool exhausted")
+            self.borrowed += 1
+            self.peak = max(self.peak, self.borrowed)
+        return FakeConnection()
+
+    def putconn(self, conn, close=False):
+        with self.lock:
+            self.borrowed -= 1
+
+
+class FakeS3:
+    def __init__(self):
+        self.threads = set()
+
+    def list_objects_v2(self, **kwargs):
+        self.threads.add(blocking_io.threading.current_thread().name)
+        time.sleep(0.05)
+        return {"Contents": [{"Key": "products/a.jpg"}, {"Key": "products/b.png"}, {"Key": "products/notes.txt"}]}
+
+
+class TestRunBlocking:
+    """Test the I/O thread pool."""
+
+    @pytest.mark.asyncio
+    async def test_event_loop_not_blocked(self):
+        """Test other coroutines keep running while a blocking call is in flight."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        result = await blocking_io.run_blocking(time.sleep, 0.2)
+        task.cancel()
+
+        assert result is None
+        assert ticks >= 5
+
+
+class TestPgConnection:
+    """Test pooled connection handling."""
+
+    def test_commit_and_return(self, monkeypatch):
+        """Test a clean block commits and returns the connection."""
+        pool = FakePool(FakeConnection())
+        monkeypatch.setattr(blocking_io, "_get_pg_pool", lambda: pool)
+
+        with blocking_io.pg_connection() as conn:
+            pass
+
+        assert conn.commits == 1
+        assert pool.returned == [False]
+
+    def test_rollback_on_error(self, monkeypatch):
+        """Test errors roll back; connections that can't roll back are closed."""
+        pool = FakePool(FakeConnection())
+        monkeypatch.setattr(blocking_io, "_get_pg_pool", lambda: pool)
+
+        with pytest.raises(ValueError):
+            with blocking_io.pg_connection():
+                raise ValueError("bad query")
+
+        pool.conn = FakeConnection(fail_rollback=True)
+        with pytest.raises(ValueError):
+            with blocking_io.pg_connection():
+                raise ValueError("bad query")
+
+        assert pool.returned == [False, True]
+
+    @pytest.mark.asyncio
+    async def test_waits_when_pool_is_exhausted(self, monkeypatch):
+        """Test more I/O threads than connections queue for one instead of failing."""
+        pool = LimitedPool(maxconn=2)
+        monkeypatch.setenv("ACTIVITY_PG_POOL_SIZE", "2")
+        monkeypatch.setattr(blocking_io, "_pg_slots", None)
+        monkeypatch.setattr(blocking_io, "_get_pg_pool", lambda: pool)
+
+        def query():
+            with blocking_io.pg_connection():
+                time.sleep(0.05)
+
+        await asyncio.gather(*(blocking_io.run_blocking(query) for _ in range(6)))
+
+        assert pool.peak == 2
+        assert pool.borrowed == 0
+
+
+class TestGetRandomUnusedPhoto:
+    """Test the activity uses the I/O pool."""
+
+    @pytest.mark.asyncio
+    async def test_lists_off_loop_and_skips_used(self, monkeypatch, tmp_path):
+        """Test S3 listing runs on an I/O thread and used photos are filtered."""
+        s3 = FakeS3()
+        catalog = PhotoCatalog(path=str(tmp_path / "catalog.sqlite3"))
+
+        @contextmanager
+        def fake_pg_connection():
+            class Cursor:
+                def execute(self, *args):
+                    pass
+
+                def fetchall(self):
+                    return [("pomandi", "products/a.jpg", datetime.utcnow())]
+
+                def close(self):
+                    pass
+
+            class Conn:
+                def cursor(self):
+                    return Cursor()
+
+            yield Conn()
+
+        monkeypatch.setattr(social_media, "get_s3_client", lambda: s3)
+        monkeypatch.setattr(social_media, "pg_connection", fake_pg_connection)
+        monkeypatch.setattr(social_media, "get_photo_catalog", lambda: catalog)
+
+        result = await ActivityEnvironment().run(social_media.get_random_unused_photo, "pomandi")
+
+        assert result["key"] == "products/b.png"
+        assert all(name.startswith("activity-io") for name in s3.threads)
+
+    @pytest.mark.asyncio
+    async def test_db_failure_falls_back(self, monkeypatch, tmp_path):
+        """Test a failed used-photo lookup still returns a photo."""
+        @contextmanager
+        def broken_pg_connection():
+            raise RuntimeError("db down")
+            yield
+
+        monkeypatch.setattr(social_media, "get_s3_client", lambda: FakeS3())
+        monkeypatch.setattr(social_media, "pg_connection", broken_pg_connection)
+        monkeypatch.setattr(social_media, "get_photo_catalog", lambda: PhotoCatalog(path=str(tmp_path / "catalog.sqlite3")))
+
+        result = await ActivityEnvironment().run(social_media.get_random_unused_photo, "pomandi")
+
+        assert result["key"] in {"products/a.jpg", "products/b.png"}
@@ -0,0 +1,245 @@
+"""
+Unit tests for DailyAnalyticsGraph parallel source collection.
+
+Tests:
+- Fetches run concurrently and each analysis follows its own fetch
+- Telegram messages keep 1..8 order
+- Per-source fetch timeout
+- Per-source activity methods (fetch_source / analyze_source / finish_report)
+- A retried merge activity doesn't re-post source messages
+"""
+
+import pytest
+import asyncio
+import dataclasses
+import time
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+from temporalio.testing import ActivityEnvironment
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from langgraph_agents.daily_analytics_graph import DailyAnalyticsGraph, SourceMessageBuffer
+from langgraph_agents.state_schemas import init_daily_analytics_state
+from temporal_app.activities import langgraph_activities
+from temporal_app.workflows.daily_analytics import (
+    DAILY_ANALYTICS_SOURCES,
+    ANALYSIS_LLM_TIMEOUT_SECONDS,
+    ANALYSIS_LLM_MAX_RETRIES,
+    ANALYSIS_ACTIVITY_TIMEOUT,
+)
+
+
+@pytest.fixture
+def graph():
+    graph = DailyAnalyticsGraph(enable_memory=False, parallel_sources=True)
+    graph._post_source_telegram = AsyncMock(return_value=True)
+    return graph
+
+
+def _held_sources(graph):
+    """Per-source results as the workflow passes them to the merge, in reverse order."""
+    sources = {}
+    for index, name in reversed(list(enumerate(graph.source_names(), start=1))):
+        sources[name] = {
+            "data": {"source": name, "error": "HTTP 401" if name == "shopify" else None},
+            "report": f"report {index}",
+            "message": [name, "", f"report {index}", index],
+            "steps_completed": [f"fetch_{name}"],
+            "errors": [],
+        }
+    return sources
+
+
+def _fake_pipelines(graph, delays):
+    """Replace fetch/analyze nodes with sleeps; the analysis sends its source message."""
+    pipelines = graph._source_pipelines()
+
+    for index, (pipeline, delay) in enumerate(zip(pipelines, delays), start=1):
+        async def fetch(state, pipeline=pipeline, delay=delay):
+            await asyncio.sleep(delay)
+            state[pipeline["data_key"]] = {"source": pipeline["name"], "error": None}
+            return state
+
+        async def analyze(state, pipeline=pipeline, index=index):
+            state["source_reports"][pipeline["name"]] = f"report {index}"
+            await graph._send_source_telegram(pipeline["name"], "", f"report {index}", index)
+            return state
+
+        pipeline["fetch"] = fetch
+        pipeline["analyze"] = analyze
+
+    graph._source_pipelines = lambda: pipelines
+    return pipelines
+
+
+class TestParallelSources:
+    """Test parallel fetch/analyze fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_sources_run_concurrently_in_order(self, graph):
+        """Test wall time tracks the slowest source and messages stay ordered."""
+        _fake_pipelines(graph, [0.2, 0.05, 0.1, 0.01, 0.15, 0.02, 0.03, 0.04])
+        state = init_daily_analytics_state(7, "pomandi")
+
+        started = time.monotonic()
+        state = await graph.collect_sources_parallel_node(state)
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 0.5
+        assert len(state["source_reports"]) == 8
+        sent_order = [call.args[3] for call in graph._post_source_telegram.await_args_list]
+        assert sent_order == list(range(1, 9))
+
+    @pytest.mark.asyncio
+    async def test_fetch_timeout_does_not_block_others(self, graph):
+        """Test a hung source times out and the rest are still reported."""
+        graph.source_timeout = 0.1
+        _fake_pipelines(graph, [5, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01])
+        state = init_daily_analytics_state(7, "pomandi")
+
+        state = await graph.collect_sources_parallel_node(state)
+
+        assert "timed out" in state["google_ads_data"]["error"]
+        assert any("timed out" in e for e in state["errors"])
+        assert graph._post_source_telegram.await_count == 8
+
+    @pytest.mark.asyncio
+    async def test_buffer_skips_missing_sources(self):
+        """Test a skipped slot releases the messages behind it."""
+        send = AsyncMock(return_value=True)
+        buffer = SourceMessageBuffer(send)
+
+        await buffer.submit(2, ("b",))
+        assert send.await_count == 0
+
+        await buffer.submit(1, None)
+        assert [call.args for call in send.await_args_list] == [("b",)]
+
+
+class TestPerSourceActivities:
+    """Test the graph methods behind the per-source Temporal activities."""
+
+    def test_workflow_sources_match_graph(self, graph):
+        """Test the workflow schedules exactly the graph's sources, in order."""
+        assert DAILY_ANALYTICS_SOURCES == graph.source_names()
+
+    @pytest.mark.asyncio
+    async def test_fetch_source_timeout(self, graph):
+        """Test a hung fetch comes back as error data."""
+        graph.source_timeout = 0.05
+        _fake_pipelines(graph, [5] + [0.01] * 7)
+
+        result = await graph.fetch_source("google_ads", days=7, brand="pomandi")
+
+        assert "timed out" in result["data"]["error"]
+        assert result["errors"]
+
+    @pytest.mark.asyncio
+    async def test_analyze_source_returns_message_unsent(self, graph):
+        """Test the analysis message is captured for the merge step, not posted."""
+        _fake_pipelines(graph, [0.01] * 8)
+
+        result = await graph.analyze_source("ga4", {"source": "ga4", "error": None})
+
+        assert result["report"] == "report 4"
+        assert result["message"] == ["ga4", "", "report 4", 4]
+        assert graph._post_source_telegram.await_count == 0
+
+    @pytest.mark.asyncio
+    async def test_analyze_source_llm_budget(self, graph, monkeypatch):
+        """Test the activity's LLM timeout/retry budget reaches the executor."""
+        executor = AsyncMock()
+        executor.run = AsyncMock(return_value="analysis")
+        monkeypatch.setattr("langgraph_agents.daily_analytics_graph.get_llm_executor", lambda: executor)
+        monkeypatch.setattr("langgraph_agents.daily_analytics_graph.CLAUDE_SDK_AVAILABLE", True)
+
+        await graph.analyze_source("ga4", {"source": "ga4", "error": None}, llm_timeout=120, llm_max_retries=1)
+
+        assert executor.run.await_args.kwargs["timeout"] == 120
+        assert executor.run.await_args.kwargs["max_retries"] == 1
+
+    def test_analysis_activity_timeout_covers_llm_retries(self):
+        """Test every executor attempt fits inside the analysis activity timeout."""
+        llm_seconds = ANALYSIS_LLM_TIMEOUT_SECONDS * (ANALYSIS_LLM_MAX_RETRIES + 1)
+
+        assert ANALYSIS_ACTIVITY_TIMEOUT.total_seconds() > llm_seconds
+
+    @pytest.mark.asyncio
+    async def test_analyze_source_unknown(self, graph):
+        """Test unknown source names are rejected."""
+        with pytest.raises(ValueError):
+            await graph.analyze_source("tiktok", {})
+
+    @pytest.mark.asyncio
+    async def test_finish_report_posts_in_order_and_merges(self, graph):
+        """Test held messages are posted 1..8 and errors reach the aggregator."""
+        graph.merge_reports_node = AsyncMock(side_effect=lambda state: state)
+        graph.save_data_node = AsyncMock(side_effect=lambda state: {**state, "data_saved": True})
+        graph.send_telegram_node = AsyncMock(side_effect=lambda state: {**state, "telegram_sent": True})
+
+        result = await graph.finish_report(_held_sources(graph), days=7, brand="pomandi")
+
+        sent_order = [call.args[3] for call in graph._post_source_telegram.await_args_list]
+        assert sent_order == list(range(1, 9))
+        merged_state = graph.merge_reports_node.await_args.args[0]
+        assert len(merged_state["source_reports"]) == 8
+        assert merged_state["shopify_data"]["error"] == "HTTP 401"
+        assert graph.error_aggregator.get_summary()["failed"] == 1
+        assert result["success"] is True
+        assert result["telegram_sent"] is True
+
+    @pytest.mark.asyncio
+    async def test_merge_retry_skips_posted_messages(self, graph, monkeypatch):
+        """Test retried merge attempts post each source once, all before the summary."""
+        events = []
+        failures = {"post": 4, "merge": 1}
+
+        async def post(name, icon, report, index):
+            if index == failures.get("post"):
+                del failures["post"]
+                raise RuntimeError("worker lost")
+            events.append(index)
+            return True
+
+        async def merge(state):
+            if failures.pop("merge", None):
+                raise RuntimeError("LLM unavailable")
+            return state
+
+        async def send_summary(state):
+            events.append("summary")
+            return {**state, "telegram_sent": True}
+
+        graph._post_source_telegram = AsyncMock(side_effect=post)
+        graph.merge_reports_node = AsyncMock(side_effect=merge)
+        graph.save_data_node = AsyncMock(side_effect=lambda state: state)
+        graph.send_telegram_node = AsyncMock(side_effect=send_summary)
+
+        class FakePool:
+            @asynccontextmanager
+            async def checkout(self, graph_class):
+                yield graph
+
+        monkeypatch.setattr("langgraph_agents.graph_pool.get_graph_pool", lambda: FakePool())
+
+        heartbeats = []
+        env = ActivityEnvironment()
+        env.on_heartbeat = lambda *details: heartbeats.append(details)
+        sources = _held_sources(graph)
+
+        for attempt in (1, 2, 3):
+            env.info = dataclasses.replace(
+                env.info, attempt=attempt, heartbeat_details=heartbeats[-1] if heartbeats else []
+            )
+            if attempt < 3:
+                with pytest.raises(RuntimeError):
+                    await env.run(langgraph_activities.merge_daily_analytics, sources, 7, "pomandi")
+            else:
+                result = await env.run(langgraph_activities.merge_daily_analytics, sources, 7, "pomandi")
+
+        assert events == list(range(1, 9)) + ["summary"]
+        assert result["telegram_sent"] is True
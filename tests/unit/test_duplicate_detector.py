@@ -0,0 +1,202 @@
+"""
+Unit tests for DuplicateDetector batch checks.
+
+Tests:
+- One round trip per layer for a batch
+- Batch results match per-item checks
+- Fallbacks without search_many / Redis
+"""
+
+import pytest
+import asyncio
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from langgraph_agents.duplicate_detector import DuplicateDetector
+
+SOURCES = ["google_ads", "meta_ads", "visitor_tracking", "ga4", "search_console", "merchant_center", "shopify", "appointments"]
+
+
+class FakeRedis:
+    """In-memory Redis with round-trip counting."""
+
+    def __init__(self):
+        self.store = {}
+        self.round_trips = 0
+
+    async def get(self, key):
+        self.round_trips += 1
+        return self.store.get(key)
+
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.store.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None):
+        self.round_trips += 1
+        self.store[key] = value.encode()
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def set(self, key, value, ex=None):
+        self.commands.append((key, value))
+        return self
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        for key, value in self.commands:
+            self.redis.store[key] = value.encode()
+
+
+class FakeMemoryHub:
+    """Memory-Hub search returning a card for the given sources."""
+
+    def __init__(self, existing_sources):
+        self.existing_sources = existing_sources
+        self.calls = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def search(self, query):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if query["data_source"] in self.existing_sources:
+            return [{"id": f"card-{query['data_source']}", "type": "analytics_data"}]
+        return []
+
+
+class FakeQdrant:
+    """Text search matching on source name."""
+
+    def __init__(self, similar_sources):
+        self.similar_sources = similar_sources
+        self.search_calls = 0
+        self.search_many_calls = 0
+
+    def _results(self, query):
+        source = query.split(" ")[0]
+        if source in self.similar_sources:
+            return [{"id": f"vec-{source}", "score": 0.99, "payload": {"source": source}}]
+        return []
+
+    async def search(self, collection, query, top_k, score_threshold):
+        self.search_calls += 1
+        return self._results(query)
+
+
+class FakeBatchQdrant(FakeQdrant):
+    """FakeQdrant with a batched search endpoint."""
+
+    async def search_many(self, collection, queries, top_k, score_threshold):
+        self.search_many_calls += 1
+        return [self._results(query) for query in queries]
+
+
+def _batch(spend=100.0):
+    return [
+        {"source": source, "date": "2026-03-01", "brand": "pomandi", "total_spend": spend + i}
+        for i, source in enumerate(SOURCES)
+    ]
+
+
+def _detector(**clients):
+    return DuplicateDetector(
+        memory_hub_client=clients.get("memory_hub"),
+        qdrant_client=clients.get("qdrant"),
+        redis_client=clients.get("redis"),
+        config={"max_concurrency": 4}
+    )
+
+
+class TestBatchCheckDuplicates:
+    """Test the batched duplicate check path."""
+
+    @pytest.mark.asyncio
+    async def test_one_round_trip_per_layer(self):
+        """Test eight sources cost one MGET, one Qdrant query and one cache write."""
+        redis = FakeRedis()
+        memory_hub = FakeMemoryHub({"shopify"})
+        qdrant = FakeBatchQdrant({"ga4"})
+        detector = _detector(redis=redis, memory_hub=memory_hub, qdrant=qdrant)
+
+        results = await detector.batch_check_duplicates(_batch())
+
+        assert redis.round_trips == 2  # MGET + pipelined SETs
+        assert qdrant.search_many_calls == 1 and qdrant.search_calls == 0
+        assert memory_hub.calls == 8
+        assert 1 < memory_hub.peak_in_flight <= 4
+        assert results["shopify"]["duplicate_type"] == "memory_hub"
+        assert results["ga4"]["duplicate_type"] == "semantic"
+        assert not results["google_ads"]["is_duplicate"]
+
+        # Second run: every cached source is an exact duplicate after one MGET
+        redis.round_trips = 0
+        results = await detector.batch_check_duplicates(_batch())
+
+        assert redis.round_trips == 1
+        exact = {s for s, r in results.items() if r["duplicate_type"] == "exact"}
+        assert exact == set(SOURCES) - {"shopify", "ga4"}
+
+    @pytest.mark.asyncio
+    async def test_matches_sequential_checks(self):
+        """Test batch results equal per-item check_duplicate results."""
+        def make():
+            return _detector(redis=FakeRedis(), memory_hub=FakeMemoryHub({"meta_ads"}), qdrant=FakeBatchQdrant({"shopify"}))
+
+        batch_detector, single_detector = make(), make()
+        await batch_detector.batch_check_duplicates(_batch()[:3])
+        for data in _batch()[:3]:
+            await single_detector.check_duplicate(data)
+
+        batch_results = await batch_detector.batch_check_duplicates(_batch())
+        single_results = {data["source"]: await single_detector.check_duplicate(data) for data in _batch()}
+
+        assert batch_results == single_results
+
+    @pytest.mark.asyncio
+    async def test_repeated_items_match_sequential_checks(self):
+        """Test a repeat of a flagged item is re-checked, a repeat of a clean one is exact."""
+        def make():
+            return _detector(redis=FakeRedis(), qdrant=FakeBatchQdrant({"ga4"}))
+
+        batch = [_batch()[3], _batch()[3], _batch()[0], _batch()[0]]
+        batch_detector, single_detector = make(), make()
+
+        batch_results = await batch_detector.batch_check_duplicates(batch)
+        single_results = {data["source"]: await single_detector.check_duplicate(data) for data in batch}
+
+        assert batch_results == single_results
+        assert batch_results["ga4"]["duplicate_type"] == "semantic"
+        assert batch_results["google_ads"]["duplicate_type"] == "exact"
+
+    @pytest.mark.asyncio
+    async def test_fallbacks_without_batch_endpoints(self):
+        """Test clients without search_many/Redis still work concurrently."""
+        qdrant = FakeQdrant({"appointments"})
+        detector = _detector(qdrant=qdrant)
+
+        results = await detector.batch_check_duplicates(_batch())
+
+        assert qdrant.search_calls == 8
+        assert results["appointments"]["duplicate_type"] == "semantic"
+
+        results = await detector.batch_check_duplicates(_batch())
+        assert results["google_ads"]["duplicate_type"] == "exact"  # Local hash cache
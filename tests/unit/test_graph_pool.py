@@ -0,0 +1,173 @@
+"""
+Unit tests for the graph instance pool.
+
+Tests:
+- Instances are initialized once and reused across checkouts
+- One shared MemoryManager, closed on pool close
+- Concurrent checkouts get distinct instances, bounded per graph
+- Failed runs discard their instance
+- Reused validators don't flag the previous run's data as duplicate
+"""
+
+import pytest
+import asyncio
+from typing import TypedDict
+
+from langgraph.graph import StateGraph, END
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from langgraph_agents.base_graph import BaseAgentGraph
+from langgraph_agents.graph_pool import GraphPool
+from langgraph_agents.validator_graph import DataValidatorGraph
+
+
+class FakeMemoryManager:
+    def __init__(self):
+        self.initialized = 0
+        self.closed = 0
+
+    async def initialize(self):
+        self.initialized += 1
+
+    async def close(self):
+        self.closed += 1
+
+
+class CounterState(TypedDict):
+    value: int
+
+
+class CounterGraph(BaseAgentGraph):
+    """Minimal graph that counts builds and per-run resets."""
+
+    builds = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.runs_since_reset = 0
+
+    def reset(self):
+        self.runs_since_reset = 0
+
+    def build_graph(self) -> StateGraph:
+        CounterGraph.builds += 1
+        workflow = StateGraph(CounterState)
+        workflow.add_node("increment", self.increment)
+        workflow.set_entry_point("increment")
+        workflow.add_edge("increment", END)
+        return workflow
+
+    async def increment(self, state: CounterState) -> CounterState:
+        await asyncio.sleep(0.01)
+        self.runs_since_reset += 1
+        return {"value": state["value"] + 1}
+
+
+@pytest.fixture(autouse=True)
+def reset_builds():
+    CounterGraph.builds = 0
+
+
+class TestGraphPool:
+    """Test checkout, reuse and lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_instances_reused(self):
+        """Test sequential checkouts reuse one initialized instance."""
+        memory_manager = FakeMemoryManager()
+        pool = GraphPool(memory_manager=memory_manager)
+
+        for _ in range(3):
+            async with pool.checkout(CounterGraph) as graph:
+                result = await graph.run(value=1)
+                assert graph.runs_since_reset == 1  # reset() on every checkout
+
+        assert result["value"] == 2
+        assert CounterGraph.builds == 1
+        assert graph.memory_manager is memory_manager
+        assert pool.get_stats()["instances_reused"] == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_memory_manager_lifecycle(self, monkeypatch):
+        """Test the pool creates one MemoryManager on start and closes it on close."""
+        created = []
+
+        def factory():
+            created.append(FakeMemoryManager())
+            return created[-1]
+
+        monkeypatch.setattr("langgraph_agents.graph_pool.MemoryManager", factory)
+        pool = GraphPool()
+
+        await asyncio.gather(pool.start([CounterGraph]), pool.start([CounterGraph]))
+        async with pool.checkout(CounterGraph) as graph:
+            await graph.run(value=0)
+
+        assert len(created) == 1 and created[0].initialized == 1
+        assert CounterGraph.builds == 1
+
+        await pool.close()
+        assert created[0].closed == 1
+        with pytest.raises(RuntimeError):
+            async with pool.checkout(CounterGraph):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_concurrent_checkouts_bounded(self):
+        """Test concurrent runs get distinct instances, at most max_per_graph."""
+        pool = GraphPool(max_per_graph=2, memory_manager=FakeMemoryManager())
+        in_use = set()
+        peak = 0
+
+        async def run_once():
+            nonlocal peak
+            async with pool.checkout(CounterGraph) as graph:
+                assert id(graph) not in in_use
+                in_use.add(id(graph))
+                peak = max(peak, len(in_use))
+                await graph.run(value=0)
+                in_use.discard(id(graph))
+
+        await asyncio.gather(*(run_once() for _ in range(6)))
+
+        assert peak == 2
+        assert CounterGraph.builds == 2
+        assert pool.get_stats()["idle"] == {"CounterGraph": 2}
+
+    @pytest.mark.asyncio
+    async def test_failed_run_discarded(self):
+        """Test an instance whose run raised is not returned to the pool."""
+        pool = GraphPool(memory_manager=FakeMemoryManager())
+
+        with pytest.raises(ValueError):
+            async with pool.checkout(CounterGraph):
+                raise ValueError("boom")
+
+        async with pool.checkout(CounterGraph):
+            pass
+
+        stats = pool.get_stats()
+        assert stats["instances_discarded"] == 1
+        assert stats["instances_created"] == 2
+
+    @pytest.mark.asyncio
+    async def test_reused_validator_forgets_previous_run(self):
+        """Test validating the same data twice on a pooled instance finds no duplicates."""
+        pool = GraphPool(memory_manager=FakeMemoryManager())
+
+        for _ in range(2):
+            async with pool.checkout(DataValidatorGraph) as graph:
+                state = await graph.detect_duplicates_node({
+                    "raw_data": {"google_ads": {"total_spend": 120.5, "total_clicks": 300}},
+                    "date": "2026-10-16",
+                    "brand": "pomandi",
+                    "errors": [],
+                })
+
+            assert state["dedup_stats"]["duplicates_found"] == 0
+            assert not state["raw_data"]["google_ads"].get("_skipped")
+
+        assert pool.get_stats()["instances_reused"] == 1
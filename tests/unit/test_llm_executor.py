@@ -0,0 +1,196 @@
+"""
+Unit tests for the shared LLM executor.
+
+Tests:
+- Token-budgeted prompt payloads (top-K by spend)
+- Concurrency cap, timeouts and retries
+- Response cache (keys, disk backend, opt-out)
+"""
+
+import pytest
+import asyncio
+import json
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from langgraph_agents import llm_executor
+from langgraph_agents.llm_executor import LLMExecutor, build_prompt_payload, trim_lists
+from langgraph_agents.llm_cache import LLMResponseCache, DiskResponseStore, make_llm_cache_key
+
+NO_CACHE = LLMResponseCache(store=None)
+
+
+class TestPromptPayload:
+    """Test token-budgeted prompt construction."""
+
+    def test_lists_trimmed_to_top_spend(self):
+        """Test rows are ranked by nested spend metrics before cutting."""
+        data = {
+            "campaigns": [
+                {"name": f"c{i}", "metrics": {"cost_micros": i * 1000}}
+                for i in range(50)
+            ]
+        }
+
+        trimmed, cut = trim_lists(data, top_k=3)
+
+        assert [c["name"] for c in trimmed["campaigns"]] == ["c49", "c48", "c47"]
+        assert cut == {"campaigns": 50}
+        assert len(data["campaigns"]) == 50  # Input untouched
+
+    def test_payload_fits_budget(self):
+        """Test top_k shrinks until the payload fits the token budget."""
+        data = {
+            "source": "google_ads",
+            "top_keywords": [
+                {"keyword": "x" * 100, "cost": i} for i in range(200)
+            ]
+        }
+
+        text = build_prompt_payload(data, max_tokens=500, top_k=20)
+        payload = json.loads(text)
+
+        assert len(text) // 4 <= 500
+        assert payload["source"] == "google_ads"
+        assert payload["top_keywords"][0]["cost"] == 199
+        assert "top_keywords" in payload["_trimmed"]
+
+    def test_small_payload_unchanged(self):
+        """Test small data is serialised as-is."""
+        data = {"total_spend": 12.5, "campaigns": [{"name": "a"}]}
+
+        assert json.loads(build_prompt_payload(data)) == data
+
+
+class TestLLMExecutor:
+    """Test bounded-concurrency execution."""
+
+    @pytest.fixture(autouse=True)
+    def sdk_available(self, monkeypatch):
+        monkeypatch.setattr(llm_executor, "CLAUDE_SDK_AVAILABLE", True)
+        monkeypatch.setattr(llm_executor, "ClaudeAgentOptions", lambda **kwargs: kwargs, raising=False)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_capped(self):
+        """Test no more than max_concurrency queries run at once."""
+        executor = LLMExecutor(max_concurrency=2, timeout=5, max_retries=0, cache=NO_CACHE)
+
+        async def fake_query(prompt, options):
+            await asyncio.sleep(0.02)
+            return f"ok {prompt}"
+
+        executor._query_once = fake_query
+        results = await asyncio.gather(*(executor.run(str(i)) for i in range(8)))
+
+        assert results == [f"ok {i}" for i in range(8)]
+        assert executor.peak_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_timeout_retried(self, monkeypatch):
+        """Test a timed out attempt is retried."""
+        monkeypatch.setattr(llm_executor.asyncio, "sleep", _no_sleep(asyncio.sleep))
+        executor = LLMExecutor(max_concurrency=1, timeout=0.05, max_retries=1, cache=NO_CACHE)
+        attempts = []
+
+        async def fake_query(prompt, options):
+            attempts.append(1)
+            if len(attempts) == 1:
+                await asyncio.Event().wait()  # Hang on first attempt
+            return "ok"
+
+        executor._query_once = fake_query
+
+        assert await executor.run("p") == "ok"
+        assert executor.timeouts == 1
+        assert executor.retries == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_retries(self, monkeypatch):
+        """Test the last error is raised once retries are exhausted."""
+        monkeypatch.setattr(llm_executor.asyncio, "sleep", _no_sleep(asyncio.sleep))
+        executor = LLMExecutor(max_concurrency=1, timeout=5, max_retries=2, cache=NO_CACHE)
+
+        async def fake_query(prompt, options):
+            raise ValueError("rate limited")
+
+        executor._query_once = fake_query
+
+        with pytest.raises(ValueError):
+            await executor.run("p")
+        assert executor.retries == 2
+        assert executor.failures == 1
+
+    @pytest.mark.asyncio
+    async def test_per_call_retry_budget(self, monkeypatch):
+        """Test max_retries passed to run() overrides the executor default."""
+        monkeypatch.setattr(llm_executor.asyncio, "sleep", _no_sleep(asyncio.sleep))
+        executor = LLMExecutor(max_concurrency=1, timeout=0.05, max_retries=2, cache=NO_CACHE)
+        attempts = []
+
+        async def fake_query(prompt, options):
+            attempts.append(1)
+            await asyncio.Event().wait()
+
+        executor._query_once = fake_query
+
+        with pytest.raises(TimeoutError, match="1 attempts"):
+            await executor.run("p", max_retries=0)
+        assert len(attempts) == 1
+        assert executor.retries == 0
+
+
+class TestLLMResponseCache:
+    """Test content-addressed response caching."""
+
+    @pytest.fixture(autouse=True)
+    def sdk_available(self, monkeypatch):
+        monkeypatch.setattr(llm_executor, "CLAUDE_SDK_AVAILABLE", True)
+        monkeypatch.setattr(llm_executor, "ClaudeAgentOptions", lambda **kwargs: kwargs, raising=False)
+
+    def test_key_covers_settings(self):
+        """Test model, system prompt and temperature change the key."""
+        base = make_llm_cache_key("prompt", "model-a", "system", 0.0)
+
+        assert base == make_llm_cache_key("prompt", "model-a", "system", 0.0)
+        assert base != make_llm_cache_key("prompt", "model-b", "system", 0.0)
+        assert base != make_llm_cache_key("prompt", "model-a", "other", 0.0)
+        assert base != make_llm_cache_key("prompt", "model-a", "system", 0.7)
+        assert base != make_llm_cache_key("prompt!", "model-a", "system", 0.0)
+
+    @pytest.mark.asyncio
+    async def test_repeated_prompt_replayed(self, tmp_path):
+        """Test an identical request is served from the disk cache."""
+        cache = LLMResponseCache(store=DiskResponseStore(str(tmp_path)), ttl=60)
+        executor = LLMExecutor(max_concurrency=1, timeout=5, max_retries=0, cache=cache)
+        calls = []
+
+        async def fake_query(prompt, options):
+            calls.append(prompt)
+            return f"analysis {len(calls)}"
+
+        executor._query_once = fake_query
+
+        assert await executor.run("same prompt") == "analysis 1"
+        assert await executor.run("same prompt") == "analysis 1"
+        assert len(calls) == 1
+        assert cache.hits == 1
+
+        # Opt-out always calls the model
+        assert await executor.run("same prompt", use_cache=False) == "analysis 2"
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_missed(self, tmp_path):
+        """Test entries past their TTL are not served."""
+        store = DiskResponseStore(str(tmp_path))
+        await store.set("llm:test:abc", "old", ttl=-1)
+
+        assert await store.get("llm:test:abc") is None
+
+
+def _no_sleep(real_sleep):
+    """Skip backoff delays without touching other sleeps."""
+    async def sleep(delay, *args, **kwargs):
+        await real_sleep(0)
+    return sleep
@@ -0,0 +1,218 @@
+"""
+Unit tests for the MCP session pool.
+
+Tests:
+- Session reuse across calls
+- Idle / max-sessions eviction
+- Background reaping of idle sessions between calls
+- Restart after the server process went away
+- Timed out sessions stay up for calls still using them
+- Sessions being acquired are not LRU-evicted
+"""
+
+import pytest
+import asyncio
+import time
+from pathlib import Path
+from unittest.mock import Mock, AsyncMock
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from langgraph_agents.clients.mcp_session_pool import MCPSessionPool, CONNECTION_CLOSED
+
+
+class _ConnectionClosed(Exception):
+    code = CONNECTION_CLOSED
+
+
+def _fake_entry(name, call_tool):
+    entry = Mock()
+    entry.server_name = name
+    entry.session = Mock()
+    entry.session.call_tool = call_tool
+    entry.alive = True
+    entry.in_use = 0
+    entry.retired = False
+    entry.last_used = time.monotonic()
+    entry.task = None
+    entry.closing = asyncio.Event()
+    return entry
+
+
+@pytest.fixture
+async def pool():
+    pool = MCPSessionPool(max_sessions=2, idle_timeout=600, health_check_interval=600)
+    started = []
+
+    async def fake_start(server_name, server_path):
+        entry = _fake_entry(server_name, AsyncMock(return_value={"server": server_name}))
+        started.append(entry)
+        pool.sessions_started += 1
+        return entry
+
+    pool._start = fake_start
+    pool.started = started
+    yield pool
+    await pool.close()
+
+
+class TestMCPSessionPool:
+    """Test pooled MCP sessions."""
+
+    @pytest.mark.asyncio
+    async def test_session_reused(self, pool):
+        """Test repeated calls to one server share a session."""
+        for _ in range(3):
+            result = await pool.call_tool("google-ads", Path("server.py"), "get_campaigns", {})
+
+        assert result == {"server": "google-ads"}
+        assert len(pool.started) == 1
+        assert pool.get_stats()["sessions_reused"] == 2
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_over_max_sessions(self, pool):
+        """Test least recently used idle server is stopped at the cap."""
+        await pool.call_tool("google-ads", Path("server.py"), "t", {})
+        await pool.call_tool("meta-ads", Path("server.py"), "t", {})
+        await pool.call_tool("shopify", Path("server.py"), "t", {})
+
+        assert set(pool._sessions) == {"meta-ads", "shopify"}
+        assert pool.started[0].closing.is_set()
+        assert pool.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_idempotent_call_retried_after_disconnect(self, pool):
+        """Test read-only calls are resent to a restarted server."""
+        await pool.call_tool("analytics", Path("server.py"), "t", {})
+        pool.started[0].session.call_tool = AsyncMock(side_effect=_ConnectionClosed())
+
+        result = await pool.call_tool("analytics", Path("server.py"), "t", {}, idempotent=True)
+
+        assert result == {"server": "analytics"}
+        assert len(pool.started) == 2
+        assert pool._sessions["analytics"] is pool.started[1]
+
+    @pytest.mark.asyncio
+    async def test_non_idempotent_call_not_retried(self, pool):
+        """Test side-effecting calls fail but the dead session is dropped."""
+        await pool.call_tool("google-ads", Path("server.py"), "t", {})
+        pool.started[0].session.call_tool = AsyncMock(side_effect=_ConnectionClosed())
+
+        with pytest.raises(_ConnectionClosed):
+            await pool.call_tool("google-ads", Path("server.py"), "update_budget", {})
+
+        assert "google-ads" not in pool._sessions
+
+        await pool.call_tool("google-ads", Path("server.py"), "t", {})
+        assert len(pool.started) == 2
+
+    @pytest.mark.asyncio
+    async def test_idle_sessions_reaped_without_new_calls(self, pool):
+        """Test the reaper stops idle servers even when nothing else starts."""
+        pool.idle_timeout = 0.05
+        pool.reap_interval = 0.02
+
+        await pool.call_tool("google-ads", Path("server.py"), "t", {})
+        assert "google-ads" in pool._sessions
+
+        await asyncio.sleep(0.2)
+
+        assert pool._sessions == {}
+        assert pool.started[0].closing.is_set()
+        assert pool._reaper.done()
+
+    @pytest.mark.asyncio
+    async def test_reaper_skips_sessions_in_use(self, pool):
+        """Test a session serving a call is not reaped mid-call."""
+        pool.idle_timeout = 0.01
+        pool.reap_interval = 0.01
+        release = asyncio.Event()
+
+        async def slow_call(*args):
+            await release.wait()
+            return {"server": "meta-ads"}
+
+        async def slow_start(server_name, server_path):
+            entry = _fake_entry(server_name, slow_call)
+            pool.started.append(entry)
+            return entry
+
+        pool._start = slow_start
+        call = asyncio.create_task(pool.call_tool("meta-ads", Path("server.py"), "t", {}))
+        await asyncio.sleep(0.05)
+
+        assert "meta-ads" in pool._sessions
+
+        release.set()
+        assert await call == {"server": "meta-ads"}
+
+    @pytest.mark.asyncio
+    async def test_timeout_keeps_session_for_other_callers(self, pool):
+        """Test one caller's timeout doesn't stop a server another call is using."""
+        release = asyncio.Event()
+
+        async def call_tool(tool_name, arguments):
+            if tool_name == "hang":
+                await asyncio.Event().wait()
+            await release.wait()
+            return {"tool": tool_name}
+
+        await pool.call_tool("google-ads", Path("server.py"), "t", {})
+        entry = pool.started[0]
+        entry.session.call_tool = call_tool
+
+        slow = asyncio.create_task(pool.call_tool("google-ads", Path("server.py"), "slow", {}))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.call_tool("google-ads", Path("server.py"), "hang", {}, timeout=0.05)
+
+        assert "google-ads" not in pool._sessions
+        assert not entry.closing.is_set()
+
+        # New callers get a fresh server while the slow call finishes on the old one
+        await pool.call_tool("google-ads", Path("server.py"), "t", {})
+        assert len(pool.started) == 2
+
+        release.set()
+        assert await slow == {"tool": "slow"}
+        assert entry.closing.is_set()
+
+    @pytest.mark.asyncio
+    async def test_lru_skips_session_being_health_checked(self, pool):
+        """Test a server whose acquire is mid-ping isn't LRU-evicted by another server's start."""
+        pool.max_sessions = 1
+        await pool.call_tool("google-ads", Path("server.py"), "t", {})
+        entry = pool.started[0]
+        pinging = asyncio.Event()
+        pong = asyncio.Event()
+
+        async def send_ping():
+            pinging.set()
+            await pong.wait()
+
+        entry.session.send_ping = send_ping
+        pool.health_check_interval = 0.0
+
+        reuse = asyncio.create_task(pool.call_tool("google-ads", Path("server.py"), "t", {}))
+        await pinging.wait()
+        await pool.call_tool("meta-ads", Path("server.py"), "t", {})
+
+        assert not entry.closing.is_set()
+
+        pong.set()
+        assert await reuse == {"server": "google-ads"}
+        assert pool.restarts == 0
+        assert len(pool.started) == 2
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_reaper(self, pool):
+        """Test close() stops the reaper task."""
+        await pool.call_tool("google-ads", Path("server.py"), "t", {})
+        reaper = pool._reaper
+
+        await pool.close()
+
+        assert reaper.done()
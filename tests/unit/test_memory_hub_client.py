@@ -0,0 +1,143 @@
+"""
+Unit tests for the pooled Memory-Hub client.
+
+Tests:
+- One pooled HTTP client reused across calls
+- Transport decision (streamable HTTP vs SSE) cached after the first call
+- create_cards_batch sends cards concurrently and keeps order
+"""
+
+import pytest
+import asyncio
+import json
+
+import httpx
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from memory.memory_hub_client import MemoryHubClient, TRANSPORT_SSE, TRANSPORT_STREAMABLE_HTTP
+
+
+class FakeMemoryHub:
+    """Memory-Hub server stub for httpx.MockTransport."""
+
+    def __init__(self, streamable_http=True, delay=0.0):
+        self.streamable_http = streamable_http
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append((request.method, request.url.path))
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+
+            if request.url.path == "/mcp":
+                if not self.streamable_http:
+                    return httpx.Response(404)
+                body = json.loads(request.content)
+                title = body["params"]["arguments"].get("title")
+                return httpx.Response(200, json={"jsonrpc": "2.0", "id": body["id"], "result": {"id": title, "action": "created"}})
+
+            if request.url.path == "/sse":
+                return httpx.Response(200, content=b"event: endpoint\ndata: /message?sessionId=abc-123\n\n")
+
+            if request.url.path == "/message":
+                return httpx.Response(202)
+
+            return httpx.Response(404)
+        finally:
+            self.in_flight -= 1
+
+
+def _client(server):
+    return MemoryHubClient("https://memory-hub.test", transport=httpx.MockTransport(server))
+
+
+class TestMemoryHubClient:
+    """Test pooled transport handling."""
+
+    @pytest.mark.asyncio
+    async def test_pooled_client_reused(self):
+        """Test calls share one AsyncClient until closed."""
+        client = _client(FakeMemoryHub())
+
+        await client.create_card(type="note", title="a", content="x")
+        pooled = client._client
+        await client.create_card(type="note", title="b", content="x")
+
+        assert client._client is pooled
+        assert client._transport == TRANSPORT_STREAMABLE_HTTP
+
+        await client.close()
+        assert client._client is None
+
+    def test_client_from_previous_loop_closed(self):
+        """Test a new event loop gets a new client and the old one is closed on its loop."""
+        client = _client(FakeMemoryHub())
+        old_loop = asyncio.new_event_loop()
+        try:
+            old_loop.run_until_complete(client.create_card(type="note", title="a", content="x"))
+            old_client = client._client
+
+            asyncio.run(client.create_card(type="note", title="b", content="x"))
+            assert client._client is not old_client
+
+            old_loop.run_until_complete(asyncio.sleep(0.01))
+            assert old_client.is_closed
+        finally:
+            old_loop.close()
+
+        # Owning loop already closed: the client is dropped
+        stale_client = client._client
+        asyncio.run(client.create_card(type="note", title="c", content="x"))
+        assert client._client is not stale_client
+
+    @pytest.mark.asyncio
+    async def test_sse_decision_cached(self):
+        """Test /mcp is probed once and later calls go straight to SSE."""
+        server = FakeMemoryHub(streamable_http=False)
+        client = _client(server)
+
+        first = await client.create_card(type="note", title="a", content="x")
+        second = await client.create_card(type="note", title="b", content="x")
+
+        assert first["action"] == second["action"] == "accepted"
+        assert client._transport == TRANSPORT_SSE
+        assert [path for _, path in server.requests].count("/mcp") == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_create_cards_batch(self):
+        """Test cards are sent concurrently and results keep card order."""
+        server = FakeMemoryHub(delay=0.02)
+        client = _client(server)
+        cards = [{"type": "note", "title": f"source-{i}", "content": "x"} for i in range(8)]
+
+        results = await client.create_cards_batch(cards, max_concurrency=4)
+
+        assert [r["id"] for r in results] == [f"source-{i}" for i in range(8)]
+        assert len(server.requests) == 8
+        assert 1 < server.peak_in_flight <= 4
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_sse_calls_capped_below_connection_limit(self, monkeypatch):
+        """Test SSE calls (two connections each) can't exhaust the pool."""
+        monkeypatch.setenv("MEMORY_HUB_MAX_CONNECTIONS", "4")
+        monkeypatch.setenv("MEMORY_HUB_MAX_CONCURRENCY", "8")
+        server = FakeMemoryHub(streamable_http=False, delay=0.02)
+        client = _client(server)
+        cards = [{"type": "note", "title": f"source-{i}", "content": "x"} for i in range(6)]
+
+        results = await asyncio.wait_for(client.create_cards_batch(cards, max_concurrency=8), timeout=5)
+
+        assert client.max_concurrency == 2
+        assert all(r["action"] == "accepted" for r in results)
+        assert server.peak_in_flight <= 2
+        await client.close()
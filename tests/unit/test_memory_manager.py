@@ -365,3 +365,679 @@ class TestRedisCache:
         assert stats["misses"] >= 1
 
         await cache.close()
+
+
+class TestEmbeddingCache:
+    """Unit tests for the tiered embedding cache."""
+
+    def test_lru_evicts_over_byte_budget(self):
+        """Test LRU evicts least recently used vectors past the byte budget."""
+        from memory.embedding_cache import LocalEmbeddingLRU, pack_vector
+
+        # Room for exactly two 4-dim float32 vectors
+        lru = LocalEmbeddingLRU(max_bytes=32)
+
+        lru.put("a", pack_vector([0.1] * 4))
+        lru.put("b", pack_vector([0.2] * 4))
+        assert lru.get("a") is not None  # "a" is now most recent
+
+        lru.put("c", pack_vector([0.3] * 4))
+
+        assert lru.get("b") is None
+        assert lru.get("a") is not None
+        assert lru.get("c") is not None
+        assert lru.evictions == 1
+        assert lru.current_bytes == 32
+
+    async def test_tiered_cache_falls_back_to_shared_store(self, tmp_path):
+        """Test vectors survive a new process-local tier via the disk store."""
+        from memory.embedding_cache import TieredEmbeddingCache, DiskEmbeddingStore
+
+        store = DiskEmbeddingStore(directory=str(tmp_path))
+        first = TieredEmbeddingCache(model="m", dimensions=3, shared_store=store)
+        await first.set("abc123", [0.5, 0.25, 0.125])
+
+        # Fresh cache simulates a new graph / worker process
+        second = TieredEmbeddingCache(model="m", dimensions=3, shared_store=store)
+        found = await second.get_many(["abc123", "missing"])
+
+        assert found == {"abc123": [0.5, 0.25, 0.125]}
+        stats = second.get_stats()
+        assert stats["local_misses"] == 2
+        assert stats["shared_hits"] == 1
+        assert stats["shared_misses"] == 1
+
+        # Second lookup is served from the in-process tier
+        assert await second.get("abc123") == [0.5, 0.25, 0.125]
+        assert second.get_stats()["local_hits"] == 1
+
+    async def test_cache_key_includes_model_and_dimensions(self, tmp_path):
+        """Test a different model never reads another model's vectors."""
+        from memory.embedding_cache import TieredEmbeddingCache, DiskEmbeddingStore
+
+        store = DiskEmbeddingStore(directory=str(tmp_path))
+        small = TieredEmbeddingCache(model="small", dimensions=3, shared_store=store)
+        large = TieredEmbeddingCache(model="large", dimensions=3, shared_store=store)
+
+        await small.set("abc123", [1.0, 2.0, 3.0])
+
+        assert await large.get("abc123") is None
+
+
+class TestEmbeddingBatcher:
+    """Unit tests for the embedding micro-batcher."""
+
+    async def test_concurrent_requests_share_one_api_call(self):
+        """Test a burst of single requests becomes one batched request."""
+        import asyncio
+        from memory.embedding_batcher import EmbeddingBatcher
+
+        calls = []
+
+        async def fake_request(texts):
+            calls.append(list(texts))
+            return [[float(len(t))] for t in texts]
+
+        batcher = EmbeddingBatcher(request_fn=fake_request, batch_size=100, window_seconds=0.01)
+
+        results = await asyncio.gather(
+            batcher.submit("a", "one"),
+            batcher.submit("b", "three"),
+            batcher.submit("a", "one"),  # identical text shares the in-flight future
+        )
+
+        assert results == [[3.0], [5.0], [3.0]]
+        assert calls == [["one", "three"]]
+        assert batcher.get_stats()["coalesced_requests"] == 1
+
+    async def test_batch_size_triggers_immediate_flush(self):
+        """Test reaching batch_size splits requests into full batches."""
+        import asyncio
+        from memory.embedding_batcher import EmbeddingBatcher
+
+        calls = []
+
+        async def fake_request(texts):
+            calls.append(len(texts))
+            return [[0.0] for _ in texts]
+
+        batcher = EmbeddingBatcher(request_fn=fake_request, batch_size=2, window_seconds=10)
+
+        await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(str(i), str(i)) for i in range(4))),
+            timeout=1
+        )
+
+        assert calls == [2, 2]
+
+    async def test_failure_propagates_to_all_waiters(self):
+        """Test an API failure is raised to every coalesced caller."""
+        import asyncio
+        from memory.embedding_batcher import EmbeddingBatcher
+
+        async def failing_request(texts):
+            raise RuntimeError("rate limited")
+
+        batcher = EmbeddingBatcher(request_fn=failing_request, window_seconds=0)
+
+        results = await asyncio.gather(
+            batcher.submit("a", "x"),
+            batcher.submit("b", "y"),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_short_response_fails_all_waiters(self):
+        """Test fewer vectors than texts fails every caller instead of hanging."""
+        import asyncio
+        from memory.embedding_batcher import EmbeddingBatcher
+
+        async def short_request(texts):
+            return [[1.0]]
+
+        batcher = EmbeddingBatcher(request_fn=short_request, window_seconds=0)
+
+        results = await asyncio.wait_for(asyncio.gather(
+            batcher.submit("a", "x"),
+            batcher.submit("b", "y"),
+            return_exceptions=True
+        ), timeout=1)
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert not batcher._inflight
+
+    async def test_inflight_flush_is_referenced(self):
+        """Test a running flush task is kept alive until it finishes."""
+        import asyncio
+        import gc
+        from memory.embedding_batcher import EmbeddingBatcher
+
+        release = asyncio.Event()
+
+        async def slow_request(texts):
+            await release.wait()
+            return [[1.0] for _ in texts]
+
+        batcher = EmbeddingBatcher(request_fn=slow_request, window_seconds=0)
+        waiter = asyncio.ensure_future(batcher.submit("a", "x"))
+        await asyncio.sleep(0.01)
+
+        gc.collect()
+        assert len(batcher._flush_tasks) == 1
+
+        release.set()
+        assert await asyncio.wait_for(waiter, timeout=1) == [1.0]
+        await asyncio.sleep(0)
+        assert not batcher._flush_tasks
+
+
+class TestRedisCacheGenerations:
+    """Unit tests for generation-based cache invalidation."""
+
+    @pytest.mark.skipif(
+        os.getenv('ENABLE_MEMORY') != 'true',
+        reason="Memory layer not enabled"
+    )
+    async def test_clear_collection_bumps_generation(self):
+        """Test invalidation hides old entries without deleting them."""
+        from memory.redis_cache import RedisCache
+
+        cache = RedisCache()
+        await cache.connect()
+
+        await cache.set("test_generations", "query", [{"test": "data"}])
+        old_generation = await cache._get_generation("test_generations")
+
+        await cache.clear_collection("test_generations")
+
+        assert await cache._get_generation("test_generations") == old_generation + 1
+        assert await cache.get("test_generations", "query") is None
+
+        # New writes land in the new generation
+        await cache.set("test_generations", "query", [{"test": "fresh"}])
+        result = await cache.get("test_generations", "query")
+        assert result[0]["test"] == "fresh"
+
+        await cache.close()
+
+    @pytest.mark.skipif(
+        os.getenv('ENABLE_MEMORY') != 'true',
+        reason="Memory layer not enabled"
+    )
+    async def test_purge_removes_only_stale_generations(self):
+        """Test the SCAN sweeper deletes old generations and keeps current keys."""
+        from memory.redis_cache import RedisCache
+
+        cache = RedisCache()
+        await cache.connect()
+
+        await cache.set("test_purge", "old", [{"test": "old"}])
+        await cache.clear_collection("test_purge")
+        await cache.set("test_purge", "new", [{"test": "new"}])
+
+        await cache.purge_collection("test_purge")
+
+        keys = [key async for key in cache.client.scan_iter(match="memory:test_purge:*")]
+        generation = await cache._get_generation("test_purge")
+        assert keys
+        assert all(key.startswith(f"memory:test_purge:g{generation}:") for key in keys)
+
+        await cache.close()
+
+
+class FakeRedis:
+    """In-memory stand-in for the few redis.asyncio calls RedisCache makes."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def setex(self, name, time, value):
+        self.data[name] = value
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+
+class TestSearchInvalidationRace:
+    """Unit tests for searches that overlap a collection invalidation."""
+
+    async def test_search_overlapping_invalidation_is_not_served(self, monkeypatch):
+        """Test results fetched before an INCR are not cached under the new generation."""
+        from memory import MemoryManager
+        from memory.redis_cache import RedisCache
+
+        monkeypatch.setenv("ENABLE_MEMORY", "true")
+
+        cache = RedisCache(enabled=False)
+        cache.enabled = True
+        cache.client = FakeRedis()
+
+        manager = None
+
+        async def search_during_invalidation(**kwargs):
+            # Another writer invalidates while this search is in flight
+            await manager.redis_cache.clear_collection(kwargs["collection_name"])
+            return [{"id": 1, "score": 0.9, "payload": {"text": "stale"}}]
+
+        embedding_generator = Mock()
+        embedding_generator.generate_single = AsyncMock(return_value=[0.1])
+        qdrant_client = Mock()
+        qdrant_client.search = AsyncMock(side_effect=search_during_invalidation)
+
+        manager = MemoryManager(
+            embedding_generator=embedding_generator,
+            qdrant_client=qdrant_client,
+            redis_cache=cache
+        )
+        manager.local_cache = None  # Redis tier only
+
+        results = await manager.search("social_posts", "caption", top_k=1)
+
+        assert results[0]["payload"]["text"] == "stale"
+        assert await cache.get_generation("social_posts") == 1
+        assert await cache.get("social_posts", "caption", top_k=1,
+                               score_threshold=manager.similarity_threshold) is None
+
+    async def test_set_without_generation_uses_current(self):
+        """Test callers that don't pass a generation still write the live one."""
+        from memory.redis_cache import RedisCache
+
+        cache = RedisCache(enabled=False)
+        cache.enabled = True
+        cache.client = FakeRedis()
+
+        await cache.clear_collection("social_posts")
+        await cache.set("social_posts", "caption", [{"id": 1}])
+
+        assert await cache.get("social_posts", "caption") == [{"id": 1}]
+
+
+class TestSearchCacheKeys:
+    """Unit tests for filter-aware search cache keys."""
+
+    def test_key_depends_on_filters_and_threshold(self):
+        """Test different filters or thresholds never share a cache entry."""
+        from memory.redis_cache import RedisCache
+
+        cache = RedisCache(enabled=False)
+
+        base = cache._make_key("social_posts", "caption", 0, {"brand": "pomandi"}, 0.75)
+
+        assert base != cache._make_key("social_posts", "caption", 0, {"brand": "costume"}, 0.75)
+        assert base != cache._make_key("social_posts", "caption", 0, None, 0.75)
+        assert base != cache._make_key("social_posts", "caption", 0, {"brand": "pomandi"}, 0.9)
+
+    def test_key_ignores_filter_order(self):
+        """Test logically identical filters map to the same key."""
+        from memory.redis_cache import RedisCache
+
+        cache = RedisCache(enabled=False)
+
+        assert cache._make_key(
+            "social_posts", "caption", 0, {"brand": "pomandi", "platform": "instagram"}
+        ) == cache._make_key(
+            "social_posts", "caption", 0, {"platform": "instagram", "brand": "pomandi"}
+        )
+
+    @pytest.mark.skipif(
+        os.getenv('ENABLE_MEMORY') != 'true',
+        reason="Memory layer not enabled"
+    )
+    async def test_smaller_top_k_served_from_superset(self):
+        """Test a top_k=2 request is answered from a cached top_k=5 entry."""
+        from memory.redis_cache import RedisCache
+
+        cache = RedisCache()
+        await cache.connect()
+        await cache.clear_collection("test_top_k")
+
+        results = [{"id": i, "score": 1 - i / 10, "payload": {}} for i in range(5)]
+        await cache.set("test_top_k", "query", results, top_k=5)
+
+        assert await cache.get("test_top_k", "query", top_k=2) == results[:2]
+        assert await cache.get("test_top_k", "query", top_k=10) is None
+
+        await cache.close()
+
+
+class TestLocalSearchCache:
+    """Unit tests for the in-process L1 search cache."""
+
+    def test_hit_and_superset_top_k(self):
+        """Test cached results serve equal or smaller top_k requests."""
+        from memory.local_cache import LocalSearchCache
+
+        cache = LocalSearchCache()
+        results = [{"id": i, "score": 0.9, "payload": {}} for i in range(5)]
+        cache.set("invoices", "sncb", results, top_k=5, filters={"matched": False})
+
+        assert cache.get("invoices", "sncb", top_k=3, filters={"matched": False}) == results[:3]
+        assert cache.get("invoices", "sncb", top_k=10, filters={"matched": False}) is None
+        assert cache.get("invoices", "sncb", top_k=3, filters={"matched": True}) is None
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+
+    def test_collection_invalidation(self):
+        """Test clearing a collection hides its entries but not others."""
+        from memory.local_cache import LocalSearchCache
+
+        cache = LocalSearchCache()
+        cache.set("invoices", "q", [{"id": 1}], top_k=1)
+        cache.set("social_posts", "q", [{"id": 2}], top_k=1)
+
+        cache.clear_collection("invoices")
+
+        assert cache.get("invoices", "q", top_k=1) is None
+        assert cache.get("social_posts", "q", top_k=1) == [{"id": 2}]
+
+    def test_ttl_and_entry_limit(self):
+        """Test expired entries miss and the entry limit evicts LRU entries."""
+        from memory.local_cache import LocalSearchCache
+
+        expired = LocalSearchCache(ttl=-1)
+        expired.set("invoices", "q", [{"id": 1}])
+        assert expired.get("invoices", "q") is None
+
+        bounded = LocalSearchCache(max_entries=2)
+        for query in ("a", "b", "c"):
+            bounded.set("invoices", query, [{"id": query}])
+
+        assert bounded.get("invoices", "a") is None
+        assert bounded.get("invoices", "c") == [{"id": "c"}]
+        assert bounded.get_stats()["evictions"] == 1
+
+    def test_returned_results_are_copies(self):
+        """Test mutating returned results does not corrupt the cache."""
+        from memory.local_cache import LocalSearchCache
+
+        cache = LocalSearchCache()
+        cache.set("invoices", "q", [{"id": 1, "score": 0.9}])
+
+        cache.get("invoices", "q")[0]["score"] = 0.0
+
+        assert cache.get("invoices", "q")[0]["score"] == 0.9
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Test L1 is opt-in via MEMORY_L1_ENABLED."""
+        from memory.local_cache import LocalSearchCache
+
+        monkeypatch.delenv("MEMORY_L1_ENABLED", raising=False)
+        assert LocalSearchCache.from_env() is None
+
+        monkeypatch.setenv("MEMORY_L1_ENABLED", "true")
+        assert isinstance(LocalSearchCache.from_env(), LocalSearchCache)
+
+    def test_set_after_overlapping_invalidation_is_dropped(self):
+        """Test results from a search that raced clear_collection are not cached."""
+        from memory.local_cache import LocalSearchCache
+
+        cache = LocalSearchCache()
+        generation = cache.generation("invoices")
+
+        cache.clear_collection("invoices")
+        cache.set("invoices", "q", [{"id": 1}], generation=generation)
+
+        assert cache.get("invoices", "q") is None
+
+
+class TestSearchMany:
+    """Unit tests for MemoryManager.search_many with mocked backends."""
+
+    def _make_manager(self, monkeypatch):
+        from memory import MemoryManager
+        from memory.redis_cache import RedisCache
+        from memory.local_cache import LocalSearchCache
+
+        monkeypatch.setenv("ENABLE_MEMORY", "true")
+
+        embedding_generator = Mock()
+        embedding_generator.generate_batch = AsyncMock(
+            side_effect=lambda texts: [[float(len(t))] for t in texts]
+        )
+
+        qdrant_client = Mock()
+        qdrant_client.search_batch = AsyncMock(
+            side_effect=lambda collection_name, query_vectors, **kwargs: [
+                [{"id": int(v[0]), "score": 0.9, "payload": {}}] for v in query_vectors
+            ]
+        )
+
+        manager = MemoryManager(
+            embedding_generator=embedding_generator,
+            qdrant_client=qdrant_client,
+            redis_cache=RedisCache(enabled=False),
+            local_cache=LocalSearchCache()
+        )
+        return manager, embedding_generator, qdrant_client
+
+    async def test_results_aligned_and_batched(self, monkeypatch):
+        """Test one embedding batch and one Qdrant batch serve all queries."""
+        manager, embedding_generator, qdrant_client = self._make_manager(monkeypatch)
+
+        results = await manager.search_many("social_posts", ["a", "bbb", "a"], top_k=1)
+
+        assert [r[0]["id"] for r in results] == [1, 3, 1]
+        embedding_generator.generate_batch.assert_awaited_once_with(["a", "bbb"])
+        qdrant_client.search_batch.assert_awaited_once()
+
+    async def test_cached_queries_skip_backends(self, monkeypatch):
+        """Test repeated queries are answered from the L1 cache."""
+        manager, embedding_generator, qdrant_client = self._make_manager(monkeypatch)
+
+        await manager.search_many("social_posts", ["a", "bb"], top_k=1)
+        results = await manager.search_many("social_posts", ["bb", "cccc"], top_k=1)
+
+        assert [r[0]["id"] for r in results] == [2, 4]
+        assert embedding_generator.generate_batch.await_args_list[-1].args[0] == ["cccc"]
+
+    async def test_filter_list_length_checked(self, monkeypatch):
+        """Test a filter list not aligned with queries is rejected up front."""
+        manager, embedding_generator, qdrant_client = self._make_manager(monkeypatch)
+
+        with pytest.raises(ValueError):
+            await manager.search_many("social_posts", ["a", "bb"], filters=[{"brand": "pomandi"}])
+
+        embedding_generator.generate_batch.assert_not_awaited()
+        qdrant_client.search_batch.assert_not_awaited()
+
+
+class TestChangeAwareSave:
+    """Unit tests for skipping unchanged documents on save."""
+
+    def _make_manager(self, monkeypatch):
+        from memory import MemoryManager
+        from memory.redis_cache import RedisCache
+
+        monkeypatch.setenv("ENABLE_MEMORY", "true")
+
+        stored = {}
+
+        async def upsert_points(collection, points):
+            for point in points:
+                stored[point["id"]] = point["payload"]
+            return len(points)
+
+        async def overwrite_payloads(collection, payloads):
+            stored.update(payloads)
+            return len(payloads)
+
+        qdrant_client = Mock()
+        qdrant_client.retrieve_points = AsyncMock(
+            side_effect=lambda collection, ids: {i: stored[i] for i in ids if i in stored}
+        )
+        qdrant_client.upsert_points = AsyncMock(side_effect=upsert_points)
+        qdrant_client.overwrite_payloads = AsyncMock(side_effect=overwrite_payloads)
+
+        embedding_generator = Mock()
+        embedding_generator.generate_single = AsyncMock(return_value=[0.1, 0.2])
+        embedding_generator.generate_batch = AsyncMock(
+            side_effect=lambda texts, **kwargs: [[0.1, 0.2] for _ in texts]
+        )
+
+        manager = MemoryManager(
+            embedding_generator=embedding_generator,
+            qdrant_client=qdrant_client,
+            redis_cache=RedisCache(enabled=False)
+        )
+        return manager, embedding_generator, qdrant_client
+
+    def test_stable_point_id(self):
+        """Test default IDs are deterministic positive integers."""
+        from memory.qdrant_client import stable_point_id
+
+        assert stable_point_id("Invoice from SNCB") == stable_point_id("Invoice from SNCB")
+        assert stable_point_id("Invoice from SNCB") != stable_point_id("Invoice from NMBS")
+        assert 0 < stable_point_id("Invoice from SNCB") < 2 ** 63
+
+    async def test_unchanged_save_skips_embedding(self, monkeypatch):
+        """Test saving identical content and metadata twice embeds once."""
+        manager, embedding_generator, qdrant_client = self._make_manager(monkeypatch)
+
+        first_id = await manager.save("invoices", "Invoice from SNCB €22.70", {"matched": False})
+        second_id = await manager.save("invoices", "Invoice from SNCB €22.70", {"matched": False})
+
+        assert first_id == second_id
+        assert embedding_generator.generate_single.await_count == 1
+        assert qdrant_client.upsert_points.await_count == 1
+
+    async def test_metadata_change_updates_payload_only(self, monkeypatch):
+        """Test a metadata-only change overwrites the payload without re-embedding."""
+        manager, embedding_generator, qdrant_client = self._make_manager(monkeypatch)
+
+        await manager.save("invoices", "Invoice from SNCB €22.70", {"matched": False})
+        await manager.save("invoices", "Invoice from SNCB €22.70", {"matched": True})
+
+        assert embedding_generator.generate_single.await_count == 1
+        qdrant_client.overwrite_payloads.assert_awaited_once()
+        payload = next(iter(qdrant_client.overwrite_payloads.await_args.args[1].values()))
+        assert payload["matched"] is True
+
+    async def test_batch_save_embeds_only_new_items(self, monkeypatch):
+        """Test batch_save embeds only items not already stored."""
+        manager, embedding_generator, qdrant_client = self._make_manager(monkeypatch)
+
+        await manager.batch_save("invoices", [
+            {"content": "a", "metadata": {}},
+            {"content": "b", "metadata": {}}
+        ])
+        count = await manager.batch_save("invoices", [
+            {"content": "a", "metadata": {}},
+            {"content": "b", "metadata": {}},
+            {"content": "c", "metadata": {}}
+        ])
+
+        assert count == 3
+        assert embedding_generator.generate_single.await_args.args[0] == "c"
+
+
+class TestPipelinedUpserts:
+    """Unit tests for pipelined Qdrant upserts."""
+
+    async def test_final_batch_waits_after_intermediate_batches(self):
+        """Test intermediate batches skip wait and the last one is the barrier."""
+        from memory.qdrant_client import QdrantClientWrapper
+
+        wrapper = QdrantClientWrapper(host="localhost", upsert_concurrency=2)
+        calls = []
+
+        async def fake_upsert(collection_name, points, wait):
+            calls.append((len(points), wait))
+
+        wrapper.client = Mock()
+        wrapper.client.upsert = AsyncMock(side_effect=fake_upsert)
+
+        points = [{"id": i, "vector": [0.0] * 4, "payload": {}} for i in range(25)]
+        count = await wrapper.upsert_points("agent_context", points, batch_size=10)
+
+        assert count == 25
+        assert calls[-1] == (5, True)
+        assert all(wait is False for _, wait in calls[:-1])
+        assert sorted(n for n, _ in calls[:-1]) == [10, 10]
+
+    def test_batches_capped_by_bytes(self):
+        """Test large payloads split batches before the count limit."""
+        from memory.qdrant_client import QdrantClientWrapper
+
+        wrapper = QdrantClientWrapper(host="localhost")
+        points = [{"id": i, "vector": [0.0] * 100, "payload": {"text": "x" * 1000}} for i in range(10)]
+
+        batches = wrapper._split_batches(points, batch_size=100, max_bytes=5000)
+
+        assert sum(len(b) for b in batches) == 10
+        assert all(len(b) <= 2 for b in batches)
+
+
+class TestCollectionStorage:
+    """Unit tests for quantized / on-disk collection storage."""
+
+    def test_growing_collections_are_quantized(self):
+        """Test large collections use on-disk vectors with scalar quantization."""
+        from memory.collections import get_collection_config, get_storage_config, build_quantization_config
+
+        storage = get_storage_config("agent_context")
+        assert storage["quantization"] == "scalar"
+        assert storage["on_disk_payload"] is True
+        assert get_collection_config("agent_context")["vectors_config"].on_disk is True
+        assert build_quantization_config(storage["quantization"]).scalar.always_ram is True
+
+        assert get_storage_config("invoices")["quantization"] is None
+
+    def test_quantization_env_override(self, monkeypatch):
+        """Test QDRANT_QUANTIZATION switches quantized collections only."""
+        from memory.collections import get_storage_config
+
+        monkeypatch.setenv("QDRANT_QUANTIZATION", "binary")
+
+        assert get_storage_config("social_posts")["quantization"] == "binary"
+        assert get_storage_config("social_posts")["oversampling"] >= 3.0
+        assert get_storage_config("invoices")["quantization"] is None
+
+    async def test_search_rescores_quantized_collections(self):
+        """Test searches on quantized collections request rescoring."""
+        from memory.qdrant_client import QdrantClientWrapper
+
+        wrapper = QdrantClientWrapper(host="localhost")
+        wrapper.client = Mock()
+        wrapper.client.search = AsyncMock(return_value=[])
+
+        await wrapper.search("agent_context", [0.0] * 4, top_k=5)
+        params = wrapper.client.search.await_args.kwargs["search_params"]
+        assert params.quantization.rescore is True
+
+        await wrapper.search("invoices", [0.0] * 4, top_k=5)
+        assert wrapper.client.search.await_args.kwargs["search_params"] is None
+
+    async def test_existing_collection_migrated(self):
+        """Test storage profile changes are applied to existing collections."""
+        from qdrant_client.models import VectorParams, Distance, HnswConfigDiff
+        from memory.collections import EMBEDDING_DIMENSIONS
+        from memory.qdrant_client import QdrantClientWrapper
+
+        wrapper = QdrantClientWrapper(host="localhost", migrate_storage=True)
+        info = Mock()
+        info.config.params.vectors = VectorParams(size=EMBEDDING_DIMENSIONS, distance=Distance.COSINE)
+        info.config.params.on_disk_payload = False
+        info.config.hnsw_config = HnswConfigDiff(m=16, ef_construct=100)
+        info.config.quantization_config = None
+
+        wrapper.client = Mock()
+        wrapper.client.get_collection = AsyncMock(return_value=info)
+        wrapper.client.update_collection = AsyncMock()
+
+        assert await wrapper.apply_storage_config("agent_context") is True
+        kwargs = wrapper.client.update_collection.await_args.kwargs
+        assert kwargs["quantization_config"].scalar is not None
+        assert kwargs["vectors_config"][""].on_disk is True
+        assert kwargs["collection_params"].on_disk_payload is True
+
+        # Already matching collection is left alone
+        wrapper.client.update_collection.reset_mock()
+        assert await wrapper.apply_storage_config("invoices") is False
+        wrapper.client.update_collection.assert_not_awaited()
@@ -0,0 +1,100 @@
+"""
+Unit tests for the metrics history store.
+
+Tests:
+- Rolling average, stddev and same-weekday baselines
+- Period and minimum-sample filtering
+- Validator anomaly detection against stored history
+"""
+
+import pytest
+from datetime import date, timedelta
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from langgraph_agents import metrics_history
+from langgraph_agents.metrics_history import MetricsHistory, extract_metrics
+from langgraph_agents.validator_graph import DataValidatorGraph, init_validation_state
+
+
+@pytest.fixture
+def history(tmp_path):
+    return MetricsHistory(path=str(tmp_path / "history.sqlite3"), min_samples=3)
+
+
+async def _fill(history, as_of: date, spends, period_days=7):
+    """Record one google_ads spend per day, oldest first, ending the day before as_of."""
+    for offset, spend in enumerate(reversed(spends), start=1):
+        day = (as_of - timedelta(days=offset)).isoformat()
+        await history.record("pomandi", day, period_days, {"google_ads": {"total_spend": spend, "total_clicks": 10}})
+
+
+class TestMetricsHistory:
+    """Test recording and baseline queries."""
+
+    def test_extract_metrics(self):
+        """Test only numeric tracked fields are kept."""
+        metrics = extract_metrics({"total_spend": 12.5, "sessions": 40, "source": "x", "total_orders": None})
+
+        assert metrics == {"spend": 12.5, "sessions": 40.0}
+
+    @pytest.mark.asyncio
+    async def test_rolling_baselines(self, history):
+        """Test average, stddev and weekday average over the lookback window."""
+        as_of = date(2026, 3, 16)  # Monday
+        spends = [100.0] * 13 + [300.0]  # 2026-03-02 .. 2026-03-15; 03-09 is a Monday
+        await _fill(history, as_of, spends)
+
+        baseline = (await history.get_baselines("pomandi", period_days=7, as_of=as_of.isoformat()))["google_ads"]
+
+        assert baseline["samples"] == 14
+        assert baseline["avg_spend"] == pytest.approx(1600 / 14)
+        assert baseline["std_spend"] == pytest.approx(51.5079, rel=1e-4)
+        assert baseline["weekday_avg_spend"] == pytest.approx(100.0)
+        assert baseline["avg_clicks"] == 10
+
+    @pytest.mark.asyncio
+    async def test_period_and_min_samples_filtered(self, history):
+        """Test other window lengths and thin history give no baseline."""
+        as_of = date(2026, 3, 16)
+        await _fill(history, as_of, [100.0] * 10, period_days=30)
+        await _fill(history, as_of, [100.0] * 2, period_days=7)
+
+        assert await history.get_baselines("pomandi", period_days=7, as_of=as_of.isoformat()) == {}
+        assert "google_ads" in await history.get_baselines("pomandi", period_days=30, as_of=as_of.isoformat())
+
+    @pytest.mark.asyncio
+    async def test_failed_sources_skipped(self, history):
+        """Test sources with an error aren't recorded."""
+        stored = await history.record("pomandi", "2026-03-15", 7, {
+            "google_ads": {"error": "quota", "total_spend": 0},
+            "shopify": {"total_revenue": 500.0, "total_orders": 5},
+        })
+
+        assert stored == 2
+
+
+class TestValidatorHistoricalContext:
+    """Test DataValidatorGraph uses stored baselines."""
+
+    @pytest.mark.asyncio
+    async def test_spend_spike_detected(self, history, monkeypatch):
+        """Test the spend spike rule fires once there is history."""
+        monkeypatch.setattr(metrics_history, "_metrics_history", history)
+        as_of = date(2026, 3, 16)
+        await _fill(history, as_of, [100.0] * 7)
+
+        validator = DataValidatorGraph(enable_memory=False)
+        state = init_validation_state(
+            brand="pomandi",
+            date=as_of.isoformat(),
+            days=7,
+            raw_data={"google_ads": {"total_spend": 450.0, "total_conversions": 3}}
+        )
+
+        state = await validator.detect_anomalies_node(state)
+
+        assert state["historical_context"]["google_ads"]["avg_spend"] == 100.0
+        assert [a["rule_id"] for a in state["anomalies"]] == ["sudden_spend_spike"]
@@ -0,0 +1,132 @@
+"""
+Unit tests for the product photo catalog.
+
+Tests:
+- Full listing follows continuation tokens past 1000 keys
+- Incremental sync continues with StartAfter; full sync drops deleted keys
+- Random unused selection excludes recently used photos per brand
+- Selection is uniform across eligible photos regardless of id gaps
+"""
+
+import pytest
+import random
+from datetime import datetime, timedelta
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from temporal_app.activities.photo_catalog import PhotoCatalog
+
+
+class FakeS3:
+    """list_objects_v2 over an in-memory key set, 1000 keys per page."""
+
+    def __init__(self, keys):
+        self.keys = set(keys)
+        self.calls = []
+
+    def list_objects_v2(self, Bucket, Prefix, MaxKeys=1000, StartAfter=None, ContinuationToken=None):
+        self.calls.append({"StartAfter": StartAfter, "ContinuationToken": ContinuationToken})
+        keys = sorted(k for k in self.keys if k.startswith(Prefix) and (StartAfter is None or k > StartAfter))
+        offset = int(ContinuationToken or 0)
+        page = keys[offset:offset + MaxKeys]
+        response = {
+            "Contents": [
+                {"Key": k, "Size": 100, "ETag": '"etag-%s"' % k, "LastModified": datetime(2026, 1, 1)}
+                for k in page
+            ],
+            "IsTruncated": offset + MaxKeys < len(keys),
+        }
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = str(offset + MaxKeys)
+        return response
+
+
+def _keys(count, start=0):
+    return [f"products/{i:05d}.jpg" for i in range(start, start + count)]
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    return PhotoCatalog(path=str(tmp_path / "catalog.sqlite3"))
+
+
+class TestSync:
+    """Test catalog sync against S3 listings."""
+
+    def test_full_listing_paginates(self, catalog):
+        """Test every key is indexed, not just the first 1000."""
+        s3 = FakeS3(_keys(2500) + ["products/readme.txt"])
+
+        result = catalog.sync(s3, "bucket")
+
+        assert result == {"full": True, "listed": 2501, "removed": 0}
+        assert len(s3.calls) == 3
+        assert catalog.get_stats()["photos"] == 2500
+
+    def test_incremental_then_full(self, catalog):
+        """Test StartAfter picks up new keys and a full sync removes deleted ones."""
+        s3 = FakeS3(_keys(10))
+        catalog.sync(s3, "bucket")
+
+        s3.keys.update(_keys(5, start=10))
+        s3.keys.discard("products/00000.jpg")
+        s3.calls = []
+        result = catalog.sync(s3, "bucket")
+
+        assert result["full"] is False and result["listed"] == 5
+        assert s3.calls[0]["StartAfter"] == "products/00009.jpg"
+        assert catalog.get_stats()["photos"] == 15
+
+        result = catalog.sync(s3, "bucket", full=True)
+
+        assert result["removed"] == 1
+        assert catalog.get_stats()["photos"] == 14
+
+
+class TestPickUnused:
+    """Test random unused selection."""
+
+    def test_excludes_recent_uses_per_brand(self, catalog):
+        """Test photos used by the brand inside the window are never picked."""
+        catalog.sync(FakeS3(_keys(20)), "bucket")
+        now = datetime.utcnow()
+        catalog.record_usage(
+            [("pomandi", key, now) for key in _keys(19)]
+            + [("costume", "products/00019.jpg", now)]
+            + [("pomandi", "products/00000.jpg", now - timedelta(days=30))]
+        )
+
+        rng = random.Random(3)
+        picks = {catalog.pick_unused("pomandi", 15, rng=rng)["key"] for _ in range(50)}
+        assert picks == {"products/00019.jpg"}
+
+        costume_picks = {catalog.pick_unused("costume", 15, rng=rng)["key"] for _ in range(50)}
+        assert "products/00019.jpg" not in costume_picks
+        assert len(costume_picks) > 5
+
+    def test_none_when_all_used(self, catalog):
+        """Test None when every photo is used, and any photo with unused_days=None."""
+        catalog.sync(FakeS3(_keys(3)), "bucket")
+        catalog.record_usage([("pomandi", key, datetime.utcnow()) for key in _keys(3)])
+
+        assert catalog.pick_unused("pomandi", 15) is None
+        assert catalog.pick_unused("pomandi", None)["key"] in _keys(3)
+        assert catalog.usage_watermark() is not None
+
+    def test_uniform_across_id_gaps(self, catalog):
+        """Test a photo after a run of used ids isn't picked more often than the rest."""
+        catalog.sync(FakeS3(_keys(20)), "bucket")
+        catalog.record_usage([("pomandi", key, datetime.utcnow()) for key in _keys(16)])
+
+        rng = random.Random(7)
+        counts = {key: 0 for key in _keys(4, start=16)}
+        for _ in range(4000):
+            counts[catalog.pick_unused("pomandi", 15, rng=rng)["key"]] += 1
+
+        assert all(800 <= count <= 1200 for count in counts.values())
+
+    def test_empty_catalog(self, catalog):
+        """Test an empty catalog returns None."""
+        assert catalog.pick_unused("pomandi", 15) is None
@@ -0,0 +1,108 @@
+"""
+Unit tests for the per-source snapshot store.
+
+Tests:
+- Missing and settling days are fetched, settled days are reused
+- Empty days count as covered
+- GA4 delta fetch merges stored days into the full window
+"""
+
+import pytest
+from datetime import date, timedelta
+from unittest.mock import AsyncMock
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from langgraph_agents.snapshot_store import SourceSnapshotStore
+from langgraph_agents.daily_analytics_graph import DailyAnalyticsGraph, summarize_ga4_traffic
+
+
+def _ga4_row(day: date, sessions: int):
+    return {
+        "date": day.strftime("%Y%m%d"),
+        "sessions": str(sessions),
+        "activeUsers": str(sessions // 2),
+        "newUsers": "1",
+        "screenPageViews": str(sessions * 3),
+        "averageSessionDuration": "60.0",
+        "bounceRate": "0.5",
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SourceSnapshotStore(path=str(tmp_path / "snapshots.sqlite3"), settle_days=2)
+
+
+class TestSourceSnapshotStore:
+    """Test day-level snapshot bookkeeping."""
+
+    @pytest.mark.asyncio
+    async def test_empty_store_fetches_whole_window(self, store):
+        """Test nothing stored means the window starts at its first day."""
+        today = date.today()
+        start = today - timedelta(days=7)
+
+        assert await store.first_unsettled_day("ga4", "traffic", start, today) == start
+
+    @pytest.mark.asyncio
+    async def test_only_settling_days_refetched(self, store, monkeypatch):
+        """Test days fetched long enough after they ended are reused."""
+        today = date.today()
+        start = today - timedelta(days=30)
+        await store.put_days("ga4", "traffic", {start.isoformat(): {"x": 1}}, start=start, end=today)
+
+        # Every day was fetched today, so only the last settle_days are unsettled
+        assert await store.first_unsettled_day("ga4", "traffic", start, today) == today - timedelta(days=1)
+
+        rows = await store.get_days("ga4", "traffic", start, today)
+        assert rows == {start.isoformat(): {"x": 1}}  # Empty days omitted
+
+    @pytest.mark.asyncio
+    async def test_sources_isolated(self, store):
+        """Test snapshots of one source don't cover another."""
+        today = date.today()
+        await store.put_days("ga4", "traffic", {}, start=today - timedelta(days=5), end=today)
+
+        assert await store.first_unsettled_day("shopify", "orders", today - timedelta(days=5), today) == today - timedelta(days=5)
+
+
+class TestGA4DeltaFetch:
+    """Test incremental GA4 fetch in DailyAnalyticsGraph."""
+
+    @pytest.mark.asyncio
+    async def test_second_run_fetches_only_recent_days(self, store):
+        """Test a 30-day window is served from one short fetch after the first run."""
+        today = date.today()
+        all_rows = [_ga4_row(today - timedelta(days=n), 10 + n) for n in range(31)]
+
+        async def fake_tool(server, tool, arguments):
+            cutoff = today - timedelta(days=arguments["days"])
+            rows = [r for r in all_rows if r["date"] >= cutoff.strftime("%Y%m%d")]
+            return {"rows": rows, "summary": summarize_ga4_traffic(rows)}
+
+        graph = DailyAnalyticsGraph(enable_memory=False)
+        graph.snapshot_store = store
+        graph._call_mcp_tool = AsyncMock(side_effect=fake_tool)
+
+        first = await graph._fetch_ga4_traffic(30)
+        assert graph._call_mcp_tool.await_args.args[2] == {"days": 30}
+
+        second = await graph._fetch_ga4_traffic(30)
+        assert graph._call_mcp_tool.await_args.args[2] == {"days": 1}
+
+        assert second["summary"] == first["summary"] == summarize_ga4_traffic(all_rows)
+        assert len(second["rows"]) == 31
+
+    @pytest.mark.asyncio
+    async def test_error_not_stored(self, store):
+        """Test a failed fetch is passed through for retry handling."""
+        graph = DailyAnalyticsGraph(enable_memory=False)
+        graph.snapshot_store = store
+        graph._call_mcp_tool = AsyncMock(return_value={"error": "quota exceeded"})
+
+        assert await graph._fetch_ga4_traffic(7) == {"error": "quota exceeded"}
+        today = date.today()
+        assert await store.first_unsettled_day("ga4", "traffic", today - timedelta(days=7), today) == today - timedelta(days=7)
@@ -0,0 +1,107 @@
+"""
+Unit tests for the task queue topology.
+
+Tests:
+- Activity routing per queue class
+- Every mapped activity exists and is registered on exactly one queue
+- WORKER_QUEUES parsing and TEMPORAL_SPLIT_QUEUES=false fallback
+- Per-queue concurrency options (fixed limits / resource-based tuner)
+"""
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from temporal_app import task_queues
+from temporal_app.task_queues import (
+    ACTIVITY_QUEUE_CLASSES,
+    QUEUE_CLASSES,
+    TASK_QUEUES,
+    activities_for,
+    task_queue_for,
+    worker_queue_classes,
+)
+from temporal_app import worker
+from temporal_app.activities import langgraph_activities
+
+
+class TestRouting:
+    """Test activity -> queue routing."""
+
+    def test_routes_by_class(self):
+        """Test long graphs, I/O and quick checks land on separate queues."""
+        assert task_queue_for(worker.run_daily_analytics_graph) == TASK_QUEUES["llm"]
+        assert task_queue_for(worker.get_random_unused_photo) == TASK_QUEUES["io"]
+        assert task_queue_for(worker.check_caption_quality) == TASK_QUEUES["fast"]
+        assert task_queue_for("unknown_activity") is None  # Workflow's own queue
+
+    def test_mapping_covers_registered_activities(self):
+        """Test mapped names are real activities and partitions don't overlap."""
+        def lookup(name):
+            # Invoice matcher / feed publisher graphs aren't registered on the worker yet
+            return getattr(worker, name, None) or getattr(langgraph_activities, name)
+
+        activities = [lookup(name) for name in ACTIVITY_QUEUE_CLASSES]
+        partitions = [activities_for(queue_class, activities) for queue_class in QUEUE_CLASSES]
+
+        assert sum(len(p) for p in partitions) == len(activities)
+        assert partitions[0] == []  # Every mapped activity leaves the workflow queue
+
+    def test_split_disabled(self, monkeypatch):
+        """Test TEMPORAL_SPLIT_QUEUES=false routes everything to the workflow queue."""
+        monkeypatch.setattr(task_queues, "SPLIT_QUEUES", False)
+
+        assert task_queue_for(worker.run_daily_analytics_graph) is None
+        assert worker_queue_classes() == ["workflows"]
+
+
+class TestWorkerQueues:
+    """Test WORKER_QUEUES parsing."""
+
+    def test_default_all(self, monkeypatch):
+        monkeypatch.delenv("WORKER_QUEUES", raising=False)
+        assert worker_queue_classes() == QUEUE_CLASSES
+
+    def test_subset(self, monkeypatch):
+        monkeypatch.setenv("WORKER_QUEUES", "llm, fast")
+        assert worker_queue_classes() == ["llm", "fast"]
+
+    def test_unknown_rejected(self, monkeypatch):
+        monkeypatch.setenv("WORKER_QUEUES", "gpu")
+        with pytest.raises(ValueError):
+            worker_queue_classes()
+
+
+class TestConcurrencyOptions:
+    """Test per-queue slot configuration."""
+
+    def test_fixed_limits(self, monkeypatch):
+        monkeypatch.delenv("TEMPORAL_RESOURCE_TUNER", raising=False)
+        options = worker._concurrency_options("llm")
+        assert options["max_concurrent_activities"] == task_queues.MAX_CONCURRENT_ACTIVITIES["llm"]
+
+    def test_resource_tuner(self, monkeypatch):
+        """Test the tuner caps activity slots at the queue limit and shares one config."""
+        monkeypatch.setenv("TEMPORAL_RESOURCE_TUNER", "true")
+        monkeypatch.setattr(worker, "_resource_tuner_config", None)
+
+        llm = worker._concurrency_options("llm")["tuner"]
+        io = worker._concurrency_options("io")["tuner"]
+
+        assert set(worker._concurrency_options("fast")) == {"tuner"}
+        assert llm.activity_slot_supplier.slot_config.maximum_slots == task_queues.MAX_CONCURRENT_ACTIVITIES["llm"]
+        assert llm.activity_slot_supplier.tuner_config is io.activity_slot_supplier.tuner_config
+
+    def test_resource_tuner_without_nexus_supplier(self, monkeypatch):
+        """Test SDKs predating Nexus slot suppliers don't get the keyword."""
+        from temporalio.worker import WorkerTuner
+
+        def create_composite(*, workflow_supplier, activity_supplier, local_activity_supplier):
+            return "tuner"
+
+        monkeypatch.setenv("TEMPORAL_RESOURCE_TUNER", "true")
+        monkeypatch.setattr(WorkerTuner, "create_composite", staticmethod(create_composite))
+
+        assert worker._concurrency_options("llm") == {"tuner": "tuner"}
@@ -0,0 +1,101 @@
+"""
+Unit tests for the TTL + LRU cache.
+
+Tests:
+- LRU eviction order and size bound
+- Per-entry and default TTL expiry
+- Hit/miss counters
+- DuplicateDetector local hash cache honours hash_ttl
+"""
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from ttl_cache import TTLCache
+from langgraph_agents.duplicate_detector import DuplicateDetector
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+    """Test cache semantics."""
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first."""
+        cache = TTLCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", 3)
+
+        assert "b" not in cache
+        assert cache.get("a") == 1 and cache.get("c") == 3
+        assert len(cache) == 2
+        assert cache.evictions == 1
+
+    def test_ttl_expiry(self):
+        """Test entries expire after the default or per-entry TTL."""
+        clock = FakeClock()
+        cache = TTLCache(maxsize=10, ttl=60, clock=clock)
+        cache.put("short", 1, ttl=5)
+        cache.put("default", 2)
+
+        clock.now += 10
+        assert cache.get("short") is None
+        assert cache.get("default") == 2
+
+        clock.now += 60
+        assert cache.get("default", "gone") == "gone"
+        assert cache.expirations == 2
+        assert len(cache) == 0
+
+    def test_stats(self):
+        """Test hit/miss counters and hit rate."""
+        cache = TTLCache(maxsize=10)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.get_stats()
+
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_rate_percent"] == pytest.approx(66.67)
+        assert stats["size"] == 1
+
+    def test_invalid_maxsize(self):
+        """Test a zero-size cache is rejected."""
+        with pytest.raises(ValueError):
+            TTLCache(maxsize=0)
+
+
+class TestDuplicateDetectorLocalCache:
+    """Test the detector's local hash cache."""
+
+    @pytest.mark.asyncio
+    async def test_hash_ttl_honoured(self):
+        """Test cached hashes stop matching after hash_ttl."""
+        clock = FakeClock()
+        detector = DuplicateDetector(config={"hash_ttl": 60, "enabled_checks": ["hash"]})
+        detector._local_hash_cache._clock = clock
+        data = {"source": "google_ads", "date": "2026-03-01", "brand": "pomandi", "total_spend": 10}
+
+        assert not (await detector.check_duplicate(data))["is_duplicate"]
+        assert (await detector.check_duplicate(data))["is_duplicate"]
+
+        clock.now += 61
+        assert not (await detector.check_duplicate(data))["is_duplicate"]
+
+        stats = detector.get_stats()["local_cache"]
+        assert stats["hits"] == 1
+        assert stats["expirations"] == 1
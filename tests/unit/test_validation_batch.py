@@ -0,0 +1,126 @@
+"""
+Unit tests for vectorized batch rule evaluation.
+
+Tests:
+- Batch failure matrix matches the per-day rule runners
+- Rolling baselines match MetricsHistory
+- Loading saved daily outputs per brand
+"""
+
+import pytest
+import json
+import random
+from datetime import date, timedelta
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from langgraph_agents.metrics_history import MetricsHistory
+from langgraph_agents.validation_rules import run_cross_source_validation, run_anomaly_detection
+from langgraph_agents.validation_batch import MetricFrame, evaluate_rules_batch, load_daily_outputs
+
+
+def _random_raw_data(rng: random.Random):
+    """Source dicts with values that land on both sides of the rule thresholds."""
+    def pick(*values):
+        return rng.choice(values)
+
+    return {
+        "google_ads": {
+            "total_spend": pick(0, 40.0, 120.0, 900.0, 6000.0),
+            "total_conversions": pick(0, 2, 10),
+            "total_clicks": pick(0, 50, 400),
+            "avg_ctr": pick(0, 0.1, 3.0, 25.0),
+            "roas": pick(0, 1.5, 4.0),
+        },
+        "meta_ads": {
+            "total_spend": pick(0, 80.0, 5000.0),
+            "total_reach": pick(0, 1000, 200000),
+            "total_conversions": pick(0, 3),
+        },
+        "shopify": {
+            "total_orders": pick(0, 1, 8, 30),
+            "total_revenue": pick(0, 50.0, 800.0, 20000.0),
+            "average_order_value": pick(0, 60.0, 150.0),
+        },
+        "visitor_tracking": {"total_sessions": pick(0, 5, 300, 150000)},
+        "ga4": {"sessions": pick(0, 200, 400), "median_session_duration": pick(0, 2, 90, 4000)},
+        "search_console": {"avg_position": pick(0, 8.0, 20.0)},
+        "merchant_center": {"total_products": 120, "disapproved_products": pick(0, 2, 10)},
+        "appointments": {"total_appointments": pick(0, 4), "with_visitor_id": pick(0, 1, 4)},
+    }
+
+
+@pytest.fixture
+def history_records():
+    rng = random.Random(17)
+    start = date(2026, 1, 1)
+    records = []
+    for offset in range(60):
+        if offset % 11 == 5:
+            continue  # Gap in collection
+        raw_data = _random_raw_data(rng)
+        if offset % 7 == 3:
+            raw_data["shopify"] = {"error": "API timeout"}
+        records.append(((start + timedelta(days=offset)).isoformat(), raw_data))
+    return records
+
+
+class TestBatchEvaluation:
+    """Test the vectorized engine against the scalar rule runners."""
+
+    @pytest.mark.asyncio
+    async def test_matches_scalar_runners(self, history_records, tmp_path):
+        """Test every rule x day cell equals the per-day evaluation."""
+        frame = MetricFrame.from_records(history_records)
+        matrix = evaluate_rules_batch(frame, lookback_days=14, min_samples=3)
+
+        history = MetricsHistory(path=str(tmp_path / "history.sqlite3"), min_samples=3)
+        for day, raw_data in history_records:
+            await history.record("pomandi", day, 7, raw_data)
+
+        expected = {}
+        for day, raw_data in history_records:
+            failed = {r.rule_id for r in run_cross_source_validation(raw_data)}
+            baselines = await history.get_baselines("pomandi", period_days=7, lookback_days=14, as_of=day)
+            for source, source_data in raw_data.items():
+                if source_data.get("error"):
+                    continue
+                for result in run_anomaly_detection(source_data, baselines.get(source, {})):
+                    failed.add(f"{source}.{result.rule_id}")
+            expected[day] = failed
+
+        actual = {day: set() for day in expected}
+        for rule_id in matrix.rule_ids:
+            for day in matrix.failing_days(rule_id):
+                assert day in actual  # Gap days never fail
+                actual[day].add(rule_id)
+
+        assert actual == expected
+        assert any(expected.values())
+
+    def test_matrix_shape_and_counts(self, history_records):
+        """Test one row per cross-source rule and per source x anomaly rule."""
+        frame = MetricFrame.from_records(history_records)
+        matrix = evaluate_rules_batch(frame)
+
+        assert matrix.failures.shape == (len(matrix.rule_ids), 60)
+        assert "roas_reality_check" in matrix.rule_ids
+        assert "google_ads.sudden_spend_spike" in matrix.rule_ids
+        assert sum(matrix.failure_counts().values()) == int(matrix.failures.sum())
+
+    def test_load_daily_outputs(self, tmp_path):
+        """Test saved reports are grouped by brand and filtered by window."""
+        for day, brand, days in [("2026-01-01", "pomandi", 7), ("2026-01-02", "pomandi", 7),
+                                 ("2026-01-02", "pomandi", 30), ("2026-01-01", "costume", 7)]:
+            (tmp_path / f"{day}_{brand}_{days}.json").write_text(json.dumps({
+                "metadata": {"brand": brand, "collection_date": day, "period_days": days},
+                "raw_data": {"google_ads": {"total_spend": 10.0 * days}}
+            }))
+
+        frames = load_daily_outputs(str(tmp_path), period_days=7)
+
+        assert set(frames) == {"pomandi", "costume"}
+        assert frames["pomandi"].size == 2
+        assert frames["pomandi"].view("google_ads").get("total_spend").tolist() == [70.0, 70.0]
@@ -0,0 +1,140 @@
+"""
+TTL + LRU Cache
+===============
+
+Small in-process cache with a size bound (least recently used entries are
+evicted first) and a per-entry time-to-live. get/put are O(1) on top of
+an OrderedDict; expired entries are dropped when touched or when they
+reach the LRU end.
+
+Not thread-safe; meant for single event-loop use inside one process.
+
+Usage:
+    from ttl_cache import TTLCache
+
+    cache = TTLCache(maxsize=1000, ttl=3600)
+    cache.put("key", "value")
+    cache.get("key")        # "value"
+    cache.get_stats()       # {"size": 1, "hits": 1, "misses": 0, ...}
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Bounded LRU cache with per-entry TTL.
+
+    Attributes:
+        maxsize: Max entries before LRU eviction
+        ttl: Default time-to-live in seconds (None = never expires)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Max entries (must be >= 1)
+            ttl: Default time-to-live in seconds (None = no expiry)
+            clock: Time source (monotonic seconds; injectable for tests)
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: "OrderedDict[Any, Tuple[Optional[float], Any]]" = OrderedDict()
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _lookup(self, key: Any) -> Any:
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            return _MISSING
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= self._clock():
+            del self._data[key]
+            self.expirations += 1
+            return _MISSING
+
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Get a live entry and mark it most recently used."""
+        value = self._lookup(key)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Insert or replace an entry, evicting the least recently used beyond maxsize.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time-to-live for this entry (defaults to self.ttl)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = self._clock() + ttl if ttl is not None else None
+
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        """Remove an entry and return its value if it was still live."""
+        value = self._lookup(key)
+        self._data.pop(key, None)
+        return default if value is _MISSING else value
+
+    def __contains__(self, key: Any) -> bool:
+        """Membership check (does not count as a hit or touch LRU order)."""
+        return self._lookup(key) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(list(self._data))
+
+    def clear(self) -> None:
+        """Remove all entries (stats are kept)."""
+        self._data.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate_percent": round(self.hits / total * 100, 2) if total else 0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }